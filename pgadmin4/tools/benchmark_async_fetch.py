@@ -0,0 +1,95 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the fetch throughput of the asynchronous cursor of
+# the query tool with a new event loop per call (asyncio.run), as it used
+# to, and with the event loop of the connection, on a large result fetched
+# in chunks.
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import psycopg
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web'))
+
+import config  # noqa: E402,F401
+from pgadmin.utils.driver.psycopg3.async_loop import \
+    AsyncLoopThread  # noqa: E402
+from pgadmin.utils.driver.psycopg3.cursor import \
+    AsyncDictCursor  # noqa: E402
+
+
+def fetch(dsn, rows, fetch_size, loop_thread):
+    async def connect():
+        return await psycopg.AsyncConnection.connect(
+            dsn, cursor_factory=AsyncDictCursor, autocommit=True)
+
+    if loop_thread is None:
+        conn = asyncio.run(connect())
+    else:
+        conn = loop_thread.run(connect())
+        conn.pgadmin_loop = loop_thread
+
+    try:
+        cur = conn.cursor(scrollable=True)
+        cur.execute(
+            "SELECT g, md5(g::text) FROM generate_series(1, {0}) g"
+            .format(rows))
+
+        count = 0
+        start = time.perf_counter()
+        while True:
+            chunk = cur.fetchmany(fetch_size, _tupples=True)
+            if not chunk:
+                break
+            count += len(chunk)
+        elapsed = time.perf_counter() - start
+        cur.close_cursor()
+    finally:
+        if loop_thread is None:
+            asyncio.run(conn.close())
+        else:
+            loop_thread.run(conn.close())
+
+    return count, elapsed
+
+
+def run(dsn, rows, fetch_size):
+    print('{0} rows, {1} at a time'.format(rows, fetch_size))
+
+    count, elapsed = fetch(dsn, rows, fetch_size, None)
+    print('{0:>10}: {1:8.3f} s, {2:.0f} rows/s'.format(
+        'per call', elapsed, count / elapsed))
+
+    loop_thread = AsyncLoopThread('benchmark-async-fetch')
+    try:
+        count, elapsed = fetch(dsn, rows, fetch_size, loop_thread)
+    finally:
+        loop_thread.stop()
+    print('{0:>10}: {1:8.3f} s, {2:.0f} rows/s'.format(
+        'connection', elapsed, count / elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure the fetch throughput of the asynchronous '
+                    'cursor of the query tool.')
+    parser.add_argument('dsn', help='Connection string of the database')
+    parser.add_argument('--rows', type=int, default=1000000,
+                        help='Number of rows fetched (default: 1000000)')
+    parser.add_argument('--fetch-size', type=int, default=1000,
+                        help='Number of rows fetched at a time '
+                             '(default: 1000)')
+    args = parser.parse_args()
+    run(args.dsn, args.rows, args.fetch_size)
@@ -0,0 +1,108 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the latency of the matching of the SQL completions
+# (SQLAutoComplete.find_matches) on a catalog of generated identifiers, for
+# each keystroke of a few words typed in the strict and fuzzy modes. The
+# candidates are built and indexed by the first query tool, and shared with
+# the other ones through the catalog metadata.
+
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web'))
+
+import config  # noqa: E402,F401
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete, \
+    Candidate  # noqa: E402
+from pgadmin.utils.sqlautocomplete.metadata_cache import \
+    CatalogMetadata  # noqa: E402
+from pgadmin.utils.sqlautocomplete.prioritization import \
+    PrevalenceCounter  # noqa: E402
+
+WORDS = ['order', 'customer', 'invoice', 'line', 'item', 'product', 'stock',
+         'account', 'payment', 'address', 'event', 'log', 'user', 'role']
+TYPED = ['customer_address', 'inv', 'payment_id', 'zzz', 'o']
+
+
+def generate_identifiers(count, seed):
+    rnd = random.Random(seed)
+    identifiers = set()
+    while len(identifiers) < count:
+        name = '_'.join(rnd.sample(WORDS, rnd.randint(1, 3)))
+        identifiers.add('{0}_{1}'.format(
+            name, ''.join(rnd.choices(string.ascii_lowercase, k=4))))
+    return sorted(identifiers)
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def new_completer(metadata):
+    """Query tool connected to the database of the metadata."""
+    completer = SQLAutoComplete.__new__(SQLAutoComplete)
+    completer.prioritizer = PrevalenceCounter([])
+    completer.metadata = metadata
+    completer.generation = metadata.generation
+    completer.search_path = ['public']
+    completer.keywords_in_uppercase = True
+    return completer
+
+
+def match(completer, identifiers, text, mode):
+    candidates, index = completer._get_candidates(
+        ('tables', None, True), lambda: True,
+        lambda: [Candidate(name, 0, 'table') for name in identifiers])
+    return completer.find_matches(text, candidates, mode=mode, meta='table',
+                                  index=index)
+
+
+def run(count, seed):
+    identifiers = generate_identifiers(count, seed)
+
+    print('{0} identifiers'.format(count))
+    for mode in ('strict', 'fuzzy'):
+        metadata = CatalogMetadata(None)
+        timings = []
+        for completer in (new_completer(metadata), new_completer(metadata)):
+            start = time.perf_counter()
+            match(completer, identifiers, '', mode)
+            timings.append(time.perf_counter() - start)
+
+        latencies = []
+        for word in TYPED:
+            for i in range(1, len(word) + 1):
+                start = time.perf_counter()
+                match(completer, identifiers, word[:i], mode)
+                latencies.append(time.perf_counter() - start)
+
+        print('{0:>6}: first call {1:8.1f} ms, other query tool {2:8.1f} ms, '
+              'keystrokes p50 {3:8.1f} ms, p95 {4:8.1f} ms, '
+              'max {5:8.1f} ms'.format(
+                  mode, timings[0] * 1000, timings[1] * 1000,
+                  percentile(latencies, 50) * 1000,
+                  percentile(latencies, 95) * 1000, max(latencies) * 1000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure the latency of the SQL completions matching.')
+    parser.add_argument('--count', type=int, default=100000,
+                        help='Number of identifiers (default: 100000)')
+    parser.add_argument('--seed', type=int, default=1,
+                        help='Seed of the generated identifiers')
+    args = parser.parse_args()
+    run(args.count, args.seed)
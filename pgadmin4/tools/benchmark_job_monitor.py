@@ -0,0 +1,144 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken by the job monitor query of the
+# dashboard on a synthetic pgAgent job log. The job log is created in a
+# transaction which is rolled back, the database must have the pgAgent
+# schema installed.
+
+import argparse
+import json
+import os
+import time
+
+import psycopg
+from jinja2 import Environment, FileSystemLoader
+
+TEMPLATE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'web', 'pgadmin',
+    'dashboard', 'templates')
+
+# Indexes shipped in pgagent--4.2--4.3.sql, created here (and rolled back)
+# when the server runs an older pgAgent schema.
+JOB_MONITOR_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS pga_joblog_jobid_jlgid "
+    "ON pgagent.pga_joblog(jlgjobid, jlgid DESC)",
+    "CREATE INDEX IF NOT EXISTS pga_joblog_jlgstart "
+    "ON pgagent.pga_joblog(jlgstart)",
+    "CREATE INDEX IF NOT EXISTS pga_jobsteplog_jlgid_jslstart "
+    "ON pgagent.pga_jobsteplog(jsljlgid, jslstart DESC)",
+]
+
+
+def create_job_log(cursor, jobs, joblog_rows, steplog_runs, history_days):
+    for sql in JOB_MONITOR_INDEXES:
+        cursor.execute(sql)
+
+    cursor.execute(
+        "INSERT INTO pgagent.pga_job(jobjclid, jobname, jobchanged) "
+        "SELECT 1, 'perf_job_' || i, now() - interval '1 day' "
+        "FROM generate_series(1, %(jobs)s) i "
+        "RETURNING jobid", {'jobs': jobs})
+    job_ids = [row[0] for row in cursor.fetchall()]
+
+    cursor.execute(
+        "INSERT INTO pgagent.pga_jobstep(jstjobid, jstname, jstkind, "
+        "jstcode, jstdbname) "
+        "SELECT jobid, 'perf_step', 's', 'SELECT 1', current_database() "
+        "FROM unnest(%(jobs)s::int[]) jobid", {'jobs': job_ids})
+
+    # Runs are spread evenly over history_days and over the jobs, in start
+    # order, the way pgAgent logs them.
+    cursor.execute(
+        "INSERT INTO pgagent.pga_joblog(jlgjobid, jlgstatus, jlgstart, "
+        "jlgduration) "
+        "SELECT (%(job_ids)s::int[])[1 + i %% %(jobs)s], "
+        "  (ARRAY['s', 's', 's', 'f', 'd'])[1 + i %% 5], "
+        "  now() - make_interval(secs => %(days)s * 86400.0 * "
+        "    (%(rows)s - i) / %(rows)s), "
+        "  interval '1 second' * (i %% 60) "
+        "FROM generate_series(1, %(rows)s) i",
+        {'job_ids': job_ids, 'jobs': jobs, 'rows': joblog_rows,
+         'days': history_days})
+
+    cursor.execute(
+        "INSERT INTO pgagent.pga_jobsteplog(jsljlgid, jsljstid, "
+        "jslstatus, jslstart, jslduration) "
+        "SELECT jl.jlgid, js.jstid, jl.jlgstatus, jl.jlgstart, "
+        "  jl.jlgduration "
+        "FROM (SELECT * FROM pgagent.pga_joblog "
+        "      ORDER BY jlgid DESC LIMIT %(runs)s) jl "
+        "JOIN pgagent.pga_jobstep js ON js.jstjobid = jl.jlgjobid",
+        {'runs': steplog_runs})
+
+    # Leave a few jobs running
+    cursor.execute(
+        "UPDATE pgagent.pga_joblog SET jlgstatus = 'r', "
+        "jlgduration = NULL "
+        "WHERE jlgid IN (SELECT jlgid FROM pgagent.pga_joblog "
+        "ORDER BY jlgid DESC LIMIT 10)")
+
+    for table in ['pga_job', 'pga_jobstep', 'pga_joblog', 'pga_jobsteplog']:
+        cursor.execute('ANALYZE pgagent.{0}'.format(table))
+
+
+def time_job_monitor(cursor, template, since, iterations):
+    sql = template.render(since=since is not None)
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        cursor.execute(sql, {'since': since})
+        result = cursor.fetchone()[0]
+        timings.append((time.perf_counter() - start) * 1000)
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result, min(timings)
+
+
+def run(dsn, jobs, rows, steplog_runs, days, iterations):
+    template = Environment(loader=FileSystemLoader(TEMPLATE_PATH)) \
+        .get_template('dashboard/sql/default/job_monitor.sql')
+
+    with psycopg.connect(dsn) as conn:
+        cursor = conn.cursor()
+        start = time.perf_counter()
+        create_job_log(cursor, jobs, rows, steplog_runs, days)
+        print('{0} jobs, {1} job log rows created in {2:.1f} s'.format(
+            jobs, rows, time.perf_counter() - start))
+
+        for name, since in (('status', 0),
+                            ('incremental', time.time() - 60),
+                            ('full', None)):
+            result, elapsed = time_job_monitor(cursor, template, since,
+                                               iterations)
+            print('{0:>12}: {1:8.1f} ms, {2} jobs'.format(
+                name, elapsed, len(result['jobs'])))
+
+        conn.rollback()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure the time taken by the job monitor query.')
+    parser.add_argument('dsn', help='Connection string of a database with '
+                                    'the pgAgent schema')
+    parser.add_argument('--jobs', type=int, default=100,
+                        help='Number of jobs (default: 100)')
+    parser.add_argument('--rows', type=int, default=10000000,
+                        help='Number of job log rows (default: 10000000)')
+    parser.add_argument('--steplog-runs', type=int, default=100000,
+                        help='Number of runs with a step log '
+                             '(default: 100000)')
+    parser.add_argument('--days', type=int, default=3650,
+                        help='Days of history of the job log (default: 3650)')
+    parser.add_argument('--iterations', type=int, default=5,
+                        help='Runs of every query, the fastest is reported')
+    args = parser.parse_args()
+    run(args.dsn, args.jobs, args.rows, args.steplog_runs, args.days,
+        args.iterations)
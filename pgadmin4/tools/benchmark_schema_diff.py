@@ -0,0 +1,119 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken by schema diff to classify the
+# objects of a large schema as identical or different, by walking every
+# object as it used to, and by hashing them first as
+# directory_compare.compare_dictionaries does. The objects are generated
+# functions, one out of --different-every differs between the schemas.
+
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web'))
+
+import config  # noqa: E402,F401
+from pgadmin import create_app  # noqa: E402
+from pgadmin.tools.schema_diff import directory_compare  # noqa: E402
+from pgadmin.tools.schema_diff.compare import \
+    SchemaDiffObjectCompare  # noqa: E402
+
+
+def generate_function(oid, index, schema):
+    return {'oid': oid, 'name': 'f{0}'.format(index), 'schema': schema,
+            'funcowner': 'postgres', 'lanname': 'plpgsql',
+            'prosrc': 'BEGIN\n    RETURN {0};\nEND;'.format(index),
+            'description': '', 'procost': 100,
+            'arguments': [{'argid': 1, 'argname': 'b', 'argtype': 'text'},
+                          {'argid': 0, 'argname': 'a', 'argtype': 'int'}],
+            'variables': [{'name': 'search_path', 'value': 'public'}],
+            'acl': [{'grantee': 'app', 'grantor': 'postgres',
+                     'privileges': [{'privilege_type': 'X',
+                                     'privilege': True,
+                                     'with_grant': False}]}],
+            'seclabels': {'provider': None, 'label': None}}
+
+
+def generate_functions(objects, different_every):
+    source, target = {}, {}
+    for index in range(objects):
+        key = 'f{0}'.format(index)
+        source[key] = generate_function(index, index, 'public')
+        target[key] = generate_function(objects + index, index, 'sales')
+        # Same lists in another order
+        target[key]['arguments'].reverse()
+        if index % different_every == 0:
+            target[key]['prosrc'] = 'BEGIN\n    RETURN NULL;\nEND;'
+    return source, target
+
+
+def compare_by_walking(source, target, ignore_keys):
+    dict1 = copy.deepcopy(source)
+    dict2 = copy.deepcopy(target)
+    different = 0
+    for key in set(dict1.keys()).intersection(dict2.keys()):
+        if not directory_compare.are_dictionaries_identical(
+                dict1[key], dict2[key], ignore_keys, False):
+            different += 1
+    return different
+
+
+class FunctionView(SchemaDiffObjectCompare):
+    """Node view rendering a fake DDL of the functions."""
+    node_type = 'function'
+    conn = None
+
+    def get_sql_from_diff(self, **kwargs):
+        return 'ALTER {0}'.format(kwargs['oid'])
+
+    def get_dependencies(self, conn, oid, **kwargs):
+        return []
+
+
+def compare_by_hashing(source, target, ignore_keys):
+    res = directory_compare.compare_dictionaries(
+        view_object=FunctionView(), source_params={'scid': 1},
+        target_params={'scid': 2}, group_name='public',
+        source_dict=source, target_dict=target,
+        node='function', node_label='Functions',
+        ignore_keys=ignore_keys, ignore_whitespaces=False)
+    return len([r for r in res if r['status'] == 'Different'])
+
+
+def run(objects, different_every):
+    source, target = generate_functions(objects, different_every)
+    ignore_keys = SchemaDiffObjectCompare.keys_to_ignore
+
+    print('{0} objects, {1} different'.format(
+        objects, len(range(0, objects, different_every))))
+    # The labels of the results are translated
+    with create_app().test_request_context():
+        for name, compare in (('walk', compare_by_walking),
+                              ('hash', compare_by_hashing)):
+            start = time.perf_counter()
+            different = compare(source, target, ignore_keys)
+            print('{0:>6}: {1:8.3f} s, {2} different'.format(
+                name, time.perf_counter() - start, different))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Measure the time taken to classify the objects of a '
+                    'schema diff.')
+    parser.add_argument('--objects', type=int, default=50000,
+                        help='Number of objects (default: 50000)')
+    parser.add_argument('--different-every', type=int, default=100,
+                        help='One object out of this number differs '
+                             '(default: 100)')
+    args = parser.parse_args()
+    run(args.objects, args.different_every)
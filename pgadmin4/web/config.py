@@ -516,6 +516,18 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 ##########################################################################
 DATA_RESULT_ROWS_PER_PAGE = 1000
 
+##########################################################################
+# Query tool result cache
+#
+# When enabled, the rows of a query result of at least
+# QUERY_RESULT_CACHE_MIN_ROWS rows are written to local files (in
+# SESSION_DB_PATH) as the pages of the result grid are fetched in sequence.
+# The pages fetched again are then served from these files. The files are
+# removed when the query tool is closed.
+##########################################################################
+QUERY_RESULT_CACHE = False
+QUERY_RESULT_CACHE_MIN_ROWS = 10000
+
 ##########################################################################
 # Allow users to display Gravatar image for their username in Server mode
 ##########################################################################
@@ -948,6 +960,21 @@ MAX_SERVER_TAGS_ALLOWED = 5
 
 ON_DEMAND_LOG_COUNT = 10000
 
+#############################################################################
+# Coalescing window for the pgAgent job status updates pushed to the browser.
+# Repeated notifications for the same job received within the window are
+# collapsed into a single update carrying the latest state. Set to 0 to push
+# every notification as soon as it is received.
+##############################################################################
+PGAGENT_JOB_STATUS_COALESCE_WINDOW = 250  # In milliseconds
+
+#############################################################################
+# Number of seconds a pgAgent job dependency graph stays cached without being
+# used. A cached graph is rebuilt as soon as the jobs or their dependencies
+# change, whatever this timeout is.
+##############################################################################
+PGAGENT_DEPENDENCY_GRAPH_CACHE_TIMEOUT = 600  # In seconds
+
 #############################################################################
 # Patch the default config with custom config and other manipulations
 #############################################################################
@@ -368,6 +368,26 @@ class CastView(PGChildNodeView, SchemaDiffObjectCompare):
 
         return True, res['rows'][0]
 
+    def _fetch_database_properties(self):
+        """
+        This function returns the properties of all the casts of the
+        database by OID, fetched with one query instead of one per cast.
+        Returns None if they could not be fetched.
+        """
+        last_system_oid = 0 if not self.blueprint.show_system_objects else \
+            self._DATABASE_LAST_SYSTEM_OID
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]),
+            datlastsysoid=last_system_oid,
+            showsysobj=self.blueprint.show_system_objects,
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        return dict((row['oid'], row) for row in res['rows'])
+
     @check_precondition
     def create(self, gid, sid, did):
         """
@@ -788,10 +808,15 @@ class CastView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # Properties of the casts of the database, fetched in bulk
+        properties = self._fetch_database_properties() or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(did, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -369,13 +369,35 @@ class EventTriggerView(PGChildNodeView, SchemaDiffObjectCompare):
             return False, gone(
                 gettext("Could not find the event trigger information."))
 
-        result = res['rows'][0]
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, result):
+        """
+        This function formats the properties of the event trigger.
+        :param result:
+        :return:
+        """
         result['is_sys_obj'] = (
             result['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
             self.datistemplate)
-        result = self._formatter(result)
+        return self._formatter(result)
 
-        return True, result
+    def _fetch_database_properties(self):
+        """
+        This function returns the properties of all the event triggers of
+        the database by OID, fetched with one query instead of one per
+        event trigger. Returns None if they could not be fetched.
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]),
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        return dict((row['oid'], self._format_properties(row))
+                    for row in res['rows'])
 
     @check_precondition
     def create(self, gid, sid, did):
@@ -867,10 +889,15 @@ class EventTriggerView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # Properties of the event triggers of the database, fetched in bulk
+        properties = self._fetch_database_properties() or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(did, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -257,11 +257,19 @@ class ExtensionView(PGChildNodeView, SchemaDiffObjectCompare):
                 gettext("Could not find the extension information.")
             )
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, row):
+        """
+        This function formats the properties of the extension.
+        :param row:
+        :return:
+        """
+        row['is_sys_obj'] = (
+            row['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
             self.datistemplate)
 
-        return True, res['rows'][0]
+        return row
 
     @check_precondition
     def create(self, gid, sid, did):
@@ -580,10 +588,9 @@ class ExtensionView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # The extensions are listed with their properties
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, row['oid'])
-            if status:
-                res[row['name']] = data
+            res[row['name']] = self._format_properties(row)
 
         return res
 
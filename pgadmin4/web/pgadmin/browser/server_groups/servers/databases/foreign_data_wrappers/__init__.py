@@ -388,16 +388,6 @@ class ForeignDataWrapperView(PGChildNodeView, SchemaDiffObjectCompare):
                         " wrapper information.")
             )
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
-            self.datistemplate)
-
-        if res['rows'][0]['fdwoptions'] is not None:
-            res['rows'][0]['fdwoptions'] = tokenize_options(
-                res['rows'][0]['fdwoptions'],
-                'fdwoption', 'fdwvalue'
-            )
-
         sql = render_template("/".join([self.template_path, self._ACL_SQL]),
                               fid=fid, conn=self.conn
                               )
@@ -406,14 +396,51 @@ class ForeignDataWrapperView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=fdw_acl_res)
 
-        for row in fdw_acl_res['rows']:
+        return True, self._format_properties(res['rows'][0],
+                                             fdw_acl_res['rows'])
+
+    def _format_properties(self, data, acl):
+        """
+        This function formats the properties of the FDW.
+        :param data: Properties of the FDW
+        :param acl: Privileges of the FDW
+        :return:
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+            self.datistemplate)
+
+        if data['fdwoptions'] is not None:
+            data['fdwoptions'] = tokenize_options(
+                data['fdwoptions'],
+                'fdwoption', 'fdwvalue'
+            )
+
+        for row in acl:
             privilege = parse_priv_from_db(row)
-            if row['deftype'] in res['rows'][0]:
-                res['rows'][0][row['deftype']].append(privilege)
+            if row['deftype'] in data:
+                data[row['deftype']].append(privilege)
             else:
-                res['rows'][0][row['deftype']] = [privilege]
+                data[row['deftype']] = [privilege]
+
+        return data
+
+    def _fetch_database_acl(self):
+        """
+        This function returns the privileges of all the FDWs by OID,
+        fetched with one query instead of one per FDW. Returns None if they
+        could not be fetched.
+        """
+        sql = render_template("/".join([self.template_path, self._ACL_SQL]),
+                              conn=self.conn)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
 
-        return True, res['rows'][0]
+        acl = dict()
+        for row in res['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+        return acl
 
     @check_precondition
     def create(self, gid, sid, did):
@@ -984,14 +1011,22 @@ class ForeignDataWrapperView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # The FDWs are listed with their properties, and their privileges
+        # are fetched in bulk
+        acl = self._fetch_database_acl()
         for row in rset['rows']:
-            status, data = self._fetch_properties(row['oid'])
-            if status:
-                # For schema diff if fdwoptions is None then convert it to
-                # the empty list.
-                if 'fdwoptions' in data and data['fdwoptions'] is None:
-                    data['fdwoptions'] = []
-                res[row['name']] = data
+            if acl is None:
+                status, data = self._fetch_properties(row['oid'])
+                if not status:
+                    continue
+            else:
+                data = self._format_properties(row, acl.get(row['oid'], []))
+
+            # For schema diff if fdwoptions is None then convert it to
+            # the empty list.
+            if 'fdwoptions' in data and data['fdwoptions'] is None:
+                data['fdwoptions'] = []
+            res[row['name']] = data
 
         return res
 
@@ -373,15 +373,6 @@ class ForeignServerView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
-            self.datistemplate)
-
-        if res['rows'][0]['fsrvoptions'] is not None:
-            res['rows'][0]['fsrvoptions'] = tokenize_options(
-                res['rows'][0]['fsrvoptions'], 'fsrvoption', 'fsrvvalue'
-            )
-
         sql = render_template("/".join([self.template_path, self._ACL_SQL]),
                               fsid=fsid, conn=self.conn
                               )
@@ -389,14 +380,50 @@ class ForeignServerView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=fs_rv_acl_res)
 
-        for row in fs_rv_acl_res['rows']:
+        return True, self._format_properties(res['rows'][0],
+                                             fs_rv_acl_res['rows'])
+
+    def _format_properties(self, data, acl):
+        """
+        This function formats the properties of the Foreign server.
+        :param data: Properties of the Foreign server
+        :param acl: Privileges of the Foreign server
+        :return:
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+            self.datistemplate)
+
+        if data['fsrvoptions'] is not None:
+            data['fsrvoptions'] = tokenize_options(
+                data['fsrvoptions'], 'fsrvoption', 'fsrvvalue'
+            )
+
+        for row in acl:
             privilege = parse_priv_from_db(row)
-            if row['deftype'] in res['rows'][0]:
-                res['rows'][0][row['deftype']].append(privilege)
+            if row['deftype'] in data:
+                data[row['deftype']].append(privilege)
             else:
-                res['rows'][0][row['deftype']] = [privilege]
+                data[row['deftype']] = [privilege]
 
-        return True, res['rows'][0]
+        return data
+
+    def _fetch_database_acl(self):
+        """
+        This function returns the privileges of all the Foreign servers by
+        OID, fetched with one query instead of one per Foreign server.
+        Returns None if they could not be fetched.
+        """
+        sql = render_template("/".join([self.template_path, self._ACL_SQL]),
+                              conn=self.conn)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        acl = dict()
+        for row in res['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+        return acl
 
     @check_precondition
     def create(self, gid, sid, did, fid):
@@ -941,14 +968,22 @@ class ForeignServerView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # The Foreign servers are listed with their properties, and their
+        # privileges are fetched in bulk
+        acl = self._fetch_database_acl()
         for row in rset['rows']:
-            status, data = self._fetch_properties(row['oid'])
-            if status:
-                # For schema diff if fsrvoptions is None then convert it to
-                # the empty list.
-                if 'fsrvoptions' in data and data['fsrvoptions'] is None:
-                    data['fsrvoptions'] = []
-                res[row['name']] = data
+            if acl is None:
+                status, data = self._fetch_properties(row['oid'])
+                if not status:
+                    continue
+            else:
+                data = self._format_properties(row, acl.get(row['oid'], []))
+
+            # For schema diff if fsrvoptions is None then convert it to
+            # the empty list.
+            if 'fsrvoptions' in data and data['fsrvoptions'] is None:
+                data['fsrvoptions'] = []
+            res[row['name']] = data
 
         return res
 
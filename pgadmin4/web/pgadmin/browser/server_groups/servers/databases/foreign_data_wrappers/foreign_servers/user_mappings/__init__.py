@@ -382,17 +382,25 @@ class UserMappingView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, data):
+        """
+        This function formats the properties of the User Mapping.
+        :param data: Properties of the User Mapping
+        :return:
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
             self.datistemplate)
 
-        if res['rows'][0]['umoptions'] is not None:
-            res['rows'][0]['umoptions'] = tokenize_options(
-                res['rows'][0]['umoptions'],
+        if data['umoptions'] is not None:
+            data['umoptions'] = tokenize_options(
+                data['umoptions'],
                 'umoption', 'umvalue'
             )
 
-        return True, res['rows'][0]
+        return data
 
     @check_precondition
     def create(self, gid, sid, did, fid, fsid):
@@ -907,21 +915,22 @@ class UserMappingView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # The user mappings are listed with their properties
         for row in rset['rows']:
-            status, data = self._fetch_properties(row['oid'])
-            if status:
-                # For schema diff if umoptions is None then convert it to
-                # the empty list.
-                if 'umoptions' in data and data['umoptions'] is None:
-                    data['umoptions'] = []
-
-                mapping_name = row['name']
-                if 'srvname' in data:
-                    mapping_name = \
-                        row['name'] + PGADMIN_STRING_SEPARATOR + \
-                        data['srvname']
-
-                res[mapping_name] = data
+            data = self._format_properties(row)
+
+            # For schema diff if umoptions is None then convert it to
+            # the empty list.
+            if 'umoptions' in data and data['umoptions'] is None:
+                data['umoptions'] = []
+
+            mapping_name = row['name']
+            if 'srvname' in data:
+                mapping_name = \
+                    row['name'] + PGADMIN_STRING_SEPARATOR + \
+                    data['srvname']
+
+            res[mapping_name] = data
 
         return res
 
@@ -380,11 +380,6 @@ class LanguageView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self._NOT_FOUND_LANG_INFORMATION)
 
-        if isinstance(res['rows'], list):
-            res['rows'][0]['is_sys_obj'] = (
-                res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
-                self.datistemplate)
-
         sql = render_template(
             "/".join([self.template_path, self._ACL_SQL]),
             lid=lid, conn=self.conn
@@ -393,27 +388,56 @@ class LanguageView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=result)
 
-        for row in result['rows']:
+        return True, self._format_properties(res['rows'][0], result['rows'])
+
+    def _format_properties(self, data, acl):
+        """
+        This function formats the properties of the language.
+        :param data: Properties of the language
+        :param acl: Privileges of the language
+        :return:
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+            self.datistemplate)
+
+        for row in acl:
             priv = parse_priv_from_db(row)
-            if row['deftype'] in res['rows'][0]:
-                res['rows'][0][row['deftype']].append(priv)
+            if row['deftype'] in data:
+                data[row['deftype']].append(priv)
             else:
-                res['rows'][0][row['deftype']] = [priv]
+                data[row['deftype']] = [priv]
 
         seclabels = []
-        if 'seclabels' in res['rows'][0] and \
-                res['rows'][0]['seclabels'] is not None:
+        if 'seclabels' in data and data['seclabels'] is not None:
             import re
-            for sec in res['rows'][0]['seclabels']:
+            for sec in data['seclabels']:
                 sec = re.search(r'([^=]+)=(.*$)', sec)
                 seclabels.append({
                     'provider': sec.group(1),
                     'label': sec.group(2)
                 })
 
-        res['rows'][0]['seclabels'] = seclabels
+        data['seclabels'] = seclabels
+
+        return data
 
-        return True, res['rows'][0]
+    def _fetch_database_acl(self):
+        """
+        This function returns the privileges of all the languages by OID,
+        fetched with one query instead of one per language. Returns None if
+        they could not be fetched.
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._ACL_SQL]), conn=self.conn)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        acl = dict()
+        for row in res['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+        return acl
 
     @check_precondition
     def update(self, gid, sid, did, lid):
@@ -847,10 +871,17 @@ class LanguageView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # The languages are listed with their properties, and their
+        # privileges are fetched in bulk
+        acl = self._fetch_database_acl()
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, row['oid'])
-            if status:
-                res[row['name']] = data
+            if acl is None:
+                status, data = self._fetch_properties(did, row['oid'])
+                if not status:
+                    continue
+            else:
+                data = self._format_properties(row, acl.get(row['oid'], []))
+            res[row['name']] = data
 
         return res
 
@@ -378,6 +378,8 @@ class PublicationView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self._NOT_FOUND_PUB_INFORMATION)
 
+        schemas = []
+        tables = []
         if not res['rows'][0]['all_table']:
             if self.manager.version >= 150000:
                 schema_name_sql = render_template(
@@ -386,37 +388,84 @@ class PublicationView(PGChildNodeView, SchemaDiffObjectCompare):
                 )
                 status, snames_list_res = self.conn.execute_dict(
                     schema_name_sql)
-
-                if len(snames_list_res['rows']) != 0:
-                    res['rows'][0]['pubschema'] = \
-                        [sname_dict['sname'] for sname_dict
-                         in snames_list_res['rows']]
+                schemas = snames_list_res['rows']
 
             table_sql = render_template(
                 "/".join([self.template_path,
                           self._GET_TABLE_FOR_PUBLICATION]),
                 pbid=pbid
             )
-
-            pub_table = []
-            pub_table_names_list = []
             status, table_res = self.conn.execute_dict(table_sql)
+            tables = table_res['rows']
 
-            for table in table_res['rows']:
-                pub_table_names_list.append(table['table_name'])
-                if 'columns' in table and 'where' in table:
-                    pub_table.append({
-                        'table_name': table['table_name'],
-                        'columns': table['columns'],
-                        'where': table['where'],
-                    })
-                else:
-                    pub_table.append(table['table_name'])
+        return True, self._format_properties(res['rows'][0], schemas, tables)
+
+    def _format_properties(self, data, schemas, tables):
+        """
+        This function formats the properties of the publication.
+        :param data: Properties of the publication
+        :param schemas: Schemas of the publication
+        :param tables: Tables of the publication
+        :return:
+        """
+        if data['all_table']:
+            return data
+
+        if len(schemas) != 0:
+            data['pubschema'] = \
+                [sname_dict['sname'] for sname_dict in schemas]
+
+        pub_table = []
+        pub_table_names_list = []
+
+        for table in tables:
+            pub_table_names_list.append(table['table_name'])
+            if 'columns' in table and 'where' in table:
+                pub_table.append({
+                    'table_name': table['table_name'],
+                    'columns': table['columns'],
+                    'where': table['where'],
+                })
+            else:
+                pub_table.append(table['table_name'])
 
-            res['rows'][0]['pubtable'] = pub_table
-            res['rows'][0]['pubtable_names'] = ', '.join(pub_table_names_list)
+        data['pubtable'] = pub_table
+        data['pubtable_names'] = ', '.join(pub_table_names_list)
 
-        return True, res['rows'][0]
+        return data
+
+    def _fetch_database_properties(self):
+        """
+        This function returns the properties of all the publications of the
+        database by OID, fetched with one query per kind of property instead
+        of several per publication. Returns None if they could not be
+        fetched.
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]))
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        templates = [('tables', self._GET_TABLE_FOR_PUBLICATION)]
+        if self.manager.version >= 150000:
+            templates.append(('schemas', self.GET_PUB_SCHEMAS_SQL))
+
+        rows = dict(schemas=dict(), tables=dict())
+        for kind, template in templates:
+            sql = render_template("/".join([self.template_path, template]))
+            status, kind_res = self.conn.execute_dict(sql)
+            if not status:
+                return None
+
+            for row in kind_res['rows']:
+                rows[kind].setdefault(row.pop('oid'), []).append(row)
+
+        return dict(
+            (row['oid'], self._format_properties(
+                row, rows['schemas'].get(row['oid'], []),
+                rows['tables'].get(row['oid'], [])))
+            for row in res['rows'])
 
     @check_precondition
     def update(self, gid, sid, did, pbid):
@@ -1088,10 +1137,15 @@ class PublicationView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # Properties of the publications of the database, fetched in bulk
+        properties = self._fetch_database_properties() or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(did, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
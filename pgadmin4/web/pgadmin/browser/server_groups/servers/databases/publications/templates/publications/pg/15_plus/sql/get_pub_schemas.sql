@@ -1,4 +1,7 @@
-SELECT n.nspname AS sname
+{### The schemas of all the publications are fetched with their OID when
+    no publication id is given ###}
+SELECT {% if not pbid %}pnpubid AS oid, {% endif %}n.nspname AS sname
 FROM pg_catalog.pg_publication_namespace pubnsp
 JOIN pg_catalog.pg_namespace n ON pubnsp.pnnspid = n.oid
-WHERE pnpubid = {{pbid}} :: oid;
\ No newline at end of file
+{% if pbid %}
+WHERE pnpubid = {{pbid}} :: oid{% endif %};
\ No newline at end of file
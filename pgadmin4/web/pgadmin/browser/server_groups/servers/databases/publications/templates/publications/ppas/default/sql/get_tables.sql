@@ -1,4 +1,6 @@
-SELECT pg_catalog.quote_ident(n.nspname) || '.' || pg_catalog.quote_ident(cls.relname) AS table_name
+{### The tables of all the publications are fetched with their OID when
+    no publication id is given ###}
+SELECT {% if not pbid %}prel.prpubid AS oid, {% endif %}pg_catalog.quote_ident(n.nspname) || '.' || pg_catalog.quote_ident(cls.relname) AS table_name
 	FROM pg_publication_rel prel
 	JOIN pg_class cls ON cls.oid = prel.prrelid
-	JOIN pg_catalog.pg_namespace n ON cls.relnamespace = n.oid WHERE prel.prpubid = {{pbid}} :: oid;
+	JOIN pg_catalog.pg_namespace n ON cls.relnamespace = n.oid{% if pbid %} WHERE prel.prpubid = {{pbid}} :: oid{% endif %};
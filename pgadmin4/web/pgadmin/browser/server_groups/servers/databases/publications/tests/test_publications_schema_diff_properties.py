@@ -0,0 +1,109 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases import publications
+from pgadmin.browser.server_groups.servers.databases.publications \
+    import PublicationView
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+DID = 5
+
+PUBLICATIONS = [
+    {'oid': 16700, 'name': 'pub_all', 'all_table': True,
+     'evnt_insert': True, 'pubowner': 'postgres'},
+    {'oid': 16701, 'name': 'pub_tables', 'all_table': False,
+     'evnt_insert': True, 'pubowner': 'postgres'},
+    {'oid': 16702, 'name': 'pub_schema', 'all_table': False,
+     'evnt_insert': False, 'pubowner': 'postgres'},
+]
+TABLES = {
+    16700: [{'table_name': 'public.ignored', 'columns': None,
+             'where': None}],
+    16701: [{'table_name': 'public.t1', 'columns': ['a', 'b'],
+             'where': '(a > 1)'},
+            {'table_name': 'public.t2', 'columns': None, 'where': None}],
+}
+SCHEMAS = {
+    16702: [{'sname': 'sales'}, {'sname': 'hr'}],
+}
+
+
+class _Manager:
+    version = 160000
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+
+    def __init__(self, bulk_status=True):
+        super().__init__()
+        self.bulk_status = bulk_status
+
+    def rows(self, template, args):
+        pbid = args.get('pbid')
+        if template == 'nodes.sql':
+            return [{'oid': p['oid'], 'name': p['name']}
+                    for p in PUBLICATIONS]
+        if not pbid and not self.bulk_status:
+            return None
+
+        if template == 'properties.sql':
+            return [p for p in PUBLICATIONS if pbid in (None, p['oid'])]
+        kind = TABLES if template == 'get_tables.sql' else SCHEMAS
+        return [row if pbid else dict(row, oid=oid)
+                for oid in sorted(kind) for row in kind[oid]
+                if pbid in (None, oid)]
+
+
+class PublicationsSchemaDiffPropertiesTestCase(BaseTestGenerator):
+    """This class tests the properties of the publications fetched in bulk
+    for the schema diff."""
+    scenarios = [
+        ('Properties fetched in bulk', dict(bulk_status=True)),
+        ('Properties fetched per publication when the bulk fetch fails',
+         dict(bulk_status=False)),
+    ]
+
+    def setUp(self):
+        self.patch = patch.object(publications, 'render_template',
+                                  render_template_name)
+        self.patch.start()
+
+    def _view(self, conn):
+        view = PublicationView.__new__(PublicationView)
+        view.conn = conn
+        view.manager = _Manager()
+        view.template_path = 'publications/pg/#160000#/sql'
+        return view
+
+    def runTest(self):
+        conn = _Connection(self.bulk_status)
+        res = PublicationView.fetch_objects_to_compare.__wrapped__(
+            self._view(conn), 1, DID)
+
+        view = self._view(_Connection())
+        expected = dict(
+            (p['name'], view._fetch_properties(DID, p['oid'])[1])
+            for p in PUBLICATIONS)
+
+        self.assertEqual(res, expected)
+        self.assertNotIn('pubtable', res['pub_all'])
+        self.assertEqual(res['pub_tables']['pubtable_names'],
+                         'public.t1, public.t2')
+        self.assertEqual(res['pub_schema']['pubschema'], ['sales', 'hr'])
+        if self.bulk_status:
+            # Nodes, properties, tables and schemas
+            self.assertEqual(len(conn.queries), 4)
+
+    def tearDown(self):
+        self.patch.stop()
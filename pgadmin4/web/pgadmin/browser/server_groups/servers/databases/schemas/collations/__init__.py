@@ -359,11 +359,38 @@ class CollationView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, data):
+        """
+        This function formats the properties fetched from the database.
+
+        :param data: Properties of the collation
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
             self.datistemplate)
 
-        return True, res['rows'][0]
+        return data
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function returns the properties of all the collations of the
+        schema by OID, fetched with one query instead of one per collation.
+        Returns None if they could not be fetched.
+
+        :param scid: Schema ID
+        """
+        SQL = render_template("/".join([self.template_path,
+                                        self._PROPERTIES_SQL]),
+                              scid=scid,
+                              datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        return dict((row['oid'], self._format_properties(row))
+                    for row in res['rows'])
 
     @check_precondition
     def get_collation(self, gid, sid, did, scid, coid=None):
@@ -809,10 +836,15 @@ class CollationView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the collations of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
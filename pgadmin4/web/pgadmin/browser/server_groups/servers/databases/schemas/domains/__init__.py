@@ -444,9 +444,6 @@ It may have been removed by another user or moved to another schema.
 
         data = res['rows'][0]
 
-        # Get Type Length and Precision
-        data.update(self._parse_type(data['fulltype']))
-
         # Get Domain Constraints
         SQL = render_template("/".join([self.template_path,
                                         self._GET_CONSTRAINTS_SQL]),
@@ -455,7 +452,21 @@ It may have been removed by another user or moved to another schema.
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        data['constraints'] = res['rows']
+        return True, self._format_properties(doid, data, res['rows'])
+
+    def _format_properties(self, doid, data, constraints):
+        """
+        This function is used to format the properties fetched from the
+        database.
+        :param doid: Domain Id
+        :param data: Properties of the domain
+        :param constraints: Constraints of the domain
+        :return:
+        """
+        # Get Type Length and Precision
+        data.update(self._parse_type(data['fulltype']))
+
+        data['constraints'] = constraints
 
         # Get formatted Security Labels
         if 'seclabels' in data:
@@ -467,7 +478,37 @@ It may have been removed by another user or moved to another schema.
                 self.datistemplate:
             data['sysdomain'] = True
 
-        return True, data
+        return data
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the domains of
+        the schema by OID, with two queries instead of two per domain.
+        Returns None if they could not be fetched.
+        :param scid:
+        :return:
+        """
+        SQL = render_template("/".join([self.template_path,
+                                        self._PROPERTIES_SQL]),
+                              scid=scid)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        SQL = render_template("/".join([self.template_path,
+                                        self._GET_CONSTRAINTS_SQL]),
+                              scid=scid)
+        status, rset = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        constraints = dict()
+        for row in rset['rows']:
+            constraints.setdefault(row.pop('oid'), []).append(row)
+
+        return dict((row['oid'], self._format_properties(
+            row['oid'], row, constraints.get(row['oid'], [])))
+            for row in res['rows'])
 
     def _parse_type(self, basetype):
         """
@@ -954,11 +995,15 @@ AND relkind != 'c'))"""
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # Properties of the domains of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, scid, row['oid'])
-
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(did, scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -1,4 +1,9 @@
+{### The constraints of all the domains of the schema are fetched with the
+    domain OID when no domain id is given ###}
 SELECT
+{% if not doid %}
+    c.contypid AS oid,
+{% endif %}
     'DOMAIN' AS objectkind, c.oid as conoid, conname, typname as relname, nspname, description,
     pg_catalog.regexp_replace(pg_catalog.pg_get_constraintdef(c.oid, true), E'CHECK \\((.*)\\).*', E'\\1') as consrc, connoinherit, convalidated
 FROM
@@ -10,6 +15,10 @@ JOIN
 LEFT OUTER JOIN
     pg_catalog.pg_description des ON (des.objoid=c.oid AND des.classoid='pg_constraint'::regclass)
 WHERE
+{% if doid %}
     contype = 'c' AND contypid =  {{doid}}::oid
+{% else %}
+    contype = 'c' AND t.typnamespace = {{scid}}::oid
+{% endif %}
 ORDER BY
     conname;
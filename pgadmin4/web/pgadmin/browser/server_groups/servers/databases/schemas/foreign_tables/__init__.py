@@ -1345,10 +1345,8 @@ class ForeignTableView(PGChildNodeView, DataTypeReader,
             return True, False
 
         data = res['rows'][0]
-        data['is_sys_obj'] = (
-            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
-            self.datistemplate)
 
+        acl = None
         if self.manager.version >= 90200:
             # Fetch privileges
             sql = render_template("/".join([self.template_path,
@@ -1357,18 +1355,7 @@ class ForeignTableView(PGChildNodeView, DataTypeReader,
             status, aclres = self.conn.execute_dict(sql)
             if not status:
                 return False, internal_server_error(errormsg=aclres)
-
-            # Get Formatted Privileges
-            data.update(self._format_proacl_from_db(aclres['rows']))
-
-        # Get formatted Security Labels
-        if 'seclabels' in data:
-            data.update(parse_sec_labels_from_db(data['seclabels']))
-
-        # Get formatted Options
-        if 'ftoptions' in data:
-            data.update({'strftoptions': data['ftoptions']})
-            data.update(self._parse_variables_from_db(data['ftoptions']))
+            acl = aclres['rows']
 
         sql = render_template("/".join([self.template_path,
                                         self._GET_CONSTRAINTS_SQL]), foid=foid)
@@ -1376,17 +1363,55 @@ class ForeignTableView(PGChildNodeView, DataTypeReader,
         if not status:
             return False, internal_server_error(errormsg=cons)
 
-        if cons and 'rows' in cons:
-            data['constraints'] = cons['rows']
-
         sql = render_template("/".join([self.template_path,
                                         self._GET_COLUMNS_SQL]), foid=foid)
         status, cols = self.conn.execute_dict(sql)
         if not status:
             return False, internal_server_error(errormsg=cols)
 
+        self._format_properties(data, acl, cons['rows'], cols['rows'])
+
+        # Get Inherited table names from their OID
+        is_error, errmsg = self._get_inherited_table_name(data, inherits)
+
+        if is_error:
+            return False, internal_server_error(errormsg=errmsg)
+
+        return True, data
+
+    def _format_properties(self, data, acl, constraints, columns,
+                           type_edit_types=None):
+        """
+        Format the properties of the foreign table fetched from the database.
+
+        Args:
+            data: Properties of the foreign table
+            acl: Privileges of the foreign table, None if not supported
+            constraints: Constraints of the foreign table
+            columns: Columns of the foreign table
+            type_edit_types: Edit types by type OID, if already fetched
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+            self.datistemplate)
+
+        if acl is not None:
+            # Get Formatted Privileges
+            data.update(self._format_proacl_from_db(acl))
+
+        # Get formatted Security Labels
+        if 'seclabels' in data:
+            data.update(parse_sec_labels_from_db(data['seclabels']))
+
+        # Get formatted Options
+        if 'ftoptions' in data:
+            data.update({'strftoptions': data['ftoptions']})
+            data.update(self._parse_variables_from_db(data['ftoptions']))
+
+        data['constraints'] = constraints
+
         # Fetch length and precision data
-        for col in cols['rows']:
+        for col in columns:
             column_utils.fetch_length_precision(col)
 
             if 'attoptions' in col and col['attoptions'] != '':
@@ -1397,32 +1422,101 @@ class ForeignTableView(PGChildNodeView, DataTypeReader,
                 col['coloptions'] = column_utils.parse_options_for_column(
                     col['attfdwoptions'])
 
-        self._get_edit_types(cols['rows'])
+        self._get_edit_types(columns, type_edit_types)
 
-        if cols and 'rows' in cols:
-            data['columns'] = cols['rows']
+        data['columns'] = columns
 
-        # Get Inherited table names from their OID
-        is_error, errmsg = self._get_inherited_table_name(data, inherits)
+        return data
 
-        if is_error:
-            return False, internal_server_error(errormsg=errmsg)
+    def _fetch_schema_properties(self, scid):
+        """
+        Return the properties of all the foreign tables of the schema by OID,
+        fetched with one query per catalog instead of one per foreign table.
+        Returns None if they could not be fetched.
 
-        return True, data
+        Args:
+            scid: Schema Id
+        """
+        sql = render_template("/".join([self.template_path,
+                                        self._PROPERTIES_SQL]),
+                              scid=scid, schema_diff=True)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        acl = None
+        if self.manager.version >= 90200:
+            sql = render_template("/".join([self.template_path,
+                                            self._ACL_SQL]),
+                                  scid=scid)
+            status, aclres = self.conn.execute_dict(sql)
+            if not status:
+                return None
+            acl = dict()
+            for row in aclres['rows']:
+                acl.setdefault(row.pop('oid'), []).append(row)
+
+        sql = render_template("/".join([self.template_path,
+                                        self._GET_CONSTRAINTS_SQL]),
+                              scid=scid)
+        status, cons = self.conn.execute_dict(sql)
+        if not status:
+            return None
+        constraints = dict()
+        for row in cons['rows']:
+            constraints.setdefault(row.pop('conrelid'), []).append(row)
 
-    def _get_edit_types(self, cols):
+        sql = render_template("/".join([self.template_path,
+                                        self._GET_COLUMNS_SQL]),
+                              scid=scid)
+        status, cols = self.conn.execute_dict(sql)
+        if not status:
+            return None
+        columns = dict()
+        for row in cols['rows']:
+            columns.setdefault(row.pop('attrelid'), []).append(row)
+
+        # Edit types of the types of all the columns
+        type_edit_types = dict()
+        type_ids = set(row['atttypid'] for row in cols['rows'])
+        if len(type_ids) > 0:
+            sql = render_template("/".join([self.template_path,
+                                            'edit_mode_types_multi.sql']),
+                                  type_ids=",".join(map(str, type_ids)))
+            status, edit_res = self.conn.execute_2darray(sql)
+            if not status:
+                return None
+            for row in edit_res['rows']:
+                type_edit_types[row['main_oid']] = row['edit_types']
+
+        properties = dict()
+        for row in res['rows']:
+            properties[row['oid']] = self._format_properties(
+                row, acl.get(row['oid'], []) if acl is not None else None,
+                constraints.get(row['oid'], []),
+                columns.get(row['oid'], []), type_edit_types)
+        return properties
+
+    def _get_edit_types(self, cols, type_edit_types=None):
         edit_types = {}
         for col in cols:
             edit_types[col['atttypid']] = []
 
         if len(cols) > 0:
-            SQL = render_template("/".join([self.template_path,
-                                            'edit_mode_types_multi.sql']),
-                                  type_ids=",".join(map(lambda x: str(x),
-                                                        edit_types.keys())))
-            _, res = self.conn.execute_2darray(SQL)
-            for row in res['rows']:
-                edit_types[row['main_oid']] = sorted(row['edit_types'])
+            # The edit types are fetched unless given by type
+            if type_edit_types is None:
+                SQL = render_template(
+                    "/".join([self.template_path,
+                              'edit_mode_types_multi.sql']),
+                    type_ids=",".join(map(lambda x: str(x),
+                                          edit_types.keys())))
+                _, res = self.conn.execute_2darray(SQL)
+                type_edit_types = dict(
+                    (row['main_oid'], row['edit_types'])
+                    for row in res['rows'])
+            for type_id, type_edit_list in type_edit_types.items():
+                if type_id in edit_types:
+                    edit_types[type_id] = sorted(type_edit_list)
 
             for column in cols:
                 edit_type_list = edit_types[column['atttypid']]
@@ -1738,12 +1832,17 @@ class ForeignTableView(PGChildNodeView, DataTypeReader,
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the foreign tables of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(0, sid, did, scid,
-                                                  row['oid'])
-            if status:
-                ForeignTableView._check_const_for_obj_compare(data)
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(0, sid, did, scid,
+                                                      row['oid'])
+                if not status:
+                    continue
+            ForeignTableView._check_const_for_obj_compare(data)
+            res[row['name']] = data
 
         return res
 
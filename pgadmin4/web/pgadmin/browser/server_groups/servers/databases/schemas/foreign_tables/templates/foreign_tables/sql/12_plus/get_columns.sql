@@ -1,19 +1,25 @@
 WITH INH_TABLES AS
     (SELECT
-     at.attname AS name, ph.inhparent AS inheritedid, ph.inhseqno,
+     at.attname AS name, ph.inhrelid, ph.inhparent AS inheritedid, ph.inhseqno,
      pg_catalog.concat(nmsp_parent.nspname, '.',parent.relname ) AS inheritedfrom
     FROM
         pg_catalog.pg_attribute at
     JOIN
+{% if foid %}
         pg_catalog.pg_inherits ph ON ph.inhparent = at.attrelid AND ph.inhrelid = {{foid}}::oid
+{% else %}
+        pg_catalog.pg_inherits ph ON ph.inhparent = at.attrelid AND ph.inhrelid IN (SELECT ft.ftrelid FROM pg_catalog.pg_foreign_table ft
+            JOIN pg_catalog.pg_class c ON c.oid = ft.ftrelid
+            WHERE c.relnamespace = {{scid}}::oid)
+{% endif %}
     JOIN
         pg_catalog.pg_class parent ON ph.inhparent  = parent.oid
     JOIN
         pg_catalog.pg_namespace nmsp_parent ON nmsp_parent.oid  = parent.relnamespace
-    GROUP BY at.attname, ph.inhparent, ph.inhseqno, inheritedfrom
-    ORDER BY at.attname, ph.inhparent, ph.inhseqno, inheritedfrom
+    GROUP BY at.attname, ph.inhrelid, ph.inhparent, ph.inhseqno, inheritedfrom
+    ORDER BY at.attname, ph.inhrelid, ph.inhparent, ph.inhseqno, inheritedfrom
     )
-SELECT INH.inheritedfrom, INH.inheritedid, att.attoptions, att.atttypid, attfdwoptions,
+SELECT{% if not foid %} att.attrelid,{% endif %} INH.inheritedfrom, INH.inheritedid, att.attoptions, att.atttypid, attfdwoptions,
     att.attname as name, att.attndims, att.atttypmod, pg_catalog.format_type(t.oid,NULL) AS cltype,
     att.attnotnull, att.attstorage, att.attstattarget, att.attnum, pg_catalog.format_type(t.oid, att.atttypmod) AS fulltype,
     t.typstorage AS defaultstorage,
@@ -31,7 +37,7 @@ SELECT INH.inheritedfrom, INH.inheritedid, att.attoptions, att.atttypid, attfdwo
 FROM
     pg_catalog.pg_attribute att
 LEFT JOIN
-    INH_TABLES as INH ON att.attname = INH.name
+    INH_TABLES as INH ON att.attname = INH.name AND INH.inhrelid = att.attrelid
 JOIN
     pg_catalog.pg_type t ON t.oid=atttypid
 JOIN
@@ -47,6 +53,14 @@ LEFT OUTER JOIN
 LEFT OUTER JOIN
 	pg_catalog.pg_description des ON (des.objoid=att.attrelid AND des.classoid='pg_class'::regclass AND des.objsubid = att.attnum)
 WHERE
+{% if foid %}
     att.attrelid={{foid}}::oid
     AND att.attnum>0
     ORDER BY att.attnum;
+{% else %}
+    att.attrelid IN (SELECT ft.ftrelid FROM pg_catalog.pg_foreign_table ft
+            JOIN pg_catalog.pg_class c ON c.oid = ft.ftrelid
+            WHERE c.relnamespace = {{scid}}::oid)
+    AND att.attnum>0
+    ORDER BY att.attrelid, att.attnum;
+{% endif %}
@@ -1,9 +1,18 @@
 SELECT
+{% if not foid %}
+    conrelid,
+{% endif %}
     oid as conoid, conname, contype,
     pg_catalog.BTRIM(substring(pg_catalog.pg_get_constraintdef(oid, true) from '\(.+\)'), '()') as consrc,
     connoinherit, convalidated, conislocal
 FROM
     pg_catalog.pg_constraint
 WHERE
+{% if foid %}
     conrelid={{foid}}::oid
+{% else %}
+    conrelid IN (SELECT ft.ftrelid FROM pg_catalog.pg_foreign_table ft
+        JOIN pg_catalog.pg_class c ON c.oid = ft.ftrelid
+        WHERE c.relnamespace = {{scid}}::oid)
+{% endif %}
 ORDER by conname;
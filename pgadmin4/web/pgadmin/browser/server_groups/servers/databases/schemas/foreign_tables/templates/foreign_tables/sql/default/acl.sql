@@ -1,10 +1,15 @@
+{### The privileges of all the foreign tables of the schema are fetched with
+    their OID when no foreign table id is given ###}
 SELECT
+{% if not foid %}
+    d.oid,
+{% endif %}
     COALESCE(gt.rolname, 'PUBLIC') AS grantee,
     g.rolname AS grantor, pg_catalog.array_agg(privilege_type) AS privileges,
     pg_catalog.array_agg(is_grantable) AS grantable
 FROM
     (SELECT
-        d.grantee, d.grantor, d.is_grantable,
+        d.oid, d.grantee, d.grantor, d.is_grantable,
         CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -23,15 +28,26 @@ FROM
         END AS privilege_type
     FROM
         (SELECT
-            (d).grantee AS grantee, (d).grantor AS grantor,
+            oid, (d).grantee AS grantee, (d).grantor AS grantor,
             (d).is_grantable AS is_grantable,
             (d).privilege_type AS privilege_type
         FROM
-            (SELECT pg_catalog.aclexplode(db.relacl) AS d FROM pg_catalog.pg_class db
+            (SELECT db.oid, pg_catalog.aclexplode(db.relacl) AS d FROM pg_catalog.pg_class db
+{% if foid %}
             WHERE db.oid = {{foid}}::OID) a ORDER BY privilege_type
+{% else %}
+            WHERE db.oid IN (SELECT ft.ftrelid FROM pg_catalog.pg_foreign_table ft
+                JOIN pg_catalog.pg_class c ON c.oid = ft.ftrelid
+                WHERE c.relnamespace = {{scid}}::oid)) a ORDER BY privilege_type
+{% endif %}
         ) d
     ) d
     LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
     LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
+{% if foid %}
 GROUP BY g.rolname, gt.rolname
 ORDER BY grantee;
+{% else %}
+GROUP BY d.oid, g.rolname, gt.rolname
+ORDER BY d.oid, grantee;
+{% endif %}
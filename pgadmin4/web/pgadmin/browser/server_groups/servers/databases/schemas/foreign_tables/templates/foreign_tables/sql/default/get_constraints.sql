@@ -1,7 +1,16 @@
 SELECT
+{% if not foid %}
+    conrelid,
+{% endif %}
     oid as conoid, conname, contype, consrc, connoinherit, convalidated, conislocal
 FROM
     pg_catalog.pg_constraint
 WHERE
+{% if foid %}
     conrelid={{foid}}::oid
+{% else %}
+    conrelid IN (SELECT ft.ftrelid FROM pg_catalog.pg_foreign_table ft
+        JOIN pg_catalog.pg_class c ON c.oid = ft.ftrelid
+        WHERE c.relnamespace = {{scid}}::oid)
+{% endif %}
 ORDER by conname;
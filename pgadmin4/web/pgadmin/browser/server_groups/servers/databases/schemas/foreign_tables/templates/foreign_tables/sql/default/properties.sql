@@ -9,11 +9,11 @@ SELECT
         pg_catalog.pg_seclabel sl1
     WHERE
         sl1.objoid=c.oid) AS seclabels
-    {% if foid %},
+    {% if foid or schema_diff %},
     (SELECT
         pg_catalog.array_agg(i.inhparent) FROM pg_catalog.pg_inherits i
     WHERE
-        i.inhrelid = {{foid}}::oid GROUP BY i.inhrelid) AS inherits
+        i.inhrelid = c.oid GROUP BY i.inhrelid) AS inherits
     {% endif %}
 FROM
     pg_catalog.pg_class c
@@ -393,10 +393,6 @@ class FtsConfigurationView(PGChildNodeView, SchemaDiffObjectCompare):
                     "database node.")
             )
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
-            self.datistemplate)
-
         # In edit mode fetch token/dictionary list also
         sql = render_template(
             "/".join([self.template_path, 'tokenDictList.sql']),
@@ -408,9 +404,55 @@ class FtsConfigurationView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=rset)
 
-        res['rows'][0]['tokens'] = rset['rows']
+        return True, self._format_properties(res['rows'][0], rset['rows'])
+
+    def _format_properties(self, data, tokens):
+        """
+        This function formats the properties fetched from the database.
+
+        :param data: Properties of the FTS configuration
+        :param tokens: Token/dictionary list of the FTS configuration
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+            self.datistemplate)
+
+        data['tokens'] = tokens
+
+        return data
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function returns the properties of all the FTS configurations
+        of the schema by OID, fetched with two queries instead of two per
+        configuration. Returns None if they could not be fetched.
+
+        :param scid: Schema ID
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]),
+            scid=scid,
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        sql = render_template(
+            "/".join([self.template_path, 'tokenDictList.sql']),
+            scid=scid
+        )
+        status, rset = self.conn.execute_dict(sql)
+        if not status:
+            return None
 
-        return True, res['rows'][0]
+        tokens = dict()
+        for row in rset['rows']:
+            tokens.setdefault(row.pop('oid'), []).append(row)
+
+        return dict((row['oid'],
+                     self._format_properties(row, tokens.get(row['oid'], [])))
+                    for row in res['rows'])
 
     @check_precondition
     def create(self, gid, sid, did, scid):
@@ -1036,10 +1078,15 @@ class FtsConfigurationView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the FTS configurations of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in fts_cfg['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -1,6 +1,11 @@
 {# Fetch token/dictionary list for FTS CONFIGURATION #}
-{% if cfgid %}
+{# The lists of all the configurations of the schema are fetched with their
+   OID when no configuration id is given #}
+{% if cfgid or scid %}
 SELECT
+{% if not cfgid %}
+    mapcfg AS oid,
+{% endif %}
     (
     SELECT
         t.alias
@@ -20,9 +25,17 @@ FROM
     LEFT OUTER JOIN pg_catalog.pg_ts_dict ON mapdict = pg_ts_dict.oid
     LEFT OUTER JOIN pg_catalog.pg_namespace pg_ns ON pg_ns.oid = pg_ts_dict.dictnamespace
 WHERE
+{% if cfgid %}
     mapcfg={{cfgid}}::OID
 GROUP BY
     token
 ORDER BY
     1
+{% else %}
+    pg_ts_config.cfgnamespace = {{scid}}::OID
+GROUP BY
+    mapcfg, token
+ORDER BY
+    1, 2
+{% endif %}
 {% endif %}
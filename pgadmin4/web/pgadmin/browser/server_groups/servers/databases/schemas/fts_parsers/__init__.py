@@ -359,10 +359,39 @@ class FtsParserView(PGChildNodeView, SchemaDiffObjectCompare):
             return False, gone(
                 _("Could not find the FTS Parser node in the database node."))
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, data):
+        """
+        This function formats the properties fetched from the database.
+
+        :param data: Properties of the FTS parser
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
             self.datistemplate)
-        return True, res['rows'][0]
+
+        return data
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function returns the properties of all the FTS parsers of the
+        schema by OID, fetched with one query instead of one per parser.
+        Returns None if they could not be fetched.
+
+        :param scid: Schema ID
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]),
+            scid=scid,
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        return dict((row['oid'], self._format_properties(row))
+                    for row in res['rows'])
 
     @check_precondition
     def create(self, gid, sid, did, scid):
@@ -978,10 +1007,15 @@ class FtsParserView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the FTS parsers of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -1350,13 +1350,6 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         resp_data = res['rows'][0]
 
-        # Get formatted Arguments
-        frmtd_params, frmtd_proargs = (
-            format_arguments_from_db(self.sql_template_path, self.conn,
-                                     resp_data))
-        resp_data.update(frmtd_params)
-        resp_data.update(frmtd_proargs)
-
         # Fetch privileges
         sql = render_template("/".join([self.sql_template_path,
                                         self._ACL_SQL]),
@@ -1365,8 +1358,27 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        return self._format_properties(fnid, resp_data, proaclres['rows'])
+
+    def _format_properties(self, fnid, resp_data, proacl, out_arg_types=None):
+        """
+        Format the properties of the function fetched from the database.
+
+        Args:
+            fnid: Function Id
+            resp_data: Properties of the function
+            proacl: Privileges of the function
+            out_arg_types: Names of the argument types by OID, if fetched
+        """
+        # Get formatted Arguments
+        frmtd_params, frmtd_proargs = (
+            format_arguments_from_db(self.sql_template_path, self.conn,
+                                     resp_data, out_arg_types))
+        resp_data.update(frmtd_params)
+        resp_data.update(frmtd_proargs)
+
         # Get Formatted Privileges
-        resp_data.update(self._format_proacl_from_db(proaclres['rows']))
+        resp_data.update(self._format_proacl_from_db(proacl))
 
         # Set System Functions Status
         resp_data['sysfunc'] = False
@@ -1401,6 +1413,46 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         return resp_data
 
+    def _fetch_schema_properties(self, scid):
+        """
+        Return the properties of all the functions of the schema by OID,
+        fetched with one query per catalog instead of one per function.
+        Returns None if they could not be fetched.
+
+        Args:
+            scid: Schema Id
+        """
+        sql = render_template("/".join([self.sql_template_path,
+                                        self._PROPERTIES_SQL]), scid=scid)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        sql = render_template("/".join([self.sql_template_path,
+                                        self._ACL_SQL]), scid=scid)
+        status, proaclres = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        proacl = dict()
+        for row in proaclres['rows']:
+            proacl.setdefault(row['oid'], []).append(row)
+
+        sql = render_template("/".join([self.sql_template_path,
+                                        'get_out_types.sql']), scid=scid)
+        status, out_types_res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        out_arg_types = dict((str(row['oid']), row['out_arg_type'])
+                             for row in out_types_res['rows'])
+
+        properties = dict()
+        for row in res['rows']:
+            properties[row['oid']] = self._format_properties(
+                row['oid'], row, proacl.get(row['oid'], []), out_arg_types)
+        return properties
+
     def _get_schema(self, scid):
         """
         Returns Schema Name from its OID.
@@ -1718,8 +1770,13 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            # Properties of the functions of the schema, fetched in bulk
+            properties = self._fetch_schema_properties(scid) or dict()
             for row in rset['rows']:
-                data = self._fetch_properties(0, sid, did, scid, row['oid'])
+                data = properties.get(row['oid'])
+                if data is None:
+                    data = self._fetch_properties(0, sid, did, scid,
+                                                  row['oid'])
                 if isinstance(data, dict):
                     res[row['name']] = data
         else:
@@ -1,6 +1,17 @@
+{% if scid %}
+SELECT DISTINCT
+    typ.oid, pg_catalog.format_type(typ.oid, NULL) AS out_arg_type
+FROM
+    pg_catalog.pg_proc pr
+JOIN
+    pg_catalog.pg_type typ ON typ.oid = ANY(pr.proallargtypes)
+WHERE
+    pr.pronamespace = {{scid}}::oid;
+{% else %}
 SELECT
     pg_catalog.format_type(oid, NULL) AS out_arg_type
 FROM
     pg_catalog.pg_type
 WHERE
     oid = {{ out_arg_oid }}::oid;
+{% endif %}
@@ -0,0 +1,139 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas import \
+    functions
+from pgadmin.browser.server_groups.servers.databases.schemas.functions \
+    import FunctionView, utils as function_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+SCID = 2200
+
+
+def _function(oid, name, **kwargs):
+    row = {
+        'oid': oid, 'name': name, 'proname': name, 'prokind': 'f',
+        'lanname': 'sql', 'prosrc': 'SELECT 1', 'proconfig': None,
+        'seclabels': None, 'proargtypenames': 'integer',
+        'proargmodes': None, 'proargnames': ['a'], 'proargdefaultvals': None,
+        'proallargtypes': None, 'is_pure_sql': False,
+    }
+    row.update(kwargs)
+    return row
+
+
+FUNCTIONS = [
+    _function(16390, 'f1', proargmodes=['i', 'o', 'o'],
+              proargnames=['a', 'b', 'c'], proallargtypes=[23, 25, 1700]),
+    _function(16391, 'f2', proconfig=['search_path=public'],
+              proargdefaultvals='1'),
+    _function(16392, 'p1', prokind='p', lanname='plpgsql',
+              proargmodes=['b'], proallargtypes=[23]),
+]
+ACL = {
+    16390: [{'grantee': 'app', 'grantor': 'postgres', 'privileges': ['X'],
+             'grantable': [True]}],
+    16391: [{'grantee': 'PUBLIC', 'grantor': 'postgres',
+             'privileges': ['X'], 'grantable': [False]},
+            {'grantee': 'app', 'grantor': 'postgres', 'privileges': ['X'],
+             'grantable': [False]}],
+}
+TYPES = {23: 'integer', 25: 'text', 1700: 'numeric'}
+
+
+class _Manager:
+    server_type = 'pg'
+    sversion = 170000
+
+
+class _Blueprint:
+    min_ver = None
+    min_ppasver = None
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+
+    def __init__(self, bulk_status=True):
+        super().__init__()
+        self.bulk_status = bulk_status
+
+    def rows(self, template, args):
+        fnid = args.get('fnid')
+        if template == 'node.sql':
+            return [{'oid': f['oid'], 'name': f['name']} for f in FUNCTIONS]
+        if not fnid and not self.bulk_status:
+            return None
+
+        if template == 'properties.sql':
+            return [f for f in FUNCTIONS if fnid in (None, f['oid'])]
+        if template == 'acl.sql' and fnid:
+            return ACL.get(fnid, [])
+        if template == 'acl.sql':
+            return [dict(row, oid=oid) for oid in sorted(ACL)
+                    for row in ACL[oid]]
+        return [{'oid': oid, 'out_arg_type': name}
+                for oid, name in TYPES.items()]
+
+    def execute_scalar(self, query):
+        self.queries.append(query)
+        return True, TYPES[query[1]['out_arg_oid']]
+
+
+class FunctionSchemaDiffPropertiesTestCase(BaseTestGenerator):
+    """This class tests the properties of the functions fetched in bulk
+    for the schema diff."""
+    scenarios = [
+        ('Properties fetched in bulk', dict(bulk_status=True)),
+        ('Properties fetched per function when the bulk fetch fails',
+         dict(bulk_status=False)),
+    ]
+
+    def setUp(self):
+        self.patches = [
+            patch.object(functions, 'render_template', render_template_name),
+            patch.object(function_utils, 'render_template',
+                         render_template_name),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def _view(self, conn):
+        view = FunctionView.__new__(FunctionView)
+        view.conn = conn
+        view.manager = _Manager()
+        view.blueprint = _Blueprint()
+        view.sql_template_path = 'functions/pg/sql/#170000#'
+        return view
+
+    def runTest(self):
+        conn = _Connection(self.bulk_status)
+        res = FunctionView.fetch_objects_to_compare.__wrapped__(
+            self._view(conn), 1, 1, SCID)
+
+        expected_conn = _Connection()
+        view = self._view(expected_conn)
+        expected = dict(
+            (f['name'], view._fetch_properties(0, 1, 1, SCID, f['oid']))
+            for f in FUNCTIONS)
+
+        self.assertEqual(res, expected)
+        self.assertEqual(res['f1']['proargs'],
+                         'IN a integer, OUT b text, OUT c numeric')
+        if self.bulk_status:
+            # Nodes, properties, privileges and argument types
+            self.assertEqual(len(conn.queries), 4)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
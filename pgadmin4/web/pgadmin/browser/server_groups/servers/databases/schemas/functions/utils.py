@@ -155,7 +155,8 @@ def map_arguments_list(argmode, argtype, argname, argdef):
     return arg.strip(" ")
 
 
-def format_arguments_from_db(sql_template_path, conn, data):
+def format_arguments_from_db(sql_template_path, conn, data,
+                             out_arg_types=None):
     """
     Create Argument list of the Function.
 
@@ -163,6 +164,8 @@ def format_arguments_from_db(sql_template_path, conn, data):
         sql_template_path:
         conn:
         data: Function Data
+        out_arg_types: Names of the argument types by OID, the types missing
+            are fetched from the database
 
     Returns:
         Function Arguments in the following format.
@@ -218,7 +221,12 @@ def format_arguments_from_db(sql_template_path, conn, data):
     proargnames_fltrd = []
     cnt = 0
     for m in proargmodes:
-        if m == 'o':  # Out Mode
+        if m == 'o' and out_arg_types and \
+                str(proallargtypes[cnt]) in out_arg_types:  # Out Mode
+            # Insert out parameter datatype
+            proargtypes.insert(cnt, out_arg_types[str(proallargtypes[cnt])])
+            proargdefaultvals.insert(cnt, '')
+        elif m == 'o':  # Out Mode
             sql = render_template("/".join([sql_template_path,
                                             'get_out_types.sql']),
                                   out_arg_oid=proallargtypes[cnt])
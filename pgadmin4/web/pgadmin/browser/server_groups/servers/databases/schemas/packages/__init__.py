@@ -350,11 +350,6 @@ class PackageView(PGChildNodeView, SchemaDiffObjectCompare):
                 errormsg=self.not_found_error_msg()
             )
 
-        res['rows'][0]['pkgheadsrc'] = self.get_inner(
-            res['rows'][0]['pkgheadsrc'])
-        res['rows'][0]['pkgbodysrc'] = self.get_inner(
-            res['rows'][0]['pkgbodysrc'])
-
         sql = render_template("/".join([self.template_path, self._ACL_SQL]),
                               scid=scid,
                               pkgid=pkgid)
@@ -363,13 +358,55 @@ class PackageView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=rset1)
 
-        for row in rset1['rows']:
+        return True, self._format_properties(res['rows'][0], rset1['rows'])
+
+    def _format_properties(self, data, acl):
+        """
+        This function is used to format the properties fetched from the
+        database.
+        :param data: Properties of the package
+        :param acl: Privileges of the package
+        :return:
+        """
+        data['pkgheadsrc'] = self.get_inner(data['pkgheadsrc'])
+        data['pkgbodysrc'] = self.get_inner(data['pkgbodysrc'])
+
+        for row in acl:
             priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
+            data.setdefault(row['deftype'], []).append(priv)
+
+        data['schema'] = self.schema
+
+        return data
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the packages of
+        the schema by OID, with two queries instead of two per package.
+        Returns None if they could not be fetched.
+        :param scid:
+        :return:
+        """
+        sql = render_template("/".join([self.template_path,
+                                        self._PROPERTIES_SQL]),
+                              scid=scid)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
 
-        res['rows'][0]['schema'] = self.schema
+        sql = render_template("/".join([self.template_path, self._ACL_SQL]),
+                              scid=scid)
+        status, rset = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        acl = dict()
+        for row in rset['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
 
-        return True, res['rows'][0]
+        return dict((row['oid'],
+                     self._format_properties(row, acl.get(row['oid'], [])))
+                    for row in res['rows'])
 
     @check_precondition(action="create")
     def create(self, gid, sid, did, scid):
@@ -860,10 +897,15 @@ class PackageView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the packages of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
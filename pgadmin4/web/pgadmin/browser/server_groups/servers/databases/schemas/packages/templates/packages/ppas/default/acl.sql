@@ -1,7 +1,7 @@
-SELECT 'pkgacl' as deftype, COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
+SELECT 'pkgacl' as deftype,{% if not pkgid %} d.oid,{% endif %} COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
 FROM
   (SELECT
-    d.grantee, d.grantor, d.is_grantable,
+    d.oid, d.grantee, d.grantor, d.is_grantable,
     CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -18,19 +18,20 @@ FROM
         ELSE 'UNKNOWN'
     END AS privilege_type
   FROM
-    (SELECT nspacl
-  FROM pg_catalog.pg_namespace
-  WHERE nspparent = {{scid}}::oid
-  AND oid = {{pkgid}}::oid
-  AND nspobjecttype = 0
-    ) acl,
-    (SELECT (d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
-        AS is_grantable, (d).privilege_type AS privilege_type FROM (SELECT pg_catalog.aclexplode(nspacl) as d FROM pg_catalog.pg_namespace
+    (SELECT oid, (d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
+        AS is_grantable, (d).privilege_type AS privilege_type FROM (SELECT oid, pg_catalog.aclexplode(nspacl) as d FROM pg_catalog.pg_namespace
         WHERE nspparent = {{scid}}::oid
+{% if pkgid %}
         AND oid = {{pkgid}}::oid
+{% endif %}
   AND nspobjecttype = 0) a ORDER BY privilege_type) d
     ) d
   LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
   LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
+{% if pkgid %}
 GROUP BY g.rolname, gt.rolname
 ORDER BY grantee
+{% else %}
+GROUP BY d.oid, g.rolname, gt.rolname
+ORDER BY d.oid, grantee
+{% endif %}
@@ -28,6 +28,9 @@ from pgadmin.utils.ajax import make_json_response, internal_server_error, \
     make_response as ajax_response, gone
 from pgadmin.utils.driver import get_driver
 
+# Number of sequences read by one query of the schema diff
+SEQUENCE_CHUNK_SIZE = 500
+
 
 class SequenceModule(SchemaChildModule):
     """
@@ -322,45 +325,103 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         elif len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        res['rows'][0]['is_sys_obj'] = (
-            res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+        sql = render_template(
+            "/".join([self.template_path, 'get_def.sql']),
+            data=res['rows'][0]
+        )
+        status, rset1 = self.conn.execute_dict(sql)
+        if not status:
+            return False, internal_server_error(errormsg=rset1)
+
+        sql = render_template(
+            "/".join([self.template_path, self._ACL_SQL]),
+            scid=scid, seid=seid
+        )
+        status, dataclres = self.conn.execute_dict(sql)
+        if not status:
+            return False, internal_server_error(errormsg=res)
+
+        return True, self._format_properties(
+            res['rows'][0], rset1['rows'][0], dataclres['rows'])
+
+    def _format_properties(self, row, definition, acl):
+        """
+        This function is used to format the properties fetched from the
+        database.
+        :param row: Properties of the sequence
+        :param definition: Definition read from the sequence
+        :param acl: Privileges of the sequence
+        :return:
+        """
+        row['is_sys_obj'] = (
+            row['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
             self.datistemplate)
 
-        for row in res['rows']:
-            sql = render_template(
-                "/".join([self.template_path, 'get_def.sql']),
-                data=row
-            )
-            status, rset1 = self.conn.execute_dict(sql)
-            if not status:
-                return False, internal_server_error(errormsg=rset1)
+        row['current_value'] = definition['last_value']
+        row['minimum'] = definition['min_value']
+        row['maximum'] = definition['max_value']
+        row['increment'] = definition['increment_by']
+        row['start'] = definition['start_value']
+        row['cache'] = definition['cache_value']
+        row['cycled'] = definition['is_cycled']
 
-            row['current_value'] = rset1['rows'][0]['last_value']
-            row['minimum'] = rset1['rows'][0]['min_value']
-            row['maximum'] = rset1['rows'][0]['max_value']
-            row['increment'] = rset1['rows'][0]['increment_by']
-            row['start'] = rset1['rows'][0]['start_value']
-            row['cache'] = rset1['rows'][0]['cache_value']
-            row['cycled'] = rset1['rows'][0]['is_cycled']
+        self._add_securities_to_row(row)
+
+        for acl_row in acl:
+            priv = parse_priv_from_db(acl_row)
+            if acl_row['deftype'] in row:
+                row[acl_row['deftype']].append(priv)
+            else:
+                row[acl_row['deftype']] = [priv]
 
-            self._add_securities_to_row(row)
+        return row
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the sequences
+        of the schema by OID. The catalogs are read with one query each, the
+        sequences themselves with one query per SEQUENCE_CHUNK_SIZE
+        sequences. Returns None if they could not be fetched.
+        :param scid:
+        :return:
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]),
+            scid=scid
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
 
         sql = render_template(
             "/".join([self.template_path, self._ACL_SQL]),
-            scid=scid, seid=seid
+            scid=scid
         )
         status, dataclres = self.conn.execute_dict(sql)
         if not status:
-            return False, internal_server_error(errormsg=res)
+            return None
 
+        acl = dict()
         for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            if row['deftype'] in res['rows'][0]:
-                res['rows'][0][row['deftype']].append(priv)
-            else:
-                res['rows'][0][row['deftype']] = [priv]
+            acl.setdefault(row.pop('oid'), []).append(row)
+
+        # The sequences which could not be read are fetched one by one
+        definitions = dict()
+        for index in range(0, len(res['rows']), SEQUENCE_CHUNK_SIZE):
+            sql = render_template(
+                "/".join([self.template_path, 'get_def.sql']),
+                sequences=res['rows'][index:index + SEQUENCE_CHUNK_SIZE]
+            )
+            status, rset = self.conn.execute_dict(sql)
+            if status:
+                definitions.update((row['oid'], row) for row in rset['rows'])
 
-        return True, res['rows'][0]
+        properties = dict()
+        for row in res['rows']:
+            if row['oid'] in definitions:
+                properties[row['oid']] = self._format_properties(
+                    row, definitions[row['oid']], acl.get(row['oid'], []))
+        return properties
 
     def _add_securities_to_row(self, row):
         sec_lbls = []
@@ -952,10 +1013,15 @@ class SequenceView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the sequences of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -1,7 +1,7 @@
-SELECT 'relacl' as deftype, COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
+SELECT 'relacl' as deftype,{% if not seid %} d.oid,{% endif %} COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
 FROM
     (SELECT
-        d.grantee, d.grantor, d.is_grantable,
+        d.oid, d.grantee, d.grantor, d.is_grantable,
         CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -18,13 +18,24 @@ FROM
         ELSE 'UNKNOWN'
         END AS privilege_type
     FROM
-        pg_catalog.aclexplode((SELECT relacl
+{% if seid %}
+        (SELECT {{seid}}::oid AS oid, * FROM pg_catalog.aclexplode((SELECT relacl
             FROM pg_catalog.pg_class cl
             LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=cl.oid AND des.classoid='pg_class'::regclass)
             WHERE relkind = 'S' AND relnamespace  = {{scid}}::oid
-            AND cl.oid = {{seid}}::oid )) d
+            AND cl.oid = {{seid}}::oid ))) d
+{% else %}
+        (SELECT cl.oid, (pg_catalog.aclexplode(cl.relacl)).*
+            FROM pg_catalog.pg_class cl
+            WHERE relkind = 'S' AND relnamespace  = {{scid}}::oid) d
+{% endif %}
         ) d
     LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
     LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
+{% if seid %}
 GROUP BY g.rolname, gt.rolname
 ORDER BY grantee
+{% else %}
+GROUP BY d.oid, g.rolname, gt.rolname
+ORDER BY d.oid, grantee
+{% endif %}
@@ -1,3 +1,6 @@
+{### The definitions of several sequences are fetched with their OID when a
+    list of sequences is given ###}
+{% if data %}
 SELECT
     last_value,
     seqmin AS min_value,
@@ -9,3 +12,22 @@ SELECT
     is_called
 FROM pg_catalog.pg_sequence, {{ conn|qtIdent(data.schema) }}.{{ conn|qtIdent(data.name) }}
 WHERE seqrelid = {{data.oid}}
+{% else %}
+{% for seq in sequences %}
+SELECT
+    seqrelid AS oid,
+    last_value,
+    seqmin AS min_value,
+    seqmax AS max_value,
+    seqstart AS start_value,
+    seqcache AS cache_value,
+    seqcycle AS is_cycled,
+    seqincrement AS increment_by,
+    is_called
+FROM pg_catalog.pg_sequence, {{ conn|qtIdent(seq.schema) }}.{{ conn|qtIdent(seq.name) }}
+WHERE seqrelid = {{seq.oid}}
+{% if not loop.last %}
+UNION ALL
+{% endif %}
+{% endfor %}
+{% endif %}
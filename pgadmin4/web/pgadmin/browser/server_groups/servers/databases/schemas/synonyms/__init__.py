@@ -427,13 +427,21 @@ class SynonymView(PGChildNodeView, SchemaDiffObjectCompare):
             if len(res['rows']) == 0:
                 return False, gone(self.not_found_error_msg())
 
-            res['rows'][0]['is_sys_obj'] = (
-                res['rows'][0]['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
-                self.datistemplate)
-            return True, res['rows'][0]
+            return True, self._format_properties(res['rows'][0])
         except Exception as e:
             return internal_server_error(errormsg=str(e))
 
+    def _format_properties(self, data):
+        """
+        This function formats the properties fetched from the database.
+        :param data: Properties of the synonym
+        :return:
+        """
+        data['is_sys_obj'] = (
+            data['oid'] <= self._DATABASE_LAST_SYSTEM_OID or
+            self.datistemplate)
+        return data
+
     @check_precondition
     def create(self, gid, sid, did, scid):
         """
@@ -764,10 +772,9 @@ class SynonymView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # The synonyms are listed with their properties
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            res[row['name']] = self._format_properties(row)
 
         return res
 
@@ -112,7 +112,8 @@ def _fetch_inherited_tables(tid, data, fetch_inherited_tables, template_path,
 
 @get_template_path
 def column_formatter(conn, tid, clid, data, edit_types_list=None,
-                     fetch_inherited_tables=True, template_path=None):
+                     fetch_inherited_tables=True, template_path=None,
+                     acl=None):
     """
     This function will return formatted output of query result
     as per client model format for column node
@@ -123,6 +124,7 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     :param edit_types_list:
     :param fetch_inherited_tables:
     :param template_path: Optional template path
+    :param acl: Privileges of the column, fetched if not given
     :return:
     """
 
@@ -157,18 +159,20 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
         data['coloptions'] = parse_options_for_column(data['attfdwoptions'])
 
     # We need to parse & convert ACL coming from database to json format
-    SQL = render_template("/".join([template_path, 'acl.sql']),
-                          tid=tid, clid=clid)
-    status, acl = conn.execute_dict(SQL)
+    if acl is None:
+        SQL = render_template("/".join([template_path, 'acl.sql']),
+                              tid=tid, clid=clid)
+        status, res = conn.execute_dict(SQL)
 
-    if not status:
-        return internal_server_error(errormsg=acl)
+        if not status:
+            return internal_server_error(errormsg=res)
+        acl = res['rows']
 
     # We will set get privileges from acl sql so we don't need
     # it from properties sql
     data['attacl'] = []
 
-    for row in acl['rows']:
+    for row in acl:
         priv = parse_priv_from_db(row)
         data.setdefault(row['deftype'], []).append(priv)
 
@@ -225,10 +229,39 @@ def parse_options_for_column(db_variables):
     return variables_lst
 
 
+def set_serial_column(table_name, col):
+    """
+    This function will show the column as serial if its default value
+    is the next value of the sequence owned by the column.
+    :param table_name: Table name
+    :param col: Column
+    """
+    # Here we assume if a column is serial
+    serial_seq_name = make_object_name(table_name, col['name'], 'seq')
+    # replace the escaped quotes for comparison
+    defval = (col.get('defval', '') or '').replace("''", "'").\
+        replace('""', '"')
+
+    if serial_seq_name in defval and defval.startswith("nextval('")\
+            and col['typname'] in ('integer', 'smallint', 'bigint'):
+
+        serial_type = {
+            'integer': 'serial',
+            'smallint': 'smallserial',
+            'bigint': 'bigserial'
+        }[col['typname']]
+
+        col['displaytypname'] = serial_type
+        col['cltype'] = serial_type
+        col['typname'] = serial_type
+        col['defval'] = ''
+
+
 @get_template_path
 def get_formatted_columns(conn, tid, data, other_columns,
                           table_or_type, template_path=None,
-                          with_serial=False):
+                          with_serial=False, columns=None, column_acl=None,
+                          column_edit_types=None):
     """
     This function will iterate and return formatted data for all
     the columns.
@@ -238,16 +271,23 @@ def get_formatted_columns(conn, tid, data, other_columns,
     :param other_columns:
     :param table_or_type:
     :param template_path: Optional template path
+    :param columns: Columns of the table, fetched if not given
+    :param column_acl: Privileges of the columns by column number, fetched
+    if not given
+    :param column_edit_types: Types the columns can be changed to by type
+    ID, fetched if not given
     :return:
     """
-    SQL = render_template("/".join([template_path, 'properties.sql']),
-                          tid=tid, show_sys_objects=False)
+    if columns is None:
+        SQL = render_template("/".join([template_path, 'properties.sql']),
+                              tid=tid, show_sys_objects=False)
 
-    status, res = conn.execute_dict(SQL)
-    if not status:
-        raise ExecuteError(res)
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            raise ExecuteError(res)
+        columns = res['rows']
 
-    all_columns = res['rows']
+    all_columns = columns
     edit_types = {}
     # Add inherited from details from other columns - type, table
     for col in all_columns:
@@ -258,41 +298,31 @@ def get_formatted_columns(conn, tid, data, other_columns,
                     other_col['inheritedfrom']
 
         if with_serial:
-            # Here we assume if a column is serial
-            serial_seq_name = make_object_name(
-                data['name'], col['name'], 'seq')
-            # replace the escaped quotes for comparison
-            defval = (col.get('defval', '') or '').replace("''", "'").\
-                replace('""', '"')
-
-            if serial_seq_name in defval and defval.startswith("nextval('")\
-                    and col['typname'] in ('integer', 'smallint', 'bigint'):
-
-                serial_type = {
-                    'integer': 'serial',
-                    'smallint': 'smallserial',
-                    'bigint': 'bigserial'
-                }[col['typname']]
-
-                col['displaytypname'] = serial_type
-                col['cltype'] = serial_type
-                col['typname'] = serial_type
-                col['defval'] = ''
+            set_serial_column(data['name'], col)
 
     data['columns'] = all_columns
 
     if 'columns' in data and len(data['columns']) > 0:
-        SQL = render_template("/".join([template_path,
-                                        'edit_mode_types_multi.sql']),
-                              type_ids=",".join(map(lambda x: str(x),
-                                                    edit_types.keys())))
-        status, res = conn.execute_2darray(SQL)
-        for row in res['rows']:
-            edit_types[row['main_oid']] = sorted(row['edit_types'])
+        if column_edit_types is None:
+            SQL = render_template("/".join([template_path,
+                                            'edit_mode_types_multi.sql']),
+                                  type_ids=",".join(map(lambda x: str(x),
+                                                        edit_types.keys())))
+            status, res = conn.execute_2darray(SQL)
+            for row in res['rows']:
+                edit_types[row['main_oid']] = sorted(row['edit_types'])
+        else:
+            # The edit types are changed by the formatter, so every table
+            # gets its own copy of them
+            for type_id in edit_types:
+                edit_types[type_id] = list(
+                    column_edit_types.get(type_id, []))
 
         for column in data['columns']:
             column_formatter(conn, tid, column['attnum'], column,
-                             edit_types[column['atttypid']], False)
+                             edit_types[column['atttypid']], False,
+                             acl=None if column_acl is None else
+                             column_acl.get(column['attnum'], []))
 
     return data
 
@@ -459,16 +459,39 @@ class CompoundTriggerView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return True, res
 
-        # Making copy of output for future use
-        data = dict(res['rows'][0])
+        return True, self._format_properties(tid, dict(res['rows'][0]))
+
+    def _format_properties(self, tid, data):
+        """
+        This function formats the properties of the compound trigger.
+        :param tid: Table Id
+        :param data: Properties of the compound trigger
+        :return:
+        """
         if len(data['tgattr']) >= 1:
             columns = ', '.join(data['tgattr'].split(' '))
             data['columns'] = compound_trigger_utils.get_column_details(
                 self.conn, tid, columns)
 
-        data = trigger_definition(data)
+        return trigger_definition(data)
+
+    def _fetch_table_properties(self, tid):
+        """
+        This function returns the properties of all the compound triggers of
+        the table by OID, fetched with one query instead of one per compound
+        trigger. Returns None if they could not be fetched.
+        :param tid:
+        """
+        SQL = render_template("/".join([self.template_path,
+                                        self._PROPERTIES_SQL]),
+                              tid=tid,
+                              datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
 
-        return True, data
+        return dict((row['oid'], self._format_properties(tid, row))
+                    for row in res['rows'])
 
     @check_precondition
     def create(self, gid, sid, did, scid, tid):
@@ -974,10 +997,16 @@ class CompoundTriggerView(PGChildNodeView, SchemaDiffObjectCompare):
                 current_app.logger.error(triggers)
                 return False
 
+            # Properties of the compound triggers of the table, fetched in
+            # bulk
+            properties = self._fetch_table_properties(tid) or dict()
             for row in triggers['rows']:
-                status, data = self._fetch_properties(tid, row['oid'])
-                if status:
-                    res[row['name']] = data
+                data = properties.get(row['oid'])
+                if data is None:
+                    status, data = self._fetch_properties(tid, row['oid'])
+                    if not status:
+                        continue
+                res[row['name']] = data
 
         return res
 
@@ -60,7 +60,8 @@ def get_parent(conn, tid, template_path=None):
 
 
 @get_template_path
-def get_check_constraints(conn, tid, cid=None, template_path=None):
+def get_check_constraints(conn, tid, cid=None, template_path=None,
+                          tids=None):
     """
     This function is used to fetch information of the
     check constraint(s) for the given table.
@@ -68,11 +69,13 @@ def get_check_constraints(conn, tid, cid=None, template_path=None):
     :param tid: Table ID
     :param cid: Check Constraint ID
     :param template_path: Template Path
+    :param tids: Comma separated IDs of the tables, the constraints of
+    which are fetched with the ID of their table instead of the table tid
     :return:
     """
 
     sql = render_template("/".join(
-        [template_path, 'properties.sql']), tid=tid, cid=cid)
+        [template_path, 'properties.sql']), tid=tid, cid=cid, tids=tids)
 
     status, result = conn.execute_dict(sql)
     if not status:
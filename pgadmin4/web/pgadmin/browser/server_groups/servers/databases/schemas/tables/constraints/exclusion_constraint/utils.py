@@ -86,7 +86,8 @@ def _get_columns(res):
 
 
 @get_template_path
-def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None):
+def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None,
+                              tids=None):
     """
     This function is used to fetch information of the
     exclusion constraint(s) for the given table.
@@ -95,10 +96,12 @@ def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None):
     :param tid: Table ID
     :param exid: Exclusion Constraint ID
     :param template_path: Template Path
+    :param tids: Comma separated IDs of the tables, the constraints of
+    which are fetched with the ID of their table instead of the table tid
     :return:
     """
     sql = render_template("/".join([template_path, 'properties.sql']),
-                          did=did, tid=tid, cid=exid)
+                          did=did, tid=tid, cid=exid, tids=tids)
 
     status, result = conn.execute_dict(sql)
     if not status:
@@ -539,6 +539,56 @@ class IndexesView(PGChildNodeView, SchemaDiffObjectCompare):
 
         return True, data
 
+    def _fetch_table_properties(self, did, tid):
+        """
+        This function returns the properties of all the indexes of the table
+        by OID, fetched with one query per kind of property instead of
+        several per index. Returns None if they could not be fetched.
+        :param did:
+        :param tid:
+        """
+        SQL = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]),
+            did=did, tid=tid,
+            datlastsysoid=self._DATABASE_LAST_SYSTEM_OID,
+            show_sys_objects=self.blueprint.show_system_objects
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        templates = [('columns', 'column_details.sql')]
+        if self.manager.version >= 110000:
+            templates.append(('include', 'include_details.sql'))
+
+        details = dict(columns=dict(), include=dict())
+        for kind, template in templates:
+            SQL = render_template("/".join([self.template_path, template]),
+                                  tid=tid)
+            status, rset = self.conn.execute_2darray(SQL)
+            if not status:
+                return None
+
+            for row in rset['rows']:
+                details[kind].setdefault(row['indexrelid'], []).append(row)
+
+        properties = dict()
+        for row in res['rows']:
+            # Add column details of the index
+            data = index_utils.get_column_details(
+                self.conn, row['oid'], dict(row),
+                rows=details['columns'].get(row['oid'], []))
+
+            # Add Include details of the index
+            if self.manager.version >= 110000:
+                data = index_utils.get_include_details(
+                    self.conn, row['oid'], data,
+                    rows=details['include'].get(row['oid'], []))
+
+            properties[row['oid']] = data
+
+        return properties
+
     @staticmethod
     def _check_for_error(required_args, data):
         """
@@ -1072,11 +1122,16 @@ class IndexesView(PGChildNodeView, SchemaDiffObjectCompare):
                 current_app.logger.error(indexes)
                 return False
 
+            # Properties of the indexes of the table, fetched in bulk
+            properties = self._fetch_table_properties(did, tid) or dict()
             for row in indexes['rows']:
-                status, data = self._fetch_properties(did, tid,
-                                                      row['oid'])
-                if status:
-                    res[row['name']] = data
+                data = properties.get(row['oid'])
+                if data is None:
+                    status, data = self._fetch_properties(did, tid,
+                                                          row['oid'])
+                    if not status:
+                        continue
+                res[row['name']] = data
         else:
             status, data = self._fetch_properties(did, tid,
                                                   oid)
@@ -1124,6 +1179,8 @@ class IndexesView(PGChildNodeView, SchemaDiffObjectCompare):
         target = kwargs.get('target')
         comp_status = kwargs.get('comp_status')
         tgt_schema = kwargs.get('target_schema', None)
+        # DDL of the source index saved in a snapshot
+        source_ddl = kwargs.get('source_ddl')
 
         diff = ''
         if comp_status == 'source_only':
@@ -1152,7 +1209,17 @@ class IndexesView(PGChildNodeView, SchemaDiffObjectCompare):
                 diff_dict
             )
 
-            if create_req:
+            if create_req and source_ddl is not None:
+                # The source index of a snapshot is created from its saved
+                # DDL once the target index is dropped.
+                diff = self.get_sql_from_index_diff(sid=tgt_params['sid'],
+                                                    did=tgt_params['did'],
+                                                    scid=tgt_params['scid'],
+                                                    tid=tgt_params['tid'],
+                                                    idx=target['oid'],
+                                                    drop_req=True)
+                diff += source_ddl
+            elif create_req:
                 diff = self.get_sql_from_index_diff(sid=src_params['sid'],
                                                     did=src_params['did'],
                                                     scid=src_params['scid'],
@@ -0,0 +1,130 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    indexes
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.indexes \
+    import IndexesView, utils as index_utils
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+DID = 5
+SCID = 2200
+TID = 16800
+
+INDEXES = [
+    {'oid': 16801, 'name': 'idx_a', 'amname': 'btree', 'indrelid': TID},
+    {'oid': 16802, 'name': 'idx_b', 'amname': 'hash', 'indrelid': TID},
+]
+
+
+def _column(indexrelid, attnum, attdef, **kwargs):
+    row = {
+        'indexrelid': indexrelid, 'attnum': attnum, 'attdef': attdef,
+        'options': ['ASC', 'NULLS LAST'], 'is_exp': False,
+        'statistics': -1, 'opcname': None, 'oprname': None,
+        'collnspname': ''
+    }
+    row.update(kwargs)
+    return row
+
+
+COLUMNS = {
+    16801: [_column(16801, 1, 'a'),
+            _column(16801, 2, '"B"', options=['DESC', 'NULLS FIRST'],
+                    collnspname='pg_catalog."C"')],
+    16802: [_column(16802, 1, 'lower(c)', is_exp=True)],
+}
+INCLUDE = {
+    16801: [{'indexrelid': 16801, 'colname': 'd'}],
+}
+
+
+class _Manager:
+    version = 160000
+
+
+class _Blueprint:
+    show_system_objects = False
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+
+    def __init__(self, bulk_status=True):
+        super().__init__()
+        self.bulk_status = bulk_status
+        self.manager = _Manager()
+
+    def rows(self, template, args):
+        idx = args.get('idx')
+        if template == 'nodes.sql':
+            return [{'oid': i['oid'], 'name': i['name']} for i in INDEXES]
+        if not idx and not self.bulk_status:
+            return None
+
+        if template == 'properties.sql':
+            return [i for i in INDEXES if idx in (None, i['oid'])]
+        kind = COLUMNS if template == 'column_details.sql' else INCLUDE
+        return [row for oid in sorted(kind) for row in kind[oid]
+                if idx in (None, oid)]
+
+
+class IndexesSchemaDiffPropertiesTestCase(BaseTestGenerator):
+    """This class tests the properties of the indexes of a table fetched in
+    bulk for the schema diff."""
+    scenarios = [
+        ('Properties fetched in bulk', dict(bulk_status=True)),
+        ('Properties fetched per index when the bulk fetch fails',
+         dict(bulk_status=False)),
+    ]
+
+    def setUp(self):
+        self.patches = [
+            patch.object(indexes, 'render_template', render_template_name),
+            patch.object(index_utils, 'render_template',
+                         render_template_name),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def _view(self, conn):
+        view = IndexesView.__new__(IndexesView)
+        view.conn = conn
+        view.manager = conn.manager
+        view.blueprint = _Blueprint()
+        view.template_path = 'indexes/sql/#160000#'
+        return view
+
+    def runTest(self):
+        conn = _Connection(self.bulk_status)
+        res = IndexesView.fetch_objects_to_compare.__wrapped__(
+            self._view(conn), 1, DID, SCID, TID)
+
+        view = self._view(_Connection())
+        expected = dict(
+            (i['name'], view._fetch_properties(DID, TID, i['oid'])[1])
+            for i in INDEXES)
+
+        self.assertEqual(res, expected)
+        self.assertEqual(res['idx_a']['columns_csv'],
+                         'a ASC NULLS LAST, "B" COLLATE pg_catalog."C" '
+                         'DESC NULLS FIRST')
+        self.assertEqual(res['idx_a']['include'], ['d'])
+        self.assertEqual(res['idx_b']['include'], [])
+        if self.bulk_status:
+            # Nodes, properties, columns and included columns
+            self.assertEqual(len(conn.queries), 4)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
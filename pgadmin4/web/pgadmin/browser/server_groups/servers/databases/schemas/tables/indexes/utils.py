@@ -89,7 +89,8 @@ def _get_column_property_display_data(row, col_str, data):
 
 
 @get_template_path
-def get_column_details(conn, idx, data, mode='properties', template_path=None):
+def get_column_details(conn, idx, data, mode='properties', template_path=None,
+                       rows=None):
     """
     This functional will fetch list of column for index.
 
@@ -98,18 +99,21 @@ def get_column_details(conn, idx, data, mode='properties', template_path=None):
     :param data: Data
     :param mode: 'create' or 'properties'
     :param template_path: Optional template path
+    :param rows: Optional columns of the index, already fetched
     :return:
     """
 
-    SQL = render_template(
-        "/".join([template_path, 'column_details.sql']), idx=idx
-    )
-    status, rset = conn.execute_2darray(SQL)
+    if rows is None:
+        SQL = render_template(
+            "/".join([template_path, 'column_details.sql']), idx=idx
+        )
+        status, rset = conn.execute_2darray(SQL)
+        if not status:
+            return internal_server_error(errormsg=rset)
+        rows = rset['rows']
+
     # Remove column if duplicate column is present in list.
-    rset['rows'] = [i for n, i in enumerate(rset['rows']) if
-                    i not in rset['rows'][n + 1:]]
-    if not status:
-        return internal_server_error(errormsg=rset)
+    rset = {'rows': [i for n, i in enumerate(rows) if i not in rows[n + 1:]]}
 
     # 'attdef' comes with quotes from query so we need to strip them
     # 'options' we need true/false to render switch ASC(false)/DESC(true)
@@ -156,7 +160,7 @@ def get_column_details(conn, idx, data, mode='properties', template_path=None):
 
 
 @get_template_path
-def get_include_details(conn, idx, data, template_path=None):
+def get_include_details(conn, idx, data, template_path=None, rows=None):
     """
     This functional will fetch list of include details for index
     supported with Postgres 11+
@@ -165,18 +169,21 @@ def get_include_details(conn, idx, data, template_path=None):
     :param idx: Index ID
     :param data: data
     :param template_path: Optional template path
+    :param rows: Optional included columns of the index, already fetched
     :return:
     """
 
-    SQL = render_template(
-        "/".join([template_path, 'include_details.sql']), idx=idx
-    )
-    status, rset = conn.execute_2darray(SQL)
-    if not status:
-        return internal_server_error(errormsg=rset)
+    if rows is None:
+        SQL = render_template(
+            "/".join([template_path, 'include_details.sql']), idx=idx
+        )
+        status, rset = conn.execute_2darray(SQL)
+        if not status:
+            return internal_server_error(errormsg=rset)
+        rows = rset['rows']
 
     # Push as collection
-    data['include'] = [col['colname'] for col in rset['rows']]
+    data['include'] = [col['colname'] for col in rows]
 
     return data
 
@@ -324,8 +324,15 @@ class RowSecurityView(PGChildNodeView):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        data = dict(res['rows'][0])
+        return True, self._format_properties(dict(res['rows'][0]))
 
+    @staticmethod
+    def _format_properties(data):
+        """
+        This function formats the properties of the policy.
+        :param data: Properties of the policy
+        :return:
+        """
         # Remove opening and closing bracket as we already have in jinja
         # template.
         if 'using' in data and data['using'] is not None and \
@@ -336,7 +343,26 @@ class RowSecurityView(PGChildNodeView):
                 data['withcheck'].endswith(')'):
             data['withcheck'] = data['withcheck'][1:-1]
 
-        return True, data
+        return data
+
+    def _fetch_table_properties(self, scid, tid):
+        """
+        This function returns the properties of all the policies of the
+        table by OID, fetched with one query instead of one per policy.
+        Returns None if they could not be fetched.
+        :param scid:
+        :param tid:
+        """
+        sql = render_template("/".join(
+            [self.template_path, self._PROPERTIES_SQL]
+        ), scid=scid, policy_table_id=tid,
+            datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        return dict((row['oid'], self._format_properties(row))
+                    for row in res['rows'])
 
     @check_precondition
     def create(self, gid, sid, did, scid, tid):
@@ -684,11 +710,16 @@ class RowSecurityView(PGChildNodeView):
             if not status:
                 current_app.logger.error(policies)
                 return False
+            # Properties of the policies of the table, fetched in bulk
+            properties = self._fetch_table_properties(scid, tid) or dict()
             for row in policies['rows']:
-                status, data = self._fetch_properties(did, scid, tid,
-                                                      row['oid'])
-                if status:
-                    res[row['name']] = data
+                data = properties.get(row['oid'])
+                if data is None:
+                    status, data = self._fetch_properties(did, scid, tid,
+                                                          row['oid'])
+                    if not status:
+                        continue
+                res[row['name']] = data
         else:
             status, data = self._fetch_properties(did, scid, tid, oid)
             if not status:
@@ -713,6 +744,8 @@ class RowSecurityView(PGChildNodeView):
         target = kwargs.get('target')
         target_schema = kwargs.get('target_schema')
         comp_status = kwargs.get('comp_status')
+        # DDL of the source policy saved in a snapshot
+        source_ddl = kwargs.get('source_ddl')
 
         diff = ''
         if comp_status == 'source_only':
@@ -744,6 +777,11 @@ class RowSecurityView(PGChildNodeView):
                                                     plid=target['oid'],
                                                     drop_req=True)
 
+                # The source policy of a snapshot is created from its
+                # saved DDL.
+                if source_ddl is not None:
+                    return delete_sql + source_ddl.lstrip('\n')
+
                 diff = self.get_sql_from_diff(gid=src_params['gid'],
                                               sid=src_params['sid'],
                                               did=src_params['did'],
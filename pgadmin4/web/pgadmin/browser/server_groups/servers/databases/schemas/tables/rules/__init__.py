@@ -321,6 +321,23 @@ class RuleView(PGChildNodeView, SchemaDiffObjectCompare):
 
         return True, parse_rule_definition(res)
 
+    def _fetch_table_properties(self, tid):
+        """
+        This function returns the properties of all the rules of the table
+        by OID, fetched with one query instead of one per rule. Returns None
+        if they could not be fetched.
+        :param tid:
+        """
+        SQL = render_template("/".join(
+            [self.template_path, self._PROPERTIES_SQL]
+        ), tid=tid, datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        return dict((row['oid'], parse_rule_definition({'rows': [row]}))
+                    for row in res['rows'])
+
     @check_precondition
     def create(self, gid, sid, did, scid, tid):
         """
@@ -663,10 +680,15 @@ class RuleView(PGChildNodeView, SchemaDiffObjectCompare):
                 current_app.logger.error(rules)
                 return False
 
+            # Properties of the rules of the table, fetched in bulk
+            properties = self._fetch_table_properties(tid) or dict()
             for row in rules['rows']:
-                status, data = self._fetch_properties(row['oid'])
-                if status:
-                    res[row['name']] = data
+                data = properties.get(row['oid'])
+                if data is None:
+                    status, data = self._fetch_properties(row['oid'])
+                    if not status:
+                        continue
+                res[row['name']] = data
         return res
 
     def ddl_compare(self, **kwargs):
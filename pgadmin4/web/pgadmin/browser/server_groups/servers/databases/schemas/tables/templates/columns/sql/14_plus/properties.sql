@@ -1,19 +1,24 @@
 WITH INH_TABLES AS
     (SELECT
-     at.attname AS name, ph.inhparent AS inheritedid, ph.inhseqno,
+     at.attname AS name, {% if tids %}ph.inhrelid, {% endif %}ph.inhparent AS inheritedid, ph.inhseqno,
      pg_catalog.concat(nmsp_parent.nspname, '.',parent.relname ) AS inheritedfrom
     FROM
         pg_catalog.pg_attribute at
     JOIN
-        pg_catalog.pg_inherits ph ON ph.inhparent = at.attrelid AND ph.inhrelid = 33896::oid
+        pg_catalog.pg_inherits ph ON ph.inhparent = at.attrelid AND
+{% if tids %}
+        ph.inhrelid IN ({{tids}})
+{% else %}
+        ph.inhrelid = {{tid}}::oid
+{% endif %}
     JOIN
         pg_catalog.pg_class parent ON ph.inhparent  = parent.oid
     JOIN
         pg_catalog.pg_namespace nmsp_parent ON nmsp_parent.oid  = parent.relnamespace
-    GROUP BY at.attname, ph.inhparent, ph.inhseqno, inheritedfrom
+    GROUP BY at.attname, {% if tids %}ph.inhrelid, {% endif %}ph.inhparent, ph.inhseqno, inheritedfrom
     ORDER BY at.attname, ph.inhparent, ph.inhseqno, inheritedfrom
     )
-SELECT DISTINCT ON (att.attnum) att.attname as name, att.atttypid, att.attlen, att.attnum, att.attndims,
+SELECT DISTINCT ON ({% if tids %}att.attrelid, {% endif %}att.attnum) {% if tids %}att.attrelid, {% endif %}att.attname as name, att.atttypid, att.attlen, att.attnum, att.attndims,
 		att.atttypmod, att.attacl, att.attnotnull, att.attoptions, att.attfdwoptions, att.attstattarget,
 		att.attstorage, att.attidentity,
 		pg_catalog.pg_get_expr(def.adbin, def.adrelid) AS defval,
@@ -49,7 +54,14 @@ FROM pg_catalog.pg_attribute att
   LEFT OUTER JOIN pg_catalog.pg_sequence seq ON cs.oid=seq.seqrelid
   LEFT OUTER JOIN pg_catalog.pg_class tab on tab.oid = att.attrelid
   LEFT OUTER join INH_TABLES as INH ON att.attname = INH.name
+{% if tids %}
+    AND INH.inhrelid = att.attrelid
+{% endif %}
+{% if tids %}
+WHERE att.attrelid IN ({{tids}})
+{% else %}
 WHERE att.attrelid = {{tid}}::oid
+{% endif %}
 {% if clid %}
     AND att.attnum = {{clid}}::int
 {% endif %}
@@ -58,4 +70,4 @@ WHERE att.attrelid = {{tid}}::oid
     AND att.attnum > 0
 {% endif %}
     AND att.attisdropped IS FALSE
-    ORDER BY att.attnum;
+    ORDER BY {% if tids %}att.attrelid, {% endif %}att.attnum;
@@ -1,11 +1,13 @@
-SELECT 'attacl' as deftype,
+{### The privileges of all the columns of the tables are fetched with their
+    table OID and column number when a list of tables is given ###}
+SELECT {% if tids %}d.attrelid, d.attnum, {% endif %}'attacl' as deftype,
     COALESCE(gt.rolname, 'PUBLIC') grantee,
     g.rolname grantor,
     pg_catalog.array_agg(privilege_type order by privilege_type) as privileges,
     pg_catalog.array_agg(is_grantable) as grantable
 FROM
   (SELECT
-    d.grantee, d.grantor, d.is_grantable,
+    {% if tids %}d.attrelid, d.attnum, {% endif %}d.grantee, d.grantor, d.is_grantable,
     CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -22,6 +24,14 @@ FROM
         ELSE 'UNKNOWN'
     END AS privilege_type
   FROM
+{% if tids %}
+    (SELECT a.attrelid, a.attnum, (d).grantee AS grantee, (d).grantor AS grantor,
+        (d).is_grantable AS is_grantable, (d).privilege_type AS privilege_type
+        FROM (SELECT att.attrelid, att.attnum, pg_catalog.aclexplode(attacl) as d
+            FROM pg_catalog.pg_attribute att
+            WHERE att.attrelid IN ({{ tids }})
+            AND att.attacl IS NOT NULL) a) d
+{% else %}
     (SELECT attacl
         FROM pg_catalog.pg_attribute att
         WHERE att.attrelid = {{tid}}::oid
@@ -32,8 +42,9 @@ FROM
         pg_catalog.aclexplode(attacl) as d FROM pg_catalog.pg_attribute att
         WHERE att.attrelid = {{tid}}::oid
         AND att.attnum = {{clid}}::int) a) d
+{% endif %}
     ) d
   LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
   LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
-GROUP BY g.rolname, gt.rolname
-ORDER BY grantee
+GROUP BY {% if tids %}d.attrelid, d.attnum, {% endif %}g.rolname, gt.rolname
+ORDER BY {% if tids %}d.attrelid, d.attnum, {% endif %}grantee
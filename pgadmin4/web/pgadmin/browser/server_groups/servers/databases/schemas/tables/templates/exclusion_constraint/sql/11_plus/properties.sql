@@ -1,4 +1,4 @@
-SELECT cls.oid,
+SELECT {% if tids %}idx.indrelid, {% endif %}cls.oid,
     cls.relname as name,
     indnkeyatts as col_count,
     amname,
@@ -25,9 +25,13 @@ LEFT JOIN pg_catalog.pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid
 LEFT OUTER JOIN pg_catalog.pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
 LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=cls.oid AND des.classoid='pg_class'::regclass)
 LEFT OUTER JOIN pg_catalog.pg_description desp ON (desp.objoid=con.oid AND desp.objsubid = 0 AND desp.classoid='pg_constraint'::regclass)
+{% if tids %}
+WHERE indrelid IN ({{tids}})
+{% else %}
 WHERE indrelid = {{tid}}::oid
+{% endif %}
 {% if cid %}
 AND cls.oid = {{cid}}::oid
 {% endif %}
 AND contype='x'
-ORDER BY cls.relname
+ORDER BY {% if tids %}idx.indrelid, {% endif %}cls.relname
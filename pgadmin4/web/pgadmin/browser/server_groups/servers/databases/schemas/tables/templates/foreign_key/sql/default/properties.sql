@@ -1,4 +1,4 @@
-SELECT ct.oid,
+SELECT {% if tids %}ct.conrelid, {% endif %}ct.oid,
       conname as name,
       condeferrable,
       condeferred,
@@ -26,7 +26,11 @@ JOIN pg_catalog.pg_class cr ON cr.oid=confrelid
 JOIN pg_catalog.pg_namespace nr ON nr.oid=cr.relnamespace
 LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=ct.oid AND des.classoid='pg_constraint'::regclass)
 WHERE contype='f' AND
+{% if tids %}
+conrelid IN ({{tids}})
+{% else %}
 conrelid = {{tid}}::oid
+{% endif %}
 {% if cid %}
 AND ct.oid = {{cid}}::oid
 {% endif %}
@@ -1,16 +1,22 @@
+{### The included columns of all the indexes of the table are fetched when no
+    index id is given ###}
 -- pg_get_indexdef did not support INCLUDE columns
 
-SELECT a.attname as colname
+SELECT {% if not idx %}i.indexrelid, {% endif %}a.attname as colname
 FROM (
     SELECT
-      i.indnkeyatts,
+      {% if not idx %}i.indexrelid, {% endif %}i.indnkeyatts,
       i.indrelid,
       pg_catalog.unnest(indkey) AS table_colnum,
       pg_catalog.unnest(ARRAY(SELECT pg_catalog.generate_series(1, i.indnatts) AS n)) attnum
     FROM
       pg_catalog.pg_index i
+{% if idx %}
     WHERE i.indexrelid = {{idx}}::OID
+{% else %}
+    WHERE i.indrelid = {{tid}}::OID
+{% endif %}
 ) i JOIN pg_catalog.pg_attribute a
 ON (a.attrelid = i.indrelid AND i.table_colnum = a.attnum)
 WHERE i.attnum > i.indnkeyatts
-ORDER BY i.attnum
+ORDER BY {% if not idx %}i.indexrelid, {% endif %}i.attnum
@@ -1,3 +1,5 @@
+{### The columns of all the indexes of the table are fetched when no
+    index id is given ###}
 SELECT
     i.indexrelid,
     CASE i.indoption[i.attnum - 1]
@@ -22,7 +24,11 @@ FROM (
           pg_catalog.unnest(ARRAY(SELECT pg_catalog.generate_series(1, i.indnatts) AS n)) AS attnum
       FROM
           pg_catalog.pg_index i
-      WHERE i.indexrelid = {{idx}}::OID
+  {% if idx %}
+    WHERE i.indexrelid = {{idx}}::OID
+{% else %}
+    WHERE i.indrelid = {{tid}}::OID
+{% endif %}
 ) i
     LEFT JOIN pg_catalog.pg_opclass o ON (o.oid = i.indclass[i.attnum - 1])
     LEFT OUTER JOIN pg_catalog.pg_constraint c ON (c.conindid = i.indexrelid)
@@ -30,4 +36,4 @@ FROM (
     LEFT JOIN pg_catalog.pg_attribute a ON (a.attrelid = i.indexrelid AND a.attnum = i.attnum)
     LEFT OUTER JOIN pg_catalog.pg_collation coll ON a.attcollation=coll.oid
     LEFT OUTER JOIN pg_catalog.pg_namespace nspc ON coll.collnamespace=nspc.oid
-ORDER BY i.attnum;
+ORDER BY {% if not idx %}i.indexrelid, {% endif %}i.attnum;
@@ -18,6 +18,10 @@ LEFT JOIN pg_catalog.pg_description des ON des.objoid = pl.oid AND des.classoid
 WHERE
 {% if plid %}
       pl.oid = {{ plid }} and n.oid = {{ scid }} and rel.oid = {{ policy_table_id }};
+{% elif policy_table_id %}
+{### The policies of the table are fetched at once without a policy id ###}
+      pl.polrelid = {{ policy_table_id }} and n.oid = {{ scid }} and rel.oid = {{ policy_table_id }}
+ORDER BY pl.polname;
 {% endif %}
 {% if tid %}
       pl.polrelid = {{ tid }};
@@ -1,9 +1,11 @@
 {### SQL to fetch privileges for tablespace ###}
-SELECT 'relacl' as deftype, COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor,
+{### The privileges of all the tables of the schema are fetched with their OID
+    when no table id is given ###}
+SELECT 'relacl' as deftype, {% if not tid %}d.oid, {% endif %}COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor,
     pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
 FROM
   (SELECT
-    d.grantee, d.grantor, d.is_grantable,
+    {% if not tid %}d.oid, {% endif %}d.grantee, d.grantor, d.is_grantable,
     CASE d.privilege_type
 		WHEN 'CONNECT' THEN 'c'
 		WHEN 'CREATE' THEN 'C'
@@ -21,6 +23,7 @@ FROM
 		ELSE 'UNKNOWN'
 	END AS privilege_type
   FROM
+{% if tid %}
     (SELECT rel.relacl
         FROM pg_catalog.pg_class rel
           LEFT OUTER JOIN pg_catalog.pg_tablespace spc on spc.oid=rel.reltablespace
@@ -30,19 +33,22 @@ FROM
         WHERE rel.relkind IN ('r','s','t','p') AND rel.relnamespace = {{ scid }}::oid
             AND rel.oid = {{ tid }}::oid
     ) acl,
-    (SELECT (d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
+{% endif %}
+    (SELECT {% if not tid %}oid, {% endif %}(d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
         AS is_grantable, (d).privilege_type AS privilege_type FROM (SELECT
-        aclexplode(rel.relacl) as d
+        {% if not tid %}rel.oid, {% endif %}aclexplode(rel.relacl) as d
         FROM pg_catalog.pg_class rel
           LEFT OUTER JOIN pg_catalog.pg_tablespace spc on spc.oid=rel.reltablespace
           LEFT OUTER JOIN pg_catalog.pg_constraint con ON con.conrelid=rel.oid AND con.contype='p'
           LEFT OUTER JOIN pg_catalog.pg_class tst ON tst.oid = rel.reltoastrelid
           LEFT JOIN pg_catalog.pg_type typ ON rel.reloftype=typ.oid
         WHERE rel.relkind IN ('r','s','t','p') AND rel.relnamespace = {{ scid }}::oid
+{% if tid %}
             AND rel.oid = {{ tid }}::oid
+{% endif %}
         ) a ORDER BY privilege_type) d
     ) d
   LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
   LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
-GROUP BY g.rolname, gt.rolname
-ORDER BY grantee
+GROUP BY {% if not tid %}d.oid, {% endif %}g.rolname, gt.rolname
+ORDER BY {% if not tid %}d.oid, {% endif %}grantee
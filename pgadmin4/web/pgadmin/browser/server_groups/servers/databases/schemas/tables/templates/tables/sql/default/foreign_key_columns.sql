@@ -0,0 +1,7 @@
+SELECT ct.oid, a1.attname AS conattname, a2.attname AS confattname
+FROM pg_catalog.pg_constraint ct
+    CROSS JOIN LATERAL ROWS FROM (pg_catalog.unnest(ct.conkey), pg_catalog.unnest(ct.confkey)) WITH ORDINALITY AS k(conkey, confkey, n)
+    JOIN pg_catalog.pg_attribute a1 ON (a1.attrelid = ct.conrelid AND a1.attnum = k.conkey)
+    JOIN pg_catalog.pg_attribute a2 ON (a2.attrelid = ct.confrelid AND a2.attnum = k.confkey)
+WHERE ct.contype = 'f' AND ct.conrelid IN ({{ tids }})
+ORDER BY ct.oid, k.n;
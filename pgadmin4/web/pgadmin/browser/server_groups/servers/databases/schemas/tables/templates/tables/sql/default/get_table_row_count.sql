@@ -1 +1,12 @@
+{### The row counts of several tables are fetched with their OID when a list
+    of tables is given ###}
+{% if data %}
 SELECT COUNT(*)::text FROM {{ conn|qtIdent(data.schema, data.name) }};
+{% else %}
+{% for tbl in tables %}
+SELECT {{ tbl.oid }}::oid AS oid, COUNT(*)::text AS rows_cnt FROM {{ conn|qtIdent(tbl.schema, tbl.name) }}
+{% if not loop.last %}
+UNION ALL
+{% endif %}
+{% endfor %}
+{% endif %}
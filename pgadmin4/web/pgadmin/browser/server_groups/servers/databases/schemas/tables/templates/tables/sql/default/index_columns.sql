@@ -0,0 +1,9 @@
+SELECT idx.indrelid, idx.indexrelid AS oid, cls.relname AS idxname,
+    pg_catalog.pg_get_indexdef(idx.indexrelid, col.n, true) AS column,
+    att.attname AS colname
+FROM pg_catalog.pg_index idx
+    JOIN pg_catalog.pg_class cls ON cls.oid = idx.indexrelid
+    CROSS JOIN LATERAL pg_catalog.generate_series(1, idx.indnatts) AS col(n)
+    LEFT OUTER JOIN pg_catalog.pg_attribute att ON (att.attrelid = idx.indrelid AND att.attnum = idx.indkey[col.n - 1])
+WHERE idx.indrelid IN ({{ tids }})
+ORDER BY idx.indrelid, cls.relname, col.n;
@@ -0,0 +1,327 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables \
+    import utils as tables_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables \
+    import TableView
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+SCID = 2200
+ROW_COUNT_THRESHOLD = 2000
+
+
+def _table(oid, name, reltuples, **kwargs):
+    row = {
+        'oid': oid, 'name': name, 'schema': 'public', 'reltuples': reltuples,
+        'reloptions': None, 'toast_reloptions': None, 'seclabels': None,
+        'typoid': None, 'coll_inherits': [], 'is_partitioned': False,
+        'partition_scheme': '', 'rlspolicy': False, 'forcerlspolicy': False,
+        'autovacuum_enabled': None, 'toast_autovacuum_enabled': None
+    }
+    for prefix in ('', 'toast_'):
+        for name_ in ('vacuum_threshold', 'vacuum_scale_factor',
+                      'analyze_threshold', 'analyze_scale_factor',
+                      'vacuum_cost_delay', 'vacuum_cost_limit',
+                      'freeze_min_age', 'freeze_max_age',
+                      'freeze_table_age'):
+            row[prefix + 'autovacuum_' + name_] = None
+    row.update(kwargs)
+    return row
+
+
+def _column(tid, attnum, name, typname='integer', atttypid=23, **kwargs):
+    col = {'attrelid': tid, 'attnum': attnum, 'name': name,
+           'atttypid': atttypid, 'typname': typname, 'cltype': typname,
+           'displaytypname': typname, 'defval': None, 'attoptions': None,
+           'seclabels': None, 'attfdwoptions': '',
+           'typnspname': 'pg_catalog', 'isdup': False, 'attndims': 0,
+           'atttypmod': -1, 'elemoid': atttypid}
+    col.update(kwargs)
+    return col
+
+
+def _acl(**kwargs):
+    row = {'grantee': 'app', 'grantor': 'postgres', 'privileges': ['r'],
+           'grantable': [False]}
+    row.update(kwargs)
+    return row
+
+
+TABLES = [
+    _table(16400, 'customers', 10, autovacuum_vacuum_threshold='50',
+           reloptions=['autovacuum_vacuum_threshold=50']),
+    _table(16410, 'orders', 5000, rlspolicy='true'),
+    _table(16420, 'empty', 0),
+]
+TABLE_ACL = [
+    _acl(oid=16400, deftype='relacl'),
+]
+COLUMNS = [
+    _column(16400, 1, 'id', defval="nextval('customers_id_seq'::regclass)"),
+    _column(16400, 2, 'email', 'text', 25),
+    _column(16410, 1, 'id'),
+    _column(16410, 2, 'customer_id'),
+    _column(16410, 3, 'during', 'tsrange', 3908),
+]
+COLUMN_ACL = [
+    _acl(attrelid=16400, attnum=2, deftype='attacl'),
+]
+INDEX_COLUMNS = [
+    {'indrelid': 16400, 'oid': 16401, 'idxname': 'customers_email_key',
+     'column': 'email', 'colname': 'email'},
+    {'indrelid': 16400, 'oid': 16401, 'idxname': 'customers_email_key',
+     'column': 'id', 'colname': 'id'},
+    {'indrelid': 16400, 'oid': 16402, 'idxname': 'customers_pkey',
+     'column': 'id', 'colname': 'id'},
+    {'indrelid': 16410, 'oid': 16411, 'idxname': 'orders_customer_id_idx',
+     'column': 'customer_id', 'colname': 'customer_id'},
+    {'indrelid': 16410, 'oid': 16412, 'idxname': 'orders_during_excl',
+     'column': 'during', 'colname': 'during'},
+]
+INDEX_CONSTRAINTS = {
+    'p': [{'indrelid': 16400, 'oid': 16402, 'name': 'customers_pkey',
+           'col_count': 1, 'conislocal': True}],
+    'u': [{'indrelid': 16400, 'oid': 16401, 'name': 'customers_email_key',
+           'col_count': 1, 'conislocal': True}],
+}
+FOREIGN_KEYS = [
+    {'conrelid': 16410, 'oid': 16413, 'name': 'orders_customer_id_fkey',
+     'confrelid': 16400, 'conkey': [2], 'confkey': [1], 'refnsp': 'public',
+     'reftab': 'customers', 'conislocal': True},
+]
+FOREIGN_KEY_COLUMNS = [
+    {'oid': 16413, 'conattname': 'customer_id', 'confattname': 'id'},
+]
+CHECK_CONSTRAINTS = [
+    {'conrelid': 16400, 'oid': 16403, 'name': 'email_check',
+     'consrc': "email <> ''::text", 'conislocal': True},
+]
+EXCLUSION_CONSTRAINTS = [
+    {'indrelid': 16410, 'oid': 16412, 'name': 'orders_during_excl',
+     'col_count': 1, 'amname': 'gist'},
+]
+EXCLUSION_COLUMNS = [
+    {'coldef': 'during', 'opcname': 'range_ops', 'options': 0,
+     'oprname': '&&', 'datatype': 'tsrange', 'is_exp': False},
+]
+EDIT_TYPES = [
+    {'main_oid': 23, 'edit_types': ['numeric', 'bigint']},
+    {'main_oid': 25, 'edit_types': ['character varying']},
+]
+
+
+def _by_table(rows, key, args):
+    """Rows of the table tid, or of the tables tids with their OID."""
+    if args.get('tids'):
+        tids = [int(tid) for tid in args['tids'].split(',')]
+        return [row for row in rows if row[key] in tids]
+    return [dict((k, v) for k, v in row.items() if k != key)
+            for row in rows if row[key] == args['tid']]
+
+
+class _Manager:
+    version = 170000
+    server_type = 'pg'
+    sid = 1
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+    manager = _Manager()
+
+    def __init__(self, bulk_status=True):
+        super().__init__()
+        self.bulk_status = bulk_status
+
+    def execute_scalar(self, query):
+        self.queries.append(query)
+        return True, '12'
+
+    def rows(self, template, args):
+        node, template = template
+        if template == 'nodes.sql':
+            return [{'oid': t['oid'], 'name': t['name']} for t in TABLES]
+        if template == 'edit_mode_types_multi.sql':
+            type_ids = [int(t) for t in args['type_ids'].split(',')]
+            return [r for r in EDIT_TYPES if r['main_oid'] in type_ids]
+        if template == 'get_parent.sql':
+            table = [t for t in TABLES if t['oid'] == args['tid']][0]
+            return [{'schema': table['schema'], 'table': table['name']}]
+        if args.get('tids') and not self.bulk_status:
+            return None
+
+        if node == 'tables' and template == 'properties.sql':
+            return [t for t in TABLES if args.get('tid') in (None, t['oid'])]
+        if node == 'tables' and template == 'acl.sql':
+            if args.get('tid'):
+                return _by_table(TABLE_ACL, 'oid', args)
+            return TABLE_ACL
+        if template == 'get_table_row_count.sql':
+            return [{'oid': t['oid'], 'rows_cnt': '12'}
+                    for t in args['tables']]
+        if node == 'columns' and template == 'properties.sql':
+            return _by_table(COLUMNS, 'attrelid', args)
+        if node == 'columns' and template == 'acl.sql':
+            if args.get('tids'):
+                return _by_table(COLUMN_ACL, 'attrelid', args)
+            return [dict((k, v) for k, v in row.items()
+                         if k not in ('attrelid', 'attnum'))
+                    for row in COLUMN_ACL if row['attrelid'] == args['tid'] and
+                    row['attnum'] == args['clid']]
+        if template == 'index_columns.sql':
+            return _by_table(INDEX_COLUMNS, 'indrelid', args)
+        if node == 'index_constraint' and template == 'properties.sql':
+            return _by_table(INDEX_CONSTRAINTS[args['constraint_type']],
+                             'indrelid', args)
+        if node == 'index_constraint':
+            cols = [col for col in INDEX_COLUMNS if col['oid'] == args['cid']]
+            if template == 'get_constraint_cols.sql':
+                return cols[:args['colcnt']]
+            return cols[1:] if args['cid'] == 16401 else []
+        if node == 'foreign_key' and template == 'properties.sql':
+            return _by_table(FOREIGN_KEYS, 'conrelid', args)
+        if template == 'foreign_key_columns.sql':
+            fk_oids = [fk['oid'] for fk in _by_table(FOREIGN_KEYS,
+                                                     'conrelid', args)]
+            return [r for r in FOREIGN_KEY_COLUMNS if r['oid'] in fk_oids]
+        if node == 'foreign_key' and template == 'get_constraint_cols.sql':
+            return [dict((k, v) for k, v in r.items() if k != 'oid')
+                    for r in FOREIGN_KEY_COLUMNS]
+        if node == 'foreign_key' and template == 'get_constraints.sql':
+            return [{'oid': oid, 'idxname': cols[0]['idxname'],
+                     'col_count': len(cols)}
+                    for oid, cols in self._indexes(args['tid']).items()]
+        if node == 'foreign_key' and template == 'get_cols.sql':
+            return [col for col in INDEX_COLUMNS if col['oid'] == args['cid']]
+        if node == 'check_constraint':
+            return _by_table(CHECK_CONSTRAINTS, 'conrelid', args)
+        if node == 'exclusion_constraint' and template == 'properties.sql':
+            return _by_table(EXCLUSION_CONSTRAINTS, 'indrelid', args)
+        if template == 'get_constraint_cols.sql':
+            return EXCLUSION_COLUMNS
+        return []
+
+    @staticmethod
+    def _indexes(tid):
+        indexes = dict()
+        for col in INDEX_COLUMNS:
+            if col['indrelid'] == tid:
+                indexes.setdefault(col['oid'], []).append(col)
+        return indexes
+
+
+def _render_template(path, **kwargs):
+    """render_template_name, with the node the template belongs to."""
+    template, kwargs = render_template_name(path, **kwargs)
+    return (path.split('/')[0], template), kwargs
+
+
+class _Preference:
+    def get(self):
+        return ROW_COUNT_THRESHOLD
+
+
+class _Preferences:
+    @staticmethod
+    def module(name):
+        return _Preferences()
+
+    def preference(self, name):
+        return _Preference()
+
+
+class TablesSchemaDiffPropertiesTestCase(BaseTestGenerator):
+    """This class tests the properties of the tables fetched in bulk for
+    the schema diff."""
+    scenarios = [
+        ('Properties fetched in bulk', dict(bulk_status=True)),
+        ('Properties fetched per table when the bulk fetch fails',
+         dict(bulk_status=False)),
+    ]
+
+    def setUp(self):
+        self.patches = [patch.object(tables_utils, 'Preferences',
+                                     _Preferences)]
+        for module in ('', 'columns.', 'constraints.index_constraint.',
+                       'constraints.foreign_key.',
+                       'constraints.check_constraint.',
+                       'constraints.exclusion_constraint.'):
+            self.patches.append(patch(
+                'pgadmin.browser.server_groups.servers.databases.schemas.'
+                'tables.' + module + 'utils.render_template',
+                _render_template))
+        for p in self.patches:
+            p.start()
+
+    def _view(self, conn):
+        view = TableView.__new__(TableView)
+        view.conn = conn
+        view.manager = conn.manager
+        view.table_template_path = 'tables/sql/#170000#'
+        view.column_template_path = 'columns/sql/#170000#'
+        # The indexes, triggers, rules and policies are compared by their
+        # own nodes
+        view.tables_sub_modules = []
+        view.fetch_default_vacuum_settings = \
+            lambda conn, sid, type: [{'name': 'autovacuum_vacuum_threshold',
+                                      'value': None}]
+        return view
+
+    def runTest(self):
+        conn = _Connection(self.bulk_status)
+        view = self._view(conn)
+        res = TableView.fetch_tables.__wrapped__(
+            view, 1, 1, SCID, with_serial_cols=True)
+
+        view = self._view(_Connection())
+        expected = dict()
+        for table in TABLES:
+            status, data = view._fetch_table_properties(1, SCID,
+                                                        table['oid'])
+            expected[table['name']] = tables_utils.BaseTableView.properties(
+                view, 0, 1, 1, SCID, table['oid'], res=data,
+                with_serial_cols=True, return_ajax_response=False)
+
+        self.assertEqual(res, expected)
+
+        customers, orders = res['customers'], res['orders']
+        self.assertEqual(customers['rows_cnt'], '12')
+        self.assertEqual(orders['rows_cnt'], '2000+')
+        self.assertEqual(res['empty']['rows_cnt'], 0)
+        self.assertEqual(len(customers['acl']), 1)
+        self.assertEqual(len(customers['relacl']), 1)
+        self.assertEqual(customers['columns'][0]['cltype'], 'serial')
+        self.assertEqual(customers['columns'][0]['edit_types'],
+                         ['bigint', 'numeric', 'serial'])
+        self.assertEqual(len(customers['columns'][1]['attacl']), 1)
+        self.assertEqual(orders['columns'][1]['edit_types'],
+                         ['bigint', 'integer', 'integer', 'numeric'])
+        self.assertEqual(customers['unique_constraint'][0]['include'],
+                         ['id'])
+        self.assertEqual(len(customers['check_constraint']), 1)
+        self.assertEqual(orders['foreign_key'][0]['coveringindex'],
+                         'orders_customer_id_idx')
+        self.assertEqual(orders['exclude_constraint'][0]['columns'][0]
+                         ['column'], 'during')
+        if self.bulk_status:
+            # Nodes, properties, privileges, then row counts, columns,
+            # column privileges, edit types, index columns, primary keys,
+            # unique constraints, foreign keys, their columns, check and
+            # exclusion constraints, and the columns and the included
+            # columns of the exclusion constraint
+            self.assertEqual(len(conn.queries), 16)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
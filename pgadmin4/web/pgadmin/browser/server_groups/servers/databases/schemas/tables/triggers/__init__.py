@@ -547,15 +547,42 @@ class TriggerView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
-        # Making copy of output for future use
-        data = dict(res['rows'][0])
+        return True, self._format_properties(tid, dict(res['rows'][0]),
+                                             without_schema)
+
+    def _format_properties(self, tid, data, without_schema=False):
+        """
+        This function formats the properties of the trigger.
+        :param tid: Table Id
+        :param data: Properties of the trigger
+        :param without_schema:
+        :return:
+        """
         data = trigger_utils.get_trigger_function_and_columns(
             self.conn, data, tid, self.blueprint.show_system_objects,
             without_schema)
 
-        data = trigger_definition(data)
+        return trigger_definition(data)
+
+    def _fetch_table_properties(self, tid, without_schema=False):
+        """
+        This function returns the properties of all the triggers of the
+        table by OID, fetched with one query instead of one per trigger.
+        Returns None if they could not be fetched.
+        :param tid:
+        :param without_schema:
+        """
+        SQL = render_template("/".join([self.template_path,
+                                        self._PROPERTIES_SQL]),
+                              tid=tid,
+                              datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
 
-        return True, data
+        return dict(
+            (row['oid'], self._format_properties(tid, row, without_schema))
+            for row in res['rows'])
 
     @check_precondition
     def create(self, gid, sid, did, scid, tid):
@@ -1045,11 +1072,17 @@ class TriggerView(PGChildNodeView, SchemaDiffObjectCompare):
             without_schema = (
                 SchemaDiffRegistry.get_schema_diff_compare_mode() ==
                 'Schema Objects')
+            # Properties of the triggers of the table, fetched in bulk
+            properties = \
+                self._fetch_table_properties(tid, without_schema) or dict()
             for row in triggers['rows']:
-                status, data = self._fetch_properties(tid, row['oid'],
-                                                      without_schema)
-                if status:
-                    res[row['name']] = data
+                data = properties.get(row['oid'])
+                if data is None:
+                    status, data = self._fetch_properties(tid, row['oid'],
+                                                          without_schema)
+                    if not status:
+                        continue
+                res[row['name']] = data
 
         return res
 
@@ -27,6 +27,7 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils.exception import ExecuteError
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     columns import utils as column_utils
@@ -50,6 +51,10 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import VacuumSettings
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 
+# Number of tables of which the columns and the constraints are fetched at
+# a time for the schema diff
+COMPARE_TABLES_CHUNK_SIZE = 500
+
 
 class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
     """
@@ -165,12 +170,15 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
 
         return wrap
 
-    def _formatter(self, did, scid, tid, data, with_serial_cols=False):
+    def _formatter(self, did, scid, tid, data, with_serial_cols=False,
+                   **kwargs):
         """
         Args:
             data: dict of query result
             scid: schema oid
             tid: table oid
+            kwargs: privileges, columns and constraints of the table
+                already fetched with the other tables of the schema
 
         Returns:
             It will return formatted output of query result
@@ -186,12 +194,14 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             data['seclabels'] = seclabels
 
         # We need to parse & convert ACL coming from database to json format
-        sql = render_template("/".join([self.table_template_path,
-                                        self._ACL_SQL]),
-                              tid=tid, scid=scid)
-        status, acl = self.conn.execute_dict(sql)
-        if not status:
-            return internal_server_error(errormsg=acl)
+        acl = kwargs.get('acl')
+        if acl is None:
+            sql = render_template("/".join([self.table_template_path,
+                                            self._ACL_SQL]),
+                                  tid=tid, scid=scid)
+            status, acl = self.conn.execute_dict(sql)
+            if not status:
+                return internal_server_error(errormsg=acl)
 
         BaseTableView._set_privileges_for_properties(data, acl)
 
@@ -233,12 +243,14 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
 
         # We will fetch all the columns for the table using
         # columns properties.sql, so we need to set template path
-        data = column_utils.get_formatted_columns(self.conn, tid,
-                                                  data, other_columns,
-                                                  table_or_type,
-                                                  with_serial=with_serial_cols)
+        data = column_utils.get_formatted_columns(
+            self.conn, tid, data, other_columns, table_or_type,
+            with_serial=with_serial_cols, columns=kwargs.get('columns'),
+            column_acl=kwargs.get('column_acl'),
+            column_edit_types=kwargs.get('column_edit_types'))
 
-        self._add_constrints_to_output(data, did, tid)
+        self._add_constrints_to_output(data, did, tid,
+                                       kwargs.get('constraints'))
 
         return data
 
@@ -280,43 +292,53 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             else:
                 data[row['deftype']] = [priv]
 
-    def _add_constrints_to_output(self, data, did, tid):
+    def _add_constrints_to_output(self, data, did, tid, constraints=None):
         # Here we will add constraint in our output
+        if constraints is None:
+            constraints = self._get_table_constraints(did, tid)
+
+        data['primary_key'] = []
+        data['unique_constraint'] = []
+        for key, rows in constraints.items():
+            for cons in rows:
+                # Exclusion constraints are not inherited by the partitions
+                if key == 'exclude_constraint' or not self.\
+                        _is_partition_and_constraint_inherited(cons, data):
+                    data.setdefault(key, []).append(cons)
+
+    def _get_table_constraints(self, did, tid):
+        """
+        This function will return the constraints of the table by the key
+        they are added with to the output, leaving out the keys of the
+        constraints which could not be fetched.
+        """
+        constraints = dict()
         index_constraints = {
             'p': 'primary_key', 'u': 'unique_constraint'
         }
         for ctype in index_constraints.keys():
-            data[index_constraints[ctype]] = []
-            status, constraints = \
+            status, rows = \
                 idxcons_utils.get_index_constraints(self.conn, did, tid, ctype)
             if status:
-                for cons in constraints:
-                    if not self.\
-                            _is_partition_and_constraint_inherited(cons, data):
-                        data.setdefault(
-                            index_constraints[ctype], []).append(cons)
+                constraints[index_constraints[ctype]] = rows
 
         # Add Foreign Keys
-        status, foreign_keys = fkey_utils.get_foreign_keys(self.conn, tid)
+        status, rows = fkey_utils.get_foreign_keys(self.conn, tid)
         if status:
-            for fk in foreign_keys:
-                if not self._is_partition_and_constraint_inherited(fk, data):
-                    data.setdefault('foreign_key', []).append(fk)
+            constraints['foreign_key'] = rows
 
         # Add Check Constraints
-        status, check_constraints = \
-            check_utils.get_check_constraints(self.conn, tid)
+        status, rows = check_utils.get_check_constraints(self.conn, tid)
         if status:
-            for cc in check_constraints:
-                if not self._is_partition_and_constraint_inherited(cc, data):
-                    data.setdefault('check_constraint', []).append(cc)
+            constraints['check_constraint'] = rows
 
         # Add Exclusion Constraint
-        status, exclusion_constraints = \
+        status, rows = \
             exclusion_utils.get_exclusion_constraints(self.conn, did, tid)
         if status:
-            for ex in exclusion_constraints:
-                data.setdefault('exclude_constraint', []).append(ex)
+            constraints['exclude_constraint'] = rows
+
+        return constraints
 
     @staticmethod
     def _is_partition_and_constraint_inherited(constraint, data):
@@ -524,25 +546,289 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             if not status:
                 return False, tables
 
+            # Properties of the tables of the schema, fetched in bulk
+            properties = self._fetch_tables_to_compare(
+                did, scid, [row['oid'] for row in tables['rows']])
+
             for row in tables['rows']:
-                status, data = \
-                    self._fetch_table_properties(did, scid, row['oid'])
-
-                if status:
-                    data = BaseTableView.properties(
-                        self, 0, sid, did, scid, row['oid'], res=data,
-                        with_serial_cols=with_serial_cols,
-                        return_ajax_response=False
-                    )
+                prefetched = properties.get(row['oid'], dict())
+                data = prefetched.pop('res', None)
+                if data is None:
+                    status, data = \
+                        self._fetch_table_properties(did, scid, row['oid'])
+                    if not status:
+                        continue
+
+                data = BaseTableView.properties(
+                    self, 0, sid, did, scid, row['oid'], res=data,
+                    with_serial_cols=with_serial_cols,
+                    return_ajax_response=False, prefetched=prefetched
+                )
 
-                    # Get sub module data of a specified table for object
-                    # comparison
-                    BaseTableView._get_sub_module_data_for_compare(
-                        self, sid, did, scid, data, row)
-                    res[row['name']] = data
+                # Get sub module data of a specified table for object
+                # comparison
+                BaseTableView._get_sub_module_data_for_compare(
+                    self, sid, did, scid, data, row)
+                res[row['name']] = data
 
             return True, res
 
+    def _fetch_tables_to_compare(self, did, scid, tids):
+        """
+        This function will fetch the properties of the given tables of the
+        schema with a few queries for all of them, and will return the
+        properties and the data fetched for their formatting by table oid.
+        The tables of a chunk which could not be fetched are left out, so
+        that they are fetched one by one.
+        """
+        sql = render_template(
+            "/".join([self.table_template_path, self._PROPERTIES_SQL]),
+            did=did, scid=scid, schema_diff=True,
+            datlastsysoid=self._DATABASE_LAST_SYSTEM_OID,
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return dict()
+        rows = dict((row['oid'], row) for row in res['rows'])
+
+        sql = render_template("/".join([self.table_template_path,
+                                        self._ACL_SQL]), scid=scid)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return dict()
+        acl = dict()
+        for row in res['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+
+        tables = [rows[tid] for tid in tids if tid in rows]
+        properties = dict()
+        for idx in range(0, len(tables), COMPARE_TABLES_CHUNK_SIZE):
+            try:
+                properties.update(self._fetch_tables_chunk_to_compare(
+                    did, tables[idx:idx + COMPARE_TABLES_CHUNK_SIZE], acl))
+            except ExecuteError:
+                continue
+
+        return properties
+
+    def _fetch_tables_chunk_to_compare(self, did, tables, acl):
+        tids = ",".join(str(table['oid']) for table in tables)
+
+        pref = Preferences.module('browser')
+        table_row_count_pref = pref.preference('table_row_count_threshold')
+        table_row_count_threshold = table_row_count_pref.get()
+
+        # Count the rows of the tables with an estimated row count lower
+        # than the threshold at once
+        counted_tables = [
+            table for table in tables
+            if BaseTableView._get_estimated_rows_cnt(
+                table, table_row_count_threshold) is None]
+        rows_cnt = dict()
+        if len(counted_tables) > 0:
+            sql = render_template(
+                "/".join(
+                    [self.table_template_path, 'get_table_row_count.sql']
+                ), tables=counted_tables, conn=self.conn
+            )
+            status, res = self.conn.execute_dict(sql)
+            if not status:
+                raise ExecuteError(res)
+            for row in res['rows']:
+                rows_cnt[row['oid']] = row['rows_cnt']
+
+        columns, column_acl, edit_types = self._fetch_tables_columns(tids)
+
+        constraints = dict()
+        for table in tables:
+            constraints[table['oid']] = {
+                'primary_key': [], 'unique_constraint': [],
+                'foreign_key': [], 'check_constraint': [],
+                'exclude_constraint': []
+            }
+        index_cols, table_indexes = self._fetch_tables_index_columns(tids)
+        self._add_index_constraints(constraints, did, tids, index_cols)
+        self._add_foreign_keys(constraints, tids, index_cols, table_indexes)
+        self._add_check_exclusion_constraints(constraints, did, tids)
+
+        properties = dict()
+        for table in tables:
+            tid = table['oid']
+            res = {'rows': [table]}
+
+            # Update autovacuum properties
+            self.update_autovacuum_properties(table)
+            BaseTableView._check_rlspolicy_support(res)
+            table['rows_cnt'] = rows_cnt.get(
+                tid, BaseTableView._get_estimated_rows_cnt(
+                    table, table_row_count_threshold))
+            table.update(self._format_tbacl_from_db(acl.get(tid, [])))
+
+            properties[tid] = {
+                'res': res,
+                'acl': {'rows': acl.get(tid, [])},
+                'columns': columns.get(tid, []),
+                'column_acl': column_acl.get(tid, dict()),
+                'column_edit_types': edit_types,
+                'constraints': constraints[tid]
+            }
+
+        return properties
+
+    def _fetch_tables_columns(self, tids):
+        """
+        This function will fetch the columns of the given tables, the
+        privileges of the columns and the types the columns can be changed
+        to, with a query for all the tables each.
+        """
+        sql = render_template(
+            "/".join([self.column_template_path, self._PROPERTIES_SQL]),
+            tids=tids, show_sys_objects=False)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            raise ExecuteError(res)
+        columns = dict()
+        for row in res['rows']:
+            columns.setdefault(row.pop('attrelid'), []).append(row)
+
+        sql = render_template(
+            "/".join([self.column_template_path, self._ACL_SQL]), tids=tids)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            raise ExecuteError(res)
+        column_acl = dict()
+        for row in res['rows']:
+            column_acl.setdefault(row.pop('attrelid'), dict()).setdefault(
+                row.pop('attnum'), []).append(row)
+
+        edit_types = dict()
+        type_ids = set(col['atttypid'] for rows in columns.values()
+                       for col in rows)
+        if len(type_ids) > 0:
+            sql = render_template(
+                "/".join([self.column_template_path,
+                          'edit_mode_types_multi.sql']),
+                type_ids=",".join(map(str, type_ids)))
+            status, res = self.conn.execute_2darray(sql)
+            if not status:
+                raise ExecuteError(res)
+            for row in res['rows']:
+                edit_types[row['main_oid']] = sorted(row['edit_types'])
+
+        return columns, column_acl, edit_types
+
+    def _fetch_tables_index_columns(self, tids):
+        """
+        This function will fetch the columns of the indexes of the given
+        tables, for their index constraints and the covering indexes of
+        their foreign keys.
+        """
+        sql = render_template(
+            "/".join([self.table_template_path, 'index_columns.sql']),
+            tids=tids)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            raise ExecuteError(res)
+        index_cols = dict()
+        table_indexes = dict()
+        for row in res['rows']:
+            if row['oid'] not in index_cols:
+                table_indexes.setdefault(row['indrelid'], []).append(
+                    row['oid'])
+            index_cols.setdefault(row['oid'], []).append(row)
+
+        return index_cols, table_indexes
+
+    def _add_index_constraints(self, tables_by_oid, did, tids, index_cols):
+        index_constraints = {
+            'p': 'primary_key', 'u': 'unique_constraint'
+        }
+        for ctype, key in index_constraints.items():
+            sql = render_template(
+                "/".join([compile_template_path('index_constraint/sql',
+                                                self.manager.version),
+                          self._PROPERTIES_SQL]),
+                did=did, tids=tids, constraint_type=ctype)
+            status, res = self.conn.execute_dict(sql)
+            if not status:
+                raise ExecuteError(res)
+
+            for cons in res['rows']:
+                tid = cons.pop('indrelid')
+                cols = index_cols.get(cons['oid'], [])
+                cons['columns'] = [
+                    {'column': col['column'].strip('"')}
+                    for col in cols[:cons['col_count']]]
+                # INCLUDE clause in index is supported from PG-11+
+                if self.manager.version >= 110000:
+                    cons['include'] = [
+                        col['colname'] for col in cols[cons['col_count']:]]
+                tables_by_oid[tid][key].append(cons)
+
+    def _add_foreign_keys(self, tables_by_oid, tids, index_cols,
+                          table_indexes):
+        sql = render_template(
+            "/".join([compile_template_path('foreign_key/sql',
+                                            self.manager.version),
+                      self._PROPERTIES_SQL]),
+            tids=tids)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            raise ExecuteError(res)
+        foreign_keys = res['rows']
+
+        sql = render_template(
+            "/".join([self.table_template_path, 'foreign_key_columns.sql']),
+            tids=tids)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            raise ExecuteError(res)
+        fk_cols = dict()
+        for row in res['rows']:
+            fk_cols.setdefault(row['oid'], []).append(row)
+
+        for fk in foreign_keys:
+            tid = fk.pop('conrelid')
+            fk['columns'] = [
+                {'local_column': row['conattname'],
+                 'references': fk['confrelid'],
+                 'referenced': row['confattname'],
+                 'references_table_name': fk['refnsp'] + '.' + fk['reftab']}
+                for row in fk_cols.get(fk['oid'], [])]
+            fk['remote_schema'] = fk['refnsp']
+            fk['remote_table'] = fk['reftab']
+
+            cols = set(row['conattname'] for row in fk_cols.get(fk['oid'], []))
+            fk['coveringindex'] = None
+            for index_oid in table_indexes.get(tid, []):
+                index = index_cols[index_oid]
+                if cols == set(col['column'].strip('"') for col in index):
+                    fk['coveringindex'] = index[0]['idxname']
+                    break
+            fk['autoindex'] = fk['coveringindex'] is None
+            fk['hasindex'] = not fk['autoindex']
+            tables_by_oid[tid]['foreign_key'].append(fk)
+
+    def _add_check_exclusion_constraints(self, tables_by_oid, did, tids):
+        status, rows = check_utils.get_check_constraints(
+            self.conn, None, tids=tids)
+        if not status:
+            raise ExecuteError(gettext(
+                "Could not fetch the check constraints of the tables."))
+        for cons in rows:
+            tables_by_oid[cons.pop('conrelid')]['check_constraint'].append(
+                cons)
+
+        status, rows = exclusion_utils.get_exclusion_constraints(
+            self.conn, did, None, tids=tids)
+        if not status:
+            raise ExecuteError(gettext(
+                "Could not fetch the exclusion constraints of the tables."))
+        for cons in rows:
+            tables_by_oid[cons.pop('indrelid')]['exclude_constraint'].append(
+                cons)
+
     def _get_sub_module_data_for_compare(self, sid, did, scid, data, row):
         # Get sub module data of a specified table for object
         # comparison
@@ -604,32 +890,27 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
         pref = Preferences.module('browser')
         table_row_count_pref = pref.preference('table_row_count_threshold')
         table_row_count_threshold = table_row_count_pref.get()
-        estimated_row_count = int(res['rows'][0].get('reltuples', 0))
 
         # Check whether 'rlspolicy' in response as it supported for
         # version 9.5 and above
         BaseTableView._check_rlspolicy_support(res)
 
-        # If estimated_row_count is zero or -1 then set the row count to 0
-        if not estimated_row_count or estimated_row_count < 0:
-            res['rows'][0]['rows_cnt'] = 0
-        # If estimated rows are greater than threshold then
-        elif estimated_row_count > table_row_count_threshold:
-            res['rows'][0]['rows_cnt'] = str(table_row_count_threshold) + '+'
+        rows_cnt = BaseTableView._get_estimated_rows_cnt(
+            res['rows'][0], table_row_count_threshold)
         # If estimated rows is lower than threshold then calculate the count
-        elif 0 < estimated_row_count <= table_row_count_threshold:
+        if rows_cnt is None:
             sql = render_template(
                 "/".join(
                     [self.table_template_path, 'get_table_row_count.sql']
                 ), data=res['rows'][0]
             )
 
-            status, count = self.conn.execute_scalar(sql)
+            status, rows_cnt = self.conn.execute_scalar(sql)
 
             if not status:
-                return False, internal_server_error(errormsg=count)
+                return False, internal_server_error(errormsg=rows_cnt)
 
-            res['rows'][0]['rows_cnt'] = count
+        res['rows'][0]['rows_cnt'] = rows_cnt
 
         # Fetch privileges
         sql = render_template("/".join([self.table_template_path,
@@ -644,6 +925,25 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
 
         return True, res
 
+    @staticmethod
+    def _get_estimated_rows_cnt(row, table_row_count_threshold):
+        """
+        This function returns the row count of the table from its estimated
+        row count, or None if the rows of the table have to be counted.
+        :param row: Properties of the table
+        :param table_row_count_threshold: Threshold set by the user
+        :return:
+        """
+        estimated_row_count = int(row.get('reltuples', 0))
+
+        # If estimated_row_count is zero or -1 then set the row count to 0
+        if not estimated_row_count or estimated_row_count < 0:
+            return 0
+        # If estimated rows are greater than threshold then
+        elif estimated_row_count > table_row_count_threshold:
+            return str(table_row_count_threshold) + '+'
+        return None
+
     def _format_tbacl_from_db(self, tbacl):
         """
         Returns privileges.
@@ -1769,7 +2069,8 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
         ].replace('=', ' = ')
 
         data = self._formatter(did, scid, tid, data,
-                               with_serial_cols=with_serial_cols)
+                               with_serial_cols=with_serial_cols,
+                               **kwargs.get('prefetched', dict()))
 
         # Fetch partition of this table if it is partitioned table.
         if 'is_partitioned' in data and data['is_partitioned']:
@@ -490,11 +490,16 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         return data
 
-    def additional_properties(self, copy_dict, tid):
+    def additional_properties(self, copy_dict, tid, rows=None):
         """
         We will use this function to add additional properties according to
         type
 
+        Args:
+            copy_dict: Properties of the type
+            tid: Type ID
+            rows: Rows of the additional properties, if already fetched
+
         Returns:
             additional properties for type like range/composite/enum
 
@@ -509,24 +514,24 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         else:
             render_args['tid'] = tid
 
-        if of_type in ('c', 'e', 'r', 'N', 'V', 'A'):
+        if rows is None and of_type in ('c', 'e', 'r', 'N', 'V', 'A'):
             SQL = render_template("/".join([self.template_path,
                                             'additional_properties.sql']),
                                   **render_args)
             status, rset = self.conn.execute_dict(SQL)
             if not status:
                 return internal_server_error(errormsg=res)
+            rows = rset['rows']
 
         # If type is of Composite then we need to add members list in our
         # output
         if of_type == 'c':
             # To display in properties
-            res = self._additional_properties_composite(rset['rows'])
+            res = self._additional_properties_composite(rows)
 
         if of_type in ('N', 'V'):
             # To display in properties
-            res = self._additional_properties_advanced_server_type(
-                rset['rows'][0])
+            res = self._additional_properties_advanced_server_type(rows[0])
 
         # If type is of ENUM then we need to add labels in our output
         if of_type == 'e':
@@ -534,7 +539,7 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             properties_list = []
             # To display in enum grid
             enum_list = []
-            for row in rset['rows']:
+            for row in rows:
                 properties_list.append(row['enumlabel'])
                 enum_list.append({'label': row['enumlabel']})
 
@@ -545,7 +550,7 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         # If type is of Range then we need to add collation,subtype etc in our
         # output
         if of_type == 'r':
-            range_dict = dict(rset['rows'][0])
+            range_dict = dict(rows[0])
             res.update(range_dict)
 
         if 'seclabels' in copy_dict and copy_dict['seclabels'] is not None:
@@ -609,9 +614,6 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             return False, gone(
                 gettext("""Could not find the type in the database."""))
 
-        # Making copy of output for future use
-        copy_dict = dict(res['rows'][0])
-
         # We need to parse & convert ACL coming from database to json format
         SQL = render_template("/".join([self.template_path, self._ACL_SQL]),
                               scid=scid, tid=tid)
@@ -619,11 +621,28 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return False, internal_server_error(errormsg=acl)
 
+        return True, self._format_properties(tid, res['rows'][0],
+                                             acl['rows'])
+
+    def _format_properties(self, tid, data, acl, additional_rows=None):
+        """
+        This function is used to format the properties fetched from the
+        database.
+        :param tid: Type ID
+        :param data: Properties of the type
+        :param acl: Privileges of the type
+        :param additional_rows: Rows of the additional properties, if
+            already fetched
+        :return:
+        """
+        # Making copy of output for future use
+        copy_dict = dict(data)
+
         # We will set get privileges from acl sql so we don't need
         # it from properties sql
         copy_dict['typacl'] = []
 
-        for row in acl['rows']:
+        for row in acl:
             priv = parse_priv_from_db(row)
             if row['deftype'] in copy_dict:
                 copy_dict[row['deftype']].append(priv)
@@ -631,9 +650,70 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
                 copy_dict[row['deftype']] = [priv]
 
         # Calling function to check and additional properties if available
-        copy_dict.update(self.additional_properties(copy_dict, tid))
+        copy_dict.update(self.additional_properties(copy_dict, tid,
+                                                    additional_rows))
 
-        return True, copy_dict
+        return copy_dict
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function is used to fetch the properties of all the types of
+        the schema by OID, with one query for the properties, one for the
+        privileges and one per kind of type for the additional properties.
+        Returns None if they could not be fetched.
+        :param scid:
+        :return:
+        """
+        SQL = render_template(
+            "/".join([self.template_path,
+                      self._PROPERTIES_SQL]),
+            scid=scid,
+            datlastsysoid=self._DATABASE_LAST_SYSTEM_OID,
+            show_system_objects=self.blueprint.show_system_objects
+        )
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        SQL = render_template("/".join([self.template_path, self._ACL_SQL]),
+                              scid=scid)
+        status, rset = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        acl = dict()
+        for row in rset['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+
+        # Additional properties by kind of type, then by type (by relation
+        # for the composite types)
+        additional = dict()
+        for of_type in set(row['typtype'] for row in res['rows']):
+            if of_type not in ('c', 'e', 'r', 'N', 'V'):
+                continue
+            SQL = render_template("/".join([self.template_path,
+                                            'additional_properties.sql']),
+                                  typtype=of_type, scid=scid, conn=self.conn)
+            status, rset = self.conn.execute_dict(SQL)
+            if not status:
+                return None
+
+            type_rows = additional.setdefault(of_type, dict())
+            for row in rset['rows']:
+                key = row['attrelid'] if of_type == 'c' else row.pop('oid')
+                type_rows.setdefault(key, []).append(row)
+
+        properties = dict()
+        for row in res['rows']:
+            of_type = row['typtype']
+            key = row['typrelid'] if of_type == 'c' else row['oid']
+            rows = additional.get(of_type, dict()).get(key, [])
+            # The types missing their single row are fetched one by one
+            if of_type in ('r', 'N', 'V') and len(rows) == 0:
+                continue
+            properties[row['oid']] = self._format_properties(
+                row['oid'], row, acl.get(row['oid'], []), rows)
+        return properties
 
     @check_precondition
     def get_collations(self, gid, sid, did, scid, tid=None):
@@ -1563,10 +1643,15 @@ class TypeView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the types of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(scid, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(scid, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
@@ -1,13 +1,15 @@
-SELECT 'typacl' as deftype, COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
+SELECT 'typacl' as deftype,{% if not tid %} d.oid,{% endif %} COALESCE(gt.rolname, 'PUBLIC') grantee, g.rolname grantor, pg_catalog.array_agg(privilege_type) as privileges, pg_catalog.array_agg(is_grantable) as grantable
 FROM
     (SELECT
-        d.grantee, d.grantor, d.is_grantable,
+        d.oid, d.grantee, d.grantor, d.is_grantable,
         CASE d.privilege_type
         WHEN 'USAGE' THEN 'U'
         ELSE 'UNKNOWN'
         END AS privilege_type
     FROM
-        (SELECT t.typacl
+        (SELECT t.oid, (d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
+            AS is_grantable, (d).privilege_type AS privilege_type FROM (SELECT
+            t.oid, pg_catalog.aclexplode(t.typacl) as d
             FROM pg_catalog.pg_type t
             LEFT OUTER JOIN pg_catalog.pg_type e ON e.oid=t.typelem
             LEFT OUTER JOIN pg_catalog.pg_class ct ON ct.oid=t.typrelid AND ct.relkind <> 'c'
@@ -16,12 +18,14 @@ FROM
             {% if tid %}
             AND t.oid = {{tid}}::oid
             {% endif %}
-        ) acl,
-        (SELECT (d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
-            AS is_grantable, (d).privilege_type AS privilege_type FROM (SELECT
-            pg_catalog.aclexplode(t.typacl) as d FROM pg_catalog.pg_type t WHERE t.oid = {{tid}}::oid) a ORDER BY privilege_type) d
+            ) t ORDER BY privilege_type) d
         ) d
     LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
     LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
+{% if tid %}
 GROUP BY g.rolname, gt.rolname
 ORDER BY grantee
+{% else %}
+GROUP BY d.oid, g.rolname, gt.rolname
+ORDER BY d.oid, grantee
+{% endif %}
@@ -1,3 +1,5 @@
+{# The additional properties of all the types of a kind of the schema are
+   fetched with the type OID when no type id is given #}
 {# The SQL given below will fetch composite type#}
 {% if typtype == 'c' %}
 SELECT attnum, attname, pg_catalog.format_type(t.oid,NULL) AS typname, attndims, atttypmod, nsp.nspname,
@@ -11,21 +13,33 @@ FROM pg_catalog.pg_attribute att
     LEFT OUTER JOIN pg_catalog.pg_type b ON t.typelem=b.oid
     LEFT OUTER JOIN pg_catalog.pg_collation c ON att.attcollation=c.oid
     LEFT OUTER JOIN pg_catalog.pg_namespace nspc ON c.collnamespace=nspc.oid
+{% if typrelid %}
     WHERE att.attrelid = {{typrelid}}::oid
     ORDER by attnum;
+{% else %}
+    WHERE att.attrelid IN (SELECT typrelid FROM pg_catalog.pg_type
+        WHERE typnamespace = {{scid}}::oid AND typtype = 'c')
+    ORDER by att.attrelid, attnum;
+{% endif %}
 {% endif %}
 
 {# The SQL given below will fetch enum type#}
 {% if typtype == 'e' %}
-SELECT enumlabel
+SELECT {% if not tid %}enumtypid AS oid, {% endif %}enumlabel
 FROM pg_catalog.pg_enum
+{% if tid %}
     WHERE enumtypid={{tid}}::oid
     ORDER by enumsortorder
+{% else %}
+    WHERE enumtypid IN (SELECT oid FROM pg_catalog.pg_type
+        WHERE typnamespace = {{scid}}::oid)
+    ORDER by enumtypid, enumsortorder
+{% endif %}
 {% endif %}
 
 {# The SQL given below will fetch range type#}
 {% if typtype == 'r' %}
-SELECT rngsubtype, st.typname,
+SELECT {% if not tid %}rngtypid AS oid, {% endif %}rngsubtype, st.typname,
     rngcollation,
     CASE WHEN n.nspname IS NOT NULL THEN pg_catalog.concat(pg_catalog.quote_ident(n.nspname), '.', pg_catalog.quote_ident(col.collname)) ELSE col.collname END AS collname,
     rngsubopc, opc.opcname,
@@ -40,5 +54,10 @@ FROM pg_catalog.pg_range
     LEFT JOIN pg_catalog.pg_opclass opc ON opc.oid=rngsubopc
     LEFT JOIN pg_catalog.pg_proc pgpr ON pgpr.oid = rngsubdiff
     LEFT JOIN pg_catalog.pg_namespace ns ON ns.oid=pgpr.pronamespace
+{% if tid %}
     WHERE rngtypid={{tid}}::oid;
+{% else %}
+    WHERE rngtypid IN (SELECT oid FROM pg_catalog.pg_type
+        WHERE typnamespace = {{scid}}::oid);
+{% endif %}
 {% endif %}
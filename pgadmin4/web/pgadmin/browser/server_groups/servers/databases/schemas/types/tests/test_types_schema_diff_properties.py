@@ -0,0 +1,147 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas import types
+from pgadmin.browser.server_groups.servers.databases.schemas.types \
+    import TypeView
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+SCID = 2200
+
+
+def _type(oid, name, typtype, **kwargs):
+    row = {
+        'oid': oid, 'name': name, 'typname': name, 'typtype': typtype,
+        'typrelid': 0, 'typacl': None, 'seclabels': None, 'is_sys_type': False
+    }
+    row.update(kwargs)
+    return row
+
+
+def _member(attrelid, attnum, attname, typname, **kwargs):
+    row = {
+        'attrelid': attrelid, 'attnum': attnum, 'attname': attname,
+        'typname': typname, 'fulltype': typname, 'elemoid': 23,
+        'attndims': 0, 'atttypmod': -1, 'nspname': 'pg_catalog',
+        'isdup': False, 'collname': None, 'collnspname': None
+    }
+    row.update(kwargs)
+    return row
+
+
+TYPES = [
+    _type(16500, 'address', 'c', typrelid=16501,
+          seclabels=['selinux=system_u:object_r:sepgsql_table_t:s0']),
+    _type(16510, 'mood', 'e'),
+    _type(16520, 'floatrange', 'r'),
+    _type(16530, 'empty_mood', 'e'),
+]
+COMPOSITE = {
+    16501: [_member(16501, 1, 'street', 'text'),
+            _member(16501, 2, 'zip', 'numeric', fulltype='numeric(5,0)',
+                    collname='C', collnspname='pg_catalog')],
+}
+ENUM = {
+    16510: [{'enumlabel': 'sad'}, {'enumlabel': 'ok'},
+            {'enumlabel': 'happy'}],
+}
+RANGE = {
+    16520: [{'rngsubtype': 701, 'typname': 'float8', 'rngcollation': 0,
+             'collname': None, 'rngsubopc': 3123, 'opcname': 'float8_ops',
+             'rngcanonical': '-', 'rngsubdiff_proc': 'float8mi',
+             'rngsubdiff': 'pg_catalog.float8mi'}],
+}
+ACL = {
+    16510: [{'deftype': 'typacl', 'grantee': 'app', 'grantor': 'postgres',
+             'privileges': ['U'], 'grantable': [False]}],
+}
+
+
+class _Blueprint:
+    show_system_objects = False
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+
+    def __init__(self, bulk_status=True):
+        super().__init__()
+        self.bulk_status = bulk_status
+
+    def rows(self, template, args):
+        tid = args.get('tid') or args.get('typrelid')
+        if template == 'nodes.sql':
+            return [{'oid': t['oid'], 'name': t['name']} for t in TYPES]
+        if not tid and not self.bulk_status:
+            return None
+
+        if template == 'properties.sql':
+            return [t for t in TYPES if tid in (None, t['oid'])]
+        if template == 'acl.sql' and tid:
+            return ACL.get(tid, [])
+        if template == 'acl.sql':
+            return [dict(row, oid=oid) for oid in sorted(ACL)
+                    for row in ACL[oid]]
+        if args['typtype'] == 'c':
+            return [row for attrelid in sorted(COMPOSITE)
+                    for row in COMPOSITE[attrelid]
+                    if tid in (None, attrelid)]
+        kind = ENUM if args['typtype'] == 'e' else RANGE
+        return [row if tid else dict(row, oid=oid)
+                for oid in sorted(kind) for row in kind[oid]
+                if tid in (None, oid)]
+
+
+class TypesSchemaDiffPropertiesTestCase(BaseTestGenerator):
+    """This class tests the properties of the types fetched in bulk for
+    the schema diff."""
+    scenarios = [
+        ('Properties fetched in bulk', dict(bulk_status=True)),
+        ('Properties fetched per type when the bulk fetch fails',
+         dict(bulk_status=False)),
+    ]
+
+    def setUp(self):
+        self.patch = patch.object(types, 'render_template',
+                                  render_template_name)
+        self.patch.start()
+
+    def _view(self, conn):
+        view = TypeView.__new__(TypeView)
+        view.conn = conn
+        view.blueprint = _Blueprint()
+        view.template_path = 'types/pg/sql/#170000#'
+        return view
+
+    def runTest(self):
+        conn = _Connection(self.bulk_status)
+        res = TypeView.fetch_objects_to_compare.__wrapped__(
+            self._view(conn), 1, 1, SCID)
+
+        view = self._view(_Connection())
+        expected = dict(
+            (t['name'], view._fetch_properties(SCID, t['oid'])[1])
+            for t in TYPES)
+
+        self.assertEqual(res, expected)
+        self.assertEqual(
+            res['address']['member_list'],
+            'street text, zip numeric(5,0) COLLATE pg_catalog."C"')
+        self.assertEqual(res['mood']['enum_list'], 'sad, ok, happy')
+        self.assertEqual(res['empty_mood']['enum'], [])
+        if self.bulk_status:
+            # Nodes, properties, privileges and one query per kind of type
+            self.assertEqual(len(conn.queries), 6)
+
+    def tearDown(self):
+        self.patch.stop()
@@ -522,19 +522,59 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffViewCompare):
         if not status:
             return False, internal_server_error(errormsg=res)
 
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
+        return True, self._format_properties(res['rows'][0],
+                                             dataclres['rows'])
 
-        result = res['rows'][0]
+    def _format_properties(self, data, acl):
+        """
+        This function is used to format the properties of a view with its
+        privileges.
+        :param data: Properties of the view
+        :param acl: Privileges of the view
+        :return:
+        """
+        for row in acl:
+            priv = parse_priv_from_db(row)
+            data.setdefault(row['deftype'], []).append(priv)
 
         # sending result to formtter
-        frmtd_reslt = self.formatter(result)
+        frmtd_reslt = self.formatter(data)
 
         # merging formatted result with main result again
-        result.update(frmtd_reslt)
+        data.update(frmtd_reslt)
+
+        return data
+
+    def _fetch_schema_properties(self, scid):
+        """
+        This function returns the properties of all the views of the schema
+        by OID, fetched with one query for the properties and one for the
+        privileges instead of two per view. Returns None if they could not
+        be fetched.
+
+        :param scid: Schema ID
+        """
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._PROPERTIES_SQL]
+        ), scid=scid, datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
 
-        return True, result
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]),
+            scid=scid)
+        status, dataclres = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        acl = dict()
+        for row in dataclres['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+
+        return dict((row['oid'],
+                     self._format_properties(row, acl.get(row['oid'], [])))
+                    for row in res['rows'])
 
     @staticmethod
     def formatter(result):
@@ -1741,13 +1781,18 @@ class ViewNode(PGChildNodeView, VacuumSettings, SchemaDiffViewCompare):
                 current_app.logger.error(views)
                 return False
 
+            # Properties of the views of the schema, fetched in bulk
+            properties = self._fetch_schema_properties(scid) or dict()
             for row in views['rows']:
-                status, data = self._fetch_properties(scid, row['oid'])
-                if status:
-                    # Fetch the data of sub module
-                    self._get_sub_module_data_for_compare(
-                        sid, did, scid, data, row['oid'])
-                    res[row['name']] = data
+                data = properties.get(row['oid'])
+                if data is None:
+                    status, data = self._fetch_properties(scid, row['oid'])
+                    if not status:
+                        continue
+                # Fetch the data of sub module
+                self._get_sub_module_data_for_compare(
+                    sid, did, scid, data, row['oid'])
+                res[row['name']] = data
         else:
             status, data = self._fetch_properties(scid, oid)
             if not status:
@@ -2183,83 +2228,116 @@ class MViewNode(ViewNode, VacuumSettings):
         if len(res['rows']) == 0:
             return False, gone(self.not_found_error_msg())
 
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]), vid=vid)
+        status, dataclres = self.conn.execute_dict(SQL)
+        if not status:
+            return False, internal_server_error(errormsg=res)
+
+        return True, self._format_properties(res['rows'][0],
+                                             dataclres['rows'])
+
+    def _format_properties(self, data, acl):
+        """
+        This function is used to format the properties of a materialized
+        view with its privileges.
+        :param data: Properties of the materialized view
+        :param acl: Privileges of the materialized view
+        :return:
+        """
         # Set value based on
         # x: No set, t: true, f: false
-        res['rows'][0]['autovacuum_enabled'] = 'x' \
-            if res['rows'][0]['autovacuum_enabled'] is None else \
-            {True: 't', False: 'f'}[res['rows'][0]['autovacuum_enabled']]
+        data['autovacuum_enabled'] = 'x' \
+            if data['autovacuum_enabled'] is None else \
+            {True: 't', False: 'f'}[data['autovacuum_enabled']]
 
-        res['rows'][0]['toast_autovacuum_enabled'] = 'x' \
-            if res['rows'][0]['toast_autovacuum_enabled'] is None else \
-            {True: 't', False: 'f'}[res['rows'][0]['toast_autovacuum_enabled']]
+        data['toast_autovacuum_enabled'] = 'x' \
+            if data['toast_autovacuum_enabled'] is None else \
+            {True: 't', False: 'f'}[data['toast_autovacuum_enabled']]
 
         # Enable custom autovaccum only if one of the options is set
         # or autovacuum is set
-        res['rows'][0]['autovacuum_custom'] = any([
-            res['rows'][0]['autovacuum_vacuum_threshold'],
-            res['rows'][0]['autovacuum_vacuum_scale_factor'],
-            res['rows'][0]['autovacuum_analyze_threshold'],
-            res['rows'][0]['autovacuum_analyze_scale_factor'],
-            res['rows'][0]['autovacuum_vacuum_cost_delay'],
-            res['rows'][0]['autovacuum_vacuum_cost_limit'],
-            res['rows'][0]['autovacuum_freeze_min_age'],
-            res['rows'][0]['autovacuum_freeze_max_age'],
-            res['rows'][0]['autovacuum_freeze_table_age']]) \
-            or res['rows'][0]['autovacuum_enabled'] in ('t', 'f')
-
-        res['rows'][0]['toast_autovacuum'] = any([
-            res['rows'][0]['toast_autovacuum_vacuum_threshold'],
-            res['rows'][0]['toast_autovacuum_vacuum_scale_factor'],
-            res['rows'][0]['toast_autovacuum_analyze_threshold'],
-            res['rows'][0]['toast_autovacuum_analyze_scale_factor'],
-            res['rows'][0]['toast_autovacuum_vacuum_cost_delay'],
-            res['rows'][0]['toast_autovacuum_vacuum_cost_limit'],
-            res['rows'][0]['toast_autovacuum_freeze_min_age'],
-            res['rows'][0]['toast_autovacuum_freeze_max_age'],
-            res['rows'][0]['toast_autovacuum_freeze_table_age']]) \
-            or res['rows'][0]['toast_autovacuum_enabled'] in ('t', 'f')
-
-        res['rows'][0]['vacuum_settings_str'] = ''
-
-        if res['rows'][0]['reloptions'] is not None:
-            res['rows'][0]['vacuum_settings_str'] += '\n'.\
-                join(res['rows'][0]['reloptions'])
-
-        if res['rows'][0]['toast_reloptions'] is not None:
-            res['rows'][0]['vacuum_settings_str'] += '\n' \
-                if res['rows'][0]['vacuum_settings_str'] != "" else ""
-            res['rows'][0]['vacuum_settings_str'] += '\n'.\
+        data['autovacuum_custom'] = any([
+            data['autovacuum_vacuum_threshold'],
+            data['autovacuum_vacuum_scale_factor'],
+            data['autovacuum_analyze_threshold'],
+            data['autovacuum_analyze_scale_factor'],
+            data['autovacuum_vacuum_cost_delay'],
+            data['autovacuum_vacuum_cost_limit'],
+            data['autovacuum_freeze_min_age'],
+            data['autovacuum_freeze_max_age'],
+            data['autovacuum_freeze_table_age']]) \
+            or data['autovacuum_enabled'] in ('t', 'f')
+
+        data['toast_autovacuum'] = any([
+            data['toast_autovacuum_vacuum_threshold'],
+            data['toast_autovacuum_vacuum_scale_factor'],
+            data['toast_autovacuum_analyze_threshold'],
+            data['toast_autovacuum_analyze_scale_factor'],
+            data['toast_autovacuum_vacuum_cost_delay'],
+            data['toast_autovacuum_vacuum_cost_limit'],
+            data['toast_autovacuum_freeze_min_age'],
+            data['toast_autovacuum_freeze_max_age'],
+            data['toast_autovacuum_freeze_table_age']]) \
+            or data['toast_autovacuum_enabled'] in ('t', 'f')
+
+        data['vacuum_settings_str'] = ''
+
+        if data['reloptions'] is not None:
+            data['vacuum_settings_str'] += '\n'.\
+                join(data['reloptions'])
+
+        if data['toast_reloptions'] is not None:
+            data['vacuum_settings_str'] += '\n' \
+                if data['vacuum_settings_str'] != "" else ""
+            data['vacuum_settings_str'] += '\n'.\
                 join(map(lambda o: self.TOAST_STR + o,
-                         res['rows'][0]['toast_reloptions']))
+                         data['toast_reloptions']))
 
-        res['rows'][0]['vacuum_settings_str'] = res['rows'][0][
+        data['vacuum_settings_str'] = data[
             'vacuum_settings_str'
         ].replace('=', ' = ')
 
-        SQL = render_template("/".join(
-            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]), vid=vid)
-        status, dataclres = self.conn.execute_dict(SQL)
-        if not status:
-            return False, internal_server_error(errormsg=res)
-
-        for row in dataclres['rows']:
-            priv = parse_priv_from_db(row)
-            res['rows'][0].setdefault(row['deftype'], []).append(priv)
-
-        result = res['rows'][0]
-
-        # sending result to formtter
-        frmtd_reslt = self.formatter(result)
-
-        # merging formated result with main result again
-        result.update(frmtd_reslt)
+        result = super()._format_properties(data, acl)
 
         result['vacuum_table'] = self.parse_vacuum_data(
             self.conn, result, 'table')
         result['vacuum_toast'] = self.parse_vacuum_data(
             self.conn, result, 'toast')
 
-        return True, result
+        return result
+
+    def _fetch_schema_properties(self, scid, did=None):
+        """
+        This function returns the properties of all the materialized views
+        of the schema by OID, fetched with one query for the properties and
+        one for the privileges instead of two per materialized view.
+        Returns None if they could not be fetched.
+
+        :param scid: Schema ID
+        :param did: Database ID
+        """
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._PROPERTIES_SQL]
+        ), did=did, scid=scid, datlastsysoid=self._DATABASE_LAST_SYSTEM_OID)
+        status, res = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        SQL = render_template("/".join(
+            [self.template_path, self._SQL_PREFIX + self._ACL_SQL]),
+            scid=scid)
+        status, dataclres = self.conn.execute_dict(SQL)
+        if not status:
+            return None
+
+        acl = dict()
+        for row in dataclres['rows']:
+            acl.setdefault(row.pop('oid'), []).append(row)
+
+        return dict((row['oid'],
+                     self._format_properties(row, acl.get(row['oid'], [])))
+                    for row in res['rows'])
 
     @check_precondition
     def refresh_data(self, gid, sid, did, scid, vid):
@@ -2399,13 +2477,19 @@ class MViewNode(ViewNode, VacuumSettings):
         if not status:
             return internal_server_error(errormsg=res)
 
+        # Properties of the materialized views of the schema, fetched in bulk
+        properties = self._fetch_schema_properties(scid, did) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_mview_properties(did, scid, row['oid'])
-            if status:
-                # Fetch the data of sub module
-                self._get_sub_module_data_for_compare(
-                    sid, did, scid, data, row['oid'])
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_mview_properties(
+                    did, scid, row['oid'])
+                if not status:
+                    continue
+            # Fetch the data of sub module
+            self._get_sub_module_data_for_compare(
+                sid, did, scid, data, row['oid'])
+            res[row['name']] = data
 
         return res
 
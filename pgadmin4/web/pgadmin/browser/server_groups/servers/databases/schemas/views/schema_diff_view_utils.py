@@ -11,8 +11,7 @@
 
 import copy
 
-from pgadmin.utils.ajax import internal_server_error
-from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries,\
+from pgadmin.tools.schema_diff.directory_compare import \
     are_dictionaries_identical
 from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
@@ -27,61 +26,6 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
 
     keys_to_ignore = view_keys_to_ignore + trigger_keys_to_ignore
 
-    def compare(self, **kwargs):
-        """
-        This function is used to compare all the table objects
-        from two different schemas.
-
-        :param kwargs:
-        :return:
-        """
-        source_params = {'sid': kwargs.get('source_sid'),
-                         'did': kwargs.get('source_did'),
-                         'scid': kwargs.get('source_scid')}
-        target_params = {'sid': kwargs.get('target_sid'),
-                         'did': kwargs.get('target_did'),
-                         'scid': kwargs.get('target_scid')}
-        ignore_owner = kwargs.get('ignore_owner')
-        ignore_whitespaces = kwargs.get('ignore_whitespaces')
-        ignore_tablespace = kwargs.get('ignore_tablespace')
-        ignore_grants = kwargs.get('ignore_grants')
-
-        group_name = kwargs.get('group_name')
-        source_schema_name = kwargs.get('source_schema_name', None)
-        source_views = {}
-        target_views = {}
-
-        status, target_schema = self.get_schema(**target_params)
-        if not status:
-            return internal_server_error(errormsg=target_schema)
-
-        if 'scid' in source_params and source_params['scid'] is not None:
-            source_views = self.fetch_objects_to_compare(**source_params)
-
-        if 'scid' in target_params and target_params['scid'] is not None:
-            target_views = self.fetch_objects_to_compare(**target_params)
-
-        # If both the dict have no items then return None.
-        if not (source_views or target_views) or (
-                len(source_views) <= 0 and len(target_views) <= 0):
-            return None
-
-        return compare_dictionaries(view_object=self,
-                                    source_params=source_params,
-                                    target_params=target_params,
-                                    target_schema=target_schema,
-                                    source_dict=source_views,
-                                    target_dict=target_views,
-                                    node=self.node_type,
-                                    node_label=self.blueprint.collection_label,
-                                    group_name=group_name,
-                                    ignore_keys=self.keys_to_ignore,
-                                    source_schema_name=source_schema_name,
-                                    ignore_owner=ignore_owner,
-                                    ignore_whitespaces=ignore_whitespaces,
-                                    ignore_tablespace=ignore_tablespace,
-                                    ignore_grants=ignore_grants)
-
     def ddl_compare(self, **kwargs):
         """
         This function will compare properties of 2 views and
@@ -102,8 +46,12 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
                          'tid': kwargs.get('target_oid')
                          }
 
-        source = self.get_sql_from_view_diff(**source_params)
-        target = self.get_sql_from_view_diff(**target_params)
+        # The side compared with a snapshot has no object id, its DDL is
+        # the one saved in the snapshot.
+        source = self.get_sql_from_view_diff(**source_params) \
+            if source_params['tid'] else ''
+        target = self.get_sql_from_view_diff(**target_params) \
+            if target_params['tid'] else ''
 
         return {'source_ddl': source,
                 'target_ddl': target,
@@ -125,6 +73,8 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
         target = kwargs.get('target')
         diff_dict = kwargs.get('diff_dict')
         ignore_whitespaces = kwargs.get('ignore_whitespaces')
+        # DDL of the child objects saved in the source snapshot
+        source_child_ddl = kwargs.get('source_child_ddl')
         diff = ''
 
         # Get the difference DDL/DML statements for table
@@ -150,11 +100,15 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
                 dict2_keys = set(dict2.keys())
                 intersect_keys = dict1_keys.intersection(dict2_keys)
 
+                child_ddl = None
+                if source_child_ddl is not None:
+                    child_ddl = source_child_ddl.get(module.node_type, dict())
+
                 # Keys that are available in source and missing in target.
                 added = dict1_keys - dict2_keys
                 diff = SchemaDiffViewCompare._compare_source_only(
                     added, module_view, source_params, target_params,
-                    dict1, diff, target_schema)
+                    dict1, diff, target_schema, child_ddl)
 
                 # Keys that are available in target and missing in source.
                 removed = dict2_keys - dict1_keys
@@ -169,7 +123,8 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
                     "source": source,
                     "target": target,
                     "target_schema": target_schema,
-                    "ignore_whitespaces": ignore_whitespaces
+                    "ignore_whitespaces": ignore_whitespaces,
+                    "child_ddl": child_ddl
                 }
                 diff = self._compare_source_and_target(
                     intersect_keys, module_view, source_params,
@@ -179,8 +134,13 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
 
     @staticmethod
     def _compare_source_only(added, module_view, source_params, target_params,
-                             dict1, diff, target_schema):
+                             dict1, diff, target_schema, child_ddl=None):
         for item in added:
+            # The child object of a snapshot is created from its saved DDL.
+            if child_ddl is not None:
+                diff += '\n' + child_ddl[item]
+                continue
+
             source_ddl = module_view.ddl_compare(
                 source_params=source_params,
                 target_params=target_params,
@@ -218,6 +178,7 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
         target = kwargs['target']
         target_schema = kwargs['target_schema']
         ignore_whitespaces = kwargs.get('ignore_whitespaces')
+        child_ddl = kwargs.get('child_ddl')
 
         for key in intersect_keys:
             # Recursively Compare the two dictionary
@@ -232,7 +193,9 @@ class SchemaDiffViewCompare(SchemaDiffObjectCompare):
                     target=dict2[key],
                     comp_status='different',
                     parent_source_data=source,
-                    parent_target_data=target
+                    parent_target_data=target,
+                    source_ddl=child_ddl[key] if child_ddl is not None
+                    else None
                 )
 
                 diff += '\n' + diff_ddl
@@ -21,6 +21,8 @@ SELECT
     {# ============= Checks if it is system view ================ #}
     {% if vid and datlastsysoid %}
     CASE WHEN {{vid}} <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
+    {% elif scid and datlastsysoid %}
+    CASE WHEN c.oid <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
     {% endif %}
     pg_catalog.array_to_string(c.relacl::text[], ', ') AS acl,
     (SELECT pg_catalog.array_agg(provider || '=' || label) FROM pg_catalog.pg_seclabels sl1 WHERE sl1.objoid=c.oid AND sl1.objsubid=0) AS seclabels,
@@ -16,6 +16,8 @@ SELECT
     {# ===== Checks if it is system view ===== #}
     {% if vid and datlastsysoid %}
     CASE WHEN {{vid}} <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
+    {% elif scid and datlastsysoid %}
+    CASE WHEN c.oid <= {{datlastsysoid}} THEN True ELSE False END AS system_view,
     {% endif %}
     (SELECT
         pg_catalog.array_agg(provider || '=' || label)
@@ -1,13 +1,19 @@
 {# ============================ Get ACLs ========================= #}
-{% if vid %}
+{# The privileges of all the views of the schema are fetched with their OID
+   when no id is given #}
+{% if vid or scid %}
 SELECT
     'datacl' as deftype,
+{% if not vid %}
+    d.oid,
+{% endif %}
     COALESCE(gt.rolname, 'PUBLIC') grantee,
     g.rolname grantor,
     pg_catalog.array_agg(privilege_type) as privileges,
     pg_catalog.array_agg(is_grantable) as grantable
 FROM
     (SELECT
+        acl.oid,
         d.grantee, d.grantor, d.is_grantable,
         CASE d.privilege_type
         WHEN 'DELETE' THEN 'd'
@@ -22,20 +28,27 @@ FROM
         END AS privilege_type
     FROM
         (SELECT
-            relacl
+            cl.oid, relacl
          FROM
             pg_catalog.pg_class cl
          LEFT OUTER JOIN pg_catalog.pg_shdescription descr ON
             (cl.oid=descr.objoid AND descr.classoid='pg_class'::regclass)
          WHERE
+{% if vid %}
             cl.oid = {{ vid }}::OID AND relkind = 'v'
+{% else %}
+            cl.relnamespace = {{ scid }}::OID AND relkind = 'v'
+{% endif %}
         ) acl,
         pg_catalog.aclexplode(relacl) d
     ) d
 LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
 LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
 GROUP BY
+{% if not vid %}
+    d.oid,
+{% endif %}
     g.rolname,
     gt.rolname
-ORDER BY grantee
+ORDER BY {% if not vid %}d.oid, {% endif %}grantee
 {% endif %}
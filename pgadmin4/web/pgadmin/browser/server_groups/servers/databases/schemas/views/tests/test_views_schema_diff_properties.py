@@ -0,0 +1,98 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas import views
+from pgadmin.browser.server_groups.servers.databases.schemas.views \
+    import ViewNode
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+SCID = 2200
+
+VIEWS = [
+    {'oid': 16600, 'name': 'v1', 'definition': ' SELECT 1;',
+     'seclabels': None, 'system_view': False},
+    {'oid': 16601, 'name': 'v2', 'definition': ' SELECT 2;',
+     'seclabels': ['selinux=system_u:object_r:sepgsql_view_t:s0'],
+     'system_view': False},
+]
+ACL = {
+    16601: [{'deftype': 'datacl', 'grantee': 'app', 'grantor': 'postgres',
+             'privileges': ['r', 'w'], 'grantable': [False, False]}],
+}
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+
+    def __init__(self, bulk_status=True):
+        super().__init__()
+        self.bulk_status = bulk_status
+
+    def rows(self, template, args):
+        vid = args.get('vid')
+        if template == 'nodes.sql':
+            return [{'oid': v['oid'], 'name': v['name']} for v in VIEWS]
+        if not vid and not self.bulk_status:
+            return None
+
+        if template == 'properties.sql':
+            return [v for v in VIEWS if vid in (None, v['oid'])]
+        if vid:
+            return ACL.get(vid, [])
+        return [dict(row, oid=oid) for oid in sorted(ACL)
+                for row in ACL[oid]]
+
+
+class ViewsSchemaDiffPropertiesTestCase(BaseTestGenerator):
+    """This class tests the properties of the views fetched in bulk for
+    the schema diff."""
+    scenarios = [
+        ('Properties fetched in bulk', dict(bulk_status=True)),
+        ('Properties fetched per view when the bulk fetch fails',
+         dict(bulk_status=False)),
+    ]
+
+    def setUp(self):
+        self.patch = patch.object(views, 'render_template',
+                                  render_template_name)
+        self.patch.start()
+
+    def _view(self, conn):
+        view = ViewNode.__new__(ViewNode)
+        view.conn = conn
+        view.template_path = 'views/pg/#170000#'
+        # The rules, triggers and indexes are compared by their own nodes
+        view.view_sub_modules = []
+        return view
+
+    def runTest(self):
+        conn = _Connection(self.bulk_status)
+        res = ViewNode.fetch_objects_to_compare.__wrapped__(
+            self._view(conn), 1, 1, SCID)
+
+        view = self._view(_Connection())
+        expected = dict(
+            (v['name'], view._fetch_properties(SCID, v['oid'])[1])
+            for v in VIEWS)
+
+        self.assertEqual(res, expected)
+        self.assertEqual(res['v2']['seclabels'],
+                         [{'provider': 'selinux',
+                           'label': 'system_u:object_r:sepgsql_view_t:s0'}])
+        self.assertEqual(len(res['v2']['datacl']), 1)
+        if self.bulk_status:
+            # Nodes, properties and privileges
+            self.assertEqual(len(conn.queries), 3)
+
+    def tearDown(self):
+        self.patch.stop()
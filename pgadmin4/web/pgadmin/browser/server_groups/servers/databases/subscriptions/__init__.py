@@ -382,15 +382,37 @@ class SubscriptionView(PGChildNodeView, SchemaDiffObjectCompare):
         if len(res['rows']) == 0:
             return False, gone(self._NOT_FOUND_PUB_INFORMATION)
 
+        return True, self._format_properties(res['rows'][0])
+
+    def _format_properties(self, data):
+        """
+        This function formats the properties of the subscription.
+        :param data: Properties of the subscription
+        :return:
+        """
         if self.manager.version >= 150000:
-            res['rows'][0]['two_phase'] = \
-                self.two_phase_mapping[res['rows'][0]['two_phase']]
+            data['two_phase'] = self.two_phase_mapping[data['two_phase']]
 
         if self.manager.version >= 160000:
-            res['rows'][0]['streaming'] = \
-                self.streaming_mapping[res['rows'][0]['streaming']]
+            data['streaming'] = self.streaming_mapping[data['streaming']]
 
-        return True, res['rows'][0]
+        return data
+
+    def _fetch_database_properties(self, did):
+        """
+        This function returns the properties of all the subscriptions of the
+        database by OID, fetched with one query instead of one per
+        subscription. Returns None if they could not be fetched.
+        :param did:
+        """
+        sql = render_template(
+            "/".join([self.template_path, self._PROPERTIES_SQL]), did=did)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return None
+
+        return dict((row['oid'], self._format_properties(row))
+                    for row in res['rows'])
 
     @check_precondition
     def statistics(self, gid, sid, did, subid=None):
@@ -922,10 +944,15 @@ class SubscriptionView(PGChildNodeView, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=rset)
 
+        # Properties of the subscriptions of the database, fetched in bulk
+        properties = self._fetch_database_properties(did) or dict()
         for row in rset['rows']:
-            status, data = self._fetch_properties(did, row['oid'])
-            if status:
-                res[row['name']] = data
+            data = properties.get(row['oid'])
+            if data is None:
+                status, data = self._fetch_properties(did, row['oid'])
+                if not status:
+                    continue
+            res[row['name']] = data
 
         return res
 
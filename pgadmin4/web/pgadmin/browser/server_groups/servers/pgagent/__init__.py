@@ -24,22 +24,36 @@ import functools
 import logging
 import threading
 
-from flask import render_template, request, jsonify, current_app
+from flask import render_template, request, jsonify, current_app, Response
 import flask
 from flask_babel import gettext as _
 from flask_login import current_user
+from flask_socketio import join_room, leave_room
 
+import config
 from config import PG_DEFAULT_DRIVER  
 
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.browser.server_groups import servers
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone, success_return
+    make_response as ajax_response, gone, success_return, bad_request, \
+    get_no_cache_header
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.preferences import Preferences
+from pgadmin.utils.crypto import decrypt
+from pgadmin.utils.exception import CryptKeyMissing
+from pgadmin.utils.master_password import get_crypt_key
+from pgadmin.user_login_check import pga_login_required
 from pgadmin.browser.server_groups.servers.pgagent.utils \
-    import format_schedule_data, format_step_data
+    import format_schedule_data, format_step_data, parse_audit_log_cursor, \
+    parse_audit_operation_types, parse_audit_retention, parse_job_ids, \
+    parse_dependency_set
+from pgadmin.browser.server_groups.servers.pgagent.job_status_listener \
+    import JobStatusListenerRegistry, get_room_name, get_job_id
+from pgadmin.browser.server_groups.servers.pgagent.dependency_graph \
+    import JobDependencyGraph, JobDependencyGraphCache, \
+    plan_dependency_update
 from pgadmin import socketio
 
 # Configure logging
@@ -51,6 +65,16 @@ SOCKETIO_NAMESPACE = '/pgagent'
 # Dictionary to store server's active listeners
 active_listeners = {}
 
+# Shared, reference counted LISTEN connections (one per server)
+job_status_listeners = JobStatusListenerRegistry()
+
+# Cached job dependency graphs (one per server). The cache holds a
+# subscription to the shared listener of the server, which tells when the
+# graph is out of date.
+job_dependency_graphs = JobDependencyGraphCache(
+    config.PGAGENT_DEPENDENCY_GRAPH_CACHE_TIMEOUT)
+DEPENDENCY_GRAPH_SUBSCRIBER = 'pga_job_dependency_graph'
+
 
 class JobModule(CollectionNodeModule):
     _NODE_TYPE = 'pga_job'
@@ -202,246 +226,265 @@ def echo_test(data):
     return response
 
 
+def _get_listener_conninfo(manager):
+    """
+    Build the connection string for the shared LISTEN connection of a server.
+    This must run in a request context, as the saved password can only be
+    decrypted with the current user's crypt key.
+    """
+    password = None
+    conn = manager.connection()
+    encpass = getattr(conn, 'password', None) or manager.password
+    if encpass:
+        crypt_key_present, crypt_key = get_crypt_key()
+        if not crypt_key_present:
+            raise CryptKeyMissing()
+        password = decrypt(encpass, crypt_key)
+        if isinstance(password, bytes):
+            password = password.decode()
+    elif manager.passexec:
+        password = manager.passexec.get()
+
+    return manager.create_connection_string(
+        manager.db, manager.user, password)
+
+
+def _emit_job_status_update(sid):
+    """
+    Returns the callable used by the shared listener of a server to fan out
+    an update to the clients watching every job of the server, and to the
+    clients which subscribed to that particular job.
+    """
+    room = get_room_name(sid)
+
+    def emit(payload):
+        jobid = get_job_id(payload)
+        to = room if jobid is None else [room, get_room_name(sid, jobid)]
+        socketio.emit('job_status_update', payload,
+                      namespace=SOCKETIO_NAMESPACE, to=to)
+    return emit
+
+
+def _get_dependency_graph_version(sid, manager):
+    """
+    Returns the version of the dependency graph of the server, as tracked by
+    its shared listener, or None if it cannot be tracked (yet). The graph
+    cache subscribes to the listener, starting it if needed.
+    """
+    listener = job_status_listeners.get(sid)
+    if listener is None or listener.stopped or \
+            DEPENDENCY_GRAPH_SUBSCRIBER not in listener.subscribers:
+        try:
+            conninfo = None
+            if listener is None or listener.stopped:
+                conninfo = _get_listener_conninfo(manager)
+            listener, _ = job_status_listeners.acquire(
+                current_app._get_current_object(), sid,
+                DEPENDENCY_GRAPH_SUBSCRIBER, conninfo,
+                _emit_job_status_update(sid),
+                config.PGAGENT_JOB_STATUS_COALESCE_WINDOW / 1000
+            )
+        except Exception as e:
+            current_app.logger.warning(
+                'Could not listen for job dependency changes on server '
+                '%s: %s', sid, e)
+            return None
+
+    return listener.graph_cache_key
+
+
+def get_job_dependency_graph(sid, manager, conn):
+    """
+    Returns the dependency graph of the jobs of the server, from the cache
+    unless the jobs or their dependencies changed since it was built.
+    :return: (status, JobDependencyGraph or error message)
+    """
+    for expired_sid in job_dependency_graphs.evict_expired():
+        job_status_listeners.release(expired_sid, DEPENDENCY_GRAPH_SUBSCRIBER)
+
+    # Read the version before the graph, a change made while it is being
+    # built makes it out of date right away.
+    version = _get_dependency_graph_version(sid, manager)
+    graph = job_dependency_graphs.get(sid, version)
+    if graph is not None:
+        return True, graph
+
+    status, res = conn.execute_dict(
+        render_template('pga_job/sql/pre3.4/dependency_graph.sql')
+    )
+    if not status:
+        return False, res
+
+    graph = JobDependencyGraph(
+        ((row['jobid'], row['jobname']) for row in res['rows']),
+        ((row['jobid'], dep) for row in res['rows']
+         for dep in row['dependent_jobids'] or [])
+    )
+    job_dependency_graphs.put(sid, version, graph)
+    return True, graph
+
+
+def _get_client_rooms(sid, job_ids):
+    """
+    Returns the rooms a client has to be in to receive the updates of the
+    given jobs. None means every job of the server.
+    """
+    if job_ids is None:
+        return {get_room_name(sid)}
+    return {get_room_name(sid, jobid) for jobid in job_ids}
+
+
+def _release_job_status_listener(sid, client_sid):
+    """
+    Drop the subscription of client_sid to the server and update the
+    active_listeners book-keeping.
+    """
+    if sid in active_listeners and client_sid in active_listeners[sid]:
+        for room in _get_client_rooms(
+                sid, active_listeners[sid][client_sid].get('job_ids')):
+            leave_room(room, sid=client_sid, namespace=SOCKETIO_NAMESPACE)
+        del active_listeners[sid][client_sid]
+        if not active_listeners[sid]:
+            del active_listeners[sid]
+
+    if job_status_listeners.release(sid, client_sid):
+        current_app.logger.info(
+            '[SocketIO pgAgent] No more subscribers for server %s, shared '
+            'job status listener stopped', sid)
+
+
 @socketio.on('start_job_status_listener', namespace=SOCKETIO_NAMESPACE)
 def start_job_status_listener(data):
     """
-    Start a listener for pgAgent job status notifications.
-    This function is called via a Socket.IO event.
+    Subscribe the client to the pgAgent job status notifications of a server.
+    All the clients of a server share a single LISTEN connection, and the
+    notifications are fanned out to the server's Socket.IO room.
     """
-    import json
-    
-    # Get the server ID from the data
     sid = data.get('sid', None)
     client_info = data.get('client_info', {})
     current_app.logger.info(
-        f"Starting job status listener for server ID {sid} from client {client_info.get('client_id', 'unknown')}"
+        "Starting job status listener for server ID %s from client %s",
+        sid, client_info.get('client_id', 'unknown')
     )
-    
+
+    def _emit_error(error, code, server_id=None):
+        socketio.emit('job_status_listener_error', {
+            'error': error,
+            'server_id': server_id,
+            'status': 'error',
+            'code': code
+        }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+    if sid is None:
+        current_app.logger.error(
+            "No server ID provided for job status listener")
+        _emit_error('No server ID provided', 'NO_SERVER_ID')
+        return
+
+    # Convert to integer if it's a string
+    if isinstance(sid, str) and sid.isdigit():
+        sid = int(sid)
+
     try:
-        # Check if we have a server ID
-        if sid is None:
-            current_app.logger.error("No server ID provided for job status listener")
-            socketio.emit('job_status_listener_error', {
-                'error': 'No server ID provided',
-                'server_id': None,
-                'status': 'error',
-                'code': 'NO_SERVER_ID'
-            }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
-            return
-        
-        # Convert to integer if it's a string
-        if isinstance(sid, str) and sid.isdigit():
-            sid = int(sid)
-            
-        # Get the server's connection manager
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
         if not manager:
-            current_app.logger.error(f"Could not find connection manager for server ID {sid}")
-            socketio.emit('job_status_listener_error', {
-                'error': 'Server connection not found',
-                'server_id': sid,
-                'status': 'error',
-                'code': 'SERVER_NOT_FOUND'
-            }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
-            return
-        
-        # Make sure we have a connection - explicitly use synchronous connection
-        conn = manager.connection(async_=0)
-        if not conn:
-            current_app.logger.error(f"Could not get connection for server ID {sid}")
-            socketio.emit('job_status_listener_error', {
-                'error': 'Database connection not available',
-                'server_id': sid,
-                'status': 'error',
-                'code': 'CONNECTION_ERROR'
-            }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
+            current_app.logger.error(
+                "Could not find connection manager for server ID %s", sid)
+            _emit_error('Server connection not found', 'SERVER_NOT_FOUND',
+                        sid)
             return
-        
-        # Set up a LISTEN command to listen for pgAgent job status updates
-        try:
-            # Use execute_void for more reliable execution of the LISTEN command
-            current_app.logger.info(f"Setting up LISTEN for pgAgent job status updates on server {sid}")
-            status, result = conn.execute_void("LISTEN job_status_update")
-            
-            if not status:
-                current_app.logger.error(f"Failed to execute LISTEN command: {result}")
-                socketio.emit('job_status_listener_error', {
-                    'error': f'Database error: Failed to execute LISTEN command: {result}',
-                    'server_id': sid,
-                    'status': 'error',
-                    'code': 'DB_ERROR_LISTEN_FAILED'
-                }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
-                return
-                
-            # Double-check that we're actually listening
-            status, channels = conn.execute_dict("SELECT pg_listening_channels() AS channel")
-            if status and 'rows' in channels:
-                has_pgagent_channel = any(row['channel'] == 'job_status_update' for row in channels['rows'])
-                current_app.logger.info(f"LISTEN command executed. Listening on job_status_update: {has_pgagent_channel}")
-                
-                if not has_pgagent_channel:
-                    current_app.logger.warning(f"LISTEN command executed but job_status_update not in listening channels. Retrying...")
-                    # Try again
-                    conn.execute_void("LISTEN job_status_update")
-            
-            current_app.logger.info(f"Listening for pgAgent job status updates on server {sid}")
-            
-            # Store the connection in the active_listeners dict for notifications
-            if sid not in active_listeners:
-                active_listeners[sid] = {}
-            
-            # Store the connection and user for this client
-            active_listeners[sid][request.sid] = {
-                'conn': conn, 
-                'user': current_user._get_current_object(),
-                'server_info': {
+
+        client_sid = request.sid
+        listener = job_status_listeners.get(sid)
+        conninfo = None
+        if listener is None or listener.stopped:
+            conninfo = _get_listener_conninfo(manager)
+
+        listener, created = job_status_listeners.acquire(
+            current_app._get_current_object(), sid, client_sid, conninfo,
+            _emit_job_status_update(sid),
+            config.PGAGENT_JOB_STATUS_COALESCE_WINDOW / 1000
+        )
+
+        if sid not in active_listeners:
+            active_listeners[sid] = {}
+
+        # Keep the job subscription of the client across restarts of the
+        # listener (e.g. Socket.IO reconnection).
+        job_ids = active_listeners[sid].get(client_sid, {}).get('job_ids')
+        for room in _get_client_rooms(sid, job_ids):
+            join_room(room, sid=client_sid, namespace=SOCKETIO_NAMESPACE)
+
+        active_listeners[sid][client_sid] = {
+            'user': current_user._get_current_object(),
+            'job_ids': job_ids,
+            'server_info': {
                 'server_id': sid,
-                'client_id': client_info.get('client_id', request.sid),
-                'socket_id': request.sid,
+                'client_id': client_info.get('client_id', client_sid),
+                'socket_id': client_sid,
                 'started_at': datetime.now().isoformat()
-                }
             }
-            
-            # Run async function in a new thread
-            async def check_notifications(app, sid, client_sid):
-                """
-                Background thread to listen for pgAgent job status updates using raw PostgreSQL connection.
-                
-                Args:
-                    app: Flask application context
-                    sid: Server ID
-                """
-                max_retries = 3
-                retry_delay = 5  # seconds
-                retry_count = 0
-                
-                while retry_count < max_retries:
-                    try:
-                        with app.app_context():                            
-                            # Get server from model
-                            from pgadmin.model import Server
-                            server = Server.query.filter_by(id=sid).first()
-                            
-                            if not server:
-                                logger.error(f"Server with ID {sid} not found")
-                                return
-                                
-                            # Create raw connection using psycopg
-                            import psycopg
-                            from psycopg.conninfo import make_conninfo
-                            
-                            # Build connection string from server details
-                            conninfo = make_conninfo(
-                                dbname=server.maintenance_db,
-                                user=server.username,
-                                password=server.password,
-                                host=server.host,
-                                port=server.port,
-                                sslmode=server.ssl_mode if hasattr(server, 'ssl_mode') else None
-                            )
-                            
-                            # Create async connection
-                            async with await psycopg.AsyncConnection.connect(conninfo) as conn:
-                                # Set up notification listener
-                                async with conn.cursor() as cur:
-                                    await cur.execute("LISTEN job_status_update")
-                                    await conn.commit() 
-                                    logger.info(f"Listening for pgAgent job updates on server {sid}")
-                                
-                                # Reset retry count on successful connection
-                                retry_count = 0
-                                while True:
-                                    logger.info(f"Checking for pgAgent job updates on server {sid}")
-                                    # Process notifications
-                                    async for notify in conn.notifies():
-                                        logger.info(f"Received pgAgent job update notification: {notify}")
-                                        try:
-                                            # Parse notification payload
-                                            payload = json.loads(notify.payload)
-                                            payload['sid'] = sid
-                                            try:
-                                                socketio.emit('job_status_update', 
-                                                    payload,
-                                                    namespace=SOCKETIO_NAMESPACE, 
-                                                    to=client_sid)
-                                            except Exception as e:
-                                                    logger.error('[SocketIO pgAgent] Error emitting job status update: %s', str(e))
-                                        except json.JSONDecodeError as e:
-                                            logger.error(f"Error parsing notification payload: {e}")
-                                        except Exception as e:
-                                            logger.error(f"Error processing notification: {e}")
-                                        
-                    except Exception as e:
-                        retry_count += 1
-                        logger.error(f"Error in notification listener (attempt {retry_count}/{max_retries}): {e}")
-                        logger.error(traceback.format_exc())
-                        
-                        if retry_count < max_retries:
-                            logger.info(f"Retrying connection in {retry_delay} seconds...")
-                            await asyncio.sleep(retry_delay)
-                        else:
-                            logger.error("Max retries exceeded. Stopping notification listener.")
-                            break
-                            
-                logger.info(f"Notification listener stopped for server {sid}")
-
-            def start_job_status_listener(app, sid, client_sid):
-                """Start the notification listener in a new event loop"""
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(check_notifications(app, sid, client_sid))
-                except Exception as e:
-                    logger.error(f"Error in notification listener thread: {e}")
-                    logger.error(traceback.format_exc())
-                finally:
-                    loop.close()
-
-            client_sid = request.sid
-            thread = threading.Thread(
-                target=start_job_status_listener, 
-                args=(current_app._get_current_object(), sid, client_sid), 
-                daemon=True
-            )
-            thread.start()
+        }
+
+        current_app.logger.info(
+            "Job status listener %s for server %s, client %s "
+            "(%d subscribers)", 'started' if created else 'shared', sid,
+            client_sid, len(listener.subscribers))
+
+        socketio.emit('job_status_listener_started', {
+            'status': 'success',
+            'server_id': sid,
+            'message': 'Job status listener started successfully',
+            'listener_info': active_listeners[sid][client_sid]['server_info']
+        }, namespace=SOCKETIO_NAMESPACE, to=client_sid)
 
-            
-            # Send success response to client
-            socketio.emit('job_status_listener_started', {
-                'status': 'success',
-                'server_id': sid,
-                'message': 'Job status listener started successfully',
-                'listener_info': active_listeners[sid][request.sid]['server_info']
-            }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
-            
-            current_app.logger.info(f"Job status listener started for server {sid}, client {request.sid}")
-            
-        except Exception as e:
-            # Handle specific database errors
-            error_msg = str(e)
-            error_code = getattr(e, 'pgcode', 'UNKNOWN_ERROR')
-            current_app.logger.error(f"Database error setting up job status listener: {error_msg}")
-            current_app.logger.error(traceback.format_exc())
-            
-            socketio.emit('job_status_listener_error', {
-                'error': f"Database error: {error_msg}",
-                'server_id': sid,
-                'status': 'error',
-                'code': f'DB_ERROR_{error_code}'
-            }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
-            
     except Exception as e:
-        # Log the full exception details for debugging
-        current_app.logger.error(f"Error starting job status listener: {str(e)}")
+        current_app.logger.error(
+            "Error starting job status listener: %s", str(e))
         current_app.logger.error(traceback.format_exc())
-        
+        _emit_error("Server error: {0}".format(str(e)), 'SERVER_ERROR', sid)
+
+
+@socketio.on('subscribe_jobs', namespace=SOCKETIO_NAMESPACE)
+def subscribe_jobs(data):
+    """
+    Restrict the job status updates pushed to this client to a set of jobs.
+    A null 'job_ids' subscribes the client to every job of the server again.
+    The client must have started the job status listener of the server.
+    """
+    sid = data.get('sid')
+    if isinstance(sid, str) and sid.isdigit():
+        sid = int(sid)
+
+    client_sid = request.sid
+    if sid not in active_listeners or \
+            client_sid not in active_listeners[sid]:
         socketio.emit('job_status_listener_error', {
-            'error': f"Server error: {str(e)}",
-            'server_id': sid if 'sid' in locals() else None,
+            'error': 'Job status listener is not started for this server',
+            'server_id': sid,
             'status': 'error',
-            'code': 'SERVER_ERROR'
-        }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
+            'code': 'LISTENER_NOT_STARTED'
+        }, namespace=SOCKETIO_NAMESPACE, to=client_sid)
+        return
+
+    job_ids = data.get('job_ids')
+    if job_ids is not None:
+        job_ids = sorted({str(jobid) for jobid in job_ids})
+
+    client = active_listeners[sid][client_sid]
+    old_rooms = _get_client_rooms(sid, client.get('job_ids'))
+    new_rooms = _get_client_rooms(sid, job_ids)
+
+    for room in old_rooms - new_rooms:
+        leave_room(room, sid=client_sid, namespace=SOCKETIO_NAMESPACE)
+    for room in new_rooms - old_rooms:
+        join_room(room, sid=client_sid, namespace=SOCKETIO_NAMESPACE)
+    client['job_ids'] = job_ids
 
+    socketio.emit('job_subscription_updated', {
+        'server_id': sid,
+        'job_ids': job_ids
+    }, namespace=SOCKETIO_NAMESPACE, to=client_sid)
 
 
 @socketio.on('stop_job_status_listener', namespace=SOCKETIO_NAMESPACE)
@@ -449,139 +492,67 @@ def stop_job_status_listener(data):
     """
     Stop listening for job status updates for this client
     """
-    current_app.logger.info('📢[SocketIO pgAgent] Stopping job status listener for client: %s', request.sid)
-    current_app.logger.debug('📢[SocketIO pgAgent] Request data: %s', str(data))
-    
+    current_app.logger.info(
+        '[SocketIO pgAgent] Stopping job status listener for client: %s',
+        request.sid)
+
     try:
         sid = data.get('sid')
         if not sid:
-            current_app.logger.warning('📢[SocketIO pgAgent] No server ID provided for stop_job_status_listener')
+            current_app.logger.warning(
+                '[SocketIO pgAgent] No server ID provided for '
+                'stop_job_status_listener')
             return
-            
-        current_app.logger.debug('📢[SocketIO pgAgent] Active listeners before stopping: %s', 
-                       str({k: list(v.keys()) for k, v in active_listeners.items()}))
-            
-        if sid not in active_listeners:
-            current_app.logger.debug('📢[SocketIO pgAgent] No active listeners found for server: %s', sid)
-            return
-            
-        if request.sid in active_listeners[sid]:
-            conn = active_listeners[sid][request.sid]['conn']
-            try:
-                current_app.logger.debug('📢[SocketIO pgAgent] Issuing UNLISTEN command for server: %s', sid)
-                status, result = conn.execute_void("UNLISTEN job_status_update")
-                current_app.logger.info('📢[SocketIO pgAgent] UNLISTEN command issued for job_status_update on server: %s (Status: %s)', 
-                              sid, status)
-                if not status:
-                    current_app.logger.warning('📢[SocketIO pgAgent] Failed to execute UNLISTEN command: %s', str(result))
-            except Exception as e:
-                current_app.logger.warning('📢[SocketIO pgAgent] Error issuing UNLISTEN command: %s', str(e))
-                current_app.logger.debug('📢[SocketIO pgAgent] Exception details: %s', traceback.format_exc())
-                
-            del active_listeners[sid][request.sid]
-            current_app.logger.info('📢[SocketIO pgAgent] Removed client %s from active listeners for server %s', 
-                          request.sid, sid)
-            
-            # Clean up if no more listeners for this server
-            if not active_listeners[sid]:
-                del active_listeners[sid]
-                current_app.logger.info('📢[SocketIO pgAgent] No more active listeners for server %s, removed server entry', sid)
-                
-        current_app.logger.debug('📢[SocketIO pgAgent] Active listeners after stopping: %s', 
-                       str({k: list(v.keys()) for k, v in active_listeners.items()}))
-                
-        socketio.emit('job_status_listener_stopped', 
-                     {'sid': sid},
-                     namespace=SOCKETIO_NAMESPACE, 
-                     to=request.sid)
-        current_app.logger.info('📢[SocketIO pgAgent] Job status listener stopped for client %s on server %s', 
-                      request.sid, sid)
+
+        if isinstance(sid, str) and sid.isdigit():
+            sid = int(sid)
+
+        _release_job_status_listener(sid, request.sid)
+
+        socketio.emit('job_status_listener_stopped',
+                      {'sid': sid},
+                      namespace=SOCKETIO_NAMESPACE,
+                      to=request.sid)
+        current_app.logger.info(
+            '[SocketIO pgAgent] Job status listener stopped for client %s '
+            'on server %s', request.sid, sid)
     except Exception as e:
-        current_app.logger.error('📢[SocketIO pgAgent] Error stopping job status listener: %s', str(e))
-        current_app.logger.error('📢[SocketIO pgAgent] Exception details: %s', traceback.format_exc())
-        socketio.emit('job_status_listener_error', 
-                     'Error stopping listener: ' + str(e),
-                     namespace=SOCKETIO_NAMESPACE, 
-                     to=request.sid)
+        current_app.logger.error(
+            '[SocketIO pgAgent] Error stopping job status listener: %s',
+            str(e))
+        current_app.logger.debug(traceback.format_exc())
+        socketio.emit('job_status_listener_error',
+                      'Error stopping listener: ' + str(e),
+                      namespace=SOCKETIO_NAMESPACE,
+                      to=request.sid)
+
 
 @socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
 def handle_client_disconnect(event=None):
     """
-    Handle client disconnection
+    Handle client disconnection. Socket.IO removes the client from its rooms,
+    we only have to drop its references on the shared listeners.
     """
-    # Import for exception handling
-    from pgadmin.utils.exception import CryptKeyMissing
-    
     client_sid = request.sid if hasattr(request, 'sid') else None
-    current_app.logger.info('📢[SocketIO pgAgent] Client disconnected: %s', client_sid)
-    
-    # If no client SID, we can't clean up
+    current_app.logger.info(
+        '[SocketIO pgAgent] Client disconnected: %s', client_sid)
+
     if not client_sid:
-        current_app.logger.warning('📢[SocketIO pgAgent] No client SID available for disconnect cleanup')
-        return
-    
-    client_servers = []
-    
-    # Find all servers this client was listening to
-    for sid in list(active_listeners.keys()):
-        if client_sid in active_listeners[sid]:
-            client_servers.append((sid, active_listeners[sid][client_sid]['conn']))
-    
-    if not client_servers:
-        current_app.logger.info('📢[SocketIO pgAgent] No active listeners found for client %s', client_sid)
         return
-    
-    current_app.logger.info('📢[SocketIO pgAgent] Cleaning up %d active listeners for client %s', 
-                      len(client_servers), client_sid)
-    
-    # Clean up each connection
-    for sid, conn in client_servers:
+
+    for sid in [sid for sid, clients in list(active_listeners.items())
+                if client_sid in clients]:
         try:
-            if conn and hasattr(conn, 'connected') and conn.connected():
-                current_app.logger.info('📢[SocketIO pgAgent] Closing connection for server %s, client %s', 
-                                  sid, client_sid)
-                
-                try:
-                    # Try to execute UNLISTEN
-                    conn.execute_dict("UNLISTEN job_status_update")
-                except CryptKeyMissing as e:
-                    current_app.logger.error('❌ [SocketIO pgAgent] Crypto key missing error during UNLISTEN: %s', str(e))
-                    current_app.logger.debug('This typically occurs when a background thread cannot access the master password')
-                except Exception as e:
-                    current_app.logger.warning('📢[SocketIO pgAgent] Error during UNLISTEN: %s', str(e))
-                
-                try:
-                    # Close the connection if it has a close method
-                    if hasattr(conn, 'close'):
-                        conn.close()
-                    elif hasattr(conn, 'release'):
-                        conn.release()
-                    else:
-                        current_app.logger.warning('📢[SocketIO pgAgent] Connection object has no close or release method')
-                except Exception as e:
-                    current_app.logger.warning('📢[SocketIO pgAgent] Error closing connection: %s', str(e))
-            
-            # Remove from active listeners dict
-            if sid in active_listeners and client_sid in active_listeners[sid]:
-                del active_listeners[sid][client_sid]
-                
-                # If no more clients for this server, clean up the server entry
-                if not active_listeners[sid]:
-                    del active_listeners[sid]
-                
-                current_app.logger.info('📢[SocketIO pgAgent] Removed listener for server %s, client %s', 
-                                  sid, client_sid)
-            
-        except CryptKeyMissing as e:
-            current_app.logger.error('❌ [SocketIO pgAgent] Crypto key missing error during disconnect cleanup: %s', str(e))
-            current_app.logger.debug('This typically occurs when a background thread cannot access the master password')
+            _release_job_status_listener(sid, client_sid)
         except Exception as e:
-            current_app.logger.error('📢[SocketIO pgAgent] Error cleaning up listener: %s', str(e))
-    
-    # Log the remaining active listeners for debugging
-    remaining_listeners = sum(len(clients) for clients in active_listeners.values())
-    current_app.logger.info('📢[SocketIO pgAgent] Disconnect cleanup complete. %d remaining active listeners', 
-                      remaining_listeners)
+            current_app.logger.error(
+                '[SocketIO pgAgent] Error cleaning up listener: %s', str(e))
+
+    current_app.logger.info(
+        '[SocketIO pgAgent] Disconnect cleanup complete. %d remaining '
+        'active listeners',
+        sum(len(clients) for clients in active_listeners.values()))
+
 
 def with_app_context(func):
     """Decorator to ensure function runs in application context"""
@@ -628,19 +599,18 @@ def get_active_listeners():
     try:
         # Collect information about active listeners
         for server_id, clients in active_listeners.items():
+            listener = job_status_listeners.get(server_id)
             listener_info[server_id] = {
                 'client_count': len(clients),
+                'listener': listener.metrics() if listener else None,
                 'clients': []
             }
-            
-            for client_id, conn_user in clients.items():
-                connection_status = 'unknown'
-                if conn_user['conn']:
-                    try:
-                        connection_status = 'connected' if conn_user['conn'].connected() else 'disconnected'
-                    except Exception as e:
-                        connection_status = f'error: {str(e)}'
-                
+
+            connection_status = 'disconnected'
+            if listener is not None and listener.connected:
+                connection_status = 'connected'
+
+            for client_id in clients.keys():
                 # Get socketio client info
                 socket_connected = False
                 try:
@@ -677,6 +647,21 @@ def get_active_listeners():
             errormsg=f"Error collecting listener information: {str(e)}"
         )
 
+
+@blueprint.route('/listener_metrics/', methods=['GET'],
+                 endpoint='listener_metrics')
+@pga_login_required
+def get_listener_metrics():
+    """
+    Return the per-server metrics of the shared job status listeners, i.e.
+    the subscriber count and the notification rate.
+    """
+    return make_json_response(
+        data=job_status_listeners.metrics(),
+        status=200
+    )
+
+
 class JobView(PGChildNodeView):
     node_type = blueprint.node_type
 
@@ -702,7 +687,15 @@ class JobView(PGChildNodeView):
         'children': [{'get': 'children'}],
         'stats': [{'get': 'statistics'}],
         'audit_log': [{'get': 'audit_log'}],
-        'dependency_graph': [{'get': 'dependency_graph'}]
+        'audit_retention': [
+            {}, {'get': 'audit_retention', 'put': 'update_audit_retention'}
+        ],
+        'dependency_graph': [
+            {'get': 'dependency_graph'}, {'get': 'dependency_graph'}
+        ],
+        'dependencies': [
+            {}, {'get': 'dependencies', 'put': 'bulk_update_dependencies'}
+        ]
     })
 
     def check_precondition(f):
@@ -732,7 +725,9 @@ class JobView(PGChildNodeView):
             WHERE
                 table_schema='pgagent' AND table_name='pga_jobstep' AND
                 column_name='jstconnstr'
-        ) has_connstr""")
+        ) has_connstr,
+        pg_catalog.to_regclass('pgagent.pga_job_audit_retention') IS NOT NULL
+            has_audit_retention""")
 
                     self.manager.db_info['pgAgent'] = res['rows'][0]
 
@@ -876,33 +871,14 @@ class JobView(PGChildNodeView):
 
         row['jdependencies'] = rset['rows']
         
-        # Get audit logs for the job
-        status, rset = self.conn.execute_dict(
-            render_template(
-                "/".join([self.template_path, 'audit_log.sql']),
-                jid=jid, conn=self.conn
-            )
-        )
+        # Get the whole audit log of the job, the Audit Logs tab has no
+        # paging. The audit_log endpoint serves it one page at a time.
+        status, page = self._fetch_audit_log_page(jid, paginate=False)
         if not status:
-            return internal_server_error(errormsg=rset)
-            
-        # Process JSON fields to ensure they're properly formatted
-        for audit_row in rset['rows']:
-            if 'old_values' in audit_row and audit_row['old_values']:
-                if isinstance(audit_row['old_values'], str):
-                    try:
-                        audit_row['old_values'] = json.loads(audit_row['old_values'])
-                    except ValueError:
-                        pass
-                        
-            if 'new_values' in audit_row and audit_row['new_values']:
-                if isinstance(audit_row['new_values'], str):
-                    try:
-                        audit_row['new_values'] = json.loads(audit_row['new_values'])
-                    except ValueError:
-                        pass
-                        
-        row['audit_logs'] = rset['rows']
+            return internal_server_error(errormsg=page)
+
+        row['audit_logs'] = json.loads(page)['rows'] \
+            if page is not None else []
 
         return ajax_response(
             response=row,
@@ -1249,153 +1225,403 @@ class JobView(PGChildNodeView):
             status=200
         )
 
+    def _fetch_audit_log_page(self, jid, operation_types=None,
+                              date_from=None, date_to=None, cursor=None,
+                              sort_order='desc', paginate=True):
+        """
+        Fetch one page of the audit log of a job, in (operation_time,
+        audit_id) order, limited to the pgAgent row threshold preference.
+        Without paginate, all the entries are fetched in a single page.
+
+        :return: (status, page) where page is the json text of
+            {'rows': [...], 'next_cursor': ...}, or None if the audit log
+            table does not exist.
+        """
+        status, exists = self.conn.execute_scalar(
+            "SELECT pg_catalog.to_regclass('pgagent.pga_job_audit_log') "
+            "IS NOT NULL"
+        )
+        if not status:
+            return False, exists
+        if not exists:
+            return True, None
+
+        rows_threshold = None
+        if paginate:
+            rows_threshold = Preferences.module('browser').preference(
+                'pgagent_row_threshold'
+            ).get()
+
+        params = {
+            'jid': jid,
+            'operation_types': operation_types,
+            'date_from': date_from,
+            'date_to': date_to,
+            'rows_threshold': rows_threshold
+        }
+        if cursor:
+            params['cursor_time'], params['cursor_id'] = cursor
+
+        return self.conn.execute_scalar(
+            render_template(
+                "/".join([self.template_path, 'audit_log.sql']),
+                jid=jid,
+                conn=self.conn,
+                operation_types=operation_types,
+                date_from=date_from,
+                date_to=date_to,
+                cursor=cursor,
+                sort_order=sort_order,
+                rows_threshold=rows_threshold,
+                has_retention=self.manager.db_info['pgAgent'].get(
+                    'has_audit_retention')
+            ),
+            params
+        )
+
     @check_precondition
     def audit_log(self, gid, sid, jid):
         """
-        Returns the audit log entries for the specified job.
-        """
-        # First check if the audit log table exists
-        check_sql = """
-        SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_schema = 'pgagent' 
-            AND table_name = 'pga_job_audit_log'
-        ) as table_exists;
+        Returns one page of the audit log entries for the specified job.
+
+        The entries are sorted on (operation_time, audit_id), newest first
+        unless sort_order is 'asc'. The 'next_cursor' of the response is
+        passed as the 'cursor' argument to get the next page, and is null
+        on the last page.
         """
-        status, check_res = self.conn.execute_dict(check_sql)
-        
+        operation_types = request.args.get('operation_types', None)
+        cursor = request.args.get('cursor', None)
+        sort_order = request.args.get('sort_order', 'desc').lower()
+
+        try:
+            if operation_types:
+                operation_types = parse_audit_operation_types(
+                    operation_types)
+            if cursor:
+                cursor = parse_audit_log_cursor(cursor)
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        if sort_order not in ('asc', 'desc'):
+            return bad_request(
+                errormsg=_("Invalid sort order: {0}").format(sort_order))
+
+        status, page = self._fetch_audit_log_page(
+            jid,
+            operation_types=operation_types or None,
+            date_from=request.args.get('date_from', None) or None,
+            date_to=request.args.get('date_to', None) or None,
+            cursor=cursor or None,
+            sort_order=sort_order
+        )
         if not status:
-            return internal_server_error(errormsg=check_res)
-            
-        if len(check_res['rows']) == 0 or not check_res['rows'][0]['table_exists']:
+            return internal_server_error(errormsg=page)
+
+        if page is None:
             # Table doesn't exist, return empty result
             return ajax_response(
-                response={'rows': [], 'msg': 'Audit log table does not exist. Please upgrade pgAgent to version 4.3 or later.'},
+                response={
+                    'rows': [], 'next_cursor': None,
+                    'msg': _('Audit log table does not exist. Please '
+                             'upgrade pgAgent to version 4.3 or later.')
+                },
                 status=200
             )
-        
-        # Get row threshold preference
-        pref = Preferences.module('browser')
-        rows_threshold = pref.preference(
-            'pgagent_row_threshold'
+
+        # The page is built by the server as json, send it as it is.
+        return Response(
+            response=page,
+            status=200,
+            mimetype="application/json",
+            headers=get_no_cache_header()
         )
-        
-        # Get filter parameters from request
-        operation_types = request.args.get('operation_types', None)
-        date_from = request.args.get('date_from', None)
-        date_to = request.args.get('date_to', None)
-        
-        # Get sorting parameters
-        sort_column = request.args.get('sort', 'operation_time')
-        sort_order = request.args.get('sort_order', 'desc')
-        
-        # Format operation types for SQL query if provided
-        operation_types_sql = None
-        if operation_types:
-            op_types = operation_types.split(',')
-            # Format as SQL string list: 'CREATE', 'MODIFY', etc.
-            operation_types_sql = "'" + "', '".join(op_types) + "'"
-
-        # Table exists, proceed with query
+
+    @check_precondition
+    def audit_retention(self, gid, sid):
+        """
+        Returns the retention policy of the audit log, whether it is
+        partitioned and its partitions.
+        """
+        if not self.manager.db_info['pgAgent'].get('has_audit_retention'):
+            return gone(
+                errormsg=_('Audit log retention is not supported. Please '
+                           'upgrade pgAgent to version 4.3 or later.'))
+
         status, res = self.conn.execute_dict(
             render_template(
-                "/".join([self.template_path, 'audit_log.sql']),
-                jid=jid,
-                conn=self.conn,
-                operation_types=operation_types_sql,
-                date_from=date_from,
-                date_to=date_to,
-                sort_column=sort_column,
-                sort_order=sort_order,
-                rows_threshold=rows_threshold.get()
+                "/".join([self.template_path, 'audit_retention.sql'])
             )
         )
-
         if not status:
             return internal_server_error(errormsg=res)
-        
-        # Debug: Log the number of rows returned and filter parameters
-        filter_info = f"Filters: operation_types={operation_types}, date_from={date_from}, date_to={date_to}"
-        print(f"Audit log query for job {jid} returned {len(res['rows'])} rows. {filter_info}")
-            
-        # Process JSON fields to ensure they're properly formatted
-        for row in res['rows']:
-            if 'old_values' in row and row['old_values']:
-                if isinstance(row['old_values'], str):
-                    try:
-                        row['old_values'] = json.loads(row['old_values'])
-                    except ValueError:
-                        pass
-                        
-            if 'new_values' in row and row['new_values']:
-                if isinstance(row['new_values'], str):
-                    try:
-                        row['new_values'] = json.loads(row['new_values'])
-                    except ValueError:
-                        pass
 
         return ajax_response(
-            response=res,
+            response=res['rows'][0],
             status=200
         )
 
     @check_precondition
-    def dependency_graph(self, gid, sid):
-        """Get the job dependency graph data."""
+    def update_audit_retention(self, gid, sid):
+        """
+        Updates the retention policy of the audit log. It can also switch
+        the audit log to or from monthly partitions, and apply the policy
+        right away with 'prune'.
+        """
+        if not self.manager.db_info['pgAgent'].get('has_audit_retention'):
+            return gone(
+                errormsg=_('Audit log retention is not supported. Please '
+                           'upgrade pgAgent to version 4.3 or later.'))
+
+        data = request.form if request.form else json.loads(
+            request.data.decode('utf-8')
+        )
         try:
-            # Get all jobs
-            status, jobs = self.conn.execute_dict(
-                render_template(
-                    "/".join([self.template_path, self._NODES_SQL]),
-                    conn=self.conn
-                )
+            data = parse_audit_retention(data)
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        status, res = self.conn.execute_void(
+            render_template(
+                "/".join([self.template_path, 'update_audit_retention.sql']),
+                data=data, conn=self.conn
             )
+        )
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        return self.audit_retention(gid=gid, sid=sid)
+
+    def _get_job_durations(self, jobids=None):
+        """
+        Returns the expected duration in seconds of the jobs, from their
+        last successful runs.
+        """
+        status, res = self.conn.execute_dict(
+            render_template(
+                "/".join([self.template_path, 'job_durations.sql']),
+                jobids=jobids
+            ),
+            {'jobids': jobids}
+        )
+        if not status:
+            return False, res
+        return True, {row['jobid']: row['duration'] for row in res['rows']}
+
+    @check_precondition
+    def dependency_graph(self, gid, sid, jid=None):
+        """
+        Returns the job dependency graph of the server, with the topological
+        level of every job and the cycles. With 'critical_path' set, the
+        longest chain of jobs weighted with their expected duration is
+        added, limited to the comma separated job ids of 'jobs' if given.
+
+        For a job, returns the jobs which must complete before it, the jobs
+        which run after it (i.e. affected if it fails) and the critical path
+        from the job through them.
+        """
+        jobids = request.args.get('jobs', None)
+        try:
+            jobids = parse_job_ids(jobids) if jobids else None
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        status, graph = get_job_dependency_graph(sid, self.manager, self.conn)
+        if not status:
+            return internal_server_error(errormsg=graph)
+
+        if jid is not None:
+            if jid not in graph:
+                return gone(errormsg=self.not_found_error_msg())
+
+            info = graph.job_info(jid)
+            path_jobs = [jid] + info['downstream']
+            status, durations = self._get_job_durations(path_jobs)
             if not status:
-                return internal_server_error(errormsg=jobs)
+                return internal_server_error(errormsg=durations)
+            path, duration = graph.critical_path(durations, path_jobs)
+            info['critical_path'] = {'jobs': path, 'duration': duration}
+            return ajax_response(response=info, status=200)
 
-            # Get all dependencies
-            status, deps = self.conn.execute_dict(
-                render_template(
-                    "/".join([self.template_path, 'dependencies.sql']),
-                    conn=self.conn
-                )
+        status, jobs = self.conn.execute_dict(
+            render_template(
+                "/".join([self.template_path, 'job_status.sql'])
             )
+        )
+        if not status:
+            return internal_server_error(errormsg=jobs)
+
+        nodes = []
+        for job in jobs['rows']:
+            if job['jobid'] not in graph:
+                continue
+            nodes.append({
+                'id': job['jobid'],
+                'name': graph.jobs[job['jobid']],
+                'enabled': job['jobenabled'],
+                'status': job['jlgstatus'],
+                'next_run': job['jobnextrun'],
+                'last_run': job['joblastrun'],
+                'level': graph.level(job['jobid'])
+            })
+
+        response = {
+            'nodes': nodes,
+            'edges': [{
+                'source': jobid,
+                'target': dependent_jobid,
+                'dependent_jobname': graph.jobs[dependent_jobid]
+            } for jobid, dependent_jobid in graph.edges],
+            'levels': graph.levels(),
+            'cycles': graph.cycles()
+        }
+
+        if request.args.get('critical_path', 'false').lower() == 'true':
+            status, durations = self._get_job_durations(jobids)
             if not status:
-                return internal_server_error(errormsg=deps)
+                return internal_server_error(errormsg=durations)
+            path, duration = graph.critical_path(durations, jobids)
+            response['critical_path'] = {'jobs': path, 'duration': duration}
 
-            # Build the graph data
-            nodes = []
-            edges = []
-            
-            # Add nodes for all jobs
-            for job in jobs['rows']:
-                nodes.append({
-                    'id': job['jobid'],
-                    'name': job['jobname'],
-                    'enabled': job['jobenabled'],
-                    'status': job['jlgstatus'],
-                    'next_run': job['jobnextrun'],
-                    'last_run': job['joblastrun']
-                })
+        return ajax_response(response=response, status=200)
 
-            # Add edges for all dependencies
-            for dep in deps['rows']:
-                edges.append({
-                    'source': dep['jobid'],
-                    'target': dep['dependent_jobid'],
-                    'dependent_jobname': dep['dependent_jobname']
-                })
+    @check_precondition
+    def dependencies(self, gid, sid):
+        """
+        Returns the dependencies of all the jobs of the server, in the
+        format accepted by bulk_update_dependencies.
+        """
+        status, res = self.conn.execute_dict(
+            render_template(
+                "/".join([self.template_path, 'dependency_graph.sql'])
+            )
+        )
+        if not status:
+            return internal_server_error(errormsg=res)
 
-            return ajax_response(
-                response={
-                    'nodes': nodes,
-                    'edges': edges
-                },
-                status=200
+        return ajax_response(
+            response=sorted(
+                ({'jobid': row['jobid'], 'dependent_jobid': dep}
+                 for row in res['rows']
+                 for dep in row['dependent_jobids'] or []),
+                key=lambda dep: (dep['jobid'], dep['dependent_jobid'])
+            ),
+            status=200
+        )
+
+    @check_precondition
+    def bulk_update_dependencies(self, gid, sid):
+        """
+        Replaces the dependencies of the jobs with the given set.
+
+        The request has the list of 'dependencies' and optionally the list
+        of 'jobs' whose dependencies are replaced, all the jobs by default.
+        The set is compared to the current dependencies, checked for
+        cycles once as a whole, and the difference is applied in a single
+        transaction. With 'dry_run', nothing is changed.
+        """
+        data = request.form if request.form else json.loads(
+            request.data.decode('utf-8')
+        )
+
+        try:
+            dependency_set = parse_dependency_set(
+                data.get('dependencies', []))
+            scope = data.get('jobs', None)
+            if scope is not None:
+                scope = set(parse_job_ids(scope))
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        status, res = self.conn.execute_void('BEGIN')
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        status, res = self.conn.execute_void(
+            render_template(
+                "/".join([self.template_path, 'lock_dependencies.sql'])
             )
+        )
+        if not status:
+            self.conn.execute_void('END')
+            return internal_server_error(errormsg=res)
 
-        except Exception as e:
-            return internal_server_error(errormsg=str(e))
+        status, res = self.conn.execute_dict(
+            render_template(
+                "/".join([self.template_path, 'dependency_graph.sql'])
+            )
+        )
+        if not status:
+            self.conn.execute_void('END')
+            return internal_server_error(errormsg=res)
+
+        jobs = {row['jobid']: row['jobname'] for row in res['rows']}
+        current = {(row['jobid'], dep) for row in res['rows']
+                   for dep in row['dependent_jobids'] or []}
+        plan = plan_dependency_update(jobs, current, dependency_set, scope)
+
+        errormsg = None
+        if plan['unknown']:
+            errormsg = _('Unknown job(s): {0}').format(
+                ', '.join(str(jobid) for jobid in plan['unknown']))
+        elif plan['out_of_scope']:
+            errormsg = _(
+                'The dependencies of job(s) {0} are not being replaced.'
+            ).format(', '.join(str(jobid)
+                               for jobid in plan['out_of_scope']))
+        if errormsg:
+            self.conn.execute_void('ROLLBACK')
+            return bad_request(errormsg=errormsg)
+
+        cycles = plan['cycles']
+        if cycles:
+            self.conn.execute_void('ROLLBACK')
+            return make_json_response(
+                status=400,
+                success=0,
+                errormsg=_(
+                    'Circular dependency detected between the jobs: {0}'
+                ).format('; '.join(
+                    ', '.join(jobs[jobid] for jobid in cycle)
+                    for cycle in cycles)),
+                data={'cycles': cycles}
+            )
+
+        removed, added = plan['removed'], plan['added']
+        result = {
+            'added': [{'jobid': jobid, 'dependent_jobid': dep}
+                      for jobid, dep in added],
+            'removed': [{'jobid': jobid, 'dependent_jobid': dep}
+                        for jobid, dep in removed],
+            'unchanged': plan['unchanged']
+        }
+
+        if data.get('dry_run', False) in (True, 'true'):
+            self.conn.execute_void('ROLLBACK')
+            return ajax_response(response=result, status=200)
+
+        for action, deps in (('removed', removed), ('added', added)):
+            if not deps:
+                continue
+            status, res = self.conn.execute_void(
+                render_template(
+                    "/".join([self.template_path,
+                              'bulk_update_dependencies.sql']),
+                    **{action: True}
+                ),
+                {
+                    action + '_jobids': [jobid for jobid, _ in deps],
+                    action + '_dependent_jobids': [dep for _, dep in deps]
+                }
+            )
+            if not status:
+                self.conn.execute_void('END')
+                return internal_server_error(errormsg=res)
+
+        status, res = self.conn.execute_void('END')
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        return ajax_response(response=result, status=200)
 
     def format_schedule_step_data(self, data):
         """
@@ -0,0 +1,384 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Job dependency graph of a pgAgent server.
+
+A row (jobid, dependent_jobid) of pga_job_dependency means that jobid runs
+after dependent_jobid has completed: dependent_jobid is upstream of jobid.
+The graph precomputes the strongly connected components, the topological
+level of every job and the upstream/downstream closures of every job, so
+that the questions asked by the UI are answered without walking the graph.
+
+The graphs are cached per server. A cached graph is tagged with the version
+of the server's shared LISTEN connection, which changes whenever a
+job_dependency_update notification is received, so a graph is never served
+after the jobs or their dependencies have changed.
+"""
+
+import threading
+import time
+
+
+class JobDependencyGraph:
+    """
+    Immutable dependency graph of the jobs of a server.
+
+    :param jobs: iterable of (jobid, jobname)
+    :param dependencies: iterable of (jobid, dependent_jobid), dependencies
+        on unknown jobs are ignored
+    """
+
+    def __init__(self, jobs, dependencies):
+        self.jobs = dict(jobs)
+        self._ids = sorted(self.jobs)
+        self._index = {jobid: i for i, jobid in enumerate(self._ids)}
+        self.edges = []
+
+        # Direct neighbours, by index
+        self._upstream = [[] for _ in self._ids]
+        self._downstream = [[] for _ in self._ids]
+        for jobid, dependent_jobid in dependencies:
+            job = self._index.get(jobid)
+            dep = self._index.get(dependent_jobid)
+            if job is None or dep is None:
+                continue
+            self.edges.append((jobid, dependent_jobid))
+            self._upstream[job].append(dep)
+            self._downstream[dep].append(job)
+
+        self._build_components()
+        self._build_levels_and_closures()
+
+    def _build_components(self):
+        """
+        Tarjan's algorithm, without recursion so that long chains of jobs
+        do not hit the recursion limit. The components are found in reverse
+        topological order of the upstream to downstream edges.
+        """
+        count = len(self._ids)
+        index = [None] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] is not None:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, pos = work.pop()
+                if pos == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                children = self._downstream[node]
+                if pos < len(children):
+                    work.append((node, pos + 1))
+                    child = children[pos]
+                    if index[child] is None:
+                        work.append((child, 0))
+                    elif on_stack[child]:
+                        lowlink[node] = min(lowlink[node], index[child])
+                    continue
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        # Upstream components first
+        components.reverse()
+        self._components = components
+        self._component_of = [0] * count
+        for cid, members in enumerate(components):
+            for member in members:
+                self._component_of[member] = cid
+
+    def _build_levels_and_closures(self):
+        """
+        Walk the components in topological order. The closures are kept as
+        bit sets (one bit per job index) so that merging the closures of the
+        upstream jobs is a single 'or'.
+        """
+        components = self._components
+        self._members = []
+        self._cyclic = []
+        for members in components:
+            bits = 0
+            for member in members:
+                bits |= 1 << member
+            self._members.append(bits)
+            self._cyclic.append(
+                len(members) > 1 or members[0] in self._upstream[members[0]]
+            )
+
+        levels = [0] * len(components)
+        upstream = [0] * len(components)
+        for cid, members in enumerate(components):
+            for member in members:
+                for dep in self._upstream[member]:
+                    pred = self._component_of[dep]
+                    if pred == cid:
+                        continue
+                    levels[cid] = max(levels[cid], levels[pred] + 1)
+                    upstream[cid] |= self._members[pred] | upstream[pred]
+
+        downstream = [0] * len(components)
+        for cid in range(len(components) - 1, -1, -1):
+            for member in components[cid]:
+                for job in self._downstream[member]:
+                    succ = self._component_of[job]
+                    if succ != cid:
+                        downstream[cid] |= \
+                            self._members[succ] | downstream[succ]
+
+        self._levels = levels
+        self._upstream_closure = upstream
+        self._downstream_closure = downstream
+
+    def _to_ids(self, bits):
+        ids = []
+        while bits:
+            low = bits & -bits
+            ids.append(self._ids[low.bit_length() - 1])
+            bits ^= low
+        return ids
+
+    def _closure(self, jobid, closures):
+        i = self._index[jobid]
+        cid = self._component_of[i]
+        bits = closures[cid]
+        if self._cyclic[cid]:
+            bits |= self._members[cid]
+            bits &= ~(1 << i)
+        return bits
+
+    def __contains__(self, jobid):
+        return jobid in self._index
+
+    def level(self, jobid):
+        """
+        Topological level of the job: 0 if it depends on no job, otherwise
+        one more than the level of its deepest upstream job. The jobs of a
+        cycle share the same level.
+        """
+        return self._levels[self._component_of[self._index[jobid]]]
+
+    def upstream(self, jobid):
+        """Returns the ids of all the jobs which must complete first."""
+        return self._to_ids(self._closure(jobid, self._upstream_closure))
+
+    def downstream(self, jobid):
+        """
+        Returns the ids of all the jobs which run after the job, i.e. which
+        are affected if it fails.
+        """
+        return self._to_ids(self._closure(jobid, self._downstream_closure))
+
+    def levels(self):
+        """Returns the job ids grouped by topological level."""
+        levels = {}
+        for i, jobid in enumerate(self._ids):
+            levels.setdefault(
+                self._levels[self._component_of[i]], []).append(jobid)
+        return [levels[level] for level in sorted(levels)]
+
+    def cycles(self):
+        """Returns the job ids of every strongly connected component which
+        forms a cycle."""
+        return [
+            sorted(self._ids[member] for member in members)
+            for cid, members in enumerate(self._components)
+            if self._cyclic[cid]
+        ]
+
+    def critical_path(self, durations, jobids=None):
+        """
+        Returns the longest chain of dependent jobs, weighted with the
+        expected duration of every job.
+
+        :param durations: dict of jobid to expected duration in seconds,
+            jobs not in it count as 0
+        :param jobids: restrict the path to these jobs (e.g. the jobs of a
+            batch), all the jobs by default
+        :return: (list of job ids in run order, total duration)
+        """
+        selected = None
+        if jobids is not None:
+            selected = 0
+            for jobid in jobids:
+                if jobid in self._index:
+                    selected |= 1 << self._index[jobid]
+
+        best = [0.0] * len(self._components)
+        prev = [None] * len(self._components)
+        found = None
+        for cid, members in enumerate(self._components):
+            members = [
+                m for m in members
+                if selected is None or selected >> m & 1
+            ]
+            if not members:
+                best[cid] = None
+                continue
+            weight = sum(
+                durations.get(self._ids[m]) or 0 for m in members)
+            start = 0.0
+            for member in members:
+                for dep in self._upstream[member]:
+                    pred = self._component_of[dep]
+                    if pred != cid and best[pred] is not None and \
+                            best[pred] > start:
+                        start = best[pred]
+                        prev[cid] = pred
+            best[cid] = start + weight
+            if found is None or best[cid] > best[found]:
+                found = cid
+
+        if found is None:
+            return [], 0
+
+        # Walk back from the last job, the members of a cycle are kept
+        # together in id order.
+        path = []
+        cid = found
+        while cid is not None:
+            path[:0] = sorted(
+                self._ids[m] for m in self._components[cid]
+                if selected is None or selected >> m & 1
+            )
+            cid = prev[cid]
+        return path, best[found]
+
+    def job_info(self, jobid):
+        """Returns the precomputed information about a job."""
+        return {
+            'jobid': jobid,
+            'jobname': self.jobs[jobid],
+            'level': self.level(jobid),
+            'upstream': self.upstream(jobid),
+            'downstream': self.downstream(jobid),
+        }
+
+
+def plan_dependency_update(jobs, current, dependency_set, scope=None):
+    """
+    Validates the replacement of the dependencies of the jobs of scope with
+    dependency_set, and computes the changes to apply.
+
+    :param jobs: dict of jobid to jobname of all the jobs of the server
+    :param current: set of the current (jobid, dependent_jobid)
+    :param dependency_set: set of the new (jobid, dependent_jobid)
+    :param scope: set of the job ids whose dependencies are replaced, all
+        the jobs by default
+    :return: dict with the 'unknown' job ids, the job ids of dependency_set
+        'out_of_scope', the 'cycles' the update would create and the
+        'added', 'removed' and 'unchanged' dependencies. The cycles are
+        only checked, and the changes only computed, when there is no
+        unknown or out of scope job.
+    """
+    if scope is None:
+        scope = set(jobs)
+
+    plan = {
+        'unknown': sorted(
+            {jobid for dep in dependency_set for jobid in dep
+             if jobid not in jobs} | (scope - set(jobs))),
+        'out_of_scope': sorted(
+            {jobid for jobid, _ in dependency_set if jobid not in scope}),
+        'cycles': [],
+        'added': [],
+        'removed': [],
+        'unchanged': 0
+    }
+    if plan['unknown'] or plan['out_of_scope']:
+        return plan
+
+    replaced = {dep for dep in current if dep[0] in scope}
+    plan['cycles'] = JobDependencyGraph(
+        jobs.items(), (current - replaced) | dependency_set).cycles()
+    if plan['cycles']:
+        return plan
+
+    plan['added'] = sorted(dependency_set - replaced)
+    plan['removed'] = sorted(replaced - dependency_set)
+    plan['unchanged'] = len(replaced & dependency_set)
+    return plan
+
+
+class JobDependencyGraphCache:
+    """
+    Per-server cache of JobDependencyGraph objects.
+
+    A graph is stored with the version it was built from and is returned
+    only for the same version. Graphs which have not been used for
+    'timeout' seconds are evicted.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, sid, version, now=None):
+        """
+        Returns the cached graph of the server, or None if there is none
+        for that version.
+        """
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None or version is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries[sid] = (entry[0], entry[1], now)
+            return entry[1]
+
+    def put(self, sid, version, graph, now=None):
+        if version is None:
+            return
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            self._entries[sid] = (version, graph, now)
+
+    def invalidate(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def evict_expired(self, now=None):
+        """
+        Drop the graphs which have not been used for 'timeout' seconds.
+        Returns the ids of their servers.
+        """
+        now = now if now is not None else time.monotonic()
+        with self._lock:
+            expired = [
+                sid for sid, entry in self._entries.items()
+                if now - entry[2] >= self.timeout
+            ]
+            for sid in expired:
+                del self._entries[sid]
+        return expired
+
+    def __contains__(self, sid):
+        return sid in self._entries
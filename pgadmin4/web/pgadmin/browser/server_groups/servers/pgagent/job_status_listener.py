@@ -0,0 +1,402 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Shared LISTEN multiplexer for the pgAgent job_status_update channel.
+
+Every server has at most one long-lived LISTEN connection, no matter how many
+Socket.IO clients are watching it. Notifications received on that connection
+are coalesced per job and fanned out to Socket.IO rooms: one room for the
+clients watching every job of the server, and one room per job for the
+clients which subscribed to a set of jobs. The connection is torn down once
+the last subscriber leaves.
+
+The same connection listens on the job_dependency_update channel, which
+bumps the graph_version of the listener, see dependency_graph.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import time
+import traceback
+from collections import deque
+
+import psycopg
+
+JOB_STATUS_CHANNEL = 'job_status_update'
+JOB_DEPENDENCY_CHANNEL = 'job_dependency_update'
+
+# Number of seconds of history used to compute the notification rate.
+NOTIFY_RATE_WINDOW = 60
+
+# How often (in seconds) the listener wakes up to check whether it has been
+# asked to stop when no notification arrives.
+NOTIFY_POLL_TIMEOUT = 1.0
+
+MAX_CONNECT_RETRIES = 3
+CONNECT_RETRY_DELAY = 5
+
+logger = logging.getLogger(__name__)
+
+# Every connection of a listener gets a new epoch, notifications may have
+# been missed in between.
+_connect_epochs = itertools.count(1)
+
+
+def get_room_name(sid, jobid=None):
+    """
+    Returns the Socket.IO room name used to fan out the job status updates
+    of the given server, or of a single job of that server.
+    """
+    if jobid is None:
+        return 'pga_job_status_{0}'.format(sid)
+    return 'pga_job_status_{0}_{1}'.format(sid, jobid)
+
+
+def get_job_id(data):
+    """
+    Returns the job id of a notification payload as a string. pgAgent sends
+    it either as 'job_id' or as 'jobid', as a number or as a string.
+    """
+    jobid = data.get('job_id', data.get('jobid'))
+    return None if jobid is None else str(jobid)
+
+
+class NotificationRate:
+    """
+    Keeps per-second notification counters for the last NOTIFY_RATE_WINDOW
+    seconds, so that the notification rate can be reported cheaply.
+    """
+
+    def __init__(self, window=NOTIFY_RATE_WINDOW):
+        self.window = window
+        self.total = 0
+        self.last_received_at = None
+        self._buckets = deque()
+        self._lock = threading.Lock()
+
+    def _evict(self, now):
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            self._buckets.popleft()
+
+    def add(self, now=None):
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            self.total += 1
+            self.last_received_at = now
+            if self._buckets and self._buckets[-1][0] == now:
+                self._buckets[-1][1] += 1
+            else:
+                self._buckets.append([now, 1])
+            self._evict(now)
+
+    def per_second(self, now=None):
+        now = int(now if now is not None else time.time())
+        with self._lock:
+            self._evict(now)
+            return round(
+                sum(count for _, count in self._buckets) / self.window, 3
+            )
+
+
+class JobStatusCoalescer:
+    """
+    Collapses the job status updates received within a window into the
+    latest update of every job. Updates without a job id are never collapsed.
+    """
+
+    def __init__(self, window=0):
+        # Window is in seconds
+        self.window = window
+        self.collapsed = 0
+        self._pending = {}
+        self._deadline = None
+        self._seq = 0
+
+    def add(self, data, now=None):
+        """
+        Queue an update. Returns True if the pending updates are due.
+        """
+        now = now if now is not None else time.monotonic()
+        jobid = get_job_id(data)
+        if jobid is None:
+            self._seq += 1
+            key = ('seq', self._seq)
+        else:
+            key = ('job', jobid)
+
+        if key in self._pending:
+            self.collapsed += 1
+        self._pending[key] = data
+
+        if self._deadline is None:
+            self._deadline = now + self.window
+        return self.is_due(now)
+
+    def is_due(self, now=None):
+        if self._deadline is None:
+            return False
+        now = now if now is not None else time.monotonic()
+        return now >= self._deadline
+
+    def timeout(self, now=None):
+        """
+        Returns the number of seconds until the pending updates are due,
+        or None if nothing is pending.
+        """
+        if self._deadline is None:
+            return None
+        now = now if now is not None else time.monotonic()
+        return max(self._deadline - now, 0)
+
+    def flush(self):
+        pending = list(self._pending.values())
+        self._pending = {}
+        self._deadline = None
+        return pending
+
+
+class ServerJobStatusListener:
+    """
+    Owns the LISTEN connection of a single server and the background thread
+    (with its own event loop) that reads notifications from it.
+
+    The listener is reference counted: every Socket.IO client subscribed to
+    the server holds one reference, see JobStatusListenerRegistry.
+    """
+
+    def __init__(self, app, sid, conninfo, emit, coalesce_window=0):
+        self.app = app
+        self.sid = sid
+        self.conninfo = conninfo
+        self.emit = emit
+        self.subscribers = set()
+        self.rate = NotificationRate()
+        self.coalescer = JobStatusCoalescer(coalesce_window)
+        self.emitted = 0
+        self.started_at = None
+        self.connected = False
+        self.last_error = None
+        self.connect_epoch = None
+        self.graph_version = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.started_at = time.time()
+        self._thread = threading.Thread(
+            target=self._run, name='pga_job_status_{0}'.format(self.sid),
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    @property
+    def finished(self):
+        """
+        True once the thread of the listener is over, the listener may have
+        given up connecting without being asked to stop.
+        """
+        return self._thread is not None and not self._thread.is_alive()
+
+    @property
+    def graph_cache_key(self):
+        """
+        Version of the job dependency graph of the server, None if it
+        cannot be tracked because the listener is not connected.
+        """
+        if not self.connected or self.stopped:
+            return None
+        return self.connect_epoch, self.graph_version
+
+    def dispatch(self, payload, now=None):
+        """
+        Parse a raw notification payload and queue it for the emit. The
+        pending updates are flushed if the coalescing window is over.
+        """
+        self.rate.add()
+        try:
+            data = json.loads(payload)
+        except (TypeError, ValueError) as e:
+            logger.error("Error parsing job status notification payload "
+                         "on server %s: %s", self.sid, e)
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        data['sid'] = self.sid
+        if self.coalescer.add(data, now):
+            self.flush()
+
+    def flush(self):
+        """
+        Emit the latest pending update of every job.
+        """
+        for data in self.coalescer.flush():
+            try:
+                self.emit(data)
+                self.emitted += 1
+            except Exception as e:
+                logger.error("Error emitting job status update for server "
+                             "%s: %s", self.sid, e)
+
+    def _poll_timeout(self):
+        timeout = self.coalescer.timeout()
+        if timeout is None:
+            return NOTIFY_POLL_TIMEOUT
+        return min(timeout, NOTIFY_POLL_TIMEOUT)
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._listen())
+        except Exception as e:
+            logger.error("Error in job status listener thread for server "
+                         "%s: %s", self.sid, e)
+            logger.debug(traceback.format_exc())
+        finally:
+            loop.close()
+            self.connected = False
+            # Nothing is pushed anymore, let the registry replace the
+            # listener.
+            self._stop_event.set()
+
+    async def _listen(self):
+        retry_count = 0
+
+        while not self.stopped and retry_count < MAX_CONNECT_RETRIES:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                        self.conninfo, autocommit=True) as conn:
+                    await conn.execute('LISTEN {0}'.format(JOB_STATUS_CHANNEL))
+                    await conn.execute(
+                        'LISTEN {0}'.format(JOB_DEPENDENCY_CHANNEL))
+                    self.connect_epoch = next(_connect_epochs)
+                    self.connected = True
+                    self.last_error = None
+                    retry_count = 0
+                    logger.info("Listening for pgAgent job status updates "
+                                "on server %s", self.sid)
+
+                    while not self.stopped:
+                        async for notify in conn.notifies(
+                                timeout=self._poll_timeout()):
+                            if notify.channel == JOB_DEPENDENCY_CHANNEL:
+                                self.graph_version += 1
+                                continue
+                            self.dispatch(notify.payload)
+                            if self.stopped:
+                                break
+                        if self.coalescer.is_due():
+                            self.flush()
+            except Exception as e:
+                self.connected = False
+                self.last_error = str(e)
+                retry_count += 1
+                logger.error("Error in job status listener for server %s "
+                             "(attempt %s/%s): %s", self.sid, retry_count,
+                             MAX_CONNECT_RETRIES, e)
+                if retry_count < MAX_CONNECT_RETRIES and not self.stopped:
+                    await asyncio.sleep(CONNECT_RETRY_DELAY)
+
+        self.connected = False
+        logger.info("Job status listener stopped for server %s", self.sid)
+
+    def metrics(self):
+        return {
+            'server_id': self.sid,
+            'subscriber_count': len(self.subscribers),
+            'connected': self.connected,
+            'notifications_total': self.rate.total,
+            'notifications_per_sec': self.rate.per_second(),
+            'notifications_collapsed': self.coalescer.collapsed,
+            'updates_emitted': self.emitted,
+            'coalesce_window_ms': int(self.coalescer.window * 1000),
+            'last_notification_at': self.rate.last_received_at,
+            'graph_version': self.graph_version,
+            'started_at': self.started_at,
+            'last_error': self.last_error
+        }
+
+
+class JobStatusListenerRegistry:
+    """
+    Reference counted registry of ServerJobStatusListener objects, keyed by
+    server id.
+    """
+
+    def __init__(self, listener_class=ServerJobStatusListener):
+        self.listener_class = listener_class
+        self._listeners = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, app, sid, client_sid, conninfo, emit,
+                coalesce_window=0):
+        """
+        Add client_sid as a subscriber of the server and start the shared
+        listener if this is the first subscriber (or the previous listener
+        gave up).
+
+        Returns the listener and a flag telling whether it was just started.
+        """
+        with self._lock:
+            previous = listener = self._listeners.get(sid)
+            created = False
+            if listener is None or listener.stopped or listener.finished:
+                listener = self.listener_class(
+                    app, sid, conninfo, emit, coalesce_window)
+                # The clients of a listener which gave up are still in the
+                # rooms, they are served by the new one.
+                if previous is not None:
+                    listener.subscribers.update(previous.subscribers)
+                self._listeners[sid] = listener
+                created = True
+            listener.subscribers.add(client_sid)
+
+        if created:
+            listener.start()
+        return listener, created
+
+    def release(self, sid, client_sid):
+        """
+        Remove client_sid from the subscribers of the server and tear down
+        the shared listener when no subscriber is left.
+
+        Returns True if the listener was stopped.
+        """
+        with self._lock:
+            listener = self._listeners.get(sid)
+            if listener is None:
+                return False
+            listener.subscribers.discard(client_sid)
+            if listener.subscribers:
+                return False
+            del self._listeners[sid]
+
+        listener.stop()
+        return True
+
+    def get(self, sid):
+        return self._listeners.get(sid)
+
+    def metrics(self):
+        with self._lock:
+            listeners = list(self._listeners.values())
+        return {str(lsn.sid): lsn.metrics() for lsn in listeners}
@@ -10,6 +10,7 @@
 """Implements pgAgent Job Schedule Node"""
 
 import json
+from datetime import date, datetime, time
 from functools import wraps
 
 from flask import render_template, request, jsonify
@@ -17,14 +18,19 @@ from flask_babel import gettext
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, gone, \
-    make_response as ajax_response, internal_server_error
+    make_response as ajax_response, internal_server_error, bad_request
 from pgadmin.utils.driver import get_driver
 from pgadmin.browser.server_groups.servers.pgagent.utils \
-    import format_schedule_data
+    import format_schedule_data, schedule_runs
 
 from config import PG_DEFAULT_DRIVER
 
 
+def _parse_value(value_type, value):
+    """Parses a date, time or timestamp formatted in ISO format, if any."""
+    return value_type.fromisoformat(value) if value else None
+
+
 class JobScheduleModule(CollectionNodeModule):
     """
     class JobScheduleModule(CollectionNodeModule)
@@ -163,9 +169,14 @@ class JobScheduleView(PGChildNodeView):
         ],
         'nodes': [{'get': 'nodes'}, {'get': 'nodes'}],
         'msql': [{'get': 'msql'}, {'get': 'msql'}],
-        'sql': [{'get': 'sql'}]
+        'sql': [{'get': 'sql'}],
+        'runs': [{'get': 'runs'}, {'get': 'runs'}]
     })
 
+    # Default and maximum number of runs computed per schedule
+    DEFAULT_RUNS_COUNT = 10
+    MAX_RUNS_COUNT = 1000
+
     def _init_(self, **kwargs):
         """
         Method is used to initialize the JobScheduleView and its base view.
@@ -544,5 +555,93 @@ class JobScheduleView(PGChildNodeView):
             status=200
         )
 
+    @check_precondition
+    def runs(self, gid, sid, jid, jscid=None):
+        """
+        This function returns the next runs of the schedule, or of all the
+        schedules of the job. The runs are computed locally from the
+        schedule definitions, as pgagent.pga_next_schedule would, instead
+        of calling it once per run.
+
+        Args:
+            gid: Server Group ID
+            sid: Server ID
+            jid: Job ID
+            jscid: JobSchedule ID
+        """
+        count = request.args.get('count', self.DEFAULT_RUNS_COUNT)
+        try:
+            count = int(count)
+            if count <= 0 or count > self.MAX_RUNS_COUNT:
+                raise ValueError
+        except ValueError:
+            return bad_request(errormsg=gettext(
+                "The number of runs must be between 1 and {0}."
+            ).format(self.MAX_RUNS_COUNT))
+
+        sql = render_template(
+            "/".join([self.template_path, 'runs.sql']),
+            jscid=jscid, jid=jid, until=request.args.get('until', None),
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        if jscid is not None and len(res['rows']) == 0:
+            return gone(
+                errormsg=gettext("Could not find the specified schedule.")
+            )
+
+        schedules = []
+        all_runs = []
+        for row in res['rows']:
+            schedule = {
+                'jscid': row['jscid'],
+                'jscname': row['jscname'],
+                'jscenabled': row['jscenabled'],
+                'runs': [],
+                'errormsg': None
+            }
+            try:
+                schedule['runs'] = schedule_runs(
+                    dict(row, jscstart=_parse_value(datetime, row['jscstart']),
+                         jscend=_parse_value(datetime, row['jscend'])),
+                    datetime.fromisoformat(row['now']), count,
+                    exceptions=zip(
+                        (_parse_value(date, d) for d in row['jexdate'] or []),
+                        (_parse_value(time, t) for t in row['jextime'] or [])
+                    ),
+                    until=_parse_value(datetime, row.get('until', None))
+                )
+            except ValueError as e:
+                # pga_next_schedule fails too on such a schedule
+                schedule['errormsg'] = str(e)
+            schedules.append(schedule)
+            all_runs.extend(schedule['runs'])
+
+        # Attach the time zone of the server to all the runs at once
+        if all_runs:
+            status, res = self.conn.execute_2darray(
+                render_template(
+                    "/".join([self.template_path, 'runs_timestamps.sql'])
+                ),
+                {'runs': all_runs}
+            )
+            if not status:
+                return internal_server_error(errormsg=res)
+
+            rows = iter(res['rows'])
+            for schedule in schedules:
+                schedule['runs'] = [
+                    next(rows)['run'] for _ in schedule['runs']
+                ]
+
+        return make_json_response(
+            data=schedules[0] if jscid is not None else schedules,
+            status=200
+        )
+
 
 JobScheduleView.register_node_view(blueprint)
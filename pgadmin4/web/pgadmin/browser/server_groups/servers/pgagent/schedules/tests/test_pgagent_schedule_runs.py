@@ -0,0 +1,189 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import random
+from datetime import date, datetime, timedelta
+
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils import test_utils as utils
+from pgadmin.browser.server_groups.servers.pgagent.tests import utils as \
+    pgagent_utils
+from pgadmin.browser.server_groups.servers.pgagent.utils import \
+    next_schedule_run, schedule_runs
+
+# SQLSTATE of a statement cancelled on statement_timeout
+QUERY_CANCELED = '57014'
+
+
+def _mask(size, selected):
+    """Boolean array of a schedule, selected are 0-based positions."""
+    return [i in selected for i in range(size)]
+
+
+def _schedule(minutes=(), hours=(), weekdays=(), monthdays=(), months=(),
+              occurrences=(), start=datetime(2026, 1, 1), end=None):
+    return {
+        'jscstart': start,
+        'jscend': end,
+        'jscminutes': _mask(60, minutes),
+        'jschours': _mask(24, hours),
+        'jscweekdays': _mask(7, weekdays),
+        'jscmonthdays': _mask(32, monthdays),
+        'jscmonths': _mask(12, months),
+        'jscoccurrence': _mask(5, occurrences),
+    }
+
+
+class PgAgentScheduleRunsTestCase(BaseTestGenerator):
+    """This class tests the expansion of a schedule into its next runs."""
+    scenarios = [
+        ('Every 3 hours, at 5 past', dict(
+            schedule=_schedule(minutes=(5,), hours=(0, 3, 6, 9)),
+            now=datetime(2026, 3, 1, 4, 0), count=3, exceptions=[],
+            expected=[datetime(2026, 3, 1, 6, 5), datetime(2026, 3, 1, 9, 5),
+                      datetime(2026, 3, 2, 0, 5)])),
+        ('Last day of the month', dict(
+            schedule=_schedule(minutes=(0,), hours=(6,), monthdays=(31,)),
+            now=datetime(2026, 1, 1), count=4, exceptions=[],
+            expected=[datetime(2026, 1, 31, 6), datetime(2026, 2, 28, 6),
+                      datetime(2026, 3, 31, 6), datetime(2026, 4, 30, 6)])),
+        ('First Monday of the month, with an excluded date', dict(
+            schedule=_schedule(minutes=(0,), hours=(6,), weekdays=(1,),
+                               occurrences=(0,)),
+            now=datetime(2026, 1, 1), count=3,
+            exceptions=[(date(2026, 2, 2), None)],
+            expected=[datetime(2026, 1, 5, 6), datetime(2026, 3, 2, 6),
+                      datetime(2026, 4, 6, 6)])),
+        ('Past the end date', dict(
+            schedule=_schedule(minutes=(0,), hours=(12,),
+                               end=datetime(2026, 1, 3)),
+            now=datetime(2026, 1, 1), count=5, exceptions=[],
+            expected=[datetime(2026, 1, 1, 12), datetime(2026, 1, 2, 12)])),
+        # Same result as pga_next_schedule: after a wrap into the next day
+        # the minute search starts from the minute of the current time.
+        ('Minute search after a wrap into the next day', dict(
+            schedule=_schedule(minutes=(0, 30), hours=(9,)),
+            now=datetime(2026, 3, 2, 10, 15), count=2, exceptions=[],
+            expected=[datetime(2026, 3, 3, 9, 30),
+                      datetime(2026, 3, 4, 9, 0)])),
+        ('Impossible date', dict(
+            schedule=_schedule(monthdays=(29,), months=(1,)),
+            now=datetime(2026, 1, 1), count=1, exceptions=[],
+            expected=ValueError)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        if self.expected is ValueError:
+            with self.assertRaises(ValueError):
+                schedule_runs(self.schedule, self.now, self.count,
+                              self.exceptions)
+            return
+
+        self.assertEqual(
+            schedule_runs(self.schedule, self.now, self.count,
+                          self.exceptions),
+            self.expected)
+        self.assertEqual(
+            next_schedule_run(self.schedule, self.now, self.exceptions),
+            self.expected[0])
+
+
+class PgAgentScheduleRunsPropertyTestCase(BaseTestGenerator):
+    """
+    This class checks the schedule engine against pga_next_schedule on
+    random schedules.
+    """
+    scenarios = [
+        ('Random schedules against pga_next_schedule',
+         dict(seed=20261017, count=200)),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        flag, msg = pgagent_utils.is_valid_server_to_run_pgagent(self)
+        if not flag:
+            self.skipTest(msg)
+        flag, msg = pgagent_utils.is_pgagent_installed_on_server(self)
+        if not flag:
+            self.skipTest(msg)
+
+        self.connection = utils.get_db_connection(
+            self.server['db'],
+            self.server['username'],
+            self.server['db_password'],
+            self.server['host'],
+            self.server['port'],
+            self.server['sslmode']
+        )
+
+    def _random_mask(self, rnd, size, ratio):
+        # Leave the array empty (any value) 4 times out of 10
+        if rnd.random() < 0.4:
+            return [False] * size
+        return [rnd.random() < ratio for _ in range(size)]
+
+    def runTest(self):
+        rnd = random.Random(self.seed)
+        pg_cursor = self.connection.cursor()
+        # Schedules which never fire would make pga_next_schedule loop
+        pg_cursor.execute("SET statement_timeout = 1000")
+        pg_cursor.execute(
+            "SELECT to_char(now(), 'YYYY-MM-DD\"T\"HH24:MI:SS')")
+        now = datetime.fromisoformat(pg_cursor.fetchone()[0])
+
+        for _ in range(self.count):
+            schedule = {
+                'jscminutes': self._random_mask(rnd, 60, 0.05),
+                'jschours': self._random_mask(rnd, 24, 0.1),
+                'jscweekdays': self._random_mask(rnd, 7, 0.3),
+                'jscmonthdays': self._random_mask(rnd, 32, 0.1),
+                'jscmonths': self._random_mask(rnd, 12, 0.3),
+                'jscoccurrence': self._random_mask(rnd, 5, 0.3),
+                # pga_next_schedule always starts from now(), a start in
+                # the future makes the result independent of it.
+                'jscstart': now + timedelta(
+                    minutes=rnd.randint(2, 3 * 365 * 24 * 60)),
+                'jscend': None,
+            }
+            if rnd.random() < 0.3:
+                schedule['jscend'] = schedule['jscstart'] + timedelta(
+                    days=rnd.randint(1, 3000))
+
+            try:
+                expected = next_schedule_run(schedule, now)
+            except ValueError:
+                expected = ValueError
+
+            pg_cursor.execute("SAVEPOINT next_schedule")
+            try:
+                pg_cursor.execute(
+                    "SELECT to_char(pgagent.pga_next_schedule("
+                    "-1, %s::timestamp, %s::timestamp, %s, %s, %s, %s, "
+                    "%s, %s), 'YYYY-MM-DD\"T\"HH24:MI:SS')",
+                    (schedule['jscstart'], schedule['jscend'],
+                     schedule['jscminutes'], schedule['jschours'],
+                     schedule['jscweekdays'], schedule['jscmonthdays'],
+                     schedule['jscmonths'], schedule['jscoccurrence']))
+                result = pg_cursor.fetchone()[0]
+                result = datetime.fromisoformat(result) if result else None
+            except Exception as e:
+                pg_cursor.execute("ROLLBACK TO SAVEPOINT next_schedule")
+                if getattr(e, 'sqlstate', None) == QUERY_CANCELED:
+                    # Still looking for a run, nothing to compare
+                    continue
+                result = ValueError
+
+            self.assertEqual(result, expected, schedule)
+
+    def tearDown(self):
+        self.connection.rollback()
+        self.connection.close()
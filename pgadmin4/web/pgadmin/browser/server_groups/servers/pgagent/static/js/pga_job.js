@@ -14,6 +14,8 @@ import getApiInstance from '../../../../../../static/js/api_instance';
 import pgAdmin from 'sources/pgadmin';
 // Import socket.io-client directly 
 import { io as socket_io } from 'socket.io-client';
+import { showAuditRetention } from '../../../../../../static/js/Dialogs/index';
+import JobSubscriptions from './pga_job_subscriptions';
 
 /* 
  * SOCKET.IO IMPROVEMENTS - JOB STATUS LISTENER
@@ -61,6 +63,9 @@ define('pgadmin.node.pga_job', [
       _listenerInitialized: false,
       _listenerActive: false,
       _socketConnected: false,
+      /* Jobs shown by the open views, the client only receives the status
+         updates of these jobs */
+      _jobSubscriptions: new JobSubscriptions(),
             
       Init: function() {
         /* Avoid mulitple registration of menus */
@@ -109,6 +114,10 @@ define('pgadmin.node.pga_job', [
           name: 'job_audit_log_execute', node: 'coll-pga_job', module: this,
           applies: ['object', 'context'], callback: 'show_job_audit_log_execute',
           priority: 5, label: gettext('Job Audit Log (Execute)'), icon: 'fa fa-play',
+        }, {
+          name: 'job_audit_retention', node: 'coll-pga_job', module: this,
+          applies: ['object', 'context'], callback: 'show_audit_retention',
+          priority: 6, label: gettext('Audit Log Retention...'), icon: 'fa fa-calendar-times',
         }]);
         this.setupJobStatusListener();
       },
@@ -232,6 +241,7 @@ define('pgadmin.node.pga_job', [
         pgBrowser.Events.on(
           'pgadmin-browser:tree:selected',
           function(item, data) {
+            self.watchSelectedJob(item, data);
             if(self._socketConnected){
               return;
             }
@@ -351,6 +361,11 @@ define('pgadmin.node.pga_job', [
             /* Handle success event for job status listener start */
             self.socket.on('job_status_listener_started', function(_data) {
               self._jobStatusListenerActive = true;
+              /* Restore the job subscription after a (re)connection */
+              const jobIds = self._jobSubscriptions.jobIds(self.currentServerId);
+              if (jobIds !== null) {
+                self.subscribeJobs(jobIds);
+              }
             });
             
             /* Handle error event for job status listener */
@@ -495,6 +510,48 @@ define('pgadmin.node.pga_job', [
         }
       },
       
+      /* Only receive the status updates of the given jobs, pass null to
+         receive the updates of every job of the server again */
+      subscribeJobs: function(jobIds) {
+        let self = this;
+        if (self.socket && self.socket.connected && self.currentServerId &&
+            self._jobStatusListenerActive) {
+          self.socket.emit('subscribe_jobs', {
+            sid: self.currentServerId,
+            job_ids: jobIds,
+          });
+        }
+      },
+
+      /* Set the jobs of a server shown by a view (job monitor, properties
+         panel), to be called again whenever they change */
+      watchJobs: function(viewId, serverId, jobIds) {
+        if (this._jobSubscriptions.watch(viewId, serverId, jobIds)) {
+          this.subscribeJobs(this._jobSubscriptions.jobIds(this.currentServerId));
+        }
+      },
+
+      /* Forget the jobs of a view when it is closed */
+      unwatchJobs: function(viewId) {
+        if (this._jobSubscriptions.unwatch(viewId)) {
+          this.subscribeJobs(this._jobSubscriptions.jobIds(this.currentServerId));
+        }
+      },
+
+      /* The properties panel shows the status of the selected job, and of
+         no job for any other node */
+      watchSelectedJob: function(item, data) {
+        if (item && data && data._type === 'pga_job') {
+          const serverItem = pgBrowser.tree.parent(pgBrowser.tree.parent(item));
+          const serverData = serverItem ? pgBrowser.tree.itemData(serverItem) : null;
+          if (serverData && serverData._type === 'server') {
+            this.watchJobs('properties', serverData._id, [data._id]);
+            return;
+          }
+        }
+        this.unwatchJobs('properties');
+      },
+
       /* Start a keep-alive ping to prevent socket disconnection */
       startKeepAlivePing: function() {
         var self = this;
@@ -748,6 +805,23 @@ define('pgadmin.node.pga_job', [
       show_job_audit_log_execute: function(args) {
         return this._copy_job_audit_log_query(args, 'EXECUTE');
       },
+
+      /* Show the retention policy of the audit log */
+      show_audit_retention: function(args) {
+        let input = args || {},
+          t = pgBrowser.tree,
+          i = input.item || t.selected(),
+          d = i ? t.itemData(i) : undefined;
+
+        if (d) {
+          showAuditRetention(
+            gettext('Audit Log Retention'),
+            this.generate_url(i, 'audit_retention', d, false)
+          );
+        }
+
+        return false;
+      },
       /* Refresh the jobs list after creating a new job */
       onSave: function(isNew, data) {
         let obj = this;
@@ -259,14 +259,6 @@ export default class PgaJobSchema extends BaseUISchema {
         canAdd: false, canDelete: false, canEdit: false,
         columns: ['audit_id', 'operation_type', 'operation_time', 'operation_user'],
         url: 'audit_log',
-        // Enable sorting
-        isSortable: true,
-        sortColumns: {
-          'audit_id': 'numeric',
-          'operation_type': 'string',
-          'operation_time': 'string',
-          'operation_user': 'string'
-        },
         // Add filter toolbar with simple filter buttons
         customButtomPanel: true,
         customButtomPanelRender: (panel) => {
@@ -0,0 +1,58 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2025, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+//////////////////////////////////////////////////////////////
+
+/* Jobs shown by the open views (job monitor, job properties...) of every
+   server. The job status updates a client subscribes to are the union of
+   the jobs of the views of its server, or every job when no view is open. */
+export default class JobSubscriptions {
+  constructor() {
+    this.views = new Map();
+  }
+
+  /* Set the jobs shown by a view, returns true if the subscription of the
+     server changed */
+  watch(viewId, sid, jobIds) {
+    const before = this.jobIds(sid);
+    this.views.set(viewId, {
+      sid: String(sid),
+      jobIds: (jobIds || []).map(String),
+    });
+    return !this.isSame(before, this.jobIds(sid));
+  }
+
+  /* Forget a closed view, returns true if the subscription of its server
+     changed */
+  unwatch(viewId) {
+    const view = this.views.get(viewId);
+    if (!view) {
+      return false;
+    }
+    const before = this.jobIds(view.sid);
+    this.views.delete(viewId);
+    return !this.isSame(before, this.jobIds(view.sid));
+  }
+
+  /* Sorted ids of the jobs watched on a server, null for every job */
+  jobIds(sid) {
+    const views = [...this.views.values()].filter(
+      view => view.sid === String(sid));
+    if (views.length === 0) {
+      return null;
+    }
+    const jobIds = new Set(views.flatMap(view => view.jobIds));
+    return [...jobIds].sort();
+  }
+
+  isSame(a, b) {
+    if (a === null || b === null) {
+      return a === b;
+    }
+    return a.length === b.length && a.every((jobid, i) => jobid === b[i]);
+  }
+}
@@ -1,5 +1,40 @@
 {% import 'macros/pga_audit_log.macros' as AUDIT_LOG %}
-{{ AUDIT_LOG.PROPERTIES(jid, conn) }}
-{% if rows_threshold is defined %}
-LIMIT {{ rows_threshold }}
-{% endif %}
+{# The page is returned as a single json document, so that old_values and
+   new_values are passed through to the client as they are stored. #}
+WITH page AS (
+{{ AUDIT_LOG.PROPERTIES(jid, conn, operation_types=operation_types, date_from=date_from, date_to=date_to, cursor=cursor, sort_order=sort_order, rows_threshold=rows_threshold, has_retention=has_retention) }}
+), numbered AS (
+    SELECT
+        page.*,
+        row_number() OVER (
+            ORDER BY
+                operation_time {% if sort_order == 'asc' %}ASC{% else %}DESC{% endif %},
+                audit_id {% if sort_order == 'asc' %}ASC{% else %}DESC{% endif %}
+        ) AS rownum
+    FROM page
+)
+SELECT
+    json_build_object(
+        'rows', COALESCE(json_agg(
+            json_build_object(
+                'audit_id', audit_id,
+                'operation_type', operation_type,
+                'operation_time', to_char(operation_time, 'YYYY-MM-DD HH24:MI:SS TZ'),
+                'operation_user', operation_user,
+                'old_values', old_values,
+                'new_values', new_values,
+                'additional_info', additional_info
+            ) ORDER BY rownum
+        ){% if rows_threshold %} FILTER (WHERE rownum <= %(rows_threshold)s::integer){% endif %}, '[]'::json),
+        'next_cursor', {% if rows_threshold %}(
+            SELECT (extract(epoch FROM operation_time) * 1000000)::bigint || '-' || audit_id
+            FROM numbered
+            WHERE rownum = %(rows_threshold)s::integer
+                AND EXISTS (
+                    SELECT 1 FROM numbered
+                    WHERE rownum > %(rows_threshold)s::integer
+                )
+        ){% else %}NULL{% endif %}
+    ) AS page
+FROM
+    numbered;
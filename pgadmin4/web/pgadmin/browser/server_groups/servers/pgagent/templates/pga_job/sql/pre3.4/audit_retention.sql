@@ -0,0 +1,24 @@
+SELECT
+    (extract(epoch FROM r.max_age) / 86400)::integer AS max_age_days,
+    r.max_rows,
+    (extract(epoch FROM r.joblog_max_age) / 86400)::integer AS joblog_max_age_days,
+    c.relkind = 'p' AS partitioned,
+    (
+        SELECT COALESCE(json_agg(json_build_object(
+            'name', p.relname,
+            'rows', GREATEST(p.reltuples, 0)::bigint,
+            'size', pg_catalog.pg_size_pretty(pg_catalog.pg_total_relation_size(p.oid)),
+            'until', pgagent.pga_job_audit_log_partition_end(p.oid)
+        ) ORDER BY p.relname), '[]'::json)
+        FROM pg_catalog.pg_inherits i
+        JOIN pg_catalog.pg_class p ON p.oid = i.inhrelid
+        WHERE i.inhparent = c.oid
+    ) AS partitions,
+    r.last_pruned_at,
+    r.last_pruned_rows,
+    r.last_dropped_partitions
+FROM
+    pgagent.pga_job_audit_retention r,
+    pg_catalog.pg_class c
+WHERE
+    c.oid = 'pgagent.pga_job_audit_log'::regclass;
@@ -0,0 +1,18 @@
+{# Apply one side of the difference between two dependency sets, rendered
+   with either removed or added. The dependencies are passed as parallel
+   arrays of job ids, so that they are deleted or inserted by a single
+   statement and the circular dependency check runs once. #}
+{% if removed %}
+DELETE FROM pgagent.pga_job_dependency d
+USING unnest(
+    %(removed_jobids)s::integer[], %(removed_dependent_jobids)s::integer[]
+) AS r(jobid, dependent_jobid)
+WHERE d.jobid = r.jobid AND d.dependent_jobid = r.dependent_jobid;
+{% endif %}
+{% if added %}
+INSERT INTO pgagent.pga_job_dependency (jobid, dependent_jobid)
+SELECT jobid, dependent_jobid
+FROM unnest(
+    %(added_jobids)s::integer[], %(added_dependent_jobids)s::integer[]
+) AS a(jobid, dependent_jobid);
+{% endif %}
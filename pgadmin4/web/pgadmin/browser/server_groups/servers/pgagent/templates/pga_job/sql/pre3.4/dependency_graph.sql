@@ -0,0 +1,11 @@
+{# Jobs with the ids of the jobs which must complete first #}
+SELECT
+    j.jobid,
+    j.jobname,
+    ARRAY(
+        SELECT d.dependent_jobid
+        FROM pgagent.pga_job_dependency d
+        WHERE d.jobid = j.jobid
+    ) AS dependent_jobids
+FROM
+    pgagent.pga_job j;
@@ -0,0 +1,18 @@
+{# Average duration, in seconds, of the last successful runs of the jobs #}
+SELECT
+    j.jobid,
+    extract(epoch FROM avg(r.jlgduration))::float AS duration
+FROM
+    pgagent.pga_job j
+    CROSS JOIN LATERAL (
+        SELECT jlgduration
+        FROM pgagent.pga_joblog
+        WHERE jlgjobid = j.jobid AND jlgstatus = 's'
+            AND jlgduration IS NOT NULL
+        ORDER BY jlgid DESC
+        LIMIT 10
+    ) r
+{% if jobids %}
+WHERE j.jobid = ANY(%(jobids)s::integer[])
+{% endif %}
+GROUP BY j.jobid;
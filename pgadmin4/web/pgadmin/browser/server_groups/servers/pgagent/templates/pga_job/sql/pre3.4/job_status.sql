@@ -0,0 +1,16 @@
+SELECT
+    j.jobid,
+    j.jobenabled,
+    j.jobnextrun,
+    j.joblastrun,
+    jl.jlgstatus
+FROM
+    pgagent.pga_job j
+    LEFT JOIN LATERAL (
+        SELECT jlgstatus
+        FROM pgagent.pga_joblog
+        WHERE jlgjobid = j.jobid
+        ORDER BY jlgid DESC
+        LIMIT 1
+    ) jl ON true
+ORDER BY j.jobid;
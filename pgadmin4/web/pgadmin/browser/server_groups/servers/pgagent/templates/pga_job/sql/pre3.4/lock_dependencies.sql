@@ -0,0 +1,2 @@
+{# Keep the dependencies from changing until the end of the transaction #}
+LOCK TABLE pgagent.pga_job_dependency IN SHARE ROW EXCLUSIVE MODE;
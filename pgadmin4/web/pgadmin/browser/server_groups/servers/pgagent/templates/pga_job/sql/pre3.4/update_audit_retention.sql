@@ -0,0 +1,10 @@
+UPDATE pgagent.pga_job_audit_retention SET
+    max_age = {% if 'max_age_days' in data %}{% if data.max_age_days %}make_interval(days => {{ data.max_age_days|qtLiteral(conn) }}::integer){% else %}NULL{% endif %}{% else %}max_age{% endif %},
+    max_rows = {% if 'max_rows' in data %}{% if data.max_rows %}{{ data.max_rows|qtLiteral(conn) }}::bigint{% else %}NULL{% endif %}{% else %}max_rows{% endif %},
+    joblog_max_age = {% if 'joblog_max_age_days' in data %}{% if data.joblog_max_age_days %}make_interval(days => {{ data.joblog_max_age_days|qtLiteral(conn) }}::integer){% else %}NULL{% endif %}{% else %}joblog_max_age{% endif %};
+{% if 'partitioned' in data %}
+SELECT pgagent.pga_job_audit_log_set_partitioned({% if data.partitioned %}true{% else %}false{% endif %});
+{% endif %}
+{% if data.prune %}
+SELECT pgagent.pga_job_audit_log_prune();
+{% endif %}
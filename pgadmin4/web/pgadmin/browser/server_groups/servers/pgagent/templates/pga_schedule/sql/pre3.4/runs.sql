@@ -0,0 +1,27 @@
+{# Timestamps are returned in the server time zone, as pga_next_schedule sees them #}
+SELECT
+    s.jscid, s.jscname, s.jscenabled,
+    to_char(s.jscstart, 'YYYY-MM-DD"T"HH24:MI:SS') AS jscstart,
+    to_char(s.jscend, 'YYYY-MM-DD"T"HH24:MI:SS') AS jscend,
+    s.jscminutes, s.jschours, s.jscweekdays, s.jscmonthdays, s.jscmonths,
+    s.jscoccurrence, e.jexdate, e.jextime,
+    to_char(now(), 'YYYY-MM-DD"T"HH24:MI:SS') AS now{% if until %},
+    to_char({{ until|qtLiteral(conn) }}::timestamptz, 'YYYY-MM-DD"T"HH24:MI:SS') AS until{% endif %}
+
+FROM
+    pgagent.pga_schedule s
+    LEFT JOIN (
+        SELECT
+            jexscid, array_agg(to_char(jexdate, 'YYYY-MM-DD')) AS jexdate,
+            array_agg(to_char(jextime, 'HH24:MI:SS')) AS jextime
+        FROM
+            pgagent.pga_exception
+        GROUP BY
+            jexscid
+    ) e ON s.jscid = e.jexscid
+WHERE
+{% if jscid %}
+   s.jscid = {{ jscid|qtLiteral(conn) }}::integer AND
+{% endif %}
+   s.jscjobid = {{ jid|qtLiteral(conn) }}::integer
+ORDER BY jscname;
@@ -0,0 +1,6 @@
+{# Converts the runs computed in the server time zone back to timestamptz #}
+SELECT
+    r.run::timestamptz AS run
+FROM
+    unnest(%(runs)s::timestamp[]) WITH ORDINALITY AS r(run, n)
+ORDER BY r.n;
@@ -0,0 +1,62 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers.pgagent.utils import \
+    parse_audit_log_cursor, parse_audit_operation_types
+
+
+class PgAgentAuditLogCursorTestCase(BaseTestGenerator):
+    """This class tests the parsing of the audit log paging arguments."""
+    scenarios = [
+        ('Valid cursor',
+         dict(cursor='1760000000123456-42',
+              expected=(1760000000123456, 42))),
+        ('Cursor without audit id',
+         dict(cursor='1760000000123456', expected=ValueError)),
+        ('Cursor with SQL in it',
+         dict(cursor="1-1'; DROP TABLE x; --", expected=ValueError)),
+        ('Negative cursor',
+         dict(cursor='-1-1', expected=ValueError)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        if self.expected is ValueError:
+            with self.assertRaises(ValueError):
+                parse_audit_log_cursor(self.cursor)
+        else:
+            self.assertEqual(parse_audit_log_cursor(self.cursor),
+                             self.expected)
+
+
+class PgAgentAuditOperationTypesTestCase(BaseTestGenerator):
+    """This class tests the parsing of the audit log operation types."""
+    scenarios = [
+        ('Operation types',
+         dict(operation_types='CREATE, modify,,EXECUTE',
+              expected=['CREATE', 'MODIFY', 'EXECUTE'])),
+        ('Unknown operation type',
+         dict(operation_types="CREATE,') OR (1=1",
+              expected=ValueError)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        if self.expected is ValueError:
+            with self.assertRaises(ValueError):
+                parse_audit_operation_types(self.operation_types)
+        else:
+            self.assertEqual(
+                parse_audit_operation_types(self.operation_types),
+                self.expected)
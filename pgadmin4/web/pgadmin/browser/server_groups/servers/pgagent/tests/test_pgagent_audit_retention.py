@@ -0,0 +1,49 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers.pgagent.utils import \
+    parse_audit_retention
+
+
+class PgAgentAuditRetentionTestCase(BaseTestGenerator):
+    """This class tests the parsing of the audit log retention settings."""
+    scenarios = [
+        ('All the settings',
+         dict(data={'max_age_days': '90', 'max_rows': 100000,
+                    'joblog_max_age_days': 30, 'partitioned': 'true',
+                    'prune': False},
+              expected={'max_age_days': 90, 'max_rows': 100000,
+                        'joblog_max_age_days': 30, 'partitioned': True,
+                        'prune': False})),
+        ('Only the changed settings',
+         dict(data={'max_rows': 5000},
+              expected={'max_rows': 5000})),
+        ('Remove the limits',
+         dict(data={'max_age_days': None, 'max_rows': ''},
+              expected={'max_age_days': None, 'max_rows': None})),
+        ('Zero max age',
+         dict(data={'max_age_days': 0}, expected=ValueError)),
+        ('Negative max rows',
+         dict(data={'max_rows': '-1'}, expected=ValueError)),
+        ('Max age with SQL in it',
+         dict(data={'max_age_days': "1); DROP TABLE x; --"},
+              expected=ValueError)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        if self.expected is ValueError:
+            with self.assertRaises(ValueError):
+                parse_audit_retention(self.data)
+        else:
+            self.assertEqual(parse_audit_retention(self.data),
+                             self.expected)
@@ -0,0 +1,96 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers.pgagent.utils import \
+    parse_dependency_set
+from pgadmin.browser.server_groups.servers.pgagent.dependency_graph import \
+    plan_dependency_update
+
+
+class PgAgentBulkDependenciesTestCase(BaseTestGenerator):
+    """This class tests the parsing of a bulk job dependency update."""
+    scenarios = [
+        ('Dependencies as objects', dict(
+            dependencies=[{'jobid': 2, 'dependent_jobid': 1},
+                          {'jobid': 3, 'dependent_jobid': 2}],
+            expected={(2, 1), (3, 2)})),
+        ('Dependencies as pairs, with duplicates', dict(
+            dependencies=[[2, 1], [2, 1], (3, 1)],
+            expected={(2, 1), (3, 1)})),
+        ('No dependency', dict(dependencies=[], expected=set())),
+        ('Not a list', dict(
+            dependencies={'jobid': 2, 'dependent_jobid': 1},
+            expected=ValueError)),
+        ('Missing job id', dict(
+            dependencies=[{'jobid': 2}], expected=ValueError)),
+        ('Job id which is not an integer', dict(
+            dependencies=[['x', 1]], expected=ValueError)),
+        ('Boolean job id', dict(
+            dependencies=[[True, 1]], expected=ValueError)),
+        ('Pair of the wrong length', dict(
+            dependencies=[[1, 2, 3]], expected=ValueError)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        if self.expected is ValueError:
+            with self.assertRaises(ValueError):
+                parse_dependency_set(self.dependencies)
+        else:
+            self.assertEqual(parse_dependency_set(self.dependencies),
+                             self.expected)
+
+
+# Jobs 1 to 4, 2 runs after 1 and 3 runs after 2
+JOBS = {1: 'extract', 2: 'transform', 3: 'load', 4: 'report'}
+CURRENT = {(2, 1), (3, 2)}
+
+
+class PgAgentPlanDependencyUpdateTestCase(BaseTestGenerator):
+    """This class tests the validation of a bulk job dependency update."""
+    scenarios = [
+        ('Unchanged dependencies', dict(
+            dependency_set={(2, 1), (3, 2)}, scope=None,
+            expected=dict(added=[], removed=[], unchanged=2))),
+        ('Dependency added', dict(
+            dependency_set={(2, 1), (3, 2), (4, 3)}, scope=None,
+            expected=dict(added=[(4, 3)], removed=[], unchanged=2))),
+        ('Dependency removed', dict(
+            dependency_set={(2, 1)}, scope=None,
+            expected=dict(added=[], removed=[(3, 2)], unchanged=1))),
+        ('Dependencies of the scope only replaced', dict(
+            dependency_set={(3, 1)}, scope={3},
+            expected=dict(added=[(3, 1)], removed=[(3, 2)], unchanged=0))),
+        ('Dependency of a job out of the scope', dict(
+            dependency_set={(3, 2), (4, 3)}, scope={3},
+            expected=dict(out_of_scope=[4]))),
+        ('Dependency on an unknown job', dict(
+            dependency_set={(2, 1), (3, 9)}, scope=None,
+            expected=dict(unknown=[9]))),
+        ('Unknown job in the scope', dict(
+            dependency_set=set(), scope={4, 8},
+            expected=dict(unknown=[8]))),
+        ('Dependency which would create a cycle', dict(
+            dependency_set={(1, 3)}, scope={1},
+            expected=dict(cycles=[[1, 2, 3]]))),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        plan = plan_dependency_update(JOBS, set(CURRENT),
+                                      self.dependency_set, self.scope)
+        expected = dict(unknown=[], out_of_scope=[], cycles=[], added=[],
+                        removed=[], unchanged=0)
+        expected.update(self.expected)
+        self.assertEqual(plan, expected)
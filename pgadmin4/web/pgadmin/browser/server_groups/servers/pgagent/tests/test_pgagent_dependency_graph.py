@@ -0,0 +1,111 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers.pgagent.dependency_graph import \
+    JobDependencyGraph, JobDependencyGraphCache
+
+# 2 runs after 1, 3 and 4 after 2, 5 and 6 after 3 and after each other, 7
+# after itself. The dependency of 9 on 1 is dropped as job 9 is unknown.
+JOBS = [(jobid, 'job{0}'.format(jobid)) for jobid in range(1, 8)]
+DEPENDENCIES = [(2, 1), (3, 2), (4, 2), (5, 3), (6, 5), (5, 6), (7, 7),
+                (9, 1)]
+DURATIONS = {1: 10, 2: 5, 3: 1, 4: 20, 5: 1, 6: 1}
+
+
+class PgAgentDependencyGraphTestCase(BaseTestGenerator):
+    """This class tests the precomputed job dependency graph."""
+    scenarios = [
+        ('Levels', dict(
+            method='levels', args=(),
+            expected=[[1, 7], [2], [3, 4], [5, 6]])),
+        ('Cycles', dict(
+            method='cycles', args=(), expected=[[7], [5, 6]])),
+        ('Level of a job', dict(method='level', args=(3,), expected=2)),
+        ('Level of a job in a cycle',
+         dict(method='level', args=(6,), expected=3)),
+        ('Upstream closure', dict(
+            method='upstream', args=(3,), expected=[1, 2])),
+        ('Upstream closure in a cycle', dict(
+            method='upstream', args=(5,), expected=[1, 2, 3, 6])),
+        ('Downstream closure', dict(
+            method='downstream', args=(1,), expected=[2, 3, 4, 5, 6])),
+        ('Downstream closure of a leaf', dict(
+            method='downstream', args=(4,), expected=[])),
+        ('Critical path', dict(
+            method='critical_path', args=(DURATIONS,),
+            expected=([1, 2, 4], 35))),
+        ('Critical path of a batch', dict(
+            method='critical_path', args=(DURATIONS, [1, 2, 3, 5, 6]),
+            expected=([1, 2, 3, 5, 6], 18))),
+        ('Critical path without jobs', dict(
+            method='critical_path', args=(DURATIONS, []),
+            expected=([], 0))),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        graph = JobDependencyGraph(JOBS, DEPENDENCIES)
+        self.assertEqual(len(graph.edges), 7)
+        self.assertEqual(getattr(graph, self.method)(*self.args),
+                         self.expected)
+
+
+class PgAgentDependencyGraphChainTestCase(BaseTestGenerator):
+    """This class tests a dependency chain longer than the recursion
+    limit."""
+    scenarios = [
+        ('Long chain', dict(length=5000)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        graph = JobDependencyGraph(
+            [(jobid, str(jobid)) for jobid in range(self.length)],
+            [(jobid, jobid - 1) for jobid in range(1, self.length)]
+        )
+        self.assertEqual(graph.level(self.length - 1), self.length - 1)
+        self.assertEqual(len(graph.downstream(0)), self.length - 1)
+        self.assertEqual(graph.cycles(), [])
+
+
+class PgAgentDependencyGraphCacheTestCase(BaseTestGenerator):
+    """This class tests the per-server dependency graph cache."""
+    scenarios = [
+        ('Same version', dict(
+            get_version=(1, 0), get_at=10, expected=True)),
+        ('Dependencies changed', dict(
+            get_version=(1, 1), get_at=10, expected=False)),
+        ('Listener reconnected', dict(
+            get_version=(2, 0), get_at=10, expected=False)),
+        ('Listener not connected', dict(
+            get_version=None, get_at=10, expected=False)),
+        ('Expired', dict(
+            get_version=(1, 0), get_at=100, expected=False)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        cache = JobDependencyGraphCache(timeout=60)
+        graph = JobDependencyGraph(JOBS, DEPENDENCIES)
+        cache.put(1, (1, 0), graph, now=0)
+        cache.put(2, None, graph, now=0)
+        self.assertNotIn(2, cache)
+
+        expired = cache.evict_expired(now=self.get_at)
+        self.assertEqual(expired, [1] if self.get_at >= 60 else [])
+        self.assertEqual(
+            cache.get(1, self.get_version, now=self.get_at) is graph,
+            self.expected)
@@ -0,0 +1,193 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.server_groups.servers.pgagent import \
+    job_status_listener
+from pgadmin.browser.server_groups.servers.pgagent.job_status_listener \
+    import JobStatusListenerRegistry, ServerJobStatusListener, \
+    NotificationRate, JobStatusCoalescer
+
+
+class FakeListener(ServerJobStatusListener):
+    """Listener which never opens a database connection."""
+    started = 0
+
+    def start(self):
+        FakeListener.started += 1
+
+
+class PgAgentJobStatusListenerTestCase(BaseTestGenerator):
+    """This class tests the shared pgAgent job status listener."""
+    scenarios = [
+        ('Single listener shared by all the clients of a server',
+         dict(clients=['c1', 'c2', 'c3'], release=['c1'],
+              expected_started=1, expected_subscribers=2,
+              expected_alive=True)),
+        ('Listener torn down when the last client leaves',
+         dict(clients=['c1', 'c2'], release=['c1', 'c2'],
+              expected_started=1, expected_subscribers=0,
+              expected_alive=False)),
+        ('Duplicate subscription of a client is counted once',
+         dict(clients=['c1', 'c1'], release=['c1'],
+              expected_started=1, expected_subscribers=0,
+              expected_alive=False)),
+    ]
+
+    def setUp(self):
+        FakeListener.started = 0
+
+    def runTest(self):
+        emitted = []
+        registry = JobStatusListenerRegistry(listener_class=FakeListener)
+
+        for client in self.clients:
+            listener, _ = registry.acquire(
+                None, 1, client, 'dbname=postgres', emitted.append)
+
+        listener.dispatch(json.dumps({'job_id': '10', 'status': 's'}))
+        listener.dispatch('not a json payload')
+
+        for client in self.release:
+            registry.release(1, client)
+
+        self.assertEqual(FakeListener.started, self.expected_started)
+        self.assertEqual(len(listener.subscribers),
+                         self.expected_subscribers)
+        self.assertEqual(registry.get(1) is not None, self.expected_alive)
+        self.assertEqual(listener.stopped, not self.expected_alive)
+
+        # Only the valid payload is emitted, but both are counted.
+        self.assertEqual(emitted, [{'job_id': '10', 'status': 's', 'sid': 1}])
+        self.assertEqual(listener.rate.total, 2)
+
+
+class PgAgentJobStatusListenerRetryTestCase(BaseTestGenerator):
+    """This class tests the replacement of a listener which gave up."""
+    scenarios = [
+        ('Listener replaced after the connection retries failed',
+         dict(clients=['c1', 'c2'])),
+    ]
+
+    def setUp(self):
+        self.connects = []
+
+        async def connect(conninfo, **kwargs):
+            self.connects.append(conninfo)
+            raise OSError('connection refused')
+
+        self.patches = [
+            patch.object(job_status_listener, 'CONNECT_RETRY_DELAY', 0),
+            patch.object(job_status_listener.psycopg.AsyncConnection,
+                         'connect', connect),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def runTest(self):
+        registry = JobStatusListenerRegistry()
+        listener, created = registry.acquire(
+            None, 1, self.clients[0], 'dbname=postgres', None)
+        self.assertTrue(created)
+        listener._thread.join(10)
+
+        self.assertEqual(len(self.connects),
+                         job_status_listener.MAX_CONNECT_RETRIES)
+        self.assertTrue(listener.finished)
+        self.assertTrue(listener.stopped)
+        self.assertEqual(listener.last_error, 'connection refused')
+
+        new_listener, created = registry.acquire(
+            None, 1, self.clients[1], 'dbname=postgres', None)
+        new_listener._thread.join(10)
+        self.assertTrue(created)
+        self.assertIsNot(new_listener, listener)
+        self.assertIs(registry.get(1), new_listener)
+        # The clients of the listener which gave up are carried over
+        self.assertEqual(new_listener.subscribers, set(self.clients))
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+
+class PgAgentNotificationRateTestCase(BaseTestGenerator):
+    """This class tests the notification rate counter."""
+    scenarios = [
+        ('Notification rate over the window',
+         dict(events=[100, 100, 101, 130], now=130, window=10,
+              expected_rate=0.1)),
+        ('Notification rate with all events in the window',
+         dict(events=[100, 100, 101, 105], now=105, window=10,
+              expected_rate=0.4)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        rate = NotificationRate(window=self.window)
+        for event in self.events:
+            rate.add(now=event)
+
+        self.assertEqual(rate.total, len(self.events))
+        self.assertEqual(rate.per_second(now=self.now), self.expected_rate)
+
+
+class PgAgentJobStatusCoalescerTestCase(BaseTestGenerator):
+    """This class tests the coalescing of the job status updates."""
+    scenarios = [
+        ('Updates of the same job within the window are collapsed',
+         dict(window=0.25,
+              updates=[(0.0, {'job_id': '1', 'status': 'r'}),
+                       (0.1, {'job_id': '2', 'status': 'r'}),
+                       (0.2, {'job_id': '1', 'status': 's'})],
+              flush_at=0.25,
+              expected=[{'job_id': '1', 'status': 's'},
+                        {'job_id': '2', 'status': 'r'}],
+              expected_collapsed=1)),
+        ('Numeric and string job ids are the same job',
+         dict(window=0.25,
+              updates=[(0.0, {'job_id': 1, 'status': 'r'}),
+                       (0.1, {'jobid': '1', 'status': 'f'})],
+              flush_at=0.3,
+              expected=[{'jobid': '1', 'status': 'f'}],
+              expected_collapsed=1)),
+        ('Updates without a job id are never collapsed',
+         dict(window=0.25,
+              updates=[(0.0, {'status': 'd'}),
+                       (0.1, {'status': 'd'})],
+              flush_at=0.25,
+              expected=[{'status': 'd'}, {'status': 'd'}],
+              expected_collapsed=0)),
+        ('No coalescing window',
+         dict(window=0,
+              updates=[(0.0, {'job_id': '1', 'status': 'r'})],
+              flush_at=0.0,
+              expected=[{'job_id': '1', 'status': 'r'}],
+              expected_collapsed=0)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        coalescer = JobStatusCoalescer(self.window)
+        for at, update in self.updates:
+            due = coalescer.add(update, now=at)
+            if at < self.flush_at:
+                self.assertFalse(due)
+
+        self.assertTrue(coalescer.is_due(now=self.flush_at))
+        self.assertEqual(coalescer.flush(), self.expected)
+        self.assertEqual(coalescer.collapsed, self.expected_collapsed)
+        self.assertIsNone(coalescer.timeout())
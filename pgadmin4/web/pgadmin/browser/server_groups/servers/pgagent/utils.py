@@ -8,6 +8,10 @@
 ##########################################################################
 
 """pgagent helper utilities"""
+import calendar
+from bisect import bisect_left
+from datetime import timedelta
+
 from flask import render_template
 
 
@@ -49,6 +53,295 @@ def format_schedule_data(data):
     return data
 
 
+# Safety net for schedules which can never fire (pga_next_schedule would
+# loop forever on them), about 270 years of one day steps.
+SCHEDULE_MAX_ITERATIONS = 100000
+
+ONE_MINUTE = timedelta(minutes=1)
+ONE_DAY = timedelta(days=1)
+
+# Months with 31 and 30 days
+LONG_MONTHS = (1, 3, 5, 7, 8, 10, 12)
+SHORT_MONTHS = (4, 6, 9, 11)
+
+
+class _ScheduleMasks:
+    """
+    The boolean arrays of a schedule, as the sorted 1-based indexes of
+    their true elements (the array subscripts used by pga_next_schedule),
+    so that looking for the next selected value is a bisection.
+    """
+
+    def __init__(self, schedule):
+        self.start = schedule.get('jscstart')
+        self.end = schedule.get('jscend')
+        self.minutes = self._indexes(schedule.get('jscminutes'))
+        self.hours = self._indexes(schedule.get('jschours'))
+        self.weekdays = self._indexes(schedule.get('jscweekdays'))
+        self.monthdays = self._indexes(schedule.get('jscmonthdays'))
+        self.months = self._indexes(schedule.get('jscmonths'))
+        self.occurrences = self._indexes(schedule.get('jscoccurrence'))
+        self.last_monthday_only = \
+            len(schedule.get('jscmonthdays') or []) == 32 and \
+            self.monthdays == [32]
+
+    @staticmethod
+    def _indexes(values):
+        return [i for i, value in enumerate(values or [], 1)
+                if value is True]
+
+
+def _first_set(indexes, low, high):
+    """Returns the first of the indexes in [low, high), None if none."""
+    pos = bisect_left(indexes, low)
+    if pos < len(indexes) and indexes[pos] < high:
+        return indexes[pos]
+    return None
+
+
+def _is_set(indexes, i):
+    pos = bisect_left(indexes, i)
+    return pos < len(indexes) and indexes[pos] == i
+
+
+def _days_in_month(year, month):
+    return calendar.monthrange(year, month)[1]
+
+
+def _schedule_exceptions(exceptions):
+    """
+    Returns the schedule exceptions as a set of (date, time), either of
+    them being None when the exception applies to every date or time.
+    """
+    return {(jexdate, jextime) for jexdate, jextime in exceptions}
+
+
+def _pga_next_schedule(masks, now, exceptions):
+    """
+    Port of pgagent.pga_next_schedule, see next_schedule_run. The
+    statements follow the PL/pgSQL function one to one, quirks included,
+    so that both always agree on the next run of a schedule.
+    """
+    minutes, hours, monthdays, months = \
+        masks.minutes, masks.hours, masks.monthdays, masks.months
+
+    # No valid start date has been specified
+    if masks.start is None:
+        return None
+
+    # The schedule is past its end date
+    if masks.end is not None and masks.end < now:
+        return None
+
+    runafter = max(masks.start.replace(second=0, microsecond=0),
+                   (now + ONE_MINUTE).replace(second=0, microsecond=0))
+
+    foundval = daytweak = minutetweak = False
+
+    for _ in range(SCHEDULE_MAX_ITERATIONS):
+        year, month, day = runafter.year, runafter.month, runafter.day
+        hour, minute = runafter.hour, runafter.minute
+
+        # Next run month
+        nextyear, nextmonth = year, month
+        i = _first_set(months, nextmonth, 13)
+        if i is None:
+            i = _first_set(months, 1, nextmonth)
+            if i is not None:
+                # Wrap into next year
+                nextyear += 1
+        if i is not None:
+            nextmonth = i
+            foundval = True
+
+        # Next run day, the lowest one if the year or month have
+        # incremented
+        if nextyear > year or nextmonth > month:
+            nextday = 1
+            i = _first_set(monthdays, 1, 33)
+        else:
+            nextday = day
+            i = _first_set(monthdays, nextday, 33)
+            if i is None:
+                i = _first_set(monthdays, 1, nextday)
+                if i is not None:
+                    # Wrap into next month
+                    if nextmonth == 12:
+                        nextyear += 1
+                        nextmonth = 1
+                    else:
+                        nextmonth += 1
+        if i is not None:
+            nextday = i
+            foundval = True
+
+        # Was the last day flag selected?
+        if nextday == 32:
+            nextday = _days_in_month(nextyear, nextmonth)
+
+        # Next run hour, the lowest one if the date has incremented
+        if nextyear > year or nextmonth > month or nextday > day or \
+                daytweak:
+            nexthour = 0
+            i = _first_set(hours, 1, 25)
+        else:
+            nexthour = hour
+            i = _first_set(hours, nexthour + 1, 25)
+            if i is None:
+                i = _first_set(hours, 1, nexthour + 1)
+                if i is not None:
+                    # Wrap into next day
+                    if nextday == _days_in_month(nextyear, nextmonth):
+                        nextday = 1
+                        if nextmonth == 12:
+                            nextyear += 1
+                            nextmonth = 1
+                        else:
+                            nextmonth += 1
+                    else:
+                        nextday += 1
+        if i is not None:
+            nexthour = i - 1
+            foundval = True
+
+        # Next run minute, the lowest one if the date or hour have
+        # incremented (sic: the search starts from the minute of runafter
+        # unless a minute was just skipped)
+        if nextyear > year or nextmonth > month or nextday > day or \
+                nexthour > hour or daytweak:
+            nextminute = 0
+            i = _first_set(minutes, 1 if minutetweak else minute, 61)
+        else:
+            nextminute = minute
+            i = _first_set(minutes, nextminute + 1, 61)
+            if i is None:
+                i = _first_set(minutes, 1, nextminute + 1)
+                if i is not None:
+                    # Wrap into next hour
+                    if nexthour == 23:
+                        nexthour = 0
+                        if nextday == _days_in_month(nextyear, nextmonth):
+                            nextday = 1
+                            if nextmonth == 12:
+                                nextyear += 1
+                                nextmonth = 1
+                            else:
+                                nextmonth += 1
+                        else:
+                            nextday += 1
+                    else:
+                        nexthour += 1
+        if i is not None:
+            nextminute = i - 1
+            foundval = True
+
+        # Raises ValueError on an impossible date such as February 30th,
+        # as the cast to timestamptz does in pga_next_schedule.
+        nextrun = runafter.replace(
+            year=nextyear, month=nextmonth, day=nextday, hour=nexthour,
+            minute=nextminute)
+
+        # All the array entries are false
+        if nextrun == runafter and not foundval:
+            nextrun += ONE_MINUTE
+
+        # The result is past the end date
+        if masks.end is not None and nextrun > masks.end:
+            return None
+
+        # Wrapped values may have carried nextrun onto an invalid time or
+        # date.
+        run_month, run_day = nextrun.month, nextrun.day
+        if not (
+            (not minutes or _is_set(minutes, nextrun.minute + 1)) and
+            (not hours or _is_set(hours, nextrun.hour + 1)) and
+            (not monthdays or _is_set(monthdays, run_day) or (
+                masks.last_monthday_only and (
+                    (run_month in LONG_MONTHS and run_day == 31) or
+                    (run_month in SHORT_MONTHS and run_day == 30) or
+                    (run_month == 2 and (
+                        (calendar.isleap(nextrun.year) and
+                         run_day == 29) or run_day == 28))
+                )
+            )) and
+            (not months or _is_set(months, run_month))
+        ):
+            runafter = nextrun + ONE_MINUTE
+            minutetweak, daytweak = True, False
+            continue
+
+        # Is it on an acceptable weekday (Sunday is 0), and on the right
+        # occurrence of that weekday in the month?
+        if (masks.weekdays and not _is_set(
+                masks.weekdays, nextrun.isoweekday() % 7 + 1)) or \
+                (masks.occurrences and not _is_set(
+                    masks.occurrences, (run_day - 1) // 7 + 1)):
+            runafter = nextrun + ONE_DAY
+            minutetweak, daytweak = False, True
+            continue
+
+        if exceptions:
+            run_date, run_time = nextrun.date(), nextrun.time()
+            if (run_date, run_time) in exceptions or \
+                    (run_date, None) in exceptions or \
+                    (None, run_time) in exceptions:
+                runafter = nextrun + ONE_MINUTE
+                minutetweak, daytweak = True, False
+                continue
+
+        return nextrun
+
+    raise ValueError('No run found for the schedule.')
+
+
+def _next_schedule_run(masks, now, exceptions):
+    try:
+        return _pga_next_schedule(masks, now, exceptions)
+    except OverflowError:
+        # Searched up to year 9999
+        raise ValueError('No run found for the schedule.')
+
+
+def next_schedule_run(schedule, now, exceptions=()):
+    """
+    Computes the next run of a schedule after 'now', as
+    pgagent.pga_next_schedule does, without a round-trip to the server.
+    All the timestamps are naive wall clock times of the server time zone.
+    :param schedule: pga_schedule row (jscstart, jscend, jscminutes,
+        jschours, jscweekdays, jscmonthdays, jscmonths, jscoccurrence)
+    :param now: current time
+    :param exceptions: iterable of (jexdate, jextime) of the schedule
+    :return: next run, None if the schedule will not run any more
+    :raises ValueError: if the schedule reaches an impossible date
+    """
+    return _next_schedule_run(
+        _ScheduleMasks(schedule), now, _schedule_exceptions(exceptions))
+
+
+def schedule_runs(schedule, now, count, exceptions=(), until=None):
+    """
+    Expands a schedule into its next runs, each run being computed after
+    the previous one like pgAgent does once a job has run.
+    :param schedule: pga_schedule row, see next_schedule_run
+    :param now: current time
+    :param count: maximum number of runs
+    :param exceptions: iterable of (jexdate, jextime) of the schedule
+    :param until: do not return the runs after this time
+    :return: list of runs
+    :raises ValueError: if the schedule reaches an impossible date
+    """
+    masks = _ScheduleMasks(schedule)
+    exceptions = _schedule_exceptions(exceptions)
+    runs = []
+    while len(runs) < count:
+        run = _next_schedule_run(masks, now, exceptions)
+        if run is None or (until is not None and run > until):
+            break
+        runs.append(run)
+        now = run
+    return runs
+
+
 def format_step_data(job_id, data, has_connection_str, conn, template_path):
     """
     This function is used to format the step data. If data is not an
@@ -84,3 +377,126 @@ def format_step_data(job_id, data, has_connection_str, conn, template_path):
                 'jstconnstr', row['jstconnstr'])
 
     return True, None
+
+
+AUDIT_OPERATION_TYPES = ('CREATE', 'MODIFY', 'DELETE', 'EXECUTE')
+
+
+def parse_audit_log_cursor(cursor):
+    """
+    Parses a cursor of the audit log, as returned in the 'next_cursor' of
+    the previous page: '<operation time in microseconds>-<audit id>'.
+    :param cursor: cursor string
+    :return: (operation time in microseconds since epoch, audit id)
+    :raises ValueError: if the cursor is malformed
+    """
+    cursor_time, sep, cursor_id = cursor.partition('-')
+    if not sep or not cursor_time.isdigit() or not cursor_id.isdigit():
+        raise ValueError('Invalid audit log cursor: {0}'.format(cursor))
+    return int(cursor_time), int(cursor_id)
+
+
+def parse_audit_operation_types(operation_types):
+    """
+    Parses a comma separated list of audit log operation types.
+    :param operation_types: e.g. 'CREATE,MODIFY'
+    :return: list of operation types
+    :raises ValueError: if an operation type is unknown
+    """
+    op_types = [op.strip().upper() for op in operation_types.split(',')
+                if op.strip()]
+    for op in op_types:
+        if op not in AUDIT_OPERATION_TYPES:
+            raise ValueError('Invalid operation type: {0}'.format(op))
+    return op_types
+
+
+# Retention settings of the audit log which are limits, NULL (no limit) if
+# not set
+AUDIT_RETENTION_LIMITS = ('max_age_days', 'max_rows', 'joblog_max_age_days')
+
+
+def parse_audit_retention(data):
+    """
+    Parses the retention settings of the audit log to update. Only the
+    settings present in data are returned. A limit set to None or '' is
+    removed.
+    :param data: dict with max_age_days, max_rows, joblog_max_age_days,
+        partitioned and prune
+    :return: dict of the settings to update
+    :raises ValueError: if a limit is not a positive integer
+    """
+    settings = {}
+    for key in AUDIT_RETENTION_LIMITS:
+        if key not in data:
+            continue
+        value = data[key]
+        if value is None or value == '':
+            settings[key] = None
+            continue
+        if isinstance(value, bool) or \
+                not str(value).strip().isdigit() or int(value) <= 0:
+            raise ValueError(
+                'Invalid value for {0}: {1}'.format(key, value))
+        settings[key] = int(value)
+
+    for key in ('partitioned', 'prune'):
+        if key in data:
+            value = data[key]
+            if isinstance(value, str):
+                value = value.lower() == 'true'
+            settings[key] = bool(value)
+
+    return settings
+
+
+def parse_job_ids(job_ids):
+    """
+    Parses a list of job ids.
+    :param job_ids: comma separated string, e.g. '1,2,3', or list of ints
+    :return: list of job ids
+    :raises ValueError: if a job id is not an integer
+    """
+    if isinstance(job_ids, list):
+        if not all(isinstance(jobid, int) and not isinstance(jobid, bool)
+                   for jobid in job_ids):
+            raise ValueError('Invalid job ids: {0}'.format(job_ids))
+        return job_ids
+
+    ids = []
+    for jobid in job_ids.split(','):
+        jobid = jobid.strip()
+        if not jobid:
+            continue
+        if not jobid.isdigit():
+            raise ValueError('Invalid job id: {0}'.format(jobid))
+        ids.append(int(jobid))
+    return ids
+
+
+def parse_dependency_set(dependencies):
+    """
+    Parses a set of job dependencies, each one given either as
+    {'jobid': ..., 'dependent_jobid': ...} or as a [jobid, dependent_jobid]
+    pair.
+    :param dependencies: list of dependencies
+    :return: set of (jobid, dependent_jobid)
+    :raises ValueError: if a dependency is malformed
+    """
+    if not isinstance(dependencies, list):
+        raise ValueError('The dependencies must be a list.')
+
+    dependency_set = set()
+    for dep in dependencies:
+        if isinstance(dep, dict):
+            pair = (dep.get('jobid'), dep.get('dependent_jobid'))
+        elif isinstance(dep, (list, tuple)) and len(dep) == 2:
+            pair = tuple(dep)
+        else:
+            raise ValueError('Invalid dependency: {0}'.format(dep))
+
+        if not all(isinstance(jobid, int) and not isinstance(jobid, bool)
+                   for jobid in pair):
+            raise ValueError('Invalid dependency: {0}'.format(dep))
+        dependency_set.add(pair)
+    return dependency_set
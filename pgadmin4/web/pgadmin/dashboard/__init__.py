@@ -17,7 +17,8 @@ from pgadmin.user_login_check import pga_login_required
 import json
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response as ajax_response,\
-    internal_server_error, make_json_response, precondition_required
+    internal_server_error, make_json_response, precondition_required, \
+    bad_request
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS, \
@@ -25,6 +26,7 @@ from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS, \
 
 from .precondition import check_precondition
 from .pgd_replication import blueprint as pgd_replication
+from .audit_log_export import EXPORT_FORMATS, stream_export
 from config import PG_DEFAULT_DRIVER, ON_DEMAND_LOG_COUNT
 
 MODULE_NAME = 'dashboard'
@@ -807,153 +809,149 @@ def replication_slots(sid=None):
     )
 
 
+def _get_pgagent_schema_info(with_columns=False):
+    """
+    Probe the pgAgent schema of the current server connection. The result is
+    cached in the connection manager, so the catalog is queried once per
+    server connection rather than on every refresh of the job monitor.
+    :param with_columns: also fetch the columns of the pgAgent tables
+    :return: status, schema info or error message
+    """
+    info = g.manager.db_info.get('pgAgentMonitor')
+
+    if info is None:
+        status, res = g.conn.execute_dict(
+            "SELECT c.relname AS table_name "
+            "FROM pg_catalog.pg_class c "
+            "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = 'pgagent' AND c.relkind IN ('r', 'p') "
+            "ORDER BY c.relname"
+        )
+        if not status:
+            return False, res
+
+        info = {'tables': res['rows']}
+        g.manager.db_info['pgAgentMonitor'] = info
+
+    if with_columns and 'table_info' not in info:
+        status, res = g.conn.execute_dict(
+            "SELECT table_name, column_name, data_type "
+            "FROM information_schema.columns "
+            "WHERE table_schema = 'pgagent' "
+            "ORDER BY table_name, ordinal_position"
+        )
+        if not status:
+            return False, res
+
+        table_info = {}
+        for row in res['rows']:
+            table_info.setdefault(row['table_name'], []).append({
+                'column_name': row['column_name'],
+                'data_type': row['data_type']
+            })
+        info['table_info'] = table_info
+
+    return True, info
+
+
 @blueprint.route('/job_monitor/<int:sid>', endpoint='job_monitor')
 @pga_login_required
 @check_precondition
 def job_monitor(sid=None):
     """
-    This function returns job monitor data
+    This function returns job monitor data.
+
+    With the 'since' argument set to the token of a previous response, only
+    the jobs which are running, were created or edited, or whose latest run
+    started or finished since that response are returned, along with the ids
+    of all the jobs so that the client can drop the deleted ones. Every
+    response has a hash of the definition of each job, for the client to
+    detect the changes which are not in the delta. The 'debug' argument adds
+    the pgAgent schema details to the response.
     :param sid: server id
     :return: Response
     """
-    try:
-        # Check if pgAgent extension is available
-        status, res = g.conn.execute_scalar(
-            "SELECT COUNT(*) FROM pg_catalog.pg_namespace WHERE nspname = 'pgagent'"
-        )
-        
-        if not status or int(res) == 0:
-            return make_json_response(
-                success=0,
-                errormsg=gettext("pgAgent extension not found. Please make sure it is installed."),
-                status=404
-            )
-            
-        # Debug: Let's check if the tables exist
-        status, tables = g.conn.execute_dict(
-            "SELECT table_name FROM information_schema.tables WHERE table_schema = 'pgagent'"
-        )
-        
-        if not status or len(tables['rows']) == 0:
-            return make_json_response(
-                success=0,
-                errormsg=gettext("pgAgent tables not found. Please make sure pgAgent is properly installed."),
-                status=404
-            )
-        
-        # Get table structure for debugging
-        table_info = {}
-        for table in tables['rows']:
-            table_name = table['table_name']
-            status, columns = g.conn.execute_dict(
-                "SELECT column_name, data_type FROM information_schema.columns "
-                "WHERE table_schema = 'pgagent' AND table_name = %s",
-                (table_name,)
-            )
-            if status:
-                table_info[table_name] = columns['rows']
-        
-        # Try a simpler query first to test
-        status, job_count = g.conn.execute_scalar(
-            "SELECT COUNT(*) FROM pgagent.pga_job"
-        )
-        
-        if not status:
+    since = request.args.get('since', None)
+    debug = request.args.get('debug', 'false').lower() == 'true'
+
+    if since is not None:
+        try:
+            since = float(since)
+        except ValueError:
             return make_json_response(
                 success=0,
-                errormsg=gettext("Error accessing pgAgent job table: {}".format(job_count)),
-                status=500
-            )
-            
-        # If we got here, we can try the full query
-        status, res = g.conn.execute_dict(
-            render_template(
-                "/".join([g.template_path, 'job_monitor.sql'])
+                errormsg=gettext("Invalid job monitor token."),
+                status=400
             )
+
+    status, schema_info = _get_pgagent_schema_info(with_columns=debug)
+    if not status:
+        return internal_server_error(errormsg=schema_info)
+
+    if len(schema_info['tables']) == 0:
+        # pgAgent may be installed later on, so don't keep the negative
+        # result around.
+        g.manager.db_info.pop('pgAgentMonitor', None)
+        return make_json_response(
+            success=0,
+            errormsg=gettext("pgAgent tables not found. Please make sure "
+                             "pgAgent is properly installed."),
+            status=404
         )
 
-        if not status:
-            return make_json_response(
-                success=0,
-                errormsg=gettext("Error executing job monitor query: {}".format(res)),
-                status=500
-            )
-            
-        # Log the structure of the result for debugging
-        if 'rows' in res and len(res['rows']) > 0:
-            first_row = res['rows'][0]
-            # Check if the result column exists
-            if 'result' in first_row:
-                # Extract the result JSON
-                result_json = first_row['result']
-                
-                # Check if result_json is a string and try to parse it
-                if isinstance(result_json, str):
-                    try:
-                        import json
-                        result_json = json.loads(result_json)
-                    except Exception as e:
-                        return make_json_response(
-                            success=0,
-                            errormsg=gettext("Error parsing JSON result: {}".format(str(e))),
-                            status=500
-                        )
-                
-                # Return the result directly
-                return ajax_response(
-                    response={
-                        'debug_info': {
-                            'tables': tables['rows'],
-                            'table_info': table_info,
-                            'job_count': job_count,
-                            'raw_result': first_row
-                        },
-                        'data': result_json
-                    },
-                    status=200
-                )
-            else:
-                # Log the available columns
-                available_columns = list(first_row.keys())
-                return make_json_response(
-                    success=0,
-                    errormsg=gettext("Expected 'result' column not found in query result. Available columns: {}".format(available_columns)),
-                    status=500
-                )
-        else:
-            # No rows returned
-            return ajax_response(
-                response={
-                    'debug_info': {
-                        'tables': tables['rows'],
-                        'table_info': table_info,
-                        'job_count': job_count,
-                        'message': 'No rows returned from query'
-                    },
-                    'data': {
-                        'summary': {
-                            'total_jobs': 0,
-                            'enabled_jobs': 0,
-                            'disabled_jobs': 0,
-                            'running_jobs': 0,
-                            'successful_jobs': 0,
-                            'failed_jobs': 0
-                        },
-                        'jobs': []
-                    }
-                },
-                status=200
-            )
-    except Exception as e:
-        import traceback
-        error_traceback = traceback.format_exc()
+    status, res = g.conn.execute_dict(
+        render_template(
+            "/".join([g.template_path, 'job_monitor.sql']),
+            since=since is not None
+        ),
+        {'since': since} if since is not None else None
+    )
+
+    if not status:
+        # The schema may have changed under us (e.g. pgAgent upgrade)
+        g.manager.db_info.pop('pgAgentMonitor', None)
         return make_json_response(
             success=0,
-            errormsg=str(e),
-            info=error_traceback,
+            errormsg=gettext(
+                "Error executing job monitor query: {}").format(res),
             status=500
         )
 
+    result = res['rows'][0]['result'] if res['rows'] else None
+    if isinstance(result, str):
+        result = json.loads(result)
+
+    result = result or {
+        'summary': {
+            'total_jobs': 0,
+            'enabled_jobs': 0,
+            'disabled_jobs': 0,
+            'running_jobs': 0,
+            'successful_jobs': 0,
+            'failed_jobs': 0
+        },
+        'jobs': []
+    }
+    result['incremental'] = since is not None
+
+    if debug:
+        return ajax_response(
+            response={
+                'debug_info': {
+                    'tables': schema_info['tables'],
+                    'table_info': schema_info['table_info'],
+                    'job_count': result['summary']['total_jobs']
+                },
+                'data': result
+            },
+            status=200
+        )
+
+    return ajax_response(
+        response=result,
+        status=200
+    )
+
 
 @blueprint.route('/run_job/<int:sid>/<int:jobid>', methods=['POST'], endpoint='run_job')
 @pga_login_required
@@ -1172,7 +1170,7 @@ def audit_logs(sid=None):
     # Check if export is requested
     export = request.args.get('export', 'false').lower() == 'true'
     export_format = request.args.get('format', 'json').lower()
-    
+
     # Prepare template parameters
     params = {
         'operation': operation,
@@ -1181,39 +1179,37 @@ def audit_logs(sid=None):
         'start_date': start_date,
         'end_date': end_date
     }
-    
-    sql = render_template("/".join(['dashboard/sql/default', 'audit_logs.sql']), **params)
-    status, res = g.conn.execute_dict(sql)
-    
+
+    status, schema_info = _get_pgagent_schema_info()
     if not status:
-        return internal_server_error(errormsg=str(res))
-    
-    # If export is requested, return the data in the requested format
+        return internal_server_error(errormsg=schema_info)
+    has_retention = any(
+        table['table_name'] == 'pga_job_audit_retention'
+        for table in schema_info['tables']
+    )
+
+    sql = render_template(
+        "/".join(['dashboard/sql/default', 'audit_logs.sql']),
+        has_retention=has_retention, **params)
+
+    # If export is requested, stream the data in the requested format
     if export:
-        if export_format == 'json':
-            # For JSON export
-            import json
-            response_data = json.dumps(res['rows'], indent=2)
-            response = Response(response_data, mimetype='application/json')
-            response.headers['Content-Disposition'] = 'attachment; filename=pgagent_audit_logs.json'
-            return response
-        elif export_format == 'csv':
-            # For CSV export
-            import csv
-            import io
-            
-            output = io.StringIO()
-            if res['rows']:
-                # Get column names from the first row
-                fieldnames = res['rows'][0].keys()
-                writer = csv.DictWriter(output, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(res['rows'])
-            
-            response = Response(output.getvalue(), mimetype='text/csv')
-            response.headers['Content-Disposition'] = 'attachment; filename=pgagent_audit_logs.csv'
-            return response
-    
+        if export_format not in EXPORT_FORMATS:
+            return bad_request(
+                errormsg=gettext("Invalid export format: {0}").format(
+                    export_format))
+
+        status, res = stream_export(
+            g.manager, sql, params, export_format, 'pgagent_audit_logs')
+        if not status:
+            return internal_server_error(errormsg=res)
+        return res
+
+    status, res = g.conn.execute_dict(sql, params)
+
+    if not status:
+        return internal_server_error(errormsg=str(res))
+
     # Default response for non-export requests
     return ajax_response(
         response=res['rows'],
@@ -1249,61 +1245,56 @@ def job_names(sid=None):
 @pga_login_required
 @check_precondition
 def job_dependency_graph(sid):
-    """Get the job dependency graph data."""
-    try:
-        if not sid:
-            return internal_server_error(errormsg=ERROR_SERVER_ID_NOT_SPECIFIED)
-
-        # Get all jobs
-        status, jobs = g.conn.execute_dict(
-            render_template(
-                "/".join([g.template_path, 'jobs.sql'])
-            )
-        )
-        if not status:
-            return internal_server_error(errormsg=jobs)
-
-        # Get all dependencies
-        status, deps = g.conn.execute_dict(
-            render_template(
-                "/".join([g.template_path, 'dependencies.sql'])
-            )
-        )
-        if not status:
-            return internal_server_error(errormsg=deps)
+    """
+    Get the job dependency graph data. The graph is cached per server, only
+    the status of the jobs is queried on every call.
+    """
+    from pgadmin.browser.server_groups.servers.pgagent import \
+        get_job_dependency_graph
 
-        # Build the graph data
-        nodes = []
-        edges = []
-        
-        # Add nodes for all jobs
-        for job in jobs['rows']:
-            nodes.append({
-                'id': job['jobid'],
-                'name': job['jobname'],
-                'enabled': job['jobenabled'],
-                'status': job['status'],
-                'next_run': job['jobnextrun'],
-                'last_run': job['joblastrun']
-            })
+    if not sid:
+        return internal_server_error(errormsg=ERROR_SERVER_ID_NOT_SPECIFIED)
 
-        # Add edges for all dependencies
-        for dep in deps['rows']:
-            edges.append({
-                'source': dep['jobid'],
-                'target': dep['dependent_jobid'],
-                'dependent_jobname': dep['dependent_jobname']
-            })
+    status, graph = get_job_dependency_graph(sid, g.manager, g.conn)
+    if not status:
+        return internal_server_error(errormsg=graph)
 
-        return ajax_response(
-            response={
-                'dependency_graph': {
-                    'nodes': nodes,
-                    'links': edges
-                }
-            },
-            status=200
+    status, jobs = g.conn.execute_dict(
+        render_template(
+            "/".join([g.template_path, 'jobs.sql'])
         )
+    )
+    if not status:
+        return internal_server_error(errormsg=jobs)
+
+    nodes = []
+    for job in jobs['rows']:
+        if job['jobid'] not in graph:
+            continue
+        nodes.append({
+            'id': job['jobid'],
+            'name': job['jobname'],
+            'enabled': job['jobenabled'],
+            'status': job['status'],
+            'next_run': job['jobnextrun'],
+            'last_run': job['joblastrun'],
+            'level': graph.level(job['jobid'])
+        })
+
+    edges = [{
+        'source': jobid,
+        'target': dependent_jobid,
+        'dependent_jobname': graph.jobs[dependent_jobid]
+    } for jobid, dependent_jobid in graph.edges]
 
-    except Exception as e:
-        return internal_server_error(errormsg=str(e))
\ No newline at end of file
+    return ajax_response(
+        response={
+            'dependency_graph': {
+                'nodes': nodes,
+                'links': edges,
+                'levels': graph.levels(),
+                'cycles': graph.cycles()
+            }
+        },
+        status=200
+    )
@@ -0,0 +1,144 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Streaming export of the pgAgent audit log.
+
+The rows are read from a server-side cursor in chunks and every chunk is
+formatted and sent to the client before the next one is fetched, so the
+memory used does not depend on the number of rows exported.
+"""
+
+import csv
+import json
+import secrets
+from io import StringIO
+
+from flask import Response, current_app, stream_with_context
+
+from pgadmin.utils.ajax import DataTypeJSONEncoder
+
+# Number of rows fetched from the server-side cursor at a time
+EXPORT_CHUNK_SIZE = 5000
+
+# format: (mimetype, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'json': ('application/json', 'json'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+def _dumps(row, **kwargs):
+    return json.dumps(row, cls=DataTypeJSONEncoder, **kwargs)
+
+
+def format_chunks(columns, chunks, export_format):
+    """
+    Format the chunks of rows in the given export format.
+
+    :param columns: column names
+    :param chunks: iterable of lists of row tuples
+    :param export_format: one of EXPORT_FORMATS
+    :return: generator of strings
+    """
+    if export_format == 'csv':
+        buf = StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(columns)
+        for rows in chunks:
+            writer.writerows(rows)
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+        # Header only, if there was no row at all
+        if buf.tell():
+            yield buf.getvalue()
+    elif export_format == 'ndjson':
+        for rows in chunks:
+            yield ''.join(
+                _dumps(dict(zip(columns, row))) + '\n' for row in rows
+            )
+    else:
+        # Same layout as json.dumps(rows, indent=2)
+        first = True
+        yield '['
+        for rows in chunks:
+            out = []
+            for row in rows:
+                out.append('\n  ' if first else ',\n  ')
+                out.append(
+                    _dumps(dict(zip(columns, row)), indent=2)
+                    .replace('\n', '\n  ')
+                )
+                first = False
+            yield ''.join(out)
+        yield ']' if first else '\n]'
+
+
+def stream_export(manager, sql, params, export_format, filename):
+    """
+    Returns a streaming response exporting the result of the query. The
+    query runs on a dedicated connection, in a server-side cursor, and the
+    connection is released once the export is over or aborted.
+
+    :param manager: server manager
+    :param sql: query
+    :param params: query parameters
+    :param export_format: one of EXPORT_FORMATS
+    :param filename: name of the downloaded file, without extension
+    :return: (status, Response or error message)
+    """
+    conn_id = 'export-{0}'.format(secrets.choice(range(1, 9999999)))
+    conn = manager.connection(conn_id=conn_id)
+    status, msg = conn.connect()
+    if not status:
+        manager.release(conn_id=conn_id)
+        return False, msg
+
+    pg_conn = conn.conn
+
+    def chunks(cur):
+        while True:
+            rows = cur.fetchmany(EXPORT_CHUNK_SIZE)
+            if not rows:
+                break
+            yield rows
+
+    def generate():
+        try:
+            with pg_conn.transaction():
+                with pg_conn.cursor(name=conn_id) as cur:
+                    cur.itersize = EXPORT_CHUNK_SIZE
+                    cur.execute(sql, params)
+                    columns = [col.name for col in cur.description]
+                    # The query is running, the caller can start streaming
+                    yield None
+                    yield from format_chunks(
+                        columns, chunks(cur), export_format)
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            current_app.logger.error(
+                'Export of {0} aborted: {1}'.format(filename, e))
+            raise
+        finally:
+            manager.release(conn_id=conn_id)
+
+    gen = generate()
+    try:
+        next(gen)
+    except Exception as e:
+        return False, str(e)
+
+    mimetype, extension = EXPORT_FORMATS[export_format]
+    response = Response(stream_with_context(gen), mimetype=mimetype)
+    response.headers['Content-Disposition'] = \
+        'attachment; filename={0}.{1}'.format(filename, extension)
+    return True, response
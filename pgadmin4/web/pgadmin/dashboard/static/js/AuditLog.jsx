@@ -29,7 +29,6 @@ import RestartAltIcon from '@mui/icons-material/RestartAlt';
 import EventIcon from '@mui/icons-material/Event';
 import EmptyPanelMessage from '../../../static/js/components/EmptyPanelMessage';
 import GetAppRoundedIcon from '@mui/icons-material/GetAppRounded';
-import { downloadFile } from '../../../static/js/utils';
 
 // Define styles as objects instead of using makeStyles
 const styles = {
@@ -465,92 +464,31 @@ function AuditLog({ sid, treeNodeInfo, pageVisible }) {
 
   const handleExport = (format) => {
     if (!sid) return;
-    
+
     // Build query parameters for filtering
     let params = new URLSearchParams();
     if (operation) params.append('operation', operation);
     if (username) params.append('username', username);
-    
+
     // We're already storing the job ID in jobname
     if (jobname) {
       params.append('jobname', jobname);
     }
-    
+
     if (startDate) params.append('start_date', startDate);
     if (endDate) params.append('end_date', endDate);
-    
-    // Show loading state
-    setLoading(true);
-    
-    // Use the API instance to make the request with proper authentication
-    api({
-      url: url_for('dashboard.audit_logs', {'sid': sid}) + '?' + params.toString(),
-      method: 'GET',
-    })
-      .then((response) => {
-        const data = response.data;
-        let fileName = `pgagent_audit_logs_${new Date().getTime()}`;
-        let contentType = 'text/plain';
-        let content = '';
-        
-        if (format === 'json') {
-          fileName += '.json';
-          contentType = 'application/json';
-          content = JSON.stringify(data, null, 2);
-        } else if (format === 'csv') {
-          fileName += '.csv';
-          contentType = 'text/csv';
-          
-          // Create CSV content
-          if (data && data.length > 0) {
-            // Get headers from the first row
-            const headers = Object.keys(data[0]);
-            content = headers.join(',') + '\n';
-            
-            // Add data rows
-            data.forEach(row => {
-              const rowValues = headers.map(header => {
-                let value = row[header];
-                // Handle special cases for CSV formatting
-                if (value === null || value === undefined) {
-                  return '';
-                } else if (typeof value === 'object') {
-                  value = JSON.stringify(value);
-                }
-                // Escape quotes and wrap in quotes if contains comma
-                value = String(value).replace(/"/g, '""');
-                if (value.includes(',') || value.includes('\n') || value.includes('"')) {
-                  value = `"${value}"`;
-                }
-                return value;
-              });
-              content += rowValues.join(',') + '\n';
-            });
-          }
-        }
-        
-        // Download the file
-        downloadFile(content, fileName, contentType);
-        setLoading(false);
-        
-        // Show success notification
-        if (window.pgAdmin && window.pgAdmin.Browser) {
-          window.pgAdmin.Browser.notifier.success(
-            gettext(`Successfully exported audit logs in ${format.toUpperCase()} format`)
-          );
-        }
-      })
-      .catch((error) => {
-        console.error('Export failed:', error);
-        setLoading(false);
-        
-        // Show error notification
-        if (window.pgAdmin && window.pgAdmin.Browser) {
-          window.pgAdmin.Browser.notifier.error(
-            gettext(`Failed to export audit logs: ${error.message}`)
-          );
-        }
-      });
+    params.append('export', 'true');
+    params.append('format', format);
+
+    // The server streams the export, let the browser download it directly
+    // instead of holding the whole file in memory here.
+    const link = document.createElement('a');
+    link.setAttribute('href', url_for('dashboard.audit_logs', {'sid': sid}) + '?' + params.toString());
+    link.setAttribute('download', `pgagent_audit_logs_${new Date().getTime()}.${format}`);
+    link.style.display = 'none';
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
   };
 
   const columns = [
@@ -860,6 +798,24 @@ function AuditLog({ sid, treeNodeInfo, pageVisible }) {
           >
             {gettext('Export CSV')}
           </Button>
+          <Button 
+            variant="outlined" 
+            onClick={() => handleExport('ndjson')} 
+            startIcon={<GetAppRoundedIcon />}
+            sx={{
+              ...styles.filterButton,
+              borderColor: '#2196f3',
+              color: '#2196f3',
+              '&:hover': {
+                borderColor: '#1976d2',
+                backgroundColor: 'rgba(33, 150, 243, 0.04)',
+              }
+            }}
+            size="medium"
+            disabled={loading}
+          >
+            {gettext('Export NDJSON')}
+          </Button>
         </Box>
       </Paper>
       
@@ -843,8 +843,50 @@ const renderErrorDetails = (errorDetails) => {
   );
 };
 
+// An incremental job monitor response can't be merged when it lacks a job
+// which is new or whose definition changed (e.g. a schedule edit only moves
+// its next run), a full snapshot must be fetched instead.
+export function isJobMonitorDeltaComplete(prev, delta) {
+  if (!prev) {
+    return false;
+  }
+  const changed = new Set((delta.jobs || []).map(job => job.jobid));
+  const versions = prev.job_versions || {};
+  return (delta.job_ids || []).every(jobid => changed.has(jobid) ||
+    (jobid in versions && versions[jobid] === delta.job_versions?.[jobid]));
+}
+
+// Merge an incremental job monitor response into the previous snapshot:
+// changed jobs are replaced (or added), deleted jobs are dropped and the
+// history of the previous snapshot is kept.
+export function mergeJobMonitorData(prev, delta) {
+  if (!prev) {
+    return delta;
+  }
+  const changed = new Map((delta.jobs || []).map(job => [job.jobid, job]));
+  const existing = new Set(delta.job_ids || []);
+  const jobs = (prev.jobs || [])
+    .filter(job => existing.has(job.jobid))
+    .map(job => {
+      const updated = changed.get(job.jobid);
+      changed.delete(job.jobid);
+      return updated || job;
+    });
+
+  return {
+    ...prev,
+    summary: delta.summary,
+    jobs: [...changed.values(), ...jobs],
+    job_versions: delta.job_versions,
+    token: delta.token,
+  };
+}
+
 export default function JobMonitor({sid, pageVisible = true}) {
   const [jobData, setJobData] = useState(null);
+  const monitorTokenRef = useRef(null);
+  // Snapshot the next incremental response is merged into
+  const jobDataRef = useRef(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [refresh, setRefresh] = useState(false);
@@ -906,6 +948,25 @@ export default function JobMonitor({sid, pageVisible = true}) {
   [allJobs]
   );
 
+  // Only receive the status updates of the jobs shown by the monitor
+  const jobsLoaded = jobData !== null;
+  const jobIdsKey = useMemo(() =>
+    allJobs.map(job => job.jobid).sort((a, b) => a - b).join(','),
+  [allJobs]
+  );
+  useEffect(() => {
+    const pgaJobNode = pgAdmin.Browser?.Nodes?.['pga_job'];
+    if (!sid || !pageVisible || !pgaJobNode?.watchJobs) return;
+    const viewId = 'job_monitor_' + sid;
+    return () => pgaJobNode.unwatchJobs(viewId);
+  }, [sid, pageVisible]);
+  useEffect(() => {
+    const pgaJobNode = pgAdmin.Browser?.Nodes?.['pga_job'];
+    if (!sid || !pageVisible || !jobsLoaded || !pgaJobNode?.watchJobs) return;
+    pgaJobNode.watchJobs('job_monitor_' + sid, sid,
+      jobIdsKey ? jobIdsKey.split(',') : []);
+  }, [sid, pageVisible, jobIdsKey, jobsLoaded]);
+
   const [jobStatusFilter, setJobStatusFilter] = useState('all');
   
   // Get filtered jobs based on current status filter
@@ -943,7 +1004,7 @@ export default function JobMonitor({sid, pageVisible = true}) {
         startDate: moment().subtract(days, 'days').toDate(),
         endDate: moment().toDate(),
       });
-      fetchJobMonitorData(); // Refresh data when time filter changes
+      fetchJobMonitorData(true); // Refresh data when time filter changes
     }
     handleTimeFilterClose();
   };
@@ -966,7 +1027,7 @@ export default function JobMonitor({sid, pageVisible = true}) {
     }
     
     setDateRangeDialogOpen(false);
-    fetchJobMonitorData(); // Refresh data when date range changes
+    fetchJobMonitorData(true); // Refresh data when date range changes
   };
 
   // Process historical data for charts with date filtering
@@ -1556,7 +1617,7 @@ export default function JobMonitor({sid, pageVisible = true}) {
   const handleJobFilterChange = (jobId) => {
     setSelectedJobFilter(jobId);
     setJobFilterAnchorEl(null);
-    fetchJobMonitorData(); // Refresh data when filter changes
+    fetchJobMonitorData(true); // Refresh data when filter changes
   };
 
   // Generate job filter options from job data
@@ -1703,6 +1764,8 @@ export default function JobMonitor({sid, pageVisible = true}) {
                   };
                   
                   // Update the job data state
+                  monitorTokenRef.current = updatedJobData.token || null;
+                  jobDataRef.current = updatedJobData;
                   setJobData(updatedJobData);
                   
                   // Automatically open log dialog for the failed job
@@ -1759,68 +1822,48 @@ export default function JobMonitor({sid, pageVisible = true}) {
     }
   }, 5000);
 
-  // Update fetchJobMonitorData to handle filter changes
-  const fetchJobMonitorData = useCallback(() => {
+  // The token of a server is meaningless for another one
+  useEffect(() => {
+    monitorTokenRef.current = null;
+    jobDataRef.current = null;
+  }, [sid]);
+
+  // Fetch the job monitor data. Once a full snapshot has been loaded, only
+  // the jobs changed since the previous response are requested and merged.
+  const fetchJobMonitorData = useCallback((full = false) => {
     if (!sid || !pageVisible) return;
-    
-    setLoading(true);
+
+    const params = {};
+    if (!full && monitorTokenRef.current) {
+      params.since = monitorTokenRef.current;
+    } else {
+      setLoading(true);
+    }
     const url = url_for('dashboard.job_monitor', {'sid': sid});
-    
-    api.get(url)
+
+    api.get(url, {params: params})
       .then(res => {
-        if (res.data) {
-          // Extract job data from response based on format
-          if (res.data.debug_info) {
-            if (res.data.data) {
-              if (typeof res.data.data === 'object' && !Array.isArray(res.data.data) && 
-                  (res.data.data.summary || res.data.data.jobs)) {
-                setJobData(res.data.data);
-              } else if (typeof res.data.data === 'object') {
-                const keys = Object.keys(res.data.data);
-                const isArrayLike = keys.length > 0 && keys.every(key => !isNaN(parseInt(key)));
-                
-                if (isArrayLike) {
-                  const rawResult = res.data.debug_info?.raw_result?.result;
-                  if (rawResult && typeof rawResult === 'object') {
-                    setJobData(rawResult);
-                  } else {
-                    setError(gettext('Invalid data format received from server'));
-                  }
-                } else {
-                  setJobData({
-                    summary: {
-                      total_jobs: res.data.debug_info?.job_count || 0,
-                      enabled_jobs: 0,
-                      disabled_jobs: 0,
-                      running_jobs: 0,
-                      successful_jobs: 0,
-                      failed_jobs: 0
-                    },
-                    jobs: []
-                  });
-                }
-              } else {
-                setError(gettext('Invalid response format from server'));
-              }
-            } else {
-              setError(gettext('Invalid response format from server'));
-            }
-          } else {
-            if (res.data.result) {
-              setJobData(res.data.result);
-            } else if (typeof res.data === 'object' && (res.data.summary || res.data.jobs)) {
-              setJobData(res.data);
-            } else {
-              setError(gettext('Invalid data format received from server'));
-            }
+        if (res.data && typeof res.data === 'object' &&
+            (res.data.summary || res.data.jobs)) {
+          if (res.data.incremental &&
+              !isJobMonitorDeltaComplete(jobDataRef.current, res.data)) {
+            monitorTokenRef.current = null;
+            fetchJobMonitorData(true);
+            return;
           }
+          monitorTokenRef.current = res.data.token || null;
+          jobDataRef.current = res.data.incremental ?
+            mergeJobMonitorData(jobDataRef.current, res.data) : res.data;
+          setJobData(jobDataRef.current);
           setError(null);
         } else {
-          setError(gettext('No data returned from server'));
+          monitorTokenRef.current = null;
+          setError(gettext('Invalid data format received from server'));
         }
         setLoading(false);
       })
       .catch(error => {
+        monitorTokenRef.current = null;
         setLoading(false);
         setError(error.response?.data?.errormsg || gettext('Error fetching job data'));
       });
@@ -1829,7 +1872,7 @@ export default function JobMonitor({sid, pageVisible = true}) {
   // Handle refresh button click
   const handleRefresh = () => {
     setRefresh(!refresh);
-    fetchJobMonitorData();
+    fetchJobMonitorData(true);
     fetchDependencyGraphData();
   };
 
@@ -8,33 +8,27 @@ SELECT
 FROM
     pgagent.pga_job_audit_log
 WHERE
+    true
     {% if operation %}
-    operation_type = '{{ operation }}'
-    {% else %}
-    1=1
+    AND operation_type = %(operation)s
     {% endif %}
-    AND
     {% if username %}
-    operation_user = '{{ username }}'
-    {% else %}
-    1=1
+    AND operation_user = %(username)s
     {% endif %}
-    AND
     {% if jobname %}
-    (additional_info LIKE '%{{ jobname }}%' OR job_id::text = '{{ jobname }}')
-    {% else %}
-    1=1
+    AND (strpos(additional_info, %(jobname)s) > 0 OR job_id::text = %(jobname)s)
     {% endif %}
-    AND
     {% if start_date %}
-    operation_time >= '{{ start_date }}'::timestamptz
-    {% else %}
-    1=1
+    AND operation_time >= %(start_date)s::timestamptz
     {% endif %}
-    AND
     {% if end_date %}
-    operation_time <= '{{ end_date }}'::timestamptz
-    {% else %}
-    1=1
+    AND operation_time <= %(end_date)s::timestamptz
     {% endif %}
-ORDER BY operation_time DESC;
\ No newline at end of file
+    {% if has_retention %}
+    {# Skip the rows past the retention max age, and their partitions #}
+    AND operation_time >= COALESCE(
+        now() - (SELECT max_age FROM pgagent.pga_job_audit_retention),
+        '-infinity'::timestamptz
+    )
+    {% endif %}
+ORDER BY operation_time DESC;
@@ -1,154 +1,132 @@
 /*pga4dash*/
+WITH
+-- Get the latest run of every job. Each lookup is a single probe of the
+-- pga_joblog (jlgjobid, jlgid DESC) index instead of a scan of the log.
+latest_runs AS (
+    SELECT
+        j.jobid,
+        j.jobname,
+        j.jobdesc,
+        j.jobenabled,
+        j.jobnextrun,
+        j.jobchanged,
+        jl.jlgid,
+        jl.jlgstatus,
+        jl.jlgstart,
+        jl.jlgduration
+    FROM
+        pgagent.pga_job j
+    LEFT JOIN LATERAL (
+        SELECT jlgid, jlgstatus, jlgstart, jlgduration
+        FROM pgagent.pga_joblog
+        WHERE jlgjobid = j.jobid
+        ORDER BY jlgid DESC
+        LIMIT 1
+    ) jl ON true
+),
 -- Get job summary statistics
-WITH job_stats AS (
+job_stats AS (
     SELECT
         COUNT(*) AS total_jobs,
         SUM(CASE WHEN jobenabled THEN 1 ELSE 0 END) AS enabled_jobs,
-        SUM(CASE WHEN NOT jobenabled THEN 1 ELSE 0 END) AS disabled_jobs
-    FROM 
-        pgagent.pga_job
-),
--- Get job status counts
-job_status_stats AS (
-    SELECT
+        SUM(CASE WHEN NOT jobenabled THEN 1 ELSE 0 END) AS disabled_jobs,
         SUM(CASE WHEN jlgstatus = 'r' THEN 1 ELSE 0 END) AS running_jobs,
         SUM(CASE WHEN jlgstatus = 's' THEN 1 ELSE 0 END) AS successful_jobs,
         SUM(CASE WHEN jlgstatus = 'f' OR jlgstatus = 'x' THEN 1 ELSE 0 END) AS failed_jobs
-    FROM 
-        pgagent.pga_joblog
-    WHERE 
-        jlgid IN (
-            SELECT MAX(jlgid) 
-            FROM pgagent.pga_joblog 
-            GROUP BY jlgjobid
-        )
+    FROM
+        latest_runs
 ),
 -- Get job steps for each job
 job_steps AS (
-    SELECT 
+    SELECT
         jstjobid,
         COUNT(*) AS total_steps
-    FROM 
+    FROM
         pgagent.pga_jobstep
-    GROUP BY 
+    GROUP BY
         jstjobid
 ),
--- Get latest step log for each job
-latest_step_logs AS (
-    SELECT DISTINCT ON (jl.jlgjobid)
-        jl.jlgjobid AS job_id,
-        js.jstname AS step_name,
-        sl.jslstatus,
-        sl.jslresult,
-        sl.jslstart,
-        sl.jslduration,
-        js.jscnextrun
-    FROM
-        pgagent.pga_jobsteplog sl
-    JOIN
-        pgagent.pga_joblog jl ON sl.jsljlgid = jl.jlgid
-    JOIN
-        pgagent.pga_jobstep js ON sl.jsljstid = js.jstid
-    ORDER BY
-        jl.jlgjobid, sl.jslstart DESC
-),
 -- Get active jobs with basic information
 active_jobs AS (
-    SELECT 
-        j.jobid,
-        j.jobname,
-        j.jobdesc,
-        j.jobenabled,
-        j.jobnextrun,
-        CASE 
-            WHEN jl.jlgstatus = 'r' THEN 'Running'
-            WHEN jl.jlgstatus = 's' THEN 'Success'
-            WHEN jl.jlgstatus = 'f' or jl.jlgstatus='x' THEN 'Failed'
-            WHEN jl.jlgstatus = 'i' THEN 'Internal Error'
-            WHEN jl.jlgstatus = 'd' THEN 'Aborted'
-            WHEN j.jobenabled THEN 'Enabled'
+    SELECT
+        lr.jobid,
+        lr.jobname,
+        lr.jobdesc,
+        lr.jobenabled,
+        lr.jobnextrun,
+        CASE
+            WHEN lr.jlgstatus = 'r' THEN 'Running'
+            WHEN lr.jlgstatus = 's' THEN 'Success'
+            WHEN lr.jlgstatus = 'f' or lr.jlgstatus='x' THEN 'Failed'
+            WHEN lr.jlgstatus = 'i' THEN 'Internal Error'
+            WHEN lr.jlgstatus = 'd' THEN 'Aborted'
+            WHEN lr.jobenabled THEN 'Enabled'
             ELSE 'Disabled'
         END AS status,
-        jl.jlgstart AS start_time,
-        jl.jlgduration AS duration,
-        -- Get the last run time for the job
-        (SELECT MAX(jlgstart) 
-         FROM pgagent.pga_joblog 
-         WHERE jlgjobid = j.jobid) AS joblastrun,
-        -- Get current step information for this specific job
-        (SELECT 
-            js.jstname
-         FROM 
-            pgagent.pga_jobsteplog sl
-         JOIN 
-            pgagent.pga_joblog jl ON sl.jsljlgid = jl.jlgid
-         JOIN 
-            pgagent.pga_jobstep js ON sl.jsljstid = js.jstid
-         WHERE 
-            jl.jlgjobid = j.jobid
-         ORDER BY 
-            sl.jslstart DESC
-         LIMIT 1
-        ) AS current_step,
-        -- Get current step status for this specific job
-        (SELECT 
-            CASE 
-                WHEN sl.jslstatus = 'r' THEN 'Running'
-                WHEN sl.jslstatus = 's' THEN 'Success'
-                WHEN sl.jslstatus = 'f' THEN 'Failed'
-                WHEN sl.jslstatus = 'i' THEN 'Internal Error'
-                WHEN sl.jslstatus = 'd' THEN 'Aborted'
-                ELSE 'Unknown'
-            END
-         FROM 
-            pgagent.pga_jobsteplog sl
-         JOIN 
-            pgagent.pga_joblog jl ON sl.jsljlgid = jl.jlgid
-         WHERE 
-            jl.jlgjobid = j.jobid
-         ORDER BY 
-            sl.jslstart DESC
-         LIMIT 1
-        ) AS current_step_status,
+        lr.jlgstart AS start_time,
+        lr.jlgduration AS duration,
+        -- Runs are logged in start order, so the latest run is the last one
+        lr.jlgstart AS joblastrun,
+        -- Get current step information from the latest run
+        sl.jstname AS current_step,
+        CASE
+            WHEN sl.jslstatus IS NULL THEN NULL
+            WHEN sl.jslstatus = 'r' THEN 'Running'
+            WHEN sl.jslstatus = 's' THEN 'Success'
+            WHEN sl.jslstatus = 'f' THEN 'Failed'
+            WHEN sl.jslstatus = 'i' THEN 'Internal Error'
+            WHEN sl.jslstatus = 'd' THEN 'Aborted'
+            ELSE 'Unknown'
+        END AS current_step_status,
         -- Calculate progress for running jobs
         CASE
-            WHEN jl.jlgstatus = 'r' THEN
-                COALESCE(
-                    (SELECT 
-                        (COUNT(DISTINCT jsl.jsljstid) FILTER (WHERE jslstatus IN ('s', 'f', 'd', 'i')))::float * 100 / 
-                        NULLIF((SELECT COUNT(*) FROM pgagent.pga_jobstep WHERE jstjobid = j.jobid), 0)
-                     FROM 
-                        pgagent.pga_jobsteplog jsl
-                     JOIN
-                        pgagent.pga_joblog jlg ON jsl.jsljlgid = jlg.jlgid
-                     WHERE 
-                        jlg.jlgjobid = j.jobid AND 
-                        jsl.jslstart >= jl.jlgstart
-                    ), 0)
-            ELSE
-                CASE 
-                    WHEN jl.jlgstatus IN ('s', 'f', 'd', 'i') THEN 100
-                    ELSE 0
-                END
+            WHEN lr.jlgstatus = 'r' THEN
+                COALESCE(sp.finished_steps::float * 100 /
+                    NULLIF(jst.total_steps, 0), 0)
+            WHEN lr.jlgstatus IN ('s', 'f', 'd', 'i') THEN 100
+            ELSE 0
         END AS progress,
         -- Include total steps for this job
-        (SELECT total_steps FROM job_steps WHERE jstjobid = j.jobid) AS total_steps
-    FROM 
-        pgagent.pga_job j
-    LEFT JOIN 
-        pgagent.pga_joblog jl ON j.jobid = jl.jlgjobid AND 
-        jl.jlgid = (
-            SELECT MAX(jlgid) 
-            FROM pgagent.pga_joblog 
-            WHERE jlgjobid = j.jobid
-        )
-    ORDER BY 
-        CASE WHEN jl.jlgstatus = 'r' THEN 0 ELSE 1 END,
-        jl.jlgstart DESC NULLS LAST
-),
+        jst.total_steps
+    FROM
+        latest_runs lr
+    LEFT JOIN
+        job_steps jst ON jst.jstjobid = lr.jobid
+    -- Latest step of the latest run, from the
+    -- pga_jobsteplog (jsljlgid, jslstart DESC) index
+    LEFT JOIN LATERAL (
+        SELECT js.jstname, jsl.jslstatus
+        FROM pgagent.pga_jobsteplog jsl
+        JOIN pgagent.pga_jobstep js ON jsl.jsljstid = js.jstid
+        WHERE jsl.jsljlgid = lr.jlgid
+        ORDER BY jsl.jslstart DESC
+        LIMIT 1
+    ) sl ON true
+    -- Steps finished so far by the running job
+    LEFT JOIN LATERAL (
+        SELECT COUNT(DISTINCT jsl.jsljstid) AS finished_steps
+        FROM pgagent.pga_jobsteplog jsl
+        WHERE jsl.jsljlgid = lr.jlgid
+            AND jsl.jslstatus IN ('s', 'f', 'd', 'i')
+    ) sp ON lr.jlgstatus = 'r'
+{% if since %}
+    -- Only the jobs which were created or edited, or whose latest run
+    -- changed since the token of the previous response. The timestamps are
+    -- set when their transaction starts, so look a little further back to
+    -- not miss the rows committed after the token was taken.
+    WHERE
+        lr.jlgstatus = 'r'
+        OR lr.jobchanged >= to_timestamp(%(since)s) - interval '10 seconds'
+        OR lr.jlgstart >= to_timestamp(%(since)s) - interval '10 seconds'
+        OR lr.jlgstart + lr.jlgduration >= to_timestamp(%(since)s) - interval '10 seconds'
+{% endif %}
+    ORDER BY
+        CASE WHEN lr.jlgstatus = 'r' THEN 0 ELSE 1 END,
+        lr.jlgstart DESC NULLS LAST
+){% if not since %},
 -- Get historical job data for charts (last 30 days)
 job_history AS (
-    SELECT 
+    SELECT
         DATE_TRUNC('day', jlgstart) AS date,
         jlgjobid,
         COUNT(*) AS total_runs,
@@ -158,33 +136,39 @@ job_history AS (
         SUM(CASE WHEN jlgstatus = 'i' THEN 1 ELSE 0 END) AS error_runs,
         SUM(CASE WHEN jlgstatus = 'd' THEN 1 ELSE 0 END) AS aborted_runs,
         AVG(EXTRACT(EPOCH FROM jlgduration)) AS avg_duration
-    FROM 
+    FROM
         pgagent.pga_joblog
-    WHERE 
+    WHERE
         jlgstart >= CURRENT_DATE - INTERVAL '30 days'
-    GROUP BY 
+    GROUP BY
         DATE_TRUNC('day', jlgstart), jlgjobid
-    ORDER BY 
+    ORDER BY
         DATE_TRUNC('day', jlgstart)
-)
-SELECT 
+){% endif %}
+SELECT
     json_build_object(
         'summary', (
-            SELECT row_to_json(combined_stats) 
+            SELECT row_to_json(combined_stats)
             FROM (
-                SELECT 
-                    js.total_jobs,
-                    js.enabled_jobs,
-                    js.disabled_jobs,
-                    COALESCE(jss.running_jobs, 0) AS running_jobs,
-                    COALESCE(jss.successful_jobs, 0) AS successful_jobs,
-                    COALESCE(jss.failed_jobs, 0) AS failed_jobs
-                FROM 
-                    job_stats js
-                LEFT JOIN 
-                    job_status_stats jss ON true
+                SELECT
+                    total_jobs,
+                    enabled_jobs,
+                    disabled_jobs,
+                    COALESCE(running_jobs, 0) AS running_jobs,
+                    COALESCE(successful_jobs, 0) AS successful_jobs,
+                    COALESCE(failed_jobs, 0) AS failed_jobs
+                FROM
+                    job_stats
             ) combined_stats
         ),
         'jobs', COALESCE((SELECT json_agg(active_jobs) FROM active_jobs), '[]'::json),
-        'history', COALESCE((SELECT json_agg(job_history) FROM job_history), '[]'::json)
-    ) AS result;
\ No newline at end of file
+        -- Hash of the definition of every job, the schedule changes only
+        -- show in the next run and do not set jobchanged
+        'job_versions', COALESCE((SELECT json_object_agg(jobid, md5(row(jobname, jobdesc, jobenabled, jobnextrun)::text)) FROM latest_runs), '{}'::json),
+{% if since %}
+        'job_ids', COALESCE((SELECT json_agg(jobid ORDER BY jobid) FROM latest_runs), '[]'::json),
+{% else %}
+        'history', COALESCE((SELECT json_agg(job_history) FROM job_history), '[]'::json),
+{% endif %}
+        'token', extract(epoch FROM now())::text
+    ) AS result;
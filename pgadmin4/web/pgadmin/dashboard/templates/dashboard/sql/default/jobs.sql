@@ -6,9 +6,11 @@ SELECT
     j.jobnextrun,
     j.joblastrun
 FROM pgagent.pga_job j
-LEFT JOIN (
-    SELECT DISTINCT ON (jlgjobid) jlgjobid, jlgstatus
+LEFT JOIN LATERAL (
+    SELECT jlgstatus
     FROM pgagent.pga_joblog
-    ORDER BY jlgjobid, jlgstart DESC
-) jl ON j.jobid = jl.jlgjobid
-ORDER BY j.jobid; 
\ No newline at end of file
+    WHERE jlgjobid = j.jobid
+    ORDER BY jlgid DESC
+    LIMIT 1
+) jl ON true
+ORDER BY j.jobid;
@@ -0,0 +1,56 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.audit_log_export import format_chunks
+
+COLUMNS = ['audit_id', 'operation_type', 'additional_info']
+ROWS = [(1, 'CREATE', 'Job created, by "postgres"'),
+        (2, 'MODIFY', None),
+        (3, 'EXECUTE', 'Job executed')]
+
+
+class AuditLogExportTestCase(BaseTestGenerator):
+    """This class tests the formatting of the streamed audit log export."""
+    scenarios = [
+        ('JSON export in chunks',
+         dict(export_format='json', chunks=[ROWS[:2], ROWS[2:]],
+              expected=json.dumps(
+                  [dict(zip(COLUMNS, row)) for row in ROWS], indent=2))),
+        ('JSON export without rows',
+         dict(export_format='json', chunks=[], expected='[]')),
+        ('NDJSON export in chunks',
+         dict(export_format='ndjson', chunks=[ROWS[:1], ROWS[1:]],
+              expected=''.join(
+                  json.dumps(dict(zip(COLUMNS, row))) + '\n'
+                  for row in ROWS))),
+        ('NDJSON export without rows',
+         dict(export_format='ndjson', chunks=[], expected='')),
+        ('CSV export in chunks',
+         dict(export_format='csv', chunks=[ROWS[:2], ROWS[2:]],
+              expected='audit_id,operation_type,additional_info\r\n'
+                       '1,CREATE,"Job created, by ""postgres"""\r\n'
+                       '2,MODIFY,\r\n'
+                       '3,EXECUTE,Job executed\r\n')),
+        ('CSV export without rows',
+         dict(export_format='csv', chunks=[],
+              expected='audit_id,operation_type,additional_info\r\n')),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        output = list(format_chunks(COLUMNS, iter(self.chunks),
+                                    self.export_format))
+        self.assertEqual(''.join(output), self.expected)
+        # Every chunk of rows is sent as soon as it is formatted
+        self.assertGreaterEqual(len(output), len(self.chunks))
@@ -0,0 +1,168 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import time
+
+from flask import render_template
+
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils import test_utils as utils
+from pgadmin.browser.server_groups.servers.pgagent.tests import \
+    utils as pgagent_utils
+
+
+class JobMonitorTestCase(BaseTestGenerator):
+    """
+    This class runs the job monitor query against a synthetic pgAgent job
+    log. All the synthetic data is created in a transaction which is rolled
+    back in tearDown. See tools/benchmark_job_monitor.py for the timings on
+    a large job log.
+    """
+    scenarios = [
+        ('Job monitor over a synthetic job log',
+         dict(jobs=20, joblog_rows=2000, steplog_runs=200,
+              history_days=60)),
+    ]
+
+    def setUp(self):
+        super().setUp()
+        self.connection = None
+        flag, msg = pgagent_utils.is_valid_server_to_run_pgagent(self)
+        if not flag:
+            self.skipTest(msg)
+        flag, msg = pgagent_utils.is_pgagent_installed_on_server(self)
+        if not flag:
+            self.skipTest(msg)
+
+        self.connection = utils.get_db_connection(
+            self.server['db'],
+            self.server['username'],
+            self.server['db_password'],
+            self.server['host'],
+            self.server['port'],
+            self.server['sslmode']
+        )
+        pg_cursor = self.connection.cursor()
+
+        pg_cursor.execute(
+            "INSERT INTO pgagent.pga_job(jobjclid, jobname, jobchanged) "
+            "SELECT 1, 'monitor_job_' || i, now() - interval '1 day' "
+            "FROM generate_series(1, %(jobs)s) i "
+            "RETURNING jobid", {'jobs': self.jobs})
+        job_ids = [row[0] for row in pg_cursor.fetchall()]
+
+        pg_cursor.execute(
+            "INSERT INTO pgagent.pga_jobstep(jstjobid, jstname, jstkind, "
+            "jstcode, jstdbname) "
+            "SELECT jobid, 'monitor_step', 's', 'SELECT 1', "
+            "current_database() "
+            "FROM unnest(%(jobs)s::int[]) jobid", {'jobs': job_ids})
+
+        # Runs are spread evenly over history_days and over the jobs, in
+        # start order, the way pgAgent logs them.
+        pg_cursor.execute(
+            "INSERT INTO pgagent.pga_joblog(jlgjobid, jlgstatus, jlgstart, "
+            "jlgduration) "
+            "SELECT (%(job_ids)s::int[])[1 + i %% %(jobs)s], "
+            "  (ARRAY['s', 's', 's', 'f', 'd'])[1 + i %% 5], "
+            "  now() - make_interval(secs => %(days)s * 86400.0 * "
+            "    (%(rows)s - i) / %(rows)s), "
+            "  interval '1 second' * (i %% 60) "
+            "FROM generate_series(1, %(rows)s) i",
+            {'job_ids': job_ids, 'jobs': self.jobs,
+             'rows': self.joblog_rows, 'days': self.history_days})
+
+        pg_cursor.execute(
+            "INSERT INTO pgagent.pga_jobsteplog(jsljlgid, jsljstid, "
+            "jslstatus, jslstart, jslduration) "
+            "SELECT jl.jlgid, js.jstid, jl.jlgstatus, jl.jlgstart, "
+            "  jl.jlgduration "
+            "FROM (SELECT * FROM pgagent.pga_joblog "
+            "      ORDER BY jlgid DESC LIMIT %(runs)s) jl "
+            "JOIN pgagent.pga_jobstep js ON js.jstjobid = jl.jlgjobid",
+            {'runs': self.steplog_runs})
+
+        # Leave a few jobs running
+        pg_cursor.execute(
+            "UPDATE pgagent.pga_joblog SET jlgstatus = 'r', "
+            "jlgduration = NULL "
+            "WHERE jlgid IN (SELECT jlgid FROM pgagent.pga_joblog "
+            "ORDER BY jlgid DESC LIMIT 10)")
+
+    def _run_job_monitor(self, pg_cursor, since):
+        sql = render_template(
+            'dashboard/sql/default/job_monitor.sql', since=since is not None)
+        pg_cursor.execute(sql, {'since': since})
+        result = pg_cursor.fetchone()[0]
+        # pgAdmin loads the json columns as text
+        if isinstance(result, str):
+            result = json.loads(result)
+        return result
+
+    def runTest(self):
+        pg_cursor = self.connection.cursor()
+
+        # Status of all the jobs, without the chart history
+        result = self._run_job_monitor(pg_cursor, 0)
+        self.assertGreaterEqual(result['summary']['total_jobs'], self.jobs)
+        self.assertGreaterEqual(result['summary']['running_jobs'], 10)
+        self.assertGreaterEqual(len(result['jobs']), self.jobs)
+
+        # Only the jobs which ran in the last minute
+        result = self._run_job_monitor(pg_cursor, time.time() - 60)
+        self.assertLess(len(result['jobs']), self.jobs)
+
+        result = self._run_job_monitor(pg_cursor, None)
+        self.assertIn('history', result)
+
+        self._check_definition_changes(pg_cursor)
+
+    def _check_definition_changes(self, pg_cursor):
+        since = time.time() - 60
+        pg_cursor.execute(
+            "INSERT INTO pgagent.pga_job(jobjclid, jobname, jobchanged) "
+            "VALUES (1, 'monitor_edited_job', now() - interval '1 day'), "
+            "(1, 'monitor_scheduled_job', now() - interval '1 day') "
+            "RETURNING jobid")
+        edited_job, scheduled_job = [row[0] for row in pg_cursor.fetchall()]
+        before = self._run_job_monitor(pg_cursor, since)
+        self.assertNotIn(edited_job, [job['jobid'] for job in before['jobs']])
+
+        # A new job and an edited one, neither has run
+        pg_cursor.execute(
+            "INSERT INTO pgagent.pga_job(jobjclid, jobname) "
+            "VALUES (1, 'monitor_new_job') RETURNING jobid")
+        new_job = pg_cursor.fetchone()[0]
+        pg_cursor.execute(
+            "UPDATE pgagent.pga_job SET jobname = 'monitor_renamed_job', "
+            "jobchanged = now() WHERE jobid = %s", (edited_job,))
+        # A schedule change only moves the next run
+        pg_cursor.execute(
+            "UPDATE pgagent.pga_job SET "
+            "jobnextrun = now() + interval '1 hour' WHERE jobid = %s",
+            (scheduled_job,))
+
+        result = self._run_job_monitor(pg_cursor, since)
+        jobs = dict((job['jobid'], job) for job in result['jobs'])
+        self.assertIn(new_job, jobs)
+        self.assertEqual(jobs[new_job]['status'], 'Enabled')
+        self.assertEqual(jobs[edited_job]['jobname'], 'monitor_renamed_job')
+        self.assertNotIn(scheduled_job, jobs)
+
+        self.assertIn(new_job, result['job_ids'])
+        self.assertNotIn(str(new_job), before['job_versions'])
+        for jobid in (edited_job, scheduled_job):
+            self.assertNotEqual(result['job_versions'][str(jobid)],
+                                before['job_versions'][str(jobid)])
+
+    def tearDown(self):
+        if self.connection is not None:
+            self.connection.rollback()
+            self.connection.close()
@@ -0,0 +1,11 @@
+{# SQL query for getting the version of the catalog, changed by DDL #}
+SELECT pg_catalog.string_agg(
+    (pg_catalog.pg_stat_get_tuples_inserted(c.oid) +
+     pg_catalog.pg_stat_get_tuples_updated(c.oid) +
+     pg_catalog.pg_stat_get_tuples_deleted(c.oid))::text, ','
+    ORDER BY c.oid) AS version
+FROM pg_catalog.pg_class c
+WHERE c.oid IN ('pg_catalog.pg_namespace'::regclass,
+    'pg_catalog.pg_class'::regclass, 'pg_catalog.pg_attribute'::regclass,
+    'pg_catalog.pg_attrdef'::regclass, 'pg_catalog.pg_constraint'::regclass,
+    'pg_catalog.pg_proc'::regclass, 'pg_catalog.pg_type'::regclass)
@@ -0,0 +1,86 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2025, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+//////////////////////////////////////////////////////////////
+
+import React from 'react';
+import PropTypes from 'prop-types';
+import gettext from 'sources/gettext';
+import BaseUISchema from '../SchemaView/base_schema.ui';
+import SchemaView from '../SchemaView';
+
+class AuditRetentionSchema extends BaseUISchema {
+  constructor() {
+    super({
+      max_age_days: null,
+      max_rows: null,
+      joblog_max_age_days: null,
+      partitioned: false,
+      prune: false,
+    });
+  }
+
+  get baseFields() {
+    return [
+      {
+        id: 'note', type: 'note',
+        text: gettext('pgAgent applies the retention policy every hour. Leave a limit empty to keep the entries forever.'),
+      }, {
+        id: 'max_age_days', label: gettext('Audit log max age (days)'),
+        type: 'int', min: 1,
+      }, {
+        id: 'max_rows', label: gettext('Audit log max rows'),
+        type: 'int', min: 1,
+      }, {
+        id: 'joblog_max_age_days', label: gettext('Job log max age (days)'),
+        type: 'int', min: 1,
+        helpMessage: gettext('The latest run of every job is always kept.'),
+      }, {
+        id: 'partitioned', label: gettext('Monthly partitions?'),
+        type: 'switch',
+        helpMessage: gettext('Old partitions are dropped instead of deleting their rows. Changing this rebuilds the audit log table.'),
+      }, {
+        id: 'partition_count', label: gettext('Partitions'),
+        type: 'int', readonly: true, visible: (state)=>state.partitioned,
+      }, {
+        id: 'prune', label: gettext('Prune now?'),
+        type: 'switch',
+      }, {
+        id: 'last_pruned_at', label: gettext('Last pruned at'),
+        type: 'text', readonly: true,
+      }, {
+        id: 'last_pruned_rows', label: gettext('Rows deleted'),
+        type: 'int', readonly: true,
+      }, {
+        id: 'last_dropped_partitions', label: gettext('Partitions dropped'),
+        type: 'int', readonly: true,
+      },
+    ];
+  }
+}
+
+export default function AuditRetentionContent({getInitData, onSave, onClose}) {
+  return <SchemaView
+    formType={'dialog'}
+    getInitData={getInitData}
+    schema={new AuditRetentionSchema()}
+    viewHelperProps={{
+      mode: 'edit',
+    }}
+    onSave={onSave}
+    onClose={onClose}
+    hasSQL={false}
+    disableSqlHelp={true}
+    disableDialogHelp={true}
+    isTabView={false}
+  />;
+}
+AuditRetentionContent.propTypes = {
+  getInitData: PropTypes.func,
+  onSave: PropTypes.func,
+  onClose: PropTypes.func,
+};
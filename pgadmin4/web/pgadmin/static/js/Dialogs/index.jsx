@@ -20,6 +20,7 @@ import NamedRestoreContent from './NamedRestoreContent';
 import ChangeOwnershipContent from './ChangeOwnershipContent';
 import UrlDialogContent from './UrlDialogContent';
 import RenameTabContent from './RenameTabContent';
+import AuditRetentionContent from './AuditRetentionContent';
 import { BROWSER_PANELS } from '../../../browser/static/js/constants';
 import ErrorBoundary from '../helpers/ErrorBoundary';
 import QuickSearch from '../QuickSearch';
@@ -354,6 +355,47 @@ export function showChangeOwnership() {
     dialogWidth: pgAdmin.Browser.stdW.md, dialogHeight: pgAdmin.Browser.stdH.md, id: 'id-change-owner' });
 }
 
+// This function is used to show the pgAgent audit log retention dialog.
+export function showAuditRetention(title, url) {
+  const api = getApiInstance();
+  const toFormData = (respData)=>({
+    ...respData,
+    partition_count: respData.partitions?.length ?? 0,
+    prune: false,
+  });
+
+  pgAdmin.Browser.notifier.showModal(title, (onClose) => {
+    return <AuditRetentionContent
+      onClose={onClose}
+      getInitData={()=>{
+        return new Promise((resolve, reject)=>{
+          api.get(url)
+            .then(({data: respData})=>resolve(toFormData(respData)))
+            .catch((err)=>{
+              onClose();
+              reject(err instanceof Error ? err : Error(gettext('Something went wrong')));
+            });
+        });
+      }}
+      onSave={(isNew, data)=>{
+        return new Promise((resolve, reject)=>{
+          api.put(url, data)
+            .then(({data: respData})=>{
+              pgAdmin.Browser.notifier.success(gettext('Audit log retention policy saved.'));
+              onClose();
+              resolve(toFormData(respData));
+            })
+            .catch((err)=>{
+              reject(err instanceof Error ? err : Error(gettext('Something went wrong')));
+            });
+        });
+      }}
+    />;
+  },
+  { isFullScreen: false, isResizeable: true, showFullScreen: true, isFullWidth: true,
+    dialogWidth: pgAdmin.Browser.stdW.md, dialogHeight: pgAdmin.Browser.stdH.md, id: 'id-audit-retention' });
+}
+
 export function showUrlDialog() {
   let title = arguments[0],
     url = arguments[1],
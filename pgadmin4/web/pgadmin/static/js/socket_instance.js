@@ -145,12 +145,13 @@ export function openSocket(namespace, options) {
   });
 }
 
-export function socketApiGet(socket, endpoint, params) {
+export function socketApiGet(socket, endpoint, params, onChunk) {
   return new Promise((resolve, reject) => {    
     socket.emit(endpoint, params);
     
     const successEvent = `${endpoint}_success`;
     const failureEvent = `${endpoint}_failed`;
+    const chunkEvent = `${endpoint}_chunk`;
     
     const successHandler = (data) => {
       cleanup();
@@ -170,11 +171,20 @@ export function socketApiGet(socket, endpoint, params) {
     };
     
     // Set up timeout
-    const timeout = setTimeout(() => {
+    const onTimeout = () => {
       console.error(`[Socket.IO] Timeout waiting for ${endpoint} response`);
       cleanup();
       reject(new Error(gettext('Socket operation timed out')));
-    }, 30000); // 30 second timeout
+    };
+    let timeout = setTimeout(onTimeout, 30000); // 30 second timeout
+
+    // Partial results sent before the success event, the timeout
+    // restarts with each of them
+    const chunkHandler = (data) => {
+      clearTimeout(timeout);
+      timeout = setTimeout(onTimeout, 30000);
+      onChunk(data);
+    };
     
     // Clean up function to remove all listeners
     const cleanup = () => {
@@ -182,12 +192,18 @@ export function socketApiGet(socket, endpoint, params) {
       socket.off(successEvent, successHandler);
       socket.off(failureEvent, failureHandler);
       socket.off('disconnect', disconnectHandler);
+      if (onChunk) {
+        socket.off(chunkEvent, chunkHandler);
+      }
     };
     
     // Set up event handlers
     socket.on(successEvent, successHandler);
     socket.on(failureEvent, failureHandler);
     socket.on('disconnect', disconnectHandler);
+    if (onChunk) {
+      socket.on(chunkEvent, chunkHandler);
+    }
   });
 }
 
@@ -10,7 +10,7 @@
 """A blueprint module implementing the erd tool."""
 import json
 
-from flask import url_for, request, Response
+from flask import url_for, request
 from flask import render_template, current_app as app
 from pgadmin.user_login_check import pga_login_required
 from flask_babel import gettext
@@ -417,6 +417,20 @@ class ERDModule(PgAdminModule):
             )
         )
 
+        self.preference.register(
+            'options',
+            'table_relation_max_tables',
+            gettext('Table Relation Max Tables'),
+            'integer',
+            1000,
+            category_label=PREF_LABEL_OPTIONS,
+            help_str=gettext(
+                'The maximum number of tables pgAdmin should add to the ERD '
+                'of a table when traversing its relations. Use -1 for no '
+                'limit.'
+            )
+        )
+
         self.preference.register(
             'options', 'cardinality_notation',
             gettext('Cardinality Notation'), 'radioModern', 'crows',
@@ -688,15 +702,15 @@ def tables(params):
         helper = ERDHelper(params['trans_id'], params['sid'], params['did'])
         _get_connection(params['sid'], params['did'], params['trans_id'])
 
-        status, tables = helper.get_all_tables(params.get('scid', None),
-                                               params.get('tid', None))
-
-        if not status:
-            tables = tables.json if isinstance(tables, Response) else tables
-            socketio.emit('tables_failed', tables,
-                          namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
-            return
+        # Send the tables as they are loaded, the last chunk is sent with
+        # tables_success
+        tables = []
+        for chunk in helper.get_tables_in_chunks(params.get('scid', None),
+                                                 params.get('tid', None)):
+            if len(tables) > 0:
+                socketio.emit('tables_chunk', tables,
+                              namespace=SOCKETIO_NAMESPACE, to=request.sid)
+            tables = chunk
         socketio.emit('tables_success', tables, namespace=SOCKETIO_NAMESPACE,
                       to=request.sid)
     except Exception as e:
@@ -635,13 +635,19 @@ export default class ERDCore {
 
   deserializeData(data){
     let oidUidMap = {};
+    this.deserializeNodes(data, oidUidMap);
+    this.deserializeLinks(oidUidMap);
+  }
 
+  deserializeNodes(data, oidUidMap){
     /* Add the nodes */
     data.forEach((nodeData)=>{
       let newNode = this.addNode(TableSchema.getErdSupportedData(nodeData));
       oidUidMap[nodeData.oid] = newNode.getID();
     });
+  }
 
+  deserializeLinks(oidUidMap){
     /* Lets use the oidUidMap for creating the links */
     let tableNodesDict = this.getModel().getNodesDict();
     _.forIn(tableNodesDict, (node, uid)=>{
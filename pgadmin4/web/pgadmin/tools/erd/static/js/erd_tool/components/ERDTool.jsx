@@ -888,8 +888,11 @@ export default class ERDTool extends React.Component {
     this.setLoading(gettext('Fetching schema data...'));
     let resData = [];
     let socket;
+    let oidUidMap = {};
     try {
       socket = await openSocket('/erd');
+      /* The tables are added as they are received, and linked once all
+         of them are there */
       resData = await socketApiGet(socket, 'tables', {
         trans_id: parseInt(this.props.params.trans_id),
         sgid: parseInt(this.props.params.sgid),
@@ -897,13 +900,21 @@ export default class ERDTool extends React.Component {
         did: parseInt(this.props.params.did),
         scid: this.props.params.scid ? parseInt(this.props.params.scid) : undefined,
         tid: this.props.params.tid ? parseInt(this.props.params.tid) : undefined,
+      }, (chunkData)=>{
+        try {
+          this.diagram.deserializeNodes(chunkData, oidUidMap);
+          this.setLoading(gettext('Fetching schema data (%s tables)...', Object.keys(oidUidMap).length));
+        } catch (error) {
+          this.handleAxiosCatch(error);
+        }
       });
     } catch (error) {
       this.handleAxiosCatch(error);
     }
     socket?.disconnect();
     try {
-      this.diagram.deserializeData(resData);
+      this.diagram.deserializeNodes(resData, oidUidMap);
+      this.diagram.deserializeLinks(oidUidMap);
     } catch (error) {
       this.handleAxiosCatch(error);
     }
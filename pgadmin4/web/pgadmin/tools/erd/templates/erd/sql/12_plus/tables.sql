@@ -0,0 +1,19 @@
+SELECT rel.oid, rel.relname AS name, rel.relnamespace AS scid, nsp.nspname AS schema,
+    des.description, rel.relrowsecurity AS rlspolicy,
+    rel.relforcerowsecurity AS forcerlspolicy,
+    (CASE WHEN rel.relpersistence = 'u' THEN true ELSE false END) AS relpersistence,
+    substring(pg_catalog.array_to_string(rel.reloptions, ',') FROM 'fillfactor=([0-9]*)') AS fillfactor,
+    substring(pg_catalog.array_to_string(rel.reloptions, ',') FROM 'parallel_workers=([0-9]*)') AS parallel_workers,
+    substring(pg_catalog.array_to_string(rel.reloptions, ',') FROM 'toast_tuple_target=([0-9]*)') AS toast_tuple_target
+FROM pg_catalog.pg_class rel
+    JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+    LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=rel.oid AND des.objsubid=0 AND des.classoid='pg_class'::regclass)
+WHERE rel.relkind IN ('r','s','t','p') AND NOT rel.relispartition
+{% if tids %}
+    AND rel.oid IN ({{ tids }})
+{% else %}
+    AND rel.relnamespace IN ({{ scids }})
+    AND NOT EXISTS (SELECT 1 FROM pg_catalog.pg_depend
+        WHERE objid = rel.oid AND deptype = 'e')
+{% endif %}
+ORDER BY rel.relname;
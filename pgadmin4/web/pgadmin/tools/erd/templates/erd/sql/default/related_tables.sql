@@ -0,0 +1,15 @@
+{### The foreign keys cloned on the partitions (conparentid <> 0) and the
+    partitions are left out, the ERD only shows the partitioned tables ###}
+SELECT rel.oid
+FROM (
+    SELECT con.confrelid AS oid FROM pg_catalog.pg_constraint con
+    WHERE con.contype = 'f' AND con.conparentid = 0
+        AND con.conrelid = ANY(ARRAY[{{ tids }}]::oid[])
+    UNION
+    SELECT con.conrelid AS oid FROM pg_catalog.pg_constraint con
+    WHERE con.contype = 'f' AND con.conparentid = 0
+        AND con.confrelid = ANY(ARRAY[{{ tids }}]::oid[])
+) rel
+    JOIN pg_catalog.pg_class cls ON cls.oid = rel.oid
+WHERE NOT cls.relispartition
+ORDER BY rel.oid;
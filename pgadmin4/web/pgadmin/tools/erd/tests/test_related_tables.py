@@ -0,0 +1,104 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.tools.erd import utils as erd_utils
+from pgadmin.tools.erd.utils import ERDTableView
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+# Foreign keys (table, referenced table): 2 references 1, 3 references 2,
+# 4 references 3 and 1, 5 references 2 and 6 references 6.
+FOREIGN_KEYS = [(2, 1), (3, 2), (4, 3), (4, 1), (5, 2), (6, 6)]
+
+
+class _Manager:
+    version = 170000
+
+
+class _Connection(FakeConnection):
+    """Connection returning the tables related by FOREIGN_KEYS."""
+    manager = _Manager()
+
+    def rows(self, template, args):
+        tids = [int(tid) for tid in args['tids'].split(',')]
+        if template == 'related_tables.sql':
+            oids = set()
+            for tid, ref in FOREIGN_KEYS:
+                if tid in tids:
+                    oids.add(ref)
+                if ref in tids:
+                    oids.add(tid)
+            return [{'oid': oid} for oid in sorted(oids)]
+        return [{'oid': tid, 'scid': 1} for tid in tids]
+
+
+def _fetch_tables_data(did, tables):
+    for table in tables:
+        table.pop('scid')
+        table['foreign_key'] = [
+            {'confrelid': ref} for tid, ref in FOREIGN_KEYS
+            if tid == table['oid']]
+    return tables
+
+
+class ERDRelatedTablesTestCase(BaseTestGenerator):
+    """This class tests the tables related to a table added to the ERD."""
+    scenarios = [
+        ('Table only', dict(
+            tid=2, maxdepth=0, max_tables=-1, levels=[[2]],
+            foreign_keys=[])),
+        ('Depth limited', dict(
+            tid=2, maxdepth=1, max_tables=-1, levels=[[2], [1, 3, 5]],
+            foreign_keys=[(2, 1), (3, 2), (5, 2)])),
+        ('No depth limit', dict(
+            tid=2, maxdepth=-1, max_tables=-1, levels=[[2], [1, 3, 5], [4]],
+            foreign_keys=[(2, 1), (3, 2), (5, 2), (4, 3), (4, 1)])),
+        ('Number of tables limited', dict(
+            tid=2, maxdepth=-1, max_tables=3, levels=[[2], [1, 3]],
+            foreign_keys=[(2, 1), (3, 2)])),
+        ('Self reference', dict(
+            tid=6, maxdepth=-1, max_tables=-1, levels=[[6]],
+            foreign_keys=[(6, 6)])),
+    ]
+
+    def setUp(self):
+        self.patch = patch.object(erd_utils, 'render_template',
+                                  render_template_name)
+        self.patch.start()
+
+    def runTest(self):
+        view = ERDTableView.__new__(ERDTableView)
+        view.conn = _Connection()
+        view.manager = view.conn.manager
+        view._fetch_tables_data = _fetch_tables_data
+
+        chunks = list(view._fetch_related_tables(
+            1, self.tid, self.maxdepth, self.max_tables, chunk_size=2))
+
+        tables = [table for chunk in chunks for table in chunk]
+        self.assertEqual([table['oid'] for table in tables],
+                         [tid for level in self.levels for tid in level])
+        self.assertEqual([(table['oid'], fk['confrelid'])
+                          for table in tables
+                          for fk in table['foreign_key']],
+                         self.foreign_keys)
+
+        # One query for the related tables and one for the tables of each
+        # level, the related tables of the last level are not needed when
+        # the depth is limited
+        related_queries = len(self.levels) - (
+            1 if len(self.levels) == self.maxdepth + 1 else 0)
+        self.assertEqual(len(view.conn.queries),
+                         len(self.levels) + related_queries)
+
+    def tearDown(self):
+        self.patch.stop()
@@ -0,0 +1,189 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables \
+    import utils as tables_utils
+from pgadmin.tools.erd import utils as erd_utils
+from pgadmin.tools.erd.utils import ERDTableView
+from pgadmin.utils.exception import ExecuteError
+from pgadmin.utils.route import BaseTestGenerator
+from regression.python_test_utils.fake_connection import \
+    FakeConnection, render_template_name
+
+TABLES = [
+    {'oid': 3, 'name': 'lines', 'scid': 20, 'schema': 'sales'},
+    {'oid': 1, 'name': 'customers', 'scid': 10, 'schema': 'public'},
+    {'oid': 2, 'name': 'orders', 'scid': 10, 'schema': 'public'},
+]
+
+
+def _column(tid, attnum, name, typname='integer', atttypid=23, **kwargs):
+    col = {'attrelid': tid, 'attnum': attnum, 'name': name,
+           'atttypid': atttypid, 'typname': typname, 'cltype': typname,
+           'displaytypname': typname, 'defval': None, 'attoptions': None,
+           'seclabels': None, 'attfdwoptions': '',
+           'typnspname': 'pg_catalog', 'isdup': False, 'attndims': 0,
+           'atttypmod': -1, 'elemoid': atttypid}
+    col.update(kwargs)
+    return col
+
+
+COLUMNS = [
+    _column(1, 1, 'id', defval="nextval('customers_id_seq'::regclass)"),
+    _column(1, 2, 'email', 'text', 25),
+    _column(2, 1, 'id'),
+    _column(2, 2, 'customer_id'),
+    _column(3, 1, 'order_id'),
+    _column(3, 2, 'line'),
+]
+COLUMN_ACL = [
+    {'attrelid': 1, 'attnum': 2, 'deftype': 'attacl', 'grantee': 'app',
+     'grantor': 'postgres', 'privileges': ['r'], 'grantable': [False]},
+]
+INDEX_COLUMNS = [
+    {'indrelid': 1, 'oid': 101, 'idxname': 'customers_pkey',
+     'column': 'id', 'colname': 'id'},
+    {'indrelid': 1, 'oid': 102, 'idxname': 'customers_email_key',
+     'column': 'email', 'colname': 'email'},
+    {'indrelid': 1, 'oid': 102, 'idxname': 'customers_email_key',
+     'column': 'id', 'colname': 'id'},
+    {'indrelid': 2, 'oid': 103, 'idxname': 'orders_customer_id_idx',
+     'column': 'customer_id', 'colname': 'customer_id'},
+]
+INDEX_CONSTRAINTS = {
+    'p': [{'indrelid': 1, 'oid': 101, 'name': 'customers_pkey',
+           'col_count': 1}],
+    'u': [{'indrelid': 1, 'oid': 102, 'name': 'customers_email_key',
+           'col_count': 1}],
+}
+FOREIGN_KEYS = [
+    {'conrelid': 2, 'oid': 201, 'name': 'orders_customer_id_fkey',
+     'confrelid': 1, 'refnsp': 'public', 'reftab': 'customers'},
+    {'conrelid': 3, 'oid': 202, 'name': 'lines_order_id_fkey',
+     'confrelid': 2, 'refnsp': 'public', 'reftab': 'orders'},
+]
+FOREIGN_KEY_COLUMNS = [
+    {'oid': 201, 'conattname': 'customer_id', 'confattname': 'id'},
+    {'oid': 202, 'conattname': 'order_id', 'confattname': 'id'},
+]
+
+
+class _Manager:
+    version = 170000
+    server_type = 'pg'
+
+
+class _Connection(FakeConnection):
+    """Connection returning the rows of the rendered templates."""
+    manager = _Manager()
+
+    def __init__(self, failed_template=None):
+        super().__init__()
+        self.failed_template = failed_template
+
+    def rows(self, template, args):
+        if template == self.failed_template:
+            return None
+
+        tids = [int(tid) for tid in args.get('tids', '').split(',') if tid]
+        if template == 'nodes.sql':
+            rows = [{'oid': 10, 'name': 'public'},
+                    {'oid': 20, 'name': 'sales'}]
+        elif template == 'tables.sql':
+            rows = TABLES
+        elif template == 'properties.sql' and 'constraint_type' in args:
+            rows = [r for r in INDEX_CONSTRAINTS[args['constraint_type']]
+                    if r['indrelid'] in tids]
+        elif template == 'properties.sql' and 'show_sys_objects' in args:
+            rows = [r for r in COLUMNS if r['attrelid'] in tids]
+        elif template == 'properties.sql':
+            rows = [r for r in FOREIGN_KEYS if r['conrelid'] in tids]
+        elif template == 'acl.sql':
+            rows = [r for r in COLUMN_ACL if r['attrelid'] in tids]
+        elif template == 'edit_mode_types_multi.sql':
+            rows = [{'main_oid': 23, 'edit_types': ['bigint', 'numeric']}]
+        elif template == 'index_columns.sql':
+            rows = [r for r in INDEX_COLUMNS if r['indrelid'] in tids]
+        else:
+            fk_oids = [fk['oid'] for fk in FOREIGN_KEYS
+                       if fk['conrelid'] in tids]
+            rows = [r for r in FOREIGN_KEY_COLUMNS if r['oid'] in fk_oids]
+        return rows
+
+
+class ERDTablesInChunksTestCase(BaseTestGenerator):
+    """This class tests the tables of the ERD loaded in chunks."""
+    scenarios = [
+        ('Tables loaded in chunks', dict(failed_template=None)),
+        ('Failure of a query of a chunk',
+         dict(failed_template='index_columns.sql')),
+    ]
+
+    def setUp(self):
+        self.patches = [
+            patch.object(erd_utils, 'render_template', render_template_name),
+            patch.object(tables_utils, 'render_template',
+                         render_template_name),
+            patch('pgadmin.browser.server_groups.servers.databases.schemas.'
+                  'utils.render_template', render_template_name),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def runTest(self):
+        view = ERDTableView.__new__(ERDTableView)
+        view.conn = _Connection(self.failed_template)
+        view.manager = view.conn.manager
+        view.column_template_path = 'columns/sql/#170000#'
+        view.table_template_path = 'tables/sql/#170000#'
+
+        chunks = view._fetch_schema_tables(1, None, chunk_size=2)
+        if self.failed_template:
+            with self.assertRaises(ExecuteError):
+                list(chunks)
+            return
+
+        chunks = list(chunks)
+        # Schemas, tables, then 8 queries per chunk
+        self.assertEqual(len(view.conn.queries), 2 + 2 * 8)
+        self.assertEqual([[t['name'] for t in chunk] for chunk in chunks],
+                         [['customers', 'orders'], ['lines']])
+
+        customers, orders = chunks[0]
+        self.assertNotIn('scid', customers)
+        self.assertEqual(customers['columns'][0]['cltype'], 'serial')
+        self.assertEqual(customers['columns'][0]['edit_types'],
+                         ['bigint', 'numeric', 'serial'])
+        self.assertEqual(customers['columns'][1]['edit_types'], ['text'])
+        self.assertEqual(len(customers['columns'][1]['attacl']), 1)
+        self.assertEqual(customers['columns'][0]['attacl'], [])
+        self.assertEqual(customers['primary_key'][0]['columns'],
+                         [{'column': 'id'}])
+        self.assertEqual(customers['unique_constraint'][0]['columns'],
+                         [{'column': 'email'}])
+        self.assertEqual(customers['unique_constraint'][0]['include'],
+                         ['id'])
+
+        fk = orders['foreign_key'][0]
+        self.assertEqual(fk['columns'], [{
+            'local_column': 'customer_id', 'references': 1,
+            'referenced': 'id',
+            'references_table_name': 'public.customers'}])
+        self.assertEqual(fk['coveringindex'], 'orders_customer_id_idx')
+        self.assertFalse(fk['autoindex'])
+
+        fk = chunks[1][0]['foreign_key'][0]
+        self.assertIsNone(fk['coveringindex'])
+        self.assertTrue(fk['autoindex'])
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
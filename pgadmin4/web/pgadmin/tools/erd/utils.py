@@ -7,19 +7,32 @@
 #
 ##########################################################################
 
+from flask import render_template
+
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
     import BaseTableView
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    columns import utils as column_utils
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import get_schemas
 from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import DataTypeReader
+from pgadmin.utils.compile_template_name import compile_template_path
+from pgadmin.utils.exception import ExecuteError
 from pgadmin.utils.preferences import Preferences
 
+# Number of tables loaded and sent to the client at a time
+TABLES_CHUNK_SIZE = 100
+
 
 class ERDTableView(BaseTableView, DataTypeReader):
     def __init__(self):
         super().__init__(cmd='erd')
 
+    @property
+    def erd_template_path(self):
+        return compile_template_path('erd/sql', self.manager.version)
+
     @BaseTableView.check_precondition
     def sql(self, conn_id=None, did=None, sid=None, data={}, with_drop=False):
         return BaseTableView.get_sql(self, did, None, None, data, None,
@@ -32,69 +45,132 @@ class ERDTableView(BaseTableView, DataTypeReader):
         return DataTypeReader.get_types(self, self.conn, condition, True)
 
     @BaseTableView.check_precondition
-    def fetch_all_tables(self, did=None, sid=None, scid=None):
-        all_tables = []
+    def fetch_all_tables_in_chunks(self, did=None, sid=None, scid=None,
+                                   chunk_size=TABLES_CHUNK_SIZE):
+        """
+        This function will yield the tables of the schema, or of all the
+        schemas of the database, chunk_size tables at a time.
+        """
+        yield from self._fetch_schema_tables(did, scid, chunk_size)
+
+    @BaseTableView.check_precondition
+    def fetch_related_tables_in_chunks(self, did=None, sid=None, tid=None,
+                                       maxdepth=-1, max_tables=-1,
+                                       chunk_size=TABLES_CHUNK_SIZE):
+        """
+        This function will yield the table and the tables related to it,
+        chunk_size tables at a time.
+        """
+        yield from self._fetch_related_tables(did, tid, maxdepth,
+                                              max_tables, chunk_size)
+
+    def _fetch_schema_tables(self, did, scid, chunk_size=TABLES_CHUNK_SIZE):
         schemas = {'rows': []}
         if scid is None:
             status, schemas = get_schemas(self.conn, show_system_objects=False)
             if not status:
-                return status, schemas
+                raise ExecuteError(schemas)
         else:
             schemas['rows'].append({'oid': scid})
 
-        for row in schemas['rows']:
-            status, res = \
-                BaseTableView.fetch_tables(self, sid, did, row['oid'],
-                                           with_serial_cols=True)
-            if not status:
-                return status, res
-
-            all_tables.extend(res.values())
-
-        return True, all_tables
-
-    @BaseTableView.check_precondition
-    def traverse_related_tables(self, did=None, sid=None, scid=None,
-                                tid=None, related=None, maxdepth=0,
-                                currdepth=0):
-
-        status, res = \
-            BaseTableView.fetch_tables(self, sid, did, scid, tid=tid,
-                                       with_serial_cols=True)
-
+        if len(schemas['rows']) == 0:
+            return
+
+        schema_order = dict((row['oid'], idx)
+                            for idx, row in enumerate(schemas['rows']))
+        tables = self._fetch_table_rows(
+            scids=",".join(str(oid) for oid in schema_order))
+
+        # Keep the tables ordered by schema, then by name
+        tables.sort(key=lambda row: schema_order[row['scid']])
+        for idx in range(0, len(tables), chunk_size):
+            yield self._fetch_tables_data(
+                did, tables[idx:idx + chunk_size])
+
+    def _fetch_related_tables(self, did, tid, maxdepth=-1, max_tables=-1,
+                              chunk_size=TABLES_CHUNK_SIZE):
+        """
+        This function will yield the table tid and the tables related to it
+        by foreign keys, up to maxdepth relations away and max_tables
+        tables. The tables are visited breadth first, so the tables of a
+        level are loaded together and the tables related to them are found
+        with a single query.
+        """
+        visited = {tid}
+        frontier = [tid]
+        depth = 0
+        while len(frontier) > 0:
+            next_frontier = []
+            if depth != maxdepth:
+                sql = render_template(
+                    "/".join([self.erd_template_path, 'related_tables.sql']),
+                    tids=",".join(map(str, frontier)))
+                status, res = self.conn.execute_dict(sql)
+                if not status:
+                    raise ExecuteError(res)
+
+                for row in res['rows']:
+                    if max_tables >= 0 and len(visited) >= max_tables:
+                        break
+                    if row['oid'] not in visited:
+                        visited.add(row['oid'])
+                        next_frontier.append(row['oid'])
+
+            tables = self._fetch_table_rows(
+                tids=",".join(map(str, frontier)))
+            for idx in range(0, len(tables), chunk_size):
+                chunk = self._fetch_tables_data(
+                    did, tables[idx:idx + chunk_size])
+                # Drop the foreign keys to the tables which are not loaded
+                for table in chunk:
+                    table['foreign_key'] = [
+                        fk for fk in table['foreign_key']
+                        if fk['confrelid'] in visited]
+                yield chunk
+
+            frontier = next_frontier
+            depth += 1
+
+    def _fetch_table_rows(self, **kwargs):
+        sql = render_template(
+            "/".join([self.erd_template_path, 'tables.sql']), **kwargs)
+        status, res = self.conn.execute_dict(sql)
         if not status:
-            return status, res
-
-        if related is None:
-            related = list()
-
-        related[tid] = res
-        # Max depth limit reached
-        if currdepth == maxdepth:
-            new_fks = []
-            for fk in related[tid].pop('foreign_key', []):
-                if fk['confrelid'] in related:
-                    new_fks.append(fk)
-
-            related[tid]['foreign_key'] = new_fks
-            return True, None
-
-        status, depending_res = BaseTableView.get_fk_ref_tables(
-            self, tid)
-
-        if not status:
-            return status, depending_res
-
-        for fk in [*res.get('foreign_key', []), *depending_res]:
-            if fk['confrelid'] in related:
-                continue
-            status, res = self.traverse_related_tables(
-                did=did, sid=sid, scid=fk['refnspoid'], tid=fk['confrelid'],
-                related=related, maxdepth=maxdepth, currdepth=currdepth + 1)
-            if not status:
-                return status, res
-
-        return True, None
+            raise ExecuteError(res)
+        return res['rows']
+
+    def _fetch_tables_data(self, did, tables):
+        """
+        This function will fetch the columns and the constraints of the
+        given tables with a few queries for all of them, and will return
+        the tables in the format used by the ERD.
+        """
+        tids = ",".join(str(table['oid']) for table in tables)
+        for table in tables:
+            table.pop('scid')
+            table['columns'] = []
+            table['primary_key'] = []
+            table['unique_constraint'] = []
+            table['foreign_key'] = []
+        tables_by_oid = dict((table['oid'], table) for table in tables)
+
+        columns, column_acl, edit_types = self._fetch_tables_columns(tids)
+        for tid, table in tables_by_oid.items():
+            column_utils.get_formatted_columns(
+                self.conn, tid, table, [], '', with_serial=True,
+                columns=columns.get(tid, []),
+                column_acl=column_acl.get(tid, dict()),
+                column_edit_types=edit_types)
+
+        # Columns of the indexes, for the index constraints and the
+        # covering indexes of the foreign keys
+        index_cols, table_indexes = self._fetch_tables_index_columns(tids)
+
+        self._add_index_constraints(tables_by_oid, did, tids, index_cols)
+        self._add_foreign_keys(tables_by_oid, tids, index_cols,
+                               table_indexes)
+
+        return tables
 
 
 class ERDHelper:
@@ -115,21 +191,22 @@ class ERDHelper:
             data=data, with_drop=with_drop)
         return SQL
 
-    def get_all_tables(self, scid, tid):
-        if tid is None and scid is None:
-            status, res = self.table_view.fetch_all_tables(
-                did=self.did, sid=self.sid)
-        elif tid is None:
-            status, res = self.table_view.fetch_all_tables(
+    def get_tables_in_chunks(self, scid, tid):
+        if tid is None:
+            return self.table_view.fetch_all_tables_in_chunks(
                 did=self.did, sid=self.sid, scid=scid)
-        else:
-            prefs = Preferences.module('erd')
-            table_relation_depth = prefs.preference('table_relation_depth')
-            related = {}
-            status, res = self.table_view.traverse_related_tables(
-                did=self.did, sid=self.sid, scid=scid, tid=tid,
-                related=related, maxdepth=table_relation_depth.get()
-            )
-            if status:
-                res = list(related.values())
-        return status, res
+
+        prefs = Preferences.module('erd')
+        return self.table_view.fetch_related_tables_in_chunks(
+            did=self.did, sid=self.sid, tid=tid,
+            maxdepth=prefs.preference('table_relation_depth').get(),
+            max_tables=prefs.preference('table_relation_max_tables').get())
+
+    def get_all_tables(self, scid, tid):
+        tables = []
+        try:
+            for chunk in self.get_tables_in_chunks(scid, tid):
+                tables.extend(chunk)
+        except ExecuteError as e:
+            return False, e.error_msg
+        return True, tables
@@ -10,24 +10,32 @@
 """A blueprint module implementing the schema_diff frame."""
 import json
 import pickle
+import queue
 import secrets
 import copy
+import threading
+from contextlib import ExitStack
 
-from flask import Response, session, url_for, request
+from flask import Response, session, url_for, request, \
+    copy_current_request_context
 from flask import render_template, current_app as app
 from flask_security import current_user
 from pgadmin.user_login_check import pga_login_required
 from flask_babel import gettext
-from pgadmin.utils import PgAdminModule
+from pgadmin.utils import PgAdminModule, filename_with_file_manager_path
 from pgadmin.utils.ajax import make_json_response, bad_request, \
-    make_response as ajax_response, internal_server_error
+    make_response as ajax_response, internal_server_error, unauthorized
 from pgadmin.model import Server, SharedServer
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.snapshot import SchemaDiffSnapshot, \
+    create_snapshot
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS,\
-    ERROR_MSG_TRANS_ID_NOT_FOUND
+    ERROR_MSG_TRANS_ID_NOT_FOUND, PREF_LABEL_OPTIONS
+from pgadmin.utils.exception import ConnectionLost
+from pgadmin.utils.preferences import Preferences
 from sqlalchemy import or_
 from pgadmin.authenticate import socket_login_required
 from pgadmin import socketio
@@ -62,6 +70,7 @@ class SchemaDiffModule(PgAdminModule):
             'schema_diff.databases',
             'schema_diff.schemas',
             'schema_diff.ddl_compare',
+            'schema_diff.snapshot',
             'schema_diff.connect_server',
             'schema_diff.connect_database',
             'schema_diff.get_server',
@@ -106,6 +115,18 @@ class SchemaDiffModule(PgAdminModule):
                              'in the Schema Diff tab.')
         )
 
+        self.preference.register(
+            'options', 'max_parallel_comparisons',
+            gettext("Maximum parallel comparisons"), 'integer', 4,
+            min_val=1, max_val=16,
+            category_label=PREF_LABEL_OPTIONS,
+            help_str=gettext('Specifies the number of schema object types '
+                             'compared at a time. Every parallel comparison '
+                             'uses connections of its own to the source and '
+                             'target databases, set it to 1 to compare them '
+                             'one at a time on the existing connections.')
+        )
+
 
 blueprint = SchemaDiffModule(MODULE_NAME, __name__, static_url_path='/static')
 
@@ -451,13 +472,24 @@ def schemas(sid, did):
 @socket_login_required
 def compare_database(params):
     """
-    This function will compare the two databases.
+    This function will compare the two databases, or a database and a
+    snapshot of a database.
     """
+    try:
+        source_snapshot = load_snapshot(params.get('source_snapshot'))
+        target_snapshot = load_snapshot(params.get('target_snapshot'))
+    except Exception as e:
+        app.logger.exception(e)
+        socketio.emit('compare_database_failed', str(e),
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+        return None
+
     # Check the pre validation before compare
     SchemaDiffRegistry.set_schema_diff_compare_mode('Database Objects')
     status, error_msg, diff_model_obj, session_obj = \
         compare_pre_validation(params['trans_id'], params['source_sid'],
-                               params['target_sid'])
+                               params['target_sid'], source_snapshot,
+                               target_snapshot)
     if not status:
         socketio.emit('compare_database_failed',
                       error_msg.json if isinstance(
@@ -474,115 +506,46 @@ def compare_database(params):
                                     diff_model_obj)
 
     try:
-        ignore_owner = bool(params['ignore_owner'])
-        ignore_whitespaces = bool(params['ignore_whitespaces'])
-        ignore_tablespace = bool(params['ignore_tablespace'])
-        ignore_grants = bool(params['ignore_grants'])
-
         # Fetch all the schemas of source and target database
         # Compare them and get the status.
         schema_result = \
             fetch_compare_schemas(params['source_sid'], params['source_did'],
-                                  params['target_sid'], params['target_did'])
-
-        total_schema = len(schema_result['source_only']) + len(
-            schema_result['target_only']) + len(
-            schema_result['in_both_database'])
+                                  params['target_sid'], params['target_did'],
+                                  source_snapshot, target_snapshot)
 
-        node_percent = 0
-        if total_schema > 0:
-            node_percent = round(100 / (total_schema * len(
-                SchemaDiffRegistry.get_registered_nodes())), 2)
-        total_percent = 0
+        database_args = {'source_sid': params['source_sid'],
+                         'source_did': params['source_did'],
+                         'target_sid': params['target_sid'],
+                         'target_did': params['target_did'],
+                         'source_snapshot': source_snapshot,
+                         'target_snapshot': target_snapshot}
 
         # Compare Database objects
-        comparison_schema_result, total_percent = \
-            compare_database_objects(
-                trans_id=params['trans_id'], session_obj=session_obj,
-                source_sid=params['source_sid'],
-                source_did=params['source_did'],
-                target_sid=params['target_sid'],
-                target_did=params['target_did'],
-                diff_model_obj=diff_model_obj, total_percent=total_percent,
-                node_percent=node_percent, ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces,
-                ignore_tablespace=ignore_tablespace,
-                ignore_grants=ignore_grants)
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        units = get_compare_units(
+            **database_args, group_name=gettext('Database Objects'),
+            parent_node='Database')
 
         # Compare Schema objects
-        if 'source_only' in schema_result and \
-                len(schema_result['source_only']) > 0:
-            for item in schema_result['source_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=item['scid'],
-                        target_sid=params['target_sid'],
-                        target_did=params['target_did'], target_scid=None,
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        is_schema_source_only=True,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
-
-        if 'target_only' in schema_result and \
-                len(schema_result['target_only']) > 0:
-            for item in schema_result['target_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=None, target_sid=params['target_sid'],
-                        target_did=params['target_did'],
-                        target_scid=item['scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+        for item in schema_result['source_only']:
+            units += get_compare_units(
+                **database_args, source_scid=item['scid'], target_scid=None,
+                schema_name=item['schema_name'], is_schema_source_only=True)
+
+        for item in schema_result['target_only']:
+            units += get_compare_units(
+                **database_args, source_scid=None, target_scid=item['scid'],
+                schema_name=item['schema_name'])
 
         # Compare the two schema present in both the databases
-        if 'in_both_database' in schema_result and \
-                len(schema_result['in_both_database']) > 0:
-            for item in schema_result['in_both_database']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=item['src_scid'],
-                        target_sid=params['target_sid'],
-                        target_did=params['target_did'],
-                        target_scid=item['tar_scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+        for item in schema_result['in_both_database']:
+            units += get_compare_units(
+                **database_args, source_scid=item['src_scid'],
+                target_scid=item['tar_scid'],
+                schema_name=item['schema_name'])
+
+        comparison_result = compare_units(
+            params, units, session_obj=session_obj,
+            diff_model_obj=diff_model_obj)
 
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
@@ -620,34 +583,15 @@ def compare_schema(params):
     update_session_diff_transaction(params['trans_id'], session_obj,
                                     diff_model_obj)
     try:
-        ignore_owner = bool(params['ignore_owner'])
-        ignore_whitespaces = bool(params['ignore_whitespaces'])
-        ignore_tablespace = bool(params['ignore_tablespace'])
-        ignore_grants = bool(params['ignore_grants'])
-        all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
-        node_percent = round(100 / len(all_registered_nodes), 2)
-        total_percent = 0
-
-        comparison_schema_result, total_percent = \
-            compare_schema_objects(
-                trans_id=params['trans_id'], session_obj=session_obj,
-                source_sid=params['source_sid'],
-                source_did=params['source_did'],
-                source_scid=params['source_scid'],
-                target_sid=params['target_sid'],
-                target_did=params['target_did'],
-                target_scid=params['target_scid'],
-                schema_name=gettext(SCH_OBJ_STR),
-                diff_model_obj=diff_model_obj,
-                total_percent=total_percent,
-                node_percent=node_percent,
-                ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces,
-                ignore_tablespace=ignore_tablespace,
-                ignore_grants=ignore_grants)
-
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        units = get_compare_units(
+            source_sid=params['source_sid'], source_did=params['source_did'],
+            source_scid=params['source_scid'],
+            target_sid=params['target_sid'], target_did=params['target_did'],
+            target_scid=params['target_scid'], schema_name=SCH_OBJ_STR)
+
+        comparison_result = compare_units(
+            params, units, session_obj=session_obj,
+            diff_model_obj=diff_model_obj)
 
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
@@ -661,6 +605,61 @@ def compare_schema(params):
                   namespace=SOCKETIO_NAMESPACE, to=request.sid)
 
 
+@blueprint.route(
+    '/snapshot/<int:trans_id>/<int:sid>/<int:did>',
+    methods=["POST"],
+    endpoint="snapshot"
+)
+@pga_login_required
+def snapshot(trans_id, sid, did):
+    """
+    This function saves a snapshot of the objects of the database to the
+    file selected in the file manager, the snapshot can then be compared in
+    place of the database.
+    """
+    # Check the transaction and connection status
+    _, error_msg, _, _ = \
+        check_transaction_status(trans_id)
+
+    if error_msg == ERROR_MSG_TRANS_ID_NOT_FOUND:
+        return make_json_response(success=0, errormsg=error_msg, status=404)
+
+    data = json.loads(request.data)
+    try:
+        filename = filename_with_file_manager_path(data['filename'], True)
+    except PermissionError as e:
+        return unauthorized(errormsg=str(e))
+    except Exception as e:
+        return bad_request(errormsg=str(e))
+
+    schemas = get_schemas(sid, did)
+    if schemas is None:
+        return internal_server_error(
+            errormsg=gettext('Could not fetch the schemas of the database.'))
+
+    try:
+        SchemaDiffRegistry.set_schema_diff_compare_mode('Database Objects')
+        create_snapshot(sid, did, schemas).save(filename)
+    except Exception as e:
+        app.logger.exception(e)
+        return internal_server_error(errormsg=str(e))
+
+    return make_json_response(
+        success=1,
+        info=gettext('Snapshot saved.'),
+        data={'filename': filename}
+    )
+
+
+def load_snapshot(filename):
+    """
+    This function loads the snapshot selected in the file manager, if any.
+    """
+    if not filename:
+        return None
+    return SchemaDiffSnapshot.load(filename_with_file_manager_path(filename))
+
+
 @blueprint.route(
     '/ddl_compare/<int:trans_id>/<int:source_sid>/<int:source_did>/'
     '<int:source_scid>/<int:target_sid>/<int:target_did>/<int:target_scid>/'
@@ -728,12 +727,6 @@ def check_version_compatibility(sid, tid):
                               'between Postgres Server and EDB Postgres '
                               'Advanced Server.')
 
-    def get_round_val(x):
-        if x < 100000:
-            return x + 100 - x % 100
-        else:
-            return x + 10000 - x % 10000
-
     if get_round_val(src_manager.version) == \
             get_round_val(tar_manager.version):
         return True, None
@@ -742,6 +735,36 @@ def check_version_compatibility(sid, tid):
                           'the same major version.')
 
 
+def check_snapshot_compatibility(sid, schema_diff_snapshot):
+    """Check the compatibility of the server and the snapshot compared."""
+
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    manager = driver.connection_manager(sid)
+    conn = manager.connection()
+
+    if not conn.connected():
+        return False, gettext('Server(s) disconnected.')
+
+    if manager.server_type != schema_diff_snapshot.server_type:
+        return False, gettext('Schema diff does not support the comparison '
+                              'between Postgres Server and EDB Postgres '
+                              'Advanced Server.')
+
+    if get_round_val(manager.version) == \
+            get_round_val(schema_diff_snapshot.version):
+        return True, None
+
+    return False, gettext('The database server and the server of the '
+                          'snapshot must be of the same major version.')
+
+
+def get_round_val(x):
+    if x < 100000:
+        return x + 100 - x % 100
+    else:
+        return x + 10000 - x % 10000
+
+
 def get_schemas(sid, did):
     """
     This function will return the list of schemas for the specified
@@ -760,147 +783,201 @@ def get_schemas(sid, did):
     return None
 
 
-def compare_database_objects(**kwargs):
+def get_compare_units(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function returns the units of work to compare the children of the
+    specified schema, one per node type in the order of the registry, or
+    the children of the database if the parent node is 'Database'.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
-    source_sid = kwargs.get('source_sid')
-    source_did = kwargs.get('source_did')
-    target_sid = kwargs.get('target_sid')
-    target_did = kwargs.get('target_did')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
-    ignore_owner = kwargs.get('ignore_owner')
-    ignore_whitespaces = kwargs.get('ignore_whitespaces')
-    ignore_tablespace = kwargs.get('ignore_tablespace')
-    ignore_grants = kwargs.get('ignore_grants')
-    comparison_result = []
+    parent_node = kwargs.pop('parent_node', 'schema')
+    schema_name = kwargs.pop('schema_name', None)
+    is_schema_source_only = kwargs.pop('is_schema_source_only', False)
 
-    all_registered_nodes = SchemaDiffRegistry.get_registered_nodes(None,
-                                                                   'Database')
-    for node_name, node_view in all_registered_nodes.items():
+    if schema_name is not None:
+        kwargs['group_name'] = gettext(schema_name)
+    if is_schema_source_only:
+        driver = get_driver(PG_DEFAULT_DRIVER)
+        kwargs['source_schema_name'] = driver.qtIdent(None, schema_name)
+
+    units = []
+    for node_name in SchemaDiffRegistry.get_registered_nodes(None,
+                                                             parent_node):
         view = SchemaDiffRegistry.get_node_view(node_name)
-        if hasattr(view, 'compare'):
-            msg = gettext('Comparing {0}'). \
-                format(gettext(view.blueprint.collection_label))
-            app.logger.debug(msg)
-            socketio.emit('compare_status', {'diff_percentage': total_percent,
-                          'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
+        if not hasattr(view, 'compare'):
+            continue
+
+        label = gettext(view.blueprint.collection_label)
+        if schema_name is None:
+            msg = gettext('Comparing {0}').format(label)
+        elif schema_name == SCH_OBJ_STR:
+            msg = gettext('Comparing {0} ').format(label)
+        else:
+            msg = gettext('Comparing {0} of schema \'{1}\'').format(
+                label, gettext(schema_name))
 
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               group_name=gettext('Database Objects'),
-                               ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces,
-                               ignore_tablespace=ignore_tablespace,
-                               ignore_grants=ignore_grants)
+        units.append({'node_name': node_name, 'msg': msg,
+                      'compare_args': kwargs})
 
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
+    return units
 
-    return comparison_result, total_percent
 
+def compare_unit(unit, **kwargs):
+    """
+    This function compares the objects of a unit returned by
+    get_compare_units().
 
-def compare_schema_objects(**kwargs):
+    :param unit: Unit to compare
+    :param kwargs: Ignore options of the comparison
+    :return: List of the compared objects
     """
-    This function is used to compare the specified schema and their children.
+    view = SchemaDiffRegistry.get_node_view(unit['node_name'])
+    return view.compare(**unit['compare_args'], **kwargs)
 
-    :param kwargs:
-    :return:
+
+def _compare_units_worker(worker_id, params, units, compared_units, stop,
+                          **kwargs):
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
-    source_sid = kwargs.get('source_sid')
-    source_did = kwargs.get('source_did')
-    source_scid = kwargs.get('source_scid')
-    target_sid = kwargs.get('target_sid')
-    target_did = kwargs.get('target_did')
-    target_scid = kwargs.get('target_scid')
-    schema_name = kwargs.get('schema_name')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
-    is_schema_source_only = kwargs.get('is_schema_source_only', False)
-    ignore_owner = kwargs.get('ignore_owner')
-    ignore_whitespaces = kwargs.get('ignore_whitespaces')
-    ignore_tablespace = kwargs.get('ignore_tablespace')
-    ignore_grants = kwargs.get('ignore_grants')
-
-    source_schema_name = None
-    if is_schema_source_only:
-        driver = get_driver(PG_DEFAULT_DRIVER)
-        source_schema_name = driver.qtIdent(None, schema_name)
+    This function is run by the worker threads of compare_units(), it
+    compares the pending units on connections of its own to the source and
+    target databases until there are none left.
+    """
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    # There is no database to connect to for a snapshot.
+    databases = dict.fromkeys(
+        [(params[side + '_sid'], params[side + '_did'])
+         for side in ['source', 'target']
+         if not params.get(side + '_snapshot')])
+    try:
+        with ExitStack() as stack:
+            for sid, did in databases:
+                conn_id = 'schema_diff_{0}_{1}_{2}'.format(
+                    params['trans_id'], worker_id, did)
+                manager = driver.connection_manager(sid)
+                conn = stack.enter_context(
+                    manager.use_connection(did, conn_id))
+                stack.callback(manager.release, conn_id=conn_id)
+                status, msg = conn.connect()
+                if not status:
+                    app.logger.error(msg)
+                    raise ConnectionLost(sid, conn.db, conn_id)
+
+            while not stop.is_set():
+                try:
+                    index, unit = units.get_nowait()
+                except queue.Empty:
+                    break
+                compared_units.put((index, False, None))
+                compared_units.put((index, True, compare_unit(unit, **kwargs)))
+    except Exception as e:
+        compared_units.put((None, True, e))
 
-    comparison_result = []
 
-    all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
-    for node_name, node_view in all_registered_nodes.items():
-        view = SchemaDiffRegistry.get_node_view(node_name)
-        if hasattr(view, 'compare'):
-            if schema_name == SCH_OBJ_STR:
-                msg = gettext('Comparing {0} '). \
-                    format(gettext(view.blueprint.collection_label))
-            else:
-                msg = gettext('Comparing {0} of schema \'{1}\''). \
-                    format(gettext(view.blueprint.collection_label),
-                           gettext(schema_name))
-            app.logger.debug(msg)
-            socketio.emit('compare_status', {'diff_percentage': total_percent,
-                          'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
+def compare_units(params, units, session_obj, diff_model_obj):
+    """
+    This function compares the units returned by get_compare_units() on as
+    many worker threads as the 'Maximum parallel comparisons' preference
+    allows and emits the progress of the comparison.
+
+    :param params: Parameters of the comparison
+    :param units: Units to compare
+    :param session_obj: Session object
+    :param diff_model_obj: Schema diff model object
+    :return: The result of the comparison in the order of the units
+    """
+    ignore_args = dict((key, bool(params[key])) for key in [
+        'ignore_owner', 'ignore_whitespaces', 'ignore_tablespace',
+        'ignore_grants'])
+    pref = Preferences.module(MODULE_NAME)
+    workers_count = min(pref.preference('max_parallel_comparisons').get(),
+                        len(units))
+    results = [None] * len(units)
+    done = 0
+
+    def emit_status(unit):
+        msg = unit['msg']
+        app.logger.debug(msg)
+        socketio.emit('compare_status',
+                      {'diff_percentage': round(done * 100 / len(units), 2),
+                       'compare_msg': msg},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+    if workers_count <= 1:
+        for index, unit in enumerate(units):
+            emit_status(unit)
+            results[index] = compare_unit(unit, **ignore_args)
+            done = done + 1
             # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
+            update_session_diff_transaction(params['trans_id'], session_obj,
                                             diff_model_obj)
+    else:
+        pending_units = queue.Queue()
+        for item in enumerate(units):
+            pending_units.put(item)
+        compared_units = queue.Queue()
+        stop = threading.Event()
+        workers = [threading.Thread(
+            target=copy_current_request_context(_compare_units_worker),
+            args=(worker_id, params, pending_units, compared_units, stop),
+            kwargs=ignore_args, daemon=True)
+            for worker_id in range(workers_count)]
+        for worker in workers:
+            worker.start()
 
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               source_scid=source_scid,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               target_scid=target_scid,
-                               group_name=gettext(schema_name),
-                               source_schema_name=source_schema_name,
-                               ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces,
-                               ignore_tablespace=ignore_tablespace,
-                               ignore_grants=ignore_grants)
+        try:
+            while done < len(units):
+                index, finished, res = compared_units.get()
+                if index is None:
+                    raise res
+                if not finished:
+                    emit_status(units[index])
+                    continue
+
+                results[index] = res
+                done = done + 1
+                # Update the message and total percentage in session object
+                update_session_diff_transaction(
+                    params['trans_id'], session_obj, diff_model_obj)
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+    comparison_result = []
+    for res in results:
+        if res is not None:
+            comparison_result = comparison_result + res
 
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-        # if total_percent is more than 100 then set it to less than 100
-        if total_percent >= 100:
-            total_percent = 96
+    # The ids of the rows are handed out once the results are merged, as
+    # the units may have been compared at the same time
+    for row_id, row in enumerate(comparison_result, start=1):
+        row['id'] = row_id
 
-    return comparison_result, total_percent
+    return comparison_result
 
 
-def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
+def fetch_compare_schemas(source_sid, source_did, target_sid, target_did,
+                          source_snapshot=None, target_snapshot=None):
     """
     This function is used to fetch all the schemas of source and target
-    database and compare them.
+    database, or snapshot, and compare them.
 
     :param source_sid:
     :param source_did:
     :param target_sid:
     :param target_did:
+    :param source_snapshot:
+    :param target_snapshot:
     :return:
     """
-    source_schemas = get_schemas(source_sid, source_did)
-    target_schemas = get_schemas(target_sid, target_did)
+    source_schemas = source_snapshot.get_schemas() \
+        if source_snapshot is not None else get_schemas(source_sid,
+                                                        source_did)
+    target_schemas = target_snapshot.get_schemas() \
+        if target_snapshot is not None else get_schemas(target_sid,
+                                                        target_did)
 
     src_schema_dict = {item['label']: item['_id'] for item in source_schemas}
     tar_schema_dict = {item['label']: item['_id'] for item in target_schemas}
@@ -933,18 +1010,27 @@ def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
                                  'src_scid': src_schema_dict[item],
                                  'tar_scid': tar_schema_dict[item]})
 
-    schema_result = {'source_only': source_only, 'target_only': target_only,
-                     'in_both_database': in_both_database}
+    # Sort the schemas by name to compare them in a stable order.
+    schema_result = {
+        'source_only': sorted(source_only,
+                              key=lambda item: item['schema_name']),
+        'target_only': sorted(target_only,
+                              key=lambda item: item['schema_name']),
+        'in_both_database': sorted(in_both_database,
+                                   key=lambda item: item['schema_name'])}
 
     return schema_result
 
 
-def compare_pre_validation(trans_id, source_sid, target_sid):
+def compare_pre_validation(trans_id, source_sid, target_sid,
+                           source_snapshot=None, target_snapshot=None):
     """
     This function is used to validate transaction id and version compatibility
     :param trans_id:
     :param source_sid:
     :param target_sid:
+    :param source_snapshot:
+    :param target_snapshot:
     :return:
     """
 
@@ -956,7 +1042,16 @@ def compare_pre_validation(trans_id, source_sid, target_sid):
         return False, res, None, None
 
     # Server version compatibility check
-    status, msg = check_version_compatibility(source_sid, target_sid)
+    if source_snapshot is not None and target_snapshot is not None:
+        status, msg = False, gettext('Two snapshots can not be compared.')
+    elif source_snapshot is not None:
+        status, msg = check_snapshot_compatibility(target_sid,
+                                                   source_snapshot)
+    elif target_snapshot is not None:
+        status, msg = check_snapshot_compatibility(source_sid,
+                                                   target_snapshot)
+    else:
+        status, msg = check_version_compatibility(source_sid, target_sid)
     if not status:
         res = make_json_response(success=0, errormsg=msg, status=428)
         return False, res, None, None
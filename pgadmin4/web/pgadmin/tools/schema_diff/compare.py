@@ -14,6 +14,7 @@ from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import internal_server_error
 from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries
+from pgadmin.tools.schema_diff.snapshot import normalize_objects
 
 
 class SchemaDiffObjectCompare:
@@ -45,6 +46,27 @@ class SchemaDiffObjectCompare:
 
         return status, schema_name
 
+    def fetch_compare_objects(self, **kwargs):
+        """
+        This function returns the objects of the database or of the schema
+        to compare, by their name.
+        """
+        return self.fetch_objects_to_compare(**kwargs)
+
+    def _get_compare_objects(self, params, snapshot):
+        """
+        This function returns the objects to compare, read from the
+        snapshot if any, and the snapshot objects.
+        """
+        if snapshot is None:
+            return self.fetch_compare_objects(**params), None
+
+        snapshot_objects = snapshot.get_objects(self.node_type,
+                                                params.get('scid'))
+        return dict((key, obj['data'])
+                    for key, obj in snapshot_objects.items()), \
+            snapshot_objects
+
     def compare(self, **kwargs):
         """
         This function is used to compare all the objects
@@ -61,30 +83,42 @@ class SchemaDiffObjectCompare:
         ignore_whitespaces = kwargs.get('ignore_whitespaces', False)
         ignore_tablespace = kwargs.get('ignore_tablespace', False)
         ignore_grants = kwargs.get('ignore_grants', False)
+        source_snapshot = kwargs.get('source_snapshot')
+        target_snapshot = kwargs.get('target_snapshot')
 
         group_name = kwargs.get('group_name')
         source_schema_name = kwargs.get('source_schema_name', None)
         source = {}
         target = {}
+        source_objects = None
+        target_objects = None
 
-        status, target_schema = self.get_schema(kwargs.get('target_sid'),
-                                                kwargs.get('target_did'),
-                                                kwargs.get('target_scid'))
-        if not status:
-            return internal_server_error(errormsg=target_schema)
+        # The schemas of a snapshot are identified by their name.
+        if target_snapshot is not None:
+            target_schema = kwargs.get('target_scid')
+        else:
+            status, target_schema = self.get_schema(
+                kwargs.get('target_sid'), kwargs.get('target_did'),
+                kwargs.get('target_scid'))
+            if not status:
+                return internal_server_error(errormsg=target_schema)
 
         if group_name == 'Database Objects':
-            source = self.fetch_objects_to_compare(**source_params)
-            target = self.fetch_objects_to_compare(**target_params)
+            source, source_objects = self._get_compare_objects(
+                source_params, source_snapshot)
+            target, target_objects = self._get_compare_objects(
+                target_params, target_snapshot)
         else:
             source_params['scid'] = kwargs.get('source_scid')
             target_params['scid'] = kwargs.get('target_scid')
 
             if 'scid' in source_params and source_params['scid'] is not None:
-                source = self.fetch_objects_to_compare(**source_params)
+                source, source_objects = self._get_compare_objects(
+                    source_params, source_snapshot)
 
             if 'scid' in target_params and target_params['scid'] is not None:
-                target = self.fetch_objects_to_compare(**target_params)
+                target, target_objects = self._get_compare_objects(
+                    target_params, target_snapshot)
 
         # If both the dict have no items then return None.
         if not (source or target) or not \
@@ -92,6 +126,12 @@ class SchemaDiffObjectCompare:
                 (len(source) <= 0 and len(target) <= 0):
             return None
 
+        # Compare the live objects as they would be read from a snapshot.
+        if target_snapshot is not None:
+            source = normalize_objects(source)
+        if source_snapshot is not None:
+            target = normalize_objects(target)
+
         return compare_dictionaries(view_object=self,
                                     source_params=source_params,
                                     target_params=target_params,
@@ -106,7 +146,9 @@ class SchemaDiffObjectCompare:
                                     ignore_owner=ignore_owner,
                                     ignore_whitespaces=ignore_whitespaces,
                                     ignore_tablespace=ignore_tablespace,
-                                    ignore_grants=ignore_grants)
+                                    ignore_grants=ignore_grants,
+                                    source_snapshot=source_objects,
+                                    target_snapshot=target_objects)
 
     def ddl_compare(self, **kwargs):
         """
@@ -134,8 +176,12 @@ class SchemaDiffObjectCompare:
         if target_scid is not None and target_scid != 0:
             target_params['scid'] = target_scid
 
-        source = self.get_sql_from_diff(**source_params)
-        target = self.get_sql_from_diff(**target_params)
+        # The side compared with a snapshot has no object id, its DDL is
+        # the one saved in the snapshot.
+        source = self.get_sql_from_diff(**source_params) \
+            if source_params['oid'] else ''
+        target = self.get_sql_from_diff(**target_params) \
+            if target_params['oid'] else ''
 
         return {'source_ddl': source,
                 'target_ddl': target,
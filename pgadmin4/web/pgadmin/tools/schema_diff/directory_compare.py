@@ -10,13 +10,13 @@
 """Directory comparison"""
 
 import copy
+import hashlib
+import json
 import string
 from flask import current_app
 from flask_babel import gettext
 from pgadmin.utils.constants import PGADMIN_STRING_SEPARATOR
 
-count = 1
-
 list_keys_array = ['name', 'colname', 'argid', 'token', 'option', 'conname',
                    'member_name', 'label', 'attname', 'fdwoption',
                    'fsrvoption', 'umoption']
@@ -53,15 +53,19 @@ def _get_source_list(**kwargs):
     group_name = kwargs.get('group_name')
     source_schema_name = kwargs.get('source_schema_name')
     target_schema = kwargs.get('target_schema')
+    source_snapshot = kwargs.get('source_snapshot')
 
-    global count
     source_only = []
     for item in added:
         source_object_id = None
         if 'oid' in source_dict[item]:
             source_object_id = source_dict[item]['oid']
 
-        if node in SPECIAL_NODES:
+        if source_snapshot is not None:
+            source_ddl = source_snapshot[item]['ddl']
+            diff_ddl = source_snapshot[item]['diff_ddl']
+            source_dependencies = source_snapshot[item]['dependencies']
+        elif node in SPECIAL_NODES:
             temp_src_params = copy.deepcopy(source_params)
             temp_src_params['tid'] = source_object_id
             temp_src_params['json_resp'] = False
@@ -106,7 +110,6 @@ def _get_source_list(**kwargs):
             title = _get_user_mapping_name(item)
 
         source_only.append({
-            'id': count,
             'type': node,
             'label': node_label,
             'title': title,
@@ -119,7 +122,6 @@ def _get_source_list(**kwargs):
             'dependencies': source_dependencies,
             'source_schema_name': source_schema_name
         })
-        count += 1
 
     return source_only
 
@@ -140,7 +142,7 @@ def _delete_keys(temp_tgt_params):
 
 
 def _get_target_list(removed, target_dict, node, target_params, view_object,
-                     node_label, group_name):
+                     node_label, group_name, target_snapshot=None):
     """
     Get only target list.
     :param removed: removed list.
@@ -150,16 +152,19 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
     :param view_object: view object for get sql.
     :param node_label: node label.
     :param group_name: group name.
+    :param target_snapshot: snapshot objects of the target.
     :return: list of target dict.
     """
-    global count
     target_only = []
     for item in removed:
         target_object_id = None
         if 'oid' in target_dict[item]:
             target_object_id = target_dict[item]['oid']
 
-        if node in SPECIAL_NODES:
+        if target_snapshot is not None:
+            target_ddl = target_snapshot[item]['ddl']
+            diff_ddl = target_snapshot[item]['drop_ddl']
+        elif node in SPECIAL_NODES:
             temp_tgt_params = copy.deepcopy(target_params)
             temp_tgt_params['tid'] = target_object_id
             temp_tgt_params['json_resp'] = False
@@ -196,7 +201,6 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
             title = _get_user_mapping_name(item)
 
         target_only.append({
-            'id': count,
             'type': node,
             'label': node_label,
             'title': title,
@@ -208,7 +212,6 @@ def _get_target_list(removed, target_dict, node, target_params, view_object,
             'group_name': group_name,
             'dependencies': []
         })
-        count += 1
 
     return target_only
 
@@ -265,7 +268,6 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
     :param other_param:
     :return: return list of identical and different dict.
     """
-    global count
     identical = []
     different = []
     dict1 = kwargs['dict1']
@@ -277,41 +279,64 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
     target_schema = kwargs.get('target_schema')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
     ignore_grants = kwargs.get('ignore_grants', False)
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
+    source_hashes = kwargs['source_hashes']
+    target_hashes = kwargs['target_hashes']
+    # Translate the statuses once, most of the objects are identical.
+    identical_status = gettext('Identical')
+    different_status = gettext('Different')
 
     for key in intersect_keys:
         source_object_id, target_object_id = \
             get_source_target_oid(source_dict, target_dict, key)
 
-        # Recursively Compare the two dictionary
-        current_app.logger.debug(
-            "Schema Diff: Source Dict: {0}".format(dict1[key]))
-        current_app.logger.debug(
-            "Schema Diff: Target Dict: {0}".format(dict2[key]))
+        # Objects with the same hash are identical, only the others are
+        # walked.
+        is_identical = source_hashes[key] == target_hashes[key]
+        if not is_identical:
+            # Recursively Compare the two dictionary
+            current_app.logger.debug(
+                "Schema Diff: Source Dict: {0}".format(dict1[key]))
+            current_app.logger.debug(
+                "Schema Diff: Target Dict: {0}".format(dict2[key]))
+            is_identical = are_dictionaries_identical(
+                dict1[key], dict2[key], ignore_keys, ignore_whitespaces)
 
-        if are_dictionaries_identical(dict1[key], dict2[key], ignore_keys,
-                                      ignore_whitespaces):
+        if is_identical:
             title = key
             if node == 'user_mapping':
                 title = _get_user_mapping_name(key)
 
-            identical.append({
-                'id': count,
+            identical_obj = {
                 'type': node,
                 'label': node_label,
                 'title': title,
                 'oid': source_object_id,
                 'source_oid': source_object_id,
                 'target_oid': target_object_id,
-                'status': gettext('Identical'),
+                'status': identical_status,
                 'group_name': group_name,
                 'dependencies': [],
                 'source_scid': source_params['scid']
                 if 'scid' in source_params else 0,
                 'target_scid': target_params['scid']
                 if 'scid' in target_params else 0,
-            })
+            }
+            # There is no database to fetch the DDL of a snapshot side from,
+            # the DDL saved in the snapshot comes with the object instead.
+            if source_snapshot is not None:
+                identical_obj['source_scid'] = 0
+                identical_obj['source_ddl'] = source_snapshot[key]['ddl']
+            if target_snapshot is not None:
+                identical_obj['target_scid'] = 0
+                identical_obj['target_ddl'] = target_snapshot[key]['ddl']
+            identical.append(identical_obj)
         else:
-            if node in SPECIAL_NODES:
+            if source_snapshot is not None or target_snapshot is not None:
+                source_ddl, target_ddl, diff_ddl, diff_dependencies = \
+                    _get_snapshot_diff_sql(key, node, view_object, **kwargs)
+            elif node in SPECIAL_NODES:
                 temp_src_params = copy.deepcopy(source_params)
                 temp_tgt_params = copy.deepcopy(target_params)
                 # Add submodules into the ignore keys so that directory
@@ -389,26 +414,159 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
             if node == 'user_mapping':
                 title = _get_user_mapping_name(key)
 
-            different.append({
-                'id': count,
+            different_obj = {
                 'type': node,
                 'label': node_label,
                 'title': title,
                 'oid': source_object_id,
                 'source_oid': source_object_id,
                 'target_oid': target_object_id,
-                'status': gettext('Different'),
+                'status': different_status,
                 'source_ddl': source_ddl,
                 'target_ddl': target_ddl,
                 'diff_ddl': diff_ddl,
                 'group_name': group_name,
                 'dependencies': diff_dependencies
-            })
-        count += 1
+            }
+            # The UI tells why there is no difference script of an object
+            # compared with a snapshot.
+            if diff_ddl is None:
+                different_obj['diff_ddl'] = ''
+                different_obj['diff_message'] = gettext(
+                    'The difference script of this object can not be '
+                    'generated from the snapshot.')
+            different.append(different_obj)
 
     return identical, different
 
 
+def _get_object_sql(view_object, node, params, object_dict,
+                    with_dependencies=False):
+    """
+    Get the DDL of an object of the database and optionally its
+    dependencies.
+    :param view_object: view object for get sql.
+    :param node: node type.
+    :param params: parameters of the database of the object.
+    :param object_dict: object dict.
+    :param with_dependencies: also get the dependencies.
+    :return: DDL and dependencies of the object.
+    """
+    object_id = object_dict['oid'] if 'oid' in object_dict else None
+    temp_params = copy.deepcopy(params)
+    dependencies = []
+
+    if node in SPECIAL_NODES:
+        temp_params['tid'] = object_id
+        if node in VIEW_NODES:
+            ddl = view_object.get_sql_from_view_diff(**temp_params)
+            if with_dependencies:
+                dependencies = view_object.get_view_submodules_dependencies(
+                    **temp_params)
+        else:
+            temp_params['json_resp'] = False
+            ddl = view_object.get_sql_from_table_diff(**temp_params)
+            if with_dependencies:
+                dependencies = \
+                    view_object.get_table_submodules_dependencies(
+                        **temp_params)
+        return ddl, dependencies
+
+    temp_params['oid'] = object_id
+    # Provide Foreign Data Wrapper ID and Foreign Server ID
+    for key in ['fdwid', 'fsid']:
+        if key in object_dict:
+            temp_params[key] = object_dict[key]
+
+    ddl = view_object.get_sql_from_diff(**temp_params)
+    if with_dependencies:
+        dependencies = view_object.get_dependencies(
+            view_object.conn, object_id, where=None,
+            show_system_objects=None, is_schema_diff=True)
+    return ddl, dependencies
+
+
+def _get_snapshot_diff_sql(key, node, view_object, **kwargs):
+    """
+    Get the DDL of an object different in the source and the target when
+    one of them is a snapshot, the DDL of the snapshot side is the one saved
+    in the snapshot.
+
+    The difference DDL is rendered from the live target object, it is None
+    when the target is a snapshot or when the DDL of the child objects of a
+    table or a view was not saved in the source snapshot.
+    :param key: Key of the object.
+    :param node: node type.
+    :param view_object: view object for get sql.
+    :return: source DDL, target DDL, difference DDL and dependencies.
+    """
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
+    source_params = kwargs['source_params']
+    target_params = kwargs['target_params']
+    dict1 = kwargs['dict1']
+    dict2 = kwargs['dict2']
+
+    if source_snapshot is not None:
+        source_ddl = source_snapshot[key]['ddl']
+        dependencies = source_snapshot[key]['dependencies']
+    else:
+        source_ddl, dependencies = _get_object_sql(
+            view_object, node, source_params, dict1[key],
+            with_dependencies=True)
+
+    if target_snapshot is not None:
+        target_ddl = target_snapshot[key]['ddl']
+    else:
+        target_ddl, _ = _get_object_sql(view_object, node, target_params,
+                                        dict2[key])
+
+    if target_snapshot is not None or (
+            node in SPECIAL_NODES and 'child_ddl' not in source_snapshot[key]):
+        return source_ddl, target_ddl, None, dependencies
+
+    ignore_keys = kwargs['ignore_keys']
+    if node in SPECIAL_NODES:
+        # Add submodules into the ignore keys so that directory
+        # difference won't include those in added, deleted and changed
+        ignore_keys = ignore_keys + ['index', 'rule', 'trigger',
+                                     'compound_trigger']
+
+    diff_dict = directory_diff(dict1[key], dict2[key],
+                               ignore_keys=ignore_keys, difference={})
+    # No need to parse acl if ignore_grants is set to True.
+    if not kwargs.get('ignore_grants', False):
+        parse_acl(dict1[key], dict2[key], diff_dict)
+
+    if node in SPECIAL_NODES:
+        temp_src_params = copy.deepcopy(source_params)
+        temp_tgt_params = copy.deepcopy(target_params)
+        temp_src_params['tid'] = None
+        temp_tgt_params['tid'] = dict2[key]['oid']
+        if node not in VIEW_NODES:
+            temp_tgt_params['json_resp'] = False
+
+        diff_ddl = view_object.get_sql_from_submodule_diff(
+            source_params=temp_src_params, target_params=temp_tgt_params,
+            source=dict1[key], target=dict2[key], diff_dict=diff_dict,
+            target_schema=kwargs.get('target_schema'),
+            ignore_whitespaces=kwargs.get('ignore_whitespaces'),
+            source_child_ddl=source_snapshot[key]['child_ddl'])
+        return source_ddl, target_ddl, diff_ddl, dependencies
+
+    temp_tgt_params = copy.deepcopy(target_params)
+    temp_tgt_params['oid'] = dict2[key]['oid'] if 'oid' in dict2[key] \
+        else None
+    for param in ['fdwid', 'fsid']:
+        if param in dict2[key]:
+            temp_tgt_params[param] = dict2[key][param]
+    temp_tgt_params.update({'data': diff_dict,
+                            'target_schema': kwargs.get('target_schema')})
+    diff_ddl = view_object.get_sql_from_diff(**temp_tgt_params)
+
+    return source_ddl, target_ddl, diff_ddl, dependencies
+
+
 def compare_dictionaries(**kwargs):
     """
     This function will compare the two dictionaries.
@@ -431,15 +589,18 @@ def compare_dictionaries(**kwargs):
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
     ignore_tablespace = kwargs.get('ignore_tablespace')
     ignore_grants = kwargs.get('ignore_grants')
-
-    dict1 = copy.deepcopy(source_dict)
-    dict2 = copy.deepcopy(target_dict)
+    source_snapshot = kwargs.get('source_snapshot')
+    target_snapshot = kwargs.get('target_snapshot')
 
     # Find the duplicate keys in both the dictionaries
-    dict1_keys = set(dict1.keys())
-    dict2_keys = set(dict2.keys())
+    dict1_keys = set(source_dict.keys())
+    dict2_keys = set(target_dict.keys())
     intersect_keys = dict1_keys.intersection(dict2_keys)
 
+    # The objects of a snapshot are saved with their hash, which ignores
+    # only the keys of the node, hash the live objects the same way then.
+    hash_ignore_keys = ignore_keys
+
     # Add gid to the params
     source_params['gid'] = target_params['gid'] = 1
 
@@ -453,13 +614,15 @@ def compare_dictionaries(**kwargs):
                                    node_label=node_label,
                                    group_name=group_name,
                                    source_schema_name=source_schema_name,
-                                   target_schema=target_schema)
+                                   target_schema=target_schema,
+                                   source_snapshot=source_snapshot)
 
     target_only = []
     # Keys that are available in target and missing in source.
     removed = dict2_keys - dict1_keys
     target_only = _get_target_list(removed, target_dict, node, target_params,
-                                   view_object, node_label, group_name)
+                                   view_object, node_label, group_name,
+                                   target_snapshot)
 
     # if ignore_owner is True then add all the possible owner keys to the
     # ignore keys.
@@ -481,6 +644,28 @@ def compare_dictionaries(**kwargs):
         grant_keys = ['relacl', 'acl', 'datacl', 'fdwacl', 'lanacl', 'fsrvacl']
         ignore_keys = ignore_keys + grant_keys
 
+    # Hash the objects once, the objects with the same hash are identical
+    # and only the others are copied and walked.
+    hash_whitespaces = False
+    if source_snapshot is None and target_snapshot is None:
+        hash_ignore_keys = ignore_keys
+        hash_whitespaces = ignore_whitespaces
+    source_hashes = _get_object_hashes(
+        source_dict, source_snapshot, intersect_keys, hash_ignore_keys,
+        hash_whitespaces)
+    target_hashes = _get_object_hashes(
+        target_dict, target_snapshot, intersect_keys, hash_ignore_keys,
+        hash_whitespaces)
+
+    # are_dictionaries_identical() replaces the lists of the objects it
+    # walks with sorted ones, walk copies of them.
+    different_keys = [key for key in intersect_keys
+                      if source_hashes[key] != target_hashes[key]]
+    dict1 = dict((key, copy.deepcopy(source_dict[key]))
+                 for key in different_keys)
+    dict2 = dict((key, copy.deepcopy(target_dict[key]))
+                 for key in different_keys)
+
     # Compare the values of duplicates keys.
     other_param = {
         "dict1": dict1,
@@ -491,7 +676,11 @@ def compare_dictionaries(**kwargs):
         "group_name": group_name,
         "target_schema": target_schema,
         "ignore_whitespaces": ignore_whitespaces,
-        "ignore_grants": ignore_grants
+        "ignore_grants": ignore_grants,
+        "source_snapshot": source_snapshot,
+        "target_snapshot": target_snapshot,
+        "source_hashes": source_hashes,
+        "target_hashes": target_hashes
     }
 
     identical, different = _get_identical_and_different_list(
@@ -501,6 +690,80 @@ def compare_dictionaries(**kwargs):
     return source_only + target_only + different + identical
 
 
+def _get_object_hashes(objects, snapshot, keys, ignore_keys,
+                       ignore_whitespaces=False):
+    """
+    Get the hash of the objects, read from the snapshot if any.
+    :param objects: objects dict.
+    :param snapshot: snapshot objects or None.
+    :param keys: keys of the objects to hash.
+    :param ignore_keys: ignore keys to hash the objects.
+    :param ignore_whitespaces: ignore whitespaces to hash the objects.
+    :return: dict of the object hashes.
+    """
+    if snapshot is not None:
+        return dict((key, snapshot[key]['hash']) for key in keys)
+    return dict((key, get_object_hash(objects[key], ignore_keys,
+                                      ignore_whitespaces))
+                for key in keys)
+
+
+def _canonical_list(value, ignore_keys, ignore_whitespaces):
+    """
+    Canonical form of a list for get_object_hash(), sorted like sort_list()
+    does. Only the dictionaries of a list are compared by ignoring keys and
+    whitespaces.
+    """
+    try:
+        value = sort_list(value, None)[0]
+    except (KeyError, TypeError):
+        # Keep the order of the list, the hashes only differ then.
+        pass
+    return [_canonical_dict(item, ignore_keys, ignore_whitespaces)
+            if isinstance(item, dict) else item for item in value]
+
+
+def _canonical_dict(value, ignore_keys, ignore_whitespaces):
+    """
+    Canonical form of a dictionary for get_object_hash().
+    """
+    canonical = {}
+    for key, item in value.items():
+        if key in ignore_keys:
+            continue
+        if isinstance(item, dict):
+            item = _canonical_dict(item, ignore_keys, ignore_whitespaces)
+        elif isinstance(item, list):
+            item = _canonical_list(item, ignore_keys, ignore_whitespaces)
+        else:
+            if ignore_whitespaces:
+                item, _ = check_for_ignore_whitespaces(ignore_whitespaces,
+                                                       item, None)
+            # '' and None are considered identical
+            if item == '':
+                item = None
+        canonical[key] = item
+    return canonical
+
+
+def get_object_hash(source_dict, ignore_keys, ignore_whitespaces=False):
+    """
+    This function returns the hash of an object, two objects with the same
+    hash are identical for are_dictionaries_identical() with the same ignore
+    keys and ignore whitespaces flag.
+    :param source_dict: object dict
+    :param ignore_keys: ignore keys to hash
+    :param ignore_whitespaces: ignore whitespaces while hashing
+    :return: hex digest of the hash
+    """
+    canonical = _canonical_dict(source_dict, set(ignore_keys),
+                                ignore_whitespaces)
+    data = json.dumps(canonical, sort_keys=True, separators=(',', ':'),
+                      default=lambda value: {type(value).__name__:
+                                             str(value)})
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
 def are_lists_identical(source_list, target_list, ignore_keys,
                         ignore_whitespaces):
     """
@@ -0,0 +1,223 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Schema diff snapshot of the objects of a database."""
+
+import datetime
+import gzip
+import json
+
+from flask_babel import gettext
+from pgadmin.utils.driver import get_driver
+from config import PG_DEFAULT_DRIVER
+from pgadmin.tools.schema_diff.directory_compare import get_object_hash, \
+    _get_source_list, _get_target_list, SPECIAL_NODES
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+
+SNAPSHOT_FORMAT = 'pgadmin4-schema-diff-snapshot'
+SNAPSHOT_VERSION = 1
+
+
+def normalize_objects(objects):
+    """
+    This function returns the objects as they are read back from a
+    snapshot, the values of the types JSON does not support being
+    converted to strings.
+    """
+    return json.loads(json.dumps(objects, default=str))
+
+
+def get_child_ddl(view, params, data, schema_name):
+    """
+    This function returns the DDL of the child objects of a table or a
+    view, by node type and name. The difference of the table or the view
+    with a snapshot is rendered from the target and the DDL saved for the
+    child objects found only in the snapshot.
+
+    :param view: Node view of the table or the view
+    :param params: sid, did and scid of the table or the view
+    :param data: Data of the table or the view
+    :param schema_name: Name of the schema of the table or the view
+    """
+    params = dict(params, tid=data['oid'])
+    child_ddl = dict()
+    for module in view.blueprint.submodules:
+        if module.node_type == 'partition' or \
+                not isinstance(data.get(module.node_type), dict):
+            continue
+
+        module_view = SchemaDiffRegistry.get_node_view(module.node_type)
+        child_ddl[module.node_type] = dict(
+            (name, module_view.ddl_compare(source_params=params,
+                                           target_params=params,
+                                           target_schema=schema_name,
+                                           source=child, target=None,
+                                           comp_status='source_only'))
+            for name, child in data[module.node_type].items())
+
+    return child_ddl
+
+
+class SchemaDiffSnapshot:
+    """
+    class SchemaDiffSnapshot
+
+        Snapshot of the objects of a database compared by the schema diff.
+        Every object is saved with its hash and DDL so that a database can
+        be compared with the snapshot without connecting to the database
+        the snapshot was taken from.
+    """
+
+    def __init__(self, server_type, version, database, **kwargs):
+        self.server_type = server_type
+        self.version = version
+        self.database = database
+        self.created = kwargs.get(
+            'created', datetime.datetime.now().isoformat())
+        self.database_objects = kwargs.get('database_objects', dict())
+        self.schemas = kwargs.get('schemas', dict())
+
+    def add_objects(self, view, params, schema_name=None):
+        """
+        This function fetches the objects of a node type of the database,
+        or of a schema of the database, and adds them to the snapshot.
+
+        :param view: Node view of the objects
+        :param params: sid, did and scid of the objects
+        :param schema_name: Name of the schema of the objects
+        """
+        objects = view.fetch_compare_objects(**params)
+        if not isinstance(objects, dict) or len(objects) == 0:
+            return
+
+        keys = sorted(objects.keys())
+        params = dict(params, gid=1)
+        node_label = view.blueprint.collection_label
+        group_name = schema_name if schema_name else 'Database Objects'
+        created = _get_source_list(added=keys, source_dict=objects,
+                                   node=view.node_type, source_params=params,
+                                   view_object=view, node_label=node_label,
+                                   group_name=group_name,
+                                   target_schema=schema_name)
+        dropped = _get_target_list(keys, objects, view.node_type, params,
+                                   view, node_label, group_name)
+
+        objects = normalize_objects(objects)
+        snapshot_objects = dict()
+        for key, create, drop in zip(keys, created, dropped):
+            snapshot_objects[key] = {
+                'hash': get_object_hash(objects[key], view.keys_to_ignore),
+                'data': objects[key],
+                'ddl': create['source_ddl'],
+                'diff_ddl': create['diff_ddl'],
+                'drop_ddl': drop['diff_ddl'],
+                'dependencies': normalize_objects(create['dependencies'])
+            }
+            if view.node_type in SPECIAL_NODES:
+                snapshot_objects[key]['child_ddl'] = get_child_ddl(
+                    view, params, objects[key], schema_name)
+
+        if schema_name is None:
+            self.database_objects[view.node_type] = snapshot_objects
+        else:
+            self.schemas.setdefault(schema_name, dict())[view.node_type] = \
+                snapshot_objects
+
+    def get_objects(self, node_type, schema_name=None):
+        """
+        This function returns the objects of a node type of the database,
+        or of a schema of the database.
+
+        :param node_type: Node type of the objects
+        :param schema_name: Name of the schema of the objects
+        :return: dict of the objects with their hash, data and DDL
+        """
+        if schema_name is None:
+            return self.database_objects.get(node_type, dict())
+        return self.schemas.get(schema_name, dict()).get(node_type, dict())
+
+    def get_schemas(self):
+        """
+        This function returns the schemas of the snapshot like
+        get_schemas() does for a database, the name of a schema being its
+        id.
+        """
+        return [{'label': name, '_id': name} for name in sorted(self.schemas)]
+
+    def save(self, filename):
+        """
+        This function saves the snapshot to a compressed JSON file.
+        """
+        with gzip.open(filename, 'wt', encoding='utf-8') as snapshot_file:
+            json.dump({'format': SNAPSHOT_FORMAT,
+                       'version': SNAPSHOT_VERSION,
+                       'server_type': self.server_type,
+                       'server_version': self.version,
+                       'database': self.database,
+                       'created': self.created,
+                       'database_objects': self.database_objects,
+                       'schemas': self.schemas}, snapshot_file,
+                      separators=(',', ':'))
+
+    @classmethod
+    def load(cls, filename):
+        """
+        This function loads a snapshot saved by save().
+        """
+        try:
+            with gzip.open(filename, 'rt', encoding='utf-8') as snapshot_file:
+                data = json.load(snapshot_file)
+        except (OSError, ValueError):
+            data = None
+
+        if not isinstance(data, dict) or \
+                data.get('format') != SNAPSHOT_FORMAT:
+            raise ValueError(gettext(
+                'The file {0} is not a schema diff snapshot.').format(
+                filename))
+        if data.get('version') != SNAPSHOT_VERSION:
+            raise ValueError(gettext(
+                'The version {0} of the schema diff snapshot is not '
+                'supported.').format(data.get('version')))
+
+        return cls(data['server_type'], data['server_version'],
+                   data['database'], created=data['created'],
+                   database_objects=data['database_objects'],
+                   schemas=data['schemas'])
+
+
+def create_snapshot(sid, did, schemas):
+    """
+    This function takes a snapshot of the objects of the database compared
+    by the schema diff.
+
+    :param sid: Server Id
+    :param did: Database Id
+    :param schemas: Schemas of the database returned by get_schemas()
+    :return: SchemaDiffSnapshot
+    """
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+    conn = manager.connection(did=did)
+    snapshot = SchemaDiffSnapshot(manager.server_type, manager.version,
+                                  conn.db)
+
+    nodes = [(node_name, None, {'sid': sid, 'did': did})
+             for node_name in SchemaDiffRegistry.get_registered_nodes(
+                 None, 'Database')]
+    for schema in schemas:
+        nodes += [(node_name, schema['label'],
+                   {'sid': sid, 'did': did, 'scid': schema['_id']})
+                  for node_name in SchemaDiffRegistry.get_registered_nodes()]
+
+    for node_name, schema_name, params in nodes:
+        view = SchemaDiffRegistry.get_node_view(node_name)
+        if hasattr(view, 'fetch_compare_objects'):
+            snapshot.add_objects(view, params, schema_name)
+
+    return snapshot
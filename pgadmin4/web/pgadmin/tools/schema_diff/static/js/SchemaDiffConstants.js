@@ -50,6 +50,8 @@ export const SCHEMA_DIFF_EVENT = {
   TRIGGER_SELECT_SERVER: 'TRIGGER_SELECT_SERVER',
   TRIGGER_SELECT_DATABASE: 'TRIGGER_SELECT_DATABASE',
   TRIGGER_SELECT_SCHEMA: 'TRIGGER_SELECT_DATABASE',
+  TRIGGER_SELECT_SNAPSHOT: 'TRIGGER_SELECT_SNAPSHOT',
+  TRIGGER_SAVE_SNAPSHOT: 'TRIGGER_SAVE_SNAPSHOT',
 
   TRIGGER_COMPARE_DIFF: 'TRIGGER_COMPARE_DIFF',
   TRIGGER_GENERATE_SCRIPT: 'TRIGGER_GENERATE_SCRIPT',
@@ -11,17 +11,24 @@ import PropTypes from 'prop-types';
 import React, { useContext, useState, useEffect } from 'react';
 
 import { Box, Grid, Typography } from '@mui/material';
+import FolderOpenRoundedIcon from '@mui/icons-material/FolderOpenRounded';
+import SaveRoundedIcon from '@mui/icons-material/SaveRounded';
+import CloseIcon from '@mui/icons-material/CloseRounded';
 
-import { InputSelect } from '../../../../../static/js/components/FormComponents';
-import { SchemaDiffEventsContext } from './SchemaDiffComponent';
+import gettext from 'sources/gettext';
+import { PgButtonGroup, PgIconButton } from '../../../../../static/js/components/Buttons';
+import { InputSelect, InputText } from '../../../../../static/js/components/FormComponents';
+import { showFileManager } from '../../../../../static/js/helpers/showFileManager';
+import { SchemaDiffContext, SchemaDiffEventsContext } from './SchemaDiffComponent';
 import { SCHEMA_DIFF_EVENT } from '../SchemaDiffConstants';
 
 
-export function InputComponent({ label, serverList, databaseList, schemaList, diff_type, selectedSid = null, selectedDid=null, selectedScid=null, onServerSchemaChange }) {
+export function InputComponent({ label, serverList, databaseList, schemaList, diff_type, selectedSid = null, selectedDid=null, selectedScid=null, selectedSnapshot=null, onServerSchemaChange }) {
   const [selectedServer, setSelectedServer] = useState(selectedSid);
   const [selectedDatabase, setSelectedDatabase] = useState(selectedDid);
   const [selectedSchema, setSelectedSchema] = useState(selectedScid);
   const eventBus = useContext(SchemaDiffEventsContext);
+  const schemaDiffToolContext = useContext(SchemaDiffContext);
   const [disableDBSelection, setDisableDBSelection] = useState(selectedSid == null);
   const [disableSchemaSelection, setDisableSchemaSelection] = useState(selectedDid == null);
 
@@ -61,6 +68,39 @@ export function InputComponent({ label, serverList, databaseList, schemaList, di
     onServerSchemaChange();
   };
 
+  const selectSnapshot = () => {
+    let params = {
+      'supported_types': ['*', 'gz'],
+      'dialog_type': 'select_file',
+    };
+    showFileManager(params, (fileName)=>{
+      setSelectedServer(null);
+      setSelectedDatabase(null);
+      setDisableDBSelection(true);
+      setSelectedSchema(null);
+      setDisableSchemaSelection(true);
+      eventBus.fireEvent(SCHEMA_DIFF_EVENT.TRIGGER_SELECT_SNAPSHOT, { snapshot: decodeURI(fileName), diff_type });
+      onServerSchemaChange();
+    }, null, schemaDiffToolContext.modal);
+  };
+
+  const clearSnapshot = () => {
+    eventBus.fireEvent(SCHEMA_DIFF_EVENT.TRIGGER_SELECT_SNAPSHOT, { snapshot: null, diff_type });
+    onServerSchemaChange();
+  };
+
+  const saveSnapshot = () => {
+    let params = {
+      'supported_types': ['*', 'gz'],
+      'dialog_type': 'create_file',
+      'dialog_title': gettext('Save Snapshot'),
+      'btn_primary': gettext('Save'),
+    };
+    showFileManager(params, (fileName)=>{
+      eventBus.fireEvent(SCHEMA_DIFF_EVENT.TRIGGER_SAVE_SNAPSHOT, { sid: selectedServer, did: selectedDatabase, filename: decodeURI(fileName) });
+    }, null, schemaDiffToolContext.modal);
+  };
+
   return (
     <Box sx={{padding: '0rem'}}>
       <Grid
@@ -71,51 +111,69 @@ export function InputComponent({ label, serverList, databaseList, schemaList, di
         <Grid item lg={2} md={2} sm={2} xs={2} sx={{padding: '0.3rem'}}>
           <Typography id={label}>{label}</Typography>
         </Grid>
-        <Grid item lg={4} md={4} sm={4} xs={4} sx={{padding: '0.3rem'}}>
-          <InputSelect
-            options={serverList}
-            optionsReloadBasis={serverList?.length}
-            onChange={changeServer}
-            value={selectedServer}
-            controlProps={
-              {
-                placeholder: 'Select server...'
+        {selectedSnapshot ?
+          <Grid item lg={9} md={9} sm={9} xs={9} sx={{padding: '0.3rem'}}>
+            <InputText value={selectedSnapshot} readonly={true} key={'snapshot_' + diff_type} />
+          </Grid>
+          : <>
+          <Grid item lg={3} md={3} sm={3} xs={3} sx={{padding: '0.3rem'}}>
+            <InputSelect
+              options={serverList}
+              optionsReloadBasis={serverList?.length}
+              onChange={changeServer}
+              value={selectedServer}
+              controlProps={
+                {
+                  placeholder: 'Select server...'
+                }
               }
-            }
-            key={'server_' + diff_type}
-          ></InputSelect>
-        </Grid>
+              key={'server_' + diff_type}
+            ></InputSelect>
+          </Grid>
 
-        <Grid item lg={3} md={3} sm={3} xs={3} sx={{padding: '0.3rem'}}>
-          <InputSelect
-            options={databaseList}
-            optionsReloadBasis={databaseList?.map ? _.join(databaseList.map((c)=>c.value), ',') : null}
-            onChange={changeDatabase}
-            value={selectedDatabase}
-            controlProps={
-              {
-                placeholder: 'Select Database...'
+          <Grid item lg={3} md={3} sm={3} xs={3} sx={{padding: '0.3rem'}}>
+            <InputSelect
+              options={databaseList}
+              optionsReloadBasis={databaseList?.map ? _.join(databaseList.map((c)=>c.value), ',') : null}
+              onChange={changeDatabase}
+              value={selectedDatabase}
+              controlProps={
+                {
+                  placeholder: 'Select Database...'
+                }
               }
-            }
-            key={'database_' + diff_type}
-            readonly={disableDBSelection}
-          ></InputSelect>
-        </Grid>
+              key={'database_' + diff_type}
+              readonly={disableDBSelection}
+            ></InputSelect>
+          </Grid>
 
-        <Grid item lg={3} md={3} sm={3} xs={3} sx={{padding: '0.3rem'}}>
-          <InputSelect
-            options={schemaList}
-            optionsReloadBasis={schemaList?.map ? _.join(schemaList.map((c)=>c.value), ',') : null}
-            onChange={changeSchema}
-            value={selectedSchema}
-            controlProps={
-              {
-                placeholder: 'Select Schema...'
+          <Grid item lg={3} md={3} sm={3} xs={3} sx={{padding: '0.3rem'}}>
+            <InputSelect
+              options={schemaList}
+              optionsReloadBasis={schemaList?.map ? _.join(schemaList.map((c)=>c.value), ',') : null}
+              onChange={changeSchema}
+              value={selectedSchema}
+              controlProps={
+                {
+                  placeholder: 'Select Schema...'
+                }
               }
+              key={'schema' + diff_type}
+              readonly={disableSchemaSelection}
+            ></InputSelect>
+          </Grid>
+          </>
+        }
+
+        <Grid item lg={1} md={1} sm={1} xs={1} sx={{padding: '0.3rem'}}>
+          <PgButtonGroup size="small">
+            {selectedSnapshot ?
+              <PgIconButton title={gettext('Clear the snapshot')} icon={<CloseIcon />} onClick={clearSnapshot} />
+              : <PgIconButton title={gettext('Select a snapshot')} icon={<FolderOpenRoundedIcon />} onClick={selectSnapshot} />
             }
-            key={'schema' + diff_type}
-            readonly={disableSchemaSelection}
-          ></InputSelect>
+            <PgIconButton title={gettext('Save a snapshot of the database')} icon={<SaveRoundedIcon />}
+              disabled={selectedSnapshot != null || selectedServer == null || selectedDatabase == null} onClick={saveSnapshot} />
+          </PgButtonGroup>
         </Grid>
       </Grid>
     </Box >
@@ -131,5 +189,6 @@ InputComponent.propTypes = {
   selectedSid: PropTypes.number,
   selectedDid: PropTypes.number,
   selectedScid:PropTypes.number,
+  selectedSnapshot:PropTypes.string,
   onServerSchemaChange:PropTypes.func
 };
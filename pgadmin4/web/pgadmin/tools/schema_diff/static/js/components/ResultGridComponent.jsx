@@ -694,20 +694,25 @@ export function ResultGridComponent({ gridData, allRowIds, filterParams, selecte
     rowSelectionTimeoutRef.current = setTimeout(()=> {
       rowSelectionTimeoutRef.current = null;
       const row = rows[rowIdx];
-      if (row.ddlData != undefined && row.status != FILTER_NAME.IDENTICAL) {
+      if (row.ddlData != undefined && (row.status != FILTER_NAME.IDENTICAL ||
+          !_.isUndefined(row.ddlData.sourceSQL) && !_.isUndefined(row.ddlData.targetSQL))) {
         eventBus.fireEvent(SCHEMA_DIFF_EVENT.TRIGGER_CHANGE_RESULT_SQL, row.ddlData);
       } else if (row.status == FILTER_NAME.IDENTICAL) {
+        // The DDL of the side compared with a snapshot comes with the row,
+        // only the DDL of the database side is fetched.
+        let sourceSQL = row.ddlData?.sourceSQL;
+        let targetSQL = row.ddlData?.targetSQL;
         let url_params = {
           'trans_id': transId,
-          'source_sid': sourceData.sid,
-          'source_did': sourceData.did,
-          'source_scid': row.source_scid,
-          'target_sid': targetData.sid,
-          'target_did': targetData.did,
-          'target_scid': row.target_scid,
+          'source_sid': _.isUndefined(sourceSQL) ? sourceData.sid : 0,
+          'source_did': _.isUndefined(sourceSQL) ? sourceData.did : 0,
+          'source_scid': _.isUndefined(sourceSQL) ? row.source_scid : 0,
+          'target_sid': _.isUndefined(targetSQL) ? targetData.sid : 0,
+          'target_did': _.isUndefined(targetSQL) ? targetData.did : 0,
+          'target_scid': _.isUndefined(targetSQL) ? row.target_scid : 0,
           'comp_status': row.status,
-          'source_oid': row.source_oid,
-          'target_oid': row.target_oid,
+          'source_oid': _.isUndefined(sourceSQL) ? row.source_oid : 0,
+          'target_oid': _.isUndefined(targetSQL) ? row.target_oid : 0,
           'node_type': row.itemType,
         };
 
@@ -715,8 +720,8 @@ export function ResultGridComponent({ gridData, allRowIds, filterParams, selecte
         schemaDiffToolContext.api.get(baseUrl).then((res) => {
           row.ddlData = {
             'SQLdiff': res.data.diff_ddl,
-            'sourceSQL': res.data.source_ddl,
-            'targetSQL': res.data.target_ddl
+            'sourceSQL': sourceSQL ?? res.data.source_ddl,
+            'targetSQL': targetSQL ?? res.data.target_ddl
           };
           eventBus.fireEvent(SCHEMA_DIFF_EVENT.TRIGGER_CHANGE_RESULT_SQL, row.ddlData);
         }).catch((err) => {
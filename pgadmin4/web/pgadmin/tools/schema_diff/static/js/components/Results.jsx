@@ -13,7 +13,7 @@ import { styled } from '@mui/material/styles';
 import React, { useContext, useState, useEffect } from 'react';
 
 import { Box } from '@mui/material';
-import { InputSQL } from '../../../../../static/js/components/FormComponents';
+import { InputSQL, MESSAGE_TYPE, NotifierMessage } from '../../../../../static/js/components/FormComponents';
 import { SchemaDiffEventsContext } from './SchemaDiffComponent';
 import { SCHEMA_DIFF_EVENT } from '../SchemaDiffConstants';
 
@@ -62,6 +62,7 @@ export function Results() {
   const [sourceSQL, setSourceSQL] = useState(null);
   const [targetSQL, setTargetSQL] = useState(null);
   const [sqlDiff, setSqlDiff] = useState(null);
+  const [sqlDiffMessage, setSqlDiffMessage] = useState(null);
 
   const eventBus = useContext(SchemaDiffEventsContext);
 
@@ -75,6 +76,7 @@ export function Results() {
     setSourceSQL(resultData.sourceSQL);
     setTargetSQL(resultData.targetSQL);
     setSqlDiff(resultData.SQLdiff);
+    setSqlDiffMessage(resultData.SQLdiffMessage);
   };
 
   return (
@@ -115,6 +117,7 @@ export function Results() {
           </Box>
         </Box>
         <Box className='Results-sqldata'>
+          {sqlDiffMessage && <NotifierMessage type={MESSAGE_TYPE.INFO} message={sqlDiffMessage} closable={false} />}
           <Box className='Results-sqlInput'>
             <InputSQL
               onLable={true}
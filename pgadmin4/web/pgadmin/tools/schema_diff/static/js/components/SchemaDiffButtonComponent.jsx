@@ -77,7 +77,14 @@ export function SchemaDiffButtonComponent({ sourceData, targetData, selectedRowI
 
   useEffect(() => {
     let isDisableComp = true;
-    if (sourceData.sid != null && sourceData.did != null && targetData.sid != null && targetData.did != null) {
+    if (sourceData.snapshot != null || targetData.snapshot != null) {
+      // A snapshot is compared with a database, not with a schema nor with
+      // another snapshot.
+      if ((sourceData.snapshot != null || sourceData.did != null) && (targetData.snapshot != null || targetData.did != null) &&
+        (sourceData.snapshot == null || targetData.snapshot == null) && sourceData.scid == null && targetData.scid == null) {
+        isDisableComp = false;
+      }
+    } else if (sourceData.sid != null && sourceData.did != null && targetData.sid != null && targetData.did != null) {
       if (!((sourceData.scid != null && targetData.scid == null) || (sourceData.scid == null && targetData.scid != null))) {
         isDisableComp = false;
       }
@@ -167,7 +174,7 @@ export function SchemaDiffButtonComponent({ sourceData, targetData, selectedRowI
         </PgButtonGroup>
       </Box>
       <Box className='SchemaDiffButtons-scriptBtn'>
-        <PgButtonGroup size="small" disabled={selectedRowIds?.length <= 0}>
+        <PgButtonGroup size="small" disabled={selectedRowIds?.length <= 0 || targetData.snapshot != null}>
           <DefaultButton startIcon={<FeaturedPlayListRoundedIcon />} onClick={generateScript}>{gettext('Generate Script')}</DefaultButton>
         </PgButtonGroup>
       </Box>
@@ -104,6 +104,8 @@ export function SchemaDiffCompare({ params }) {
   const [targetSchemaList, setTargetSchemaList] = useState([]);
   const [selectedSourceScid, setSelectedSourceScid] = useState(null);
   const [selectedTargetScid, setSelectedTargetScid] = useState(null);
+  const [selectedSourceSnapshot, setSelectedSourceSnapshot] = useState(null);
+  const [selectedTargetSnapshot, setSelectedTargetSnapshot] = useState(null);
 
   const [sourceGroupServerList, setSourceGroupServerList] = useState([]);
   const [gridData, setGridData] = useState([]);
@@ -149,6 +151,12 @@ export function SchemaDiffCompare({ params }) {
     eventBus.registerListener(
       SCHEMA_DIFF_EVENT.TRIGGER_SELECT_SCHEMA, triggerSelectSchema);
 
+    eventBus.registerListener(
+      SCHEMA_DIFF_EVENT.TRIGGER_SELECT_SNAPSHOT, triggerSelectSnapshot);
+
+    eventBus.registerListener(
+      SCHEMA_DIFF_EVENT.TRIGGER_SAVE_SNAPSHOT, triggerSaveSnapshot);
+
     eventBus.registerListener(
       SCHEMA_DIFF_EVENT.TRIGGER_COMPARE_DIFF, triggerCompareDiff);
 
@@ -246,6 +254,32 @@ export function SchemaDiffCompare({ params }) {
     }
   };
 
+  const triggerSelectSnapshot = ({ snapshot, diff_type }) => {
+    // A snapshot is compared in place of a database.
+    checkAndSetSourceData(diff_type, null);
+    if (diff_type == TYPE.SOURCE) {
+      setSelectedSourceSnapshot(snapshot);
+      setSourceSchemaList([]);
+    } else {
+      setSelectedTargetSnapshot(snapshot);
+      setTargetSchemaList([]);
+    }
+  };
+
+  const triggerSaveSnapshot = ({ sid, did, filename }) => {
+    setLoaderText(gettext('Saving snapshot...'));
+    schemaDiffToolContext.api.post(
+      url_for('schema_diff.snapshot', { 'trans_id': params.transId, 'sid': sid, 'did': did }),
+      { 'filename': filename }
+    ).then(() => {
+      setLoaderText(null);
+      pgAdmin.Browser.notifier.success(gettext('Snapshot saved.'));
+    }).catch((error) => {
+      setLoaderText(null);
+      pgAdmin.Browser.notifier.alert(gettext('Save snapshot error'), parseApiError(error));
+    });
+  };
+
   const triggerCompareDiff = async ({ sourceData, targetData, compareParams, filterParams }) => {
     setGridData([]);
     setIsInit(false);
@@ -276,6 +310,12 @@ export function SchemaDiffCompare({ params }) {
         'ignore_tablespace': compareParams['ignoreTablespace'],
         'ignore_grants': compareParams['ignoreGrants'],
       };
+      if (sourceData['snapshot']) {
+        url_params['source_snapshot'] = sourceData['snapshot'];
+      }
+      if (targetData['snapshot']) {
+        url_params['target_snapshot'] = targetData['snapshot'];
+      }
       let socketEndpoint = 'compare_database';
       if (sourceData['scid'] != null && targetData['scid'] != null) {
         url_params['source_scid'] = sourceData['scid'];
@@ -398,6 +438,7 @@ export function SchemaDiffCompare({ params }) {
         'dependencieRowIds': [],
         'ddlData': {
           'SQLdiff': record.diff_ddl,
+          'SQLdiffMessage': record.diff_message,
           'sourceSQL': record.source_ddl,
           'targetSQL': record.target_ddl
         }
@@ -440,6 +481,7 @@ export function SchemaDiffCompare({ params }) {
           'dependencieRowIds': [],
           'ddlData': {
             'SQLdiff': record.diff_ddl,
+            'SQLdiffMessage': record.diff_message,
             'sourceSQL': record.source_ddl,
             'targetSQL': record.target_ddl
           }
@@ -493,6 +535,7 @@ export function SchemaDiffCompare({ params }) {
           'dependencieRowIds': [],
           'ddlData': {
             'SQLdiff': record.diff_ddl,
+            'SQLdiffMessage': record.diff_message,
             'sourceSQL': record.source_ddl,
             'targetSQL': record.target_ddl
           }
@@ -702,6 +745,7 @@ export function SchemaDiffCompare({ params }) {
               selectedSid={selectedSourceSid}
               selectedDid={selectedSourceDid}
               selectedScid={selectedSourceScid}
+              selectedSnapshot={selectedSourceSnapshot}
               diff_type={TYPE.SOURCE}
               onServerSchemaChange={handleServerSchemaChange}
             ></InputComponent>
@@ -726,6 +770,7 @@ export function SchemaDiffCompare({ params }) {
               selectedSid={selectedTargetSid}
               selectedDid={selectedTargetDid}
               selectedScid={selectedTargetScid}
+              selectedSnapshot={selectedTargetSnapshot}
               diff_type={TYPE.TARGET}
               onServerSchemaChange={handleServerSchemaChange}
             ></InputComponent>
@@ -737,6 +782,7 @@ export function SchemaDiffCompare({ params }) {
                 'sid': selectedSourceSid,
                 'did': selectedSourceDid,
                 'scid': selectedSourceScid,
+                'snapshot': selectedSourceSnapshot,
               }}
               selectedRowIds={selectedRowIds}
               onServerSchemaChange={handleServerSchemaChange}
@@ -745,6 +791,7 @@ export function SchemaDiffCompare({ params }) {
                 'sid': selectedTargetSid,
                 'did': selectedTargetDid,
                 'scid': selectedTargetScid,
+                'snapshot': selectedTargetSnapshot,
               }}
               filterParams={getFilterParams()}
               compareParams={compareOptions}
@@ -752,7 +799,7 @@ export function SchemaDiffCompare({ params }) {
           </Grid>
         </Grid>
       </Box>
-      {showResultGrid && gridData.length > 0  && selectedTargetDid && selectedSourceDid ?
+      {showResultGrid && gridData.length > 0  && (selectedTargetDid || selectedTargetSnapshot) && (selectedSourceDid || selectedSourceSnapshot) ?
         <ResultGridComponent
           gridData={gridData}
           allRowIds={allRowIdList}
@@ -764,11 +811,13 @@ export function SchemaDiffCompare({ params }) {
             'sid': selectedSourceSid,
             'did': selectedSourceDid,
             'scid': selectedSourceScid,
+            'snapshot': selectedSourceSnapshot,
           }}
           targetData={{
             'sid': selectedTargetSid,
             'did': selectedTargetDid,
             'scid': selectedTargetScid,
+            'snapshot': selectedTargetSnapshot,
           }}
         ></ResultGridComponent>
         :
@@ -781,6 +830,9 @@ export function SchemaDiffCompare({ params }) {
           <strong>{gettext('Schema Compare:')}</strong>
           {gettext(' Select the server, database and schema for the source and target and Click')} <strong>{gettext('Compare.')}</strong>
           <br />
+          <strong>{gettext('Snapshot Compare:')}</strong>
+          {gettext(' Save a snapshot of a database, then select the snapshot in place of the source or target database and Click')} <strong>{gettext('Compare.')}</strong>
+          <br />
           <strong>{gettext('Note:')}</strong> {gettext('The dependencies will not be resolved in the Schema comparison.')}
         </Box>
       }
@@ -0,0 +1,110 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+
+from pgadmin.tools.schema_diff import directory_compare
+from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
+from pgadmin.utils.route import BaseTestGenerator
+
+# One object out of DIFFERENT_EVERY differs between source and target
+DIFFERENT_EVERY = 100
+
+
+def _function(oid, index, schema):
+    return {'oid': oid, 'name': 'f{0}'.format(index), 'schema': schema,
+            'funcowner': 'postgres', 'lanname': 'plpgsql',
+            'prosrc': 'BEGIN\n    RETURN {0};\nEND;'.format(index),
+            'description': '', 'procost': 100,
+            'arguments': [{'argid': 1, 'argname': 'b', 'argtype': 'text'},
+                          {'argid': 0, 'argname': 'a', 'argtype': 'int'}],
+            'variables': [{'name': 'search_path', 'value': 'public'}],
+            'acl': [{'grantee': 'app', 'grantor': 'postgres',
+                     'privileges': [{'privilege_type': 'X',
+                                     'privilege': True,
+                                     'with_grant': False}]}],
+            'seclabels': {'provider': None, 'label': None}}
+
+
+def _functions(objects):
+    source, target = {}, {}
+    for index in range(objects):
+        key = 'f{0}'.format(index)
+        source[key] = _function(index, index, 'public')
+        target[key] = _function(objects + index, index, 'sales')
+        # Same lists in another order
+        target[key]['arguments'].reverse()
+        if index % DIFFERENT_EVERY == 0:
+            target[key]['prosrc'] = 'BEGIN\n    RETURN NULL;\nEND;'
+    return source, target
+
+
+def _compare_by_walking(source, target, ignore_keys):
+    """
+    Returns the keys of the identical and different objects found by
+    walking every object, as schema diff did before hashing them.
+    """
+    dict1 = copy.deepcopy(source)
+    dict2 = copy.deepcopy(target)
+    identical, different = set(), set()
+    for key in set(dict1.keys()).intersection(dict2.keys()):
+        if directory_compare.are_dictionaries_identical(
+                dict1[key], dict2[key], ignore_keys, False):
+            identical.add(key)
+        else:
+            different.add(key)
+    return identical, different
+
+
+class _FunctionView(SchemaDiffObjectCompare):
+    """Node view rendering a fake DDL of the functions."""
+    node_type = 'function'
+    conn = None
+
+    def get_sql_from_diff(self, **kwargs):
+        return 'ALTER {0}'.format(kwargs['oid'])
+
+    def get_dependencies(self, conn, oid, **kwargs):
+        return []
+
+
+class SchemaDiffCompareHashedTestCase(BaseTestGenerator):
+    """
+    This class checks that hashing the objects classifies them as walking
+    every object does. See tools/benchmark_schema_diff.py for the timings
+    on a large schema.
+    """
+    scenarios = [
+        ('Compare a schema', dict(objects=500)),
+    ]
+
+    def setUp(self):
+        self.source, self.target = _functions(self.objects)
+
+    def runTest(self):
+        ignore_keys = SchemaDiffObjectCompare.keys_to_ignore
+
+        identical, different = _compare_by_walking(
+            self.source, self.target, ignore_keys)
+
+        res = directory_compare.compare_dictionaries(
+            view_object=_FunctionView(), source_params={'scid': 1},
+            target_params={'scid': 2}, group_name='public',
+            source_dict=self.source, target_dict=self.target,
+            node='function', node_label='Functions',
+            ignore_keys=ignore_keys, ignore_whitespaces=False)
+
+        self.assertEqual(set(r['title'] for r in res
+                             if r['status'] == 'Identical'), identical)
+        self.assertEqual(set(r['title'] for r in res
+                             if r['status'] == 'Different'), different)
+        self.assertEqual(len(different), self.objects // DIFFERENT_EVERY)
+        # The compared objects are left untouched
+        self.assertEqual([a['argid'] for a in self.source['f1']['arguments']],
+                         [1, 0])
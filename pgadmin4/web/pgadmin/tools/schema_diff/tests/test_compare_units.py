@@ -0,0 +1,199 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from flask import request
+
+from pgadmin.tools import schema_diff
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.utils.exception import ExecuteError
+from pgadmin.utils.route import BaseTestGenerator
+
+PARAMS = {'trans_id': 1, 'source_sid': 1, 'source_did': 10,
+          'target_sid': 2, 'target_did': 20, 'ignore_owner': 0,
+          'ignore_whitespaces': 1, 'ignore_tablespace': 0,
+          'ignore_grants': 0}
+NODES = ['table', 'view', 'function']
+SCHEMAS = ['public', 'sales', 'stock']
+
+# Connections used by the current thread, set by _Manager.use_connection()
+_thread_connections = threading.local()
+
+
+class _Connection:
+    def __init__(self, conn_id):
+        self.conn_id = conn_id
+        self.db = 'db'
+
+    def connect(self):
+        return True, None
+
+
+class _Manager:
+    def __init__(self, sid):
+        self.sid = sid
+        self.conn_ids = []
+        self.released = []
+
+    @contextmanager
+    def use_connection(self, did, conn_id):
+        self.conn_ids.append(conn_id)
+        _thread_connections.__dict__.setdefault('conn_ids', {})[did] = \
+            conn_id
+        try:
+            yield _Connection(conn_id)
+        finally:
+            del _thread_connections.conn_ids[did]
+
+    def release(self, conn_id):
+        self.released.append(conn_id)
+
+
+class _Driver:
+    def __init__(self):
+        self.managers = {1: _Manager(1), 2: _Manager(2)}
+
+    def connection_manager(self, sid):
+        return self.managers[sid]
+
+
+class _View:
+    """Node view returning the connections it compared the objects on."""
+    failed_unit = None
+
+    def __init__(self, node_name):
+        self.node_name = node_name
+
+    def compare(self, **kwargs):
+        # Give the other workers the time to pick a unit
+        time.sleep(0.01)
+        if (kwargs['group_name'], self.node_name) == _View.failed_unit:
+            raise ExecuteError('comparison failed')
+
+        conn_ids = getattr(_thread_connections, 'conn_ids', {})
+        return [{'group_name': kwargs['group_name'],
+                 'type': self.node_name,
+                 'ignore_whitespaces': kwargs['ignore_whitespaces'],
+                 'source_conn_id': conn_ids.get(kwargs['source_did']),
+                 'target_conn_id': conn_ids.get(kwargs['target_did'])}]
+
+
+class _Preference:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _Preferences:
+    def __init__(self, max_parallel_comparisons):
+        self.max_parallel_comparisons = max_parallel_comparisons
+
+    def preference(self, name):
+        return _Preference(getattr(self, name))
+
+
+class _SocketIO:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event, data, **kwargs):
+        self.events.append((event, data))
+
+
+class SchemaDiffCompareUnitsTestCase(BaseTestGenerator):
+    """This class tests the schema diff units compared in parallel."""
+    scenarios = [
+        ('Units compared one at a time', dict(
+            max_parallel_comparisons=1, failed_unit=None)),
+        ('Units compared in parallel', dict(
+            max_parallel_comparisons=4, failed_unit=None)),
+        ('Failure of a unit compared in parallel', dict(
+            max_parallel_comparisons=4, failed_unit=('sales', 'view'))),
+    ]
+
+    def setUp(self):
+        self.driver = _Driver()
+        self.socketio = _SocketIO()
+        preferences = _Preferences(self.max_parallel_comparisons)
+        self.patches = [
+            patch.object(schema_diff, 'get_driver',
+                         lambda driver: self.driver),
+            patch.object(schema_diff, 'socketio', self.socketio),
+            patch.object(schema_diff.Preferences, 'module',
+                         lambda name: preferences),
+            patch.object(schema_diff, 'update_session_diff_transaction',
+                         lambda *args: None),
+            patch.object(SchemaDiffRegistry, 'get_node_view', _View),
+        ]
+        for p in self.patches:
+            p.start()
+        _View.failed_unit = self.failed_unit
+        # The status is emitted to the socket of the request
+        self.request_context = self.app.test_request_context()
+        self.request_context.push()
+        request.sid = 'sid'
+
+    def runTest(self):
+        units = [{'node_name': node_name,
+                  'msg': 'Comparing {0} of {1}'.format(node_name, schema),
+                  'compare_args': {
+                      'source_sid': 1, 'source_did': 10, 'target_sid': 2,
+                      'target_did': 20, 'group_name': schema}}
+                 for schema in SCHEMAS for node_name in NODES]
+
+        if self.failed_unit:
+            with self.assertRaises(ExecuteError):
+                schema_diff.compare_units(PARAMS, units, None, None)
+        else:
+            res = schema_diff.compare_units(PARAMS, units, None, None)
+            self.assertEqual([(r['group_name'], r['type']) for r in res],
+                             [(schema, node_name) for schema in SCHEMAS
+                              for node_name in NODES])
+            self.assertTrue(all(r['ignore_whitespaces'] for r in res))
+            # The ids follow the order of the rows
+            self.assertEqual([r['id'] for r in res],
+                             list(range(1, len(res) + 1)))
+            self.assertEqual(len(self.socketio.events), len(units))
+
+            statuses = [data for _, data in self.socketio.events]
+            self.assertEqual(sorted(s['compare_msg'] for s in statuses),
+                             sorted(unit['msg'] for unit in units))
+            percentages = [s['diff_percentage'] for s in statuses]
+            self.assertEqual(percentages, sorted(percentages))
+            self.assertLess(percentages[-1], 100)
+
+        source, target = self.driver.managers[1], self.driver.managers[2]
+        if self.max_parallel_comparisons == 1:
+            # The existing connections are used
+            self.assertEqual(source.conn_ids, [])
+            self.assertTrue(all(r['source_conn_id'] is None for r in res))
+            return
+
+        # Every worker compares on connections of its own and releases
+        # them even if the comparison failed.
+        self.assertEqual(len(source.conn_ids), 4)
+        self.assertEqual(len(set(source.conn_ids)), 4)
+        self.assertEqual(sorted(source.released), sorted(source.conn_ids))
+        self.assertEqual(sorted(target.released), sorted(target.conn_ids))
+        if not self.failed_unit:
+            self.assertTrue(all(r['source_conn_id'] in source.conn_ids and
+                                r['target_conn_id'] in target.conn_ids
+                                for r in res))
+            self.assertGreater(len(set(r['source_conn_id'] for r in res)), 1)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.request_context.pop()
@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import inspect
+import json
+import os
+import secrets
+import sys
+import uuid
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
+    import BaseTableView
+from pgadmin.tools.schema_diff.snapshot import SchemaDiffSnapshot
+from . import test_schema_diff_comp
+
+# Methods fetching the properties of all the objects of a database, a
+# schema or a table at once. The objects they do not return are fetched
+# one by one.
+BULK_METHODS = ('_fetch_database_properties', '_fetch_schema_properties',
+                '_fetch_table_properties', '_fetch_tables_to_compare')
+
+
+def get_bulk_methods():
+    """
+    This function returns the node views defining a method fetching the
+    properties in bulk, with the name of the method.
+    """
+    methods = []
+    for name, module in list(sys.modules.items()):
+        if not name.startswith('pgadmin.browser.') or '.tests' in name:
+            continue
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != name:
+                continue
+            # _fetch_table_properties() of the tables fetches the properties
+            # of a single table.
+            methods += [(cls, method) for method in BULK_METHODS
+                        if method in cls.__dict__ and not (
+                            cls is BaseTableView and
+                            method == '_fetch_table_properties')]
+    return methods
+
+
+class SchemaDiffBulkPropertiesTestCase(
+        test_schema_diff_comp.SchemaDiffTestCase):
+    """
+    This class will test that the objects compared by the schema diff are
+    the same when their properties are fetched in bulk and one by one.
+    """
+    scenarios = [
+        ('Schema diff bulk properties', dict(
+            url='schema_diff/snapshot/{0}/{1}/{2}'))
+    ]
+
+    def take_snapshot(self, db_id):
+        filename = 'schema_diff_bulk_{0}.json.gz'.format(
+            str(uuid.uuid4())[1:8])
+        response = self.tester.post(
+            self.url.format(self.trans_id, self.server_id, db_id),
+            data=json.dumps({'filename': filename}),
+            content_type='html/json')
+        self.assertEqual(response.status_code, 200)
+
+        filename = json.loads(response.data.decode('utf-8'))['data'][
+            'filename']
+        try:
+            return SchemaDiffSnapshot.load(filename)
+        finally:
+            os.remove(filename)
+
+    def assert_same_objects(self, bulk, fallback):
+        self.assertEqual(sorted(bulk), sorted(fallback))
+        for node_type, objects in bulk.items():
+            self.assertEqual(sorted(objects), sorted(fallback[node_type]),
+                             node_type)
+            for name, obj in objects.items():
+                for key in ('data', 'ddl'):
+                    self.assertEqual(obj[key], fallback[node_type][name][key],
+                                     '{0} {1}'.format(node_type, name))
+
+    def runTest(self):
+        """ This function will test the bulk properties."""
+        self.assertEqual(True, self.restored_backup)
+        self.trans_id = str(secrets.choice(range(1, 99999)))
+        response = self.tester.get(
+            'schema_diff/initialize/{}'.format(self.trans_id))
+        self.assertEqual(response.status_code, 200)
+
+        url = 'schema_diff/server/connect/{}'.format(self.server_id)
+        data = {'password': self.server['db_password']}
+        self.tester.post(url, data=json.dumps(data), content_type='html/json')
+
+        methods = get_bulk_methods()
+        self.assertNotEqual(methods, [])
+
+        for db_id in (self.src_db_id, self.tar_db_id):
+            self.tester.post('schema_diff/database/connect/{0}/{1}'.format(
+                self.server_id, db_id))
+
+            bulk = self.take_snapshot(db_id)
+            with ExitStack() as stack:
+                for cls, method in methods:
+                    stack.enter_context(
+                        patch.object(cls, method, return_value=dict()))
+                fallback = self.take_snapshot(db_id)
+
+            self.assertNotEqual(bulk.schemas, dict())
+            self.assert_same_objects(bulk.database_objects,
+                                     fallback.database_objects)
+            self.assertEqual(sorted(bulk.schemas), sorted(fallback.schemas))
+            for schema_name, objects in bulk.schemas.items():
+                self.assert_same_objects(objects,
+                                         fallback.schemas[schema_name])
@@ -0,0 +1,362 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+import gzip
+import os
+import tempfile
+from decimal import Decimal
+from unittest.mock import patch
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    schema_diff_table_utils import SchemaDiffTableCompare
+from pgadmin.tools.schema_diff import directory_compare
+from pgadmin.tools.schema_diff.compare import SchemaDiffObjectCompare
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.tools.schema_diff.snapshot import SchemaDiffSnapshot
+from pgadmin.utils.route import BaseTestGenerator
+
+
+def _function(oid, name, src='SELECT 1', **kwargs):
+    function = {'oid': oid, 'name': name, 'prosrc': src,
+                'procost': Decimal('100'), 'description': '',
+                'arguments': [{'argid': 1, 'argname': 'a'},
+                              {'argid': 0, 'argname': 'b'}],
+                'acl': [{'grantee': 'app', 'privileges': ['X']}]}
+    function.update(kwargs)
+    return function
+
+
+# Functions of the database the snapshot is taken from, the live database
+# is compared with it.
+SNAPSHOT_FUNCTIONS = {
+    'f1': _function(1, 'f1'),
+    'f2': _function(2, 'f2', 'SELECT 2'),
+    'f3': _function(3, 'f3'),
+}
+LIVE_FUNCTIONS = {
+    'f1': _function(11, 'f1', description=None,
+                    arguments=[{'argid': 0, 'argname': 'b'},
+                               {'argid': 1, 'argname': 'a'}]),
+    'f2': _function(12, 'f2', 'SELECT 22'),
+    'f4': _function(14, 'f4'),
+}
+
+
+class _Blueprint:
+    collection_label = 'Functions'
+
+
+class _FunctionView(SchemaDiffObjectCompare):
+    """Node view rendering the DDL of the live functions."""
+    node_type = 'function'
+    blueprint = _Blueprint()
+    keys_to_ignore = SchemaDiffObjectCompare.keys_to_ignore
+    conn = None
+
+    def __init__(self, functions):
+        self.functions = functions
+        self.fetched = []
+
+    def fetch_objects_to_compare(self, sid, did, scid):
+        self.fetched.append(sid)
+        return copy.deepcopy(self.functions)
+
+    def get_sql_from_diff(self, **kwargs):
+        if kwargs.get('drop_sql'):
+            return 'DROP {0}'.format(kwargs['oid'])
+        if 'data' in kwargs:
+            return 'ALTER {0} {1}'.format(kwargs['oid'],
+                                          sorted(kwargs['data']))
+        return 'CREATE {0}'.format(kwargs['oid'])
+
+    def get_dependencies(self, conn, oid, **kwargs):
+        return [oid]
+
+
+def _table(oid, name, description, indexes):
+    return {'oid': oid, 'name': name, 'description': description,
+            'columns': [], 'index': indexes}
+
+
+def _index(oid, name, amname='btree'):
+    return {'oid': oid, 'name': name, 'amname': amname}
+
+
+# Tables of the database the snapshot is taken from, the live database is
+# compared with it.
+SNAPSHOT_TABLES = {
+    't1': _table(1, 't1', 'baseline', {'i1': _index(101, 'i1'),
+                                       'i2': _index(102, 'i2')}),
+}
+LIVE_TABLES = {
+    't1': _table(11, 't1', 'live', {'i2': _index(112, 'i2', 'hash'),
+                                    'i3': _index(113, 'i3')}),
+}
+
+
+class _Module:
+    def __init__(self, node_type):
+        self.node_type = node_type
+
+
+class _TableBlueprint:
+    collection_label = 'Tables'
+    submodules = [_Module('column'), _Module('index')]
+
+
+class _Manager:
+    server_type = 'pg'
+    version = 170000
+
+
+class _IndexView:
+    """Node view rendering the DDL of the live indexes."""
+
+    def ddl_compare(self, **kwargs):
+        comp_status = kwargs['comp_status']
+        if comp_status == 'source_only':
+            return 'CREATE INDEX {0}.{1}'.format(
+                kwargs['source_params']['tid'], kwargs['source']['oid'])
+        if comp_status == 'target_only':
+            return 'DROP INDEX {0}'.format(kwargs['target']['oid'])
+        if kwargs.get('source_ddl') is not None:
+            return 'DROP INDEX {0}\n{1}'.format(kwargs['target']['oid'],
+                                                kwargs['source_ddl'])
+        return 'ALTER INDEX {0}'.format(kwargs['target']['oid'])
+
+
+class _TableView(SchemaDiffTableCompare):
+    """Node view rendering the DDL of the live tables."""
+    node_type = 'table'
+    blueprint = _TableBlueprint()
+    manager = _Manager()
+    conn = None
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def fetch_tables(self, sid, did, scid, with_serial_cols=False):
+        return copy.deepcopy(self.tables)
+
+    def get_sql_from_table_diff(self, **kwargs):
+        if 'diff_data' in kwargs:
+            return 'ALTER TABLE {0}'.format(kwargs['tid'])
+        return 'CREATE TABLE {0}'.format(kwargs['tid'])
+
+    def get_drop_sql(self, **kwargs):
+        return 'DROP TABLE {0}'.format(kwargs['tid'])
+
+    def get_table_submodules_dependencies(self, **kwargs):
+        return []
+
+
+class SchemaDiffObjectHashTestCase(BaseTestGenerator):
+    """This class tests the hash of the objects compared by schema diff."""
+    scenarios = [
+        ('Lists in another order', dict(
+            target=dict(arguments=[{'argid': 0, 'argname': 'b'},
+                                   {'argid': 1, 'argname': 'a'}]),
+            ignore_whitespaces=False, identical=True)),
+        ('Ignored key different', dict(
+            target=dict(schema='other'), ignore_whitespaces=False,
+            identical=True)),
+        ('Empty string and None', dict(
+            target=dict(description=None), ignore_whitespaces=False,
+            identical=True)),
+        ('Whitespaces ignored', dict(
+            target=dict(prosrc='SELECT  1\n'), ignore_whitespaces=True,
+            identical=True)),
+        ('Whitespaces not ignored', dict(
+            target=dict(prosrc='SELECT  1\n'), ignore_whitespaces=False,
+            identical=False)),
+        ('Value of another type', dict(
+            target=dict(procost='100'), ignore_whitespaces=False,
+            identical=False)),
+        ('Key of a list item different', dict(
+            target=dict(acl=[{'grantee': 'app', 'privileges': ['X', 'C']}]),
+            ignore_whitespaces=False, identical=False)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        source = _function(1, 'f1')
+        target = _function(1, 'f1', **self.target)
+        ignore_keys = SchemaDiffObjectCompare.keys_to_ignore
+
+        self.assertEqual(
+            directory_compare.are_dictionaries_identical(
+                copy.deepcopy(source), copy.deepcopy(target), ignore_keys,
+                self.ignore_whitespaces), self.identical)
+        self.assertEqual(
+            directory_compare.get_object_hash(
+                source, ignore_keys, self.ignore_whitespaces) ==
+            directory_compare.get_object_hash(
+                target, ignore_keys, self.ignore_whitespaces),
+            self.identical)
+
+
+class SchemaDiffSnapshotTestCase(BaseTestGenerator):
+    """This class tests the comparison of a database with a snapshot."""
+    scenarios = [
+        ('Snapshot as source', dict(snapshot_side='source')),
+        ('Snapshot as target', dict(snapshot_side='target')),
+    ]
+
+    def setUp(self):
+        self.patches = [
+            patch.object(_FunctionView, 'get_schema', staticmethod(
+                lambda sid, did, scid: (True, 'public'))),
+        ]
+        for p in self.patches:
+            p.start()
+        self.filename = os.path.join(tempfile.mkdtemp(), 'snapshot.json.gz')
+
+    def _take_snapshot(self):
+        snapshot = SchemaDiffSnapshot('pg', 170000, 'baseline')
+        snapshot.add_objects(_FunctionView(SNAPSHOT_FUNCTIONS),
+                             {'sid': 1, 'did': 1, 'scid': 10}, 'public')
+        snapshot.save(self.filename)
+        return SchemaDiffSnapshot.load(self.filename)
+
+    def runTest(self):
+        snapshot = self._take_snapshot()
+        self.assertEqual(snapshot.get_schemas(),
+                         [{'label': 'public', '_id': 'public'}])
+        f1 = snapshot.get_objects('function', 'public')['f1']
+        self.assertEqual(f1['ddl'], 'CREATE 1')
+        self.assertEqual(f1['drop_ddl'], 'DROP 1')
+        self.assertEqual(f1['data']['procost'], '100')
+
+        live_view = _FunctionView(LIVE_FUNCTIONS)
+        if self.snapshot_side == 'source':
+            kwargs = dict(source_sid=None, source_did=None,
+                          source_scid='public', source_snapshot=snapshot,
+                          target_sid=2, target_did=2, target_scid=20)
+        else:
+            kwargs = dict(source_sid=2, source_did=2, source_scid=20,
+                          target_sid=None, target_did=None,
+                          target_scid='public', target_snapshot=snapshot)
+
+        with patch.object(directory_compare, 'are_dictionaries_identical',
+                          wraps=directory_compare.are_dictionaries_identical
+                          ) as are_identical:
+            res = live_view.compare(group_name='public', **kwargs)
+
+        # Only the live database is read and only the objects whose hash
+        # differ are walked.
+        self.assertEqual(live_view.fetched, [2])
+        self.assertEqual(are_identical.call_count, 1)
+
+        res = dict((r['title'], r) for r in res)
+        self.assertEqual(res['f1']['status'], 'Identical')
+        # The snapshot side of an identical object comes with its DDL
+        self.assertEqual(res['f1'][self.snapshot_side + '_ddl'], 'CREATE 1')
+        self.assertEqual(res['f1'][self.snapshot_side + '_scid'], 0)
+        live_side = 'target' if self.snapshot_side == 'source' else 'source'
+        self.assertNotIn(live_side + '_ddl', res['f1'])
+        self.assertEqual(res['f1'][live_side + '_scid'], 20)
+        self.assertEqual(res['f2']['status'], 'Different')
+        if self.snapshot_side == 'source':
+            self.assertEqual(res['f3']['status'], 'Source Only')
+            self.assertEqual(res['f3']['source_ddl'], 'CREATE 3')
+            self.assertEqual(res['f3']['dependencies'], [3])
+            self.assertEqual(res['f4']['status'], 'Target Only')
+            self.assertEqual(res['f4']['diff_ddl'], 'DROP 14')
+            self.assertEqual(res['f2']['source_ddl'], 'CREATE 2')
+            self.assertEqual(res['f2']['target_ddl'], 'CREATE 12')
+            self.assertEqual(res['f2']['diff_ddl'], "ALTER 12 ['prosrc']")
+        else:
+            self.assertEqual(res['f4']['status'], 'Source Only')
+            self.assertEqual(res['f4']['source_ddl'], 'CREATE 14')
+            self.assertEqual(res['f3']['status'], 'Target Only')
+            self.assertEqual(res['f3']['target_ddl'], 'CREATE 3')
+            self.assertEqual(res['f3']['diff_ddl'], 'DROP 3')
+            self.assertEqual(res['f2']['source_ddl'], 'CREATE 12')
+            self.assertEqual(res['f2']['target_ddl'], 'CREATE 2')
+            # The UI tells why there is no difference script
+            self.assertEqual(res['f2']['diff_ddl'], '')
+            self.assertIn('diff_message', res['f2'])
+
+        # Invalid snapshots
+        with gzip.open(self.filename, 'wt') as snapshot_file:
+            snapshot_file.write('{"format": "other"}')
+        with self.assertRaises(ValueError):
+            SchemaDiffSnapshot.load(self.filename)
+        with open(self.filename, 'w') as snapshot_file:
+            snapshot_file.write('not compressed')
+        with self.assertRaises(ValueError):
+            SchemaDiffSnapshot.load(self.filename)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        os.remove(self.filename)
+        os.rmdir(os.path.dirname(self.filename))
+
+
+class SchemaDiffSnapshotTableTestCase(BaseTestGenerator):
+    """This class tests the difference of a table compared with a
+    snapshot."""
+    scenarios = [
+        ('Snapshot as source', dict(snapshot_side='source')),
+        ('Snapshot as target', dict(snapshot_side='target')),
+    ]
+
+    def setUp(self):
+        index_view = _IndexView()
+        self.patches = [
+            patch.object(_TableView, 'get_schema', staticmethod(
+                lambda sid, did, scid: (True, 'public'))),
+            patch.object(SchemaDiffRegistry, 'get_node_view',
+                         staticmethod(lambda node_type: index_view)),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def runTest(self):
+        snapshot = SchemaDiffSnapshot('pg', 170000, 'baseline')
+        snapshot.add_objects(_TableView(SNAPSHOT_TABLES),
+                             {'sid': 1, 'did': 1, 'scid': 10}, 'public')
+        # The DDL of the child objects is saved with the table
+        self.assertEqual(
+            snapshot.get_objects('table', 'public')['t1']['child_ddl'],
+            {'index': {'i1': 'CREATE INDEX 1.101',
+                       'i2': 'CREATE INDEX 1.102'}})
+
+        if self.snapshot_side == 'source':
+            kwargs = dict(source_sid=None, source_did=None,
+                          source_scid='public', source_snapshot=snapshot,
+                          target_sid=2, target_did=2, target_scid=20)
+        else:
+            kwargs = dict(source_sid=2, source_did=2, source_scid=20,
+                          target_sid=None, target_did=None,
+                          target_scid='public', target_snapshot=snapshot)
+        res = _TableView(LIVE_TABLES).compare(group_name='public', **kwargs)
+
+        self.assertEqual(len(res), 1)
+        self.assertEqual(res[0]['status'], 'Different')
+        if self.snapshot_side == 'source':
+            # Rendered from the live target and the saved child objects
+            self.assertEqual(res[0]['source_ddl'], 'CREATE TABLE 1')
+            self.assertEqual(res[0]['target_ddl'], 'CREATE TABLE 11')
+            self.assertEqual(res[0]['diff_ddl'],
+                             'ALTER TABLE 11\nCREATE INDEX 1.101'
+                             '\nDROP INDEX 113\nDROP INDEX 112\n'
+                             'CREATE INDEX 1.102')
+            self.assertNotIn('diff_message', res[0])
+        else:
+            self.assertEqual(res[0]['diff_ddl'], '')
+            self.assertIn('diff_message', res[0])
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
@@ -29,6 +29,8 @@ from flask_babel import gettext
 from pgadmin.tools.sqleditor.utils.query_tool_connection_check \
     import query_tool_connection_check
 from pgadmin.user_login_check import pga_login_required
+from pgadmin import socketio
+from pgadmin.authenticate import socket_login_required
 from flask_security import current_user
 from pgadmin.misc.file_manager import Filemanager
 from pgadmin.tools.sqleditor.command import QueryToolCommand, ObjectRegistry, \
@@ -37,13 +39,18 @@ from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
     ASYNC_EXECUTION_ABORTED, \
     CONNECTION_STATUS_MESSAGE_MAPPING, TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.start_running_query import StartRunningQuery
-from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
-    update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    register_transaction, load_transaction, update_transaction, \
+    persist_transaction, remove_transaction, get_serialization_time, \
+    SERIALIZATION_METRIC
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
+from pgadmin.utils.csv_export import gzip_chunks
 from pgadmin.utils.ajax import make_json_response, bad_request, \
     success_return, internal_server_error, service_unavailable
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils.driver.abstract import ROW_FORMAT_DICT, \
+    ROW_FORMAT_TUPLE, ROW_FORMAT_COLUMNAR, ROW_FORMATS, to_columnar
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost, \
     CryptKeyMissing, ObjectGone
 from pgadmin.browser.utils import underscore_unescape, underscore_escape
@@ -55,6 +62,11 @@ from pgadmin.tools.sqleditor.utils.query_tool_fs_utils import \
     read_file_generator
 from pgadmin.tools.sqleditor.utils.filter_dialog import FilterDialog
 from pgadmin.tools.sqleditor.utils.query_history import QueryHistory
+from pgadmin.tools.sqleditor.utils.pg_type_cache import get_pg_types
+from pgadmin.tools.sqleditor.utils.query_result_push import \
+    SOCKETIO_NAMESPACE, subscribe, unsubscribe, pop_result, clear_results
+from pgadmin.tools.sqleditor.utils.result_cache import get_cached_rows, \
+    add_fetched_rows, evict_result_cache
 from pgadmin.tools.sqleditor.utils.macros import get_macros, \
     get_user_macros, set_macros
 from pgadmin.utils.constants import MIMETYPE_APP_JS, \
@@ -76,6 +88,8 @@ TRANSACTION_STATUS_CHECK_FAILED = gettext("Transaction status check failed.")
 _NODES_SQL = 'nodes.sql'
 sqleditor_close_session_lock = Lock()
 auto_complete_objects = dict()
+# Lock of the SQLAutoComplete object, by transaction id
+auto_complete_locks = dict()
 
 
 class SqlEditorModule(PgAdminModule):
@@ -170,6 +184,20 @@ class SqlEditorModule(PgAdminModule):
 blueprint = SqlEditorModule(MODULE_NAME, __name__, static_url_path='/static')
 
 
+@blueprint.after_request
+def add_serialization_timing(response):
+    """
+    Reports the time spent pickling and unpickling the command objects of the
+    transactions in the Server-Timing header.
+    """
+    serialization_time = get_serialization_time()
+    if serialization_time is not None:
+        response.headers.add(
+            'Server-Timing', '{0};dur={1:.3f}'.format(
+                SERIALIZATION_METRIC, serialization_time * 1000))
+    return response
+
+
 @blueprint.route('/')
 @pga_login_required
 def index():
@@ -266,8 +294,10 @@ def initialize_viewdata(trans_id, cmd_type, obj_type, sgid, sid, did, obj_id):
     # and data_sorting keys of the filter dialog into the
     # newly created command object.
     if str(trans_id) in sql_grid_data:
-        old_trans_obj = pickle.loads(
-            sql_grid_data[str(trans_id)]['command_obj'])
+        # Store the changes of the restored transaction first
+        persist_transaction(trans_id)
+        _, old_trans_obj = load_transaction(
+            trans_id, sql_grid_data[str(trans_id)])
         if old_trans_obj.did == did and old_trans_obj.obj_id == obj_id:
             command_obj.set_filter(old_trans_obj._row_filter)
             command_obj.set_data_sorting(
@@ -282,6 +312,8 @@ def initialize_viewdata(trans_id, cmd_type, obj_type, sgid, sid, did, obj_id):
 
     # Store the grid dictionary into the session variable
     session['gridData'] = sql_grid_data
+    register_transaction(trans_id, dict(sql_grid_data[str(trans_id)]),
+                         command_obj)
 
     return make_json_response(
         data={
@@ -548,6 +580,8 @@ def _init_sqleditor(trans_id, connect, sgid, sid, did, dbname=None, **kwargs):
 
     # Store the grid dictionary into the session variable
     session['gridData'] = sql_grid_data
+    register_transaction(trans_id, dict(sql_grid_data[str(trans_id)]),
+                         command_obj)
 
     return False, '', conn_id, manager.version
 
@@ -639,8 +673,8 @@ def close(trans_id):
     """
     with sqleditor_close_session_lock:
         # delete the SQLAutoComplete object
-        if trans_id in auto_complete_objects:
-            del auto_complete_objects[trans_id]
+        auto_complete_objects.pop(trans_id, None)
+        auto_complete_locks.pop(trans_id, None)
 
         if 'gridData' not in session:
             return make_json_response(data={'status': True})
@@ -706,10 +740,16 @@ def close_sqleditor_session(trans_id):
     :param trans_id: Transaction id
     :return:
     """
+    try:
+        evict_result_cache(trans_id)
+    except Exception as e:
+        current_app.logger.error(e)
+    clear_results(trans_id)
+
     if 'gridData' in session and str(trans_id) in session['gridData']:
-        cmd_obj_str = session['gridData'][str(trans_id)]['command_obj']
-        # Use pickle.loads function to get the command object
-        cmd_obj = pickle.loads(cmd_obj_str)
+        _, cmd_obj = load_transaction(
+            trans_id, session['gridData'][str(trans_id)])
+        remove_transaction(trans_id)
 
         # if connection id is None then no need to release the connection
         if cmd_obj.conn_id is not None:
@@ -766,9 +806,8 @@ def check_transaction_status(trans_id, auto_comp=False):
         return False, ERROR_MSG_TRANS_ID_NOT_FOUND, None, None, None
 
     # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
-    session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    session_obj, trans_obj = load_transaction(
+        trans_id, grid_data[str(trans_id)])
 
     if auto_comp:
         conn_id = trans_obj.conn_id_ac
@@ -863,8 +902,6 @@ def start_view_data(trans_id):
         sql = trans_obj.get_sql(default_conn)
         _, primary_keys = trans_obj.get_primary_keys(default_conn)
 
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-
         has_oids = False
         if trans_obj.object_type == 'table':
             # Fetch OIDs status
@@ -885,7 +922,7 @@ def start_view_data(trans_id):
         # Store the OIDs status into session object
         session_obj['has_oids'] = has_oids
 
-        update_session_grid_transaction(trans_id, session_obj)
+        update_transaction(trans_id, session_obj, trans_obj)
 
         # Execute sql asynchronously
         status, result = conn.execute_async(sql)
@@ -958,6 +995,18 @@ def poll(trans_id):
     Args:
         trans_id: unique transaction id
     """
+    return poll_result(trans_id)
+
+
+def poll_result(trans_id, query_thread=False):
+    """
+    This method returns the poll response of the asynchronous query.
+
+    Args:
+        trans_id: unique transaction id
+        query_thread: True when called by the query thread, once the query
+            completed, to push the response to the client
+    """
     result = None
     rows_affected = 0
     rows_fetched_from = 0
@@ -987,7 +1036,7 @@ def poll(trans_id):
                                   status=404)
 
     is_thread_alive = False
-    if trans_obj.get_thread_native_id():
+    if not query_thread and trans_obj.get_thread_native_id():
         for thread in threading.enumerate():
             _native_id = thread.native_id if hasattr(thread, 'native_id'
                                                      ) else thread.ident
@@ -996,6 +1045,12 @@ def poll(trans_id):
                 is_thread_alive = True
                 break
 
+    # The response already pushed by the query thread
+    if not is_thread_alive and not query_thread:
+        response = pop_result(trans_id)
+        if response is not None:
+            return response
+
     # if transaction object is instance of QueryToolCommand
     # and transaction aborted for some reason then issue a
     # rollback to cleanup
@@ -1067,9 +1122,6 @@ def poll(trans_id):
                         trans_obj.check_updatable_results_pkeys_oids():
                     _, primary_keys = trans_obj.get_primary_keys()
                     session_obj['has_oids'] = trans_obj.has_oids()
-                    # Update command_obj in session obj
-                    session_obj['command_obj'] = pickle.dumps(
-                        trans_obj, -1)
                     # If primary_keys exist, add them to the session_obj to
                     # allow for saving any changes to the data
                     if primary_keys is not None:
@@ -1101,10 +1153,9 @@ def poll(trans_id):
                         return internal_server_error(types)
 
                     for col_name, col_info in columns.items():
-                        for col_type in types:
-                            if col_type['oid'] == col_info['type_code']:
-                                typname = col_type['typname']
-                                col_info['type_name'] = typname
+                        typname = types.get(col_info['type_code'])
+                        if typname is not None:
+                            col_info['type_name'] = typname
 
                         # Using characters %, (, ) in the argument names is not
                         # supported in psycopg
@@ -1113,6 +1164,9 @@ def poll(trans_id):
                             encode('unicode_escape').decode('utf-8')
 
                     session_obj['columns_info'] = columns
+                    types = [{'oid': oid, 'typname': typname}
+                             for oid, typname in sorted(types.items())
+                             if typname is not None]
 
                 # status of async_fetchmany_2darray is True and result is none
                 # means nothing to fetch
@@ -1121,16 +1175,17 @@ def poll(trans_id):
 
                     if res_len > 0:
                         rows_fetched_from = trans_obj.get_fetched_row_cnt()
+                        # The first page starts the local cache of the result
+                        _add_fetched_rows(trans_id, conn, rows_fetched_from,
+                                          result, ROW_FORMAT_TUPLE)
                         trans_obj.update_fetched_row_cnt(
                             rows_fetched_from + res_len)
                         rows_fetched_from += 1
                         rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                        session_obj['command_obj'] = pickle.dumps(
-                            trans_obj, -1)
 
                 # As we changed the transaction object we need to
-                # restore it and update the session variable.
-                update_session_grid_transaction(trans_id, session_obj)
+                # update the transaction registry.
+                update_transaction(trans_id, session_obj, trans_obj)
 
             # Procedure/Function output may comes in the form of Notices
             # from the database server, so we need to append those outputs
@@ -1191,6 +1246,58 @@ def poll(trans_id):
     )
 
 
+def _get_row_format():
+    """
+    Returns the row format requested for the result, a tuple per row by
+    default or a list of values per column with ?row_format=columnar.
+    """
+    row_format = request.args.get('row_format', ROW_FORMAT_TUPLE)
+    return row_format if row_format in ROW_FORMATS else None
+
+
+def _get_cached_rows(trans_id, conn, from_rownum, to_rownum, row_format):
+    """
+    Returns the rows from the local cache of the query result, or None
+    when the rows are to be fetched from the cursor. Rows are cached as
+    tuples, the dict format is always fetched from the cursor.
+    """
+    if row_format == ROW_FORMAT_DICT:
+        return None
+    try:
+        rows = get_cached_rows(trans_id, conn, from_rownum, to_rownum)
+    except Exception as e:
+        current_app.logger.warning(
+            'Could not read the cached query result: {0}'.format(e))
+        return None
+    if rows is not None and row_format == ROW_FORMAT_COLUMNAR:
+        return to_columnar(rows, len(rows[0]) if rows else 0)
+    return rows
+
+
+def _add_fetched_rows(trans_id, conn, from_rownum, result, row_format):
+    """
+    Adds the rows fetched from the cursor to the local cache of the query
+    result.
+    """
+    if row_format == ROW_FORMAT_DICT or not isinstance(result, list):
+        return
+    rows = list(zip(*result)) if row_format == ROW_FORMAT_COLUMNAR \
+        else result
+    try:
+        add_fetched_rows(trans_id, conn, from_rownum, rows)
+    except Exception as e:
+        current_app.logger.warning(
+            'Could not cache the query result: {0}'.format(e))
+
+
+def _result_row_count(result, row_format):
+    if not result:
+        return 0
+    if row_format == ROW_FORMAT_COLUMNAR:
+        return len(result[0])
+    return len(result)
+
+
 @blueprint.route(
     '/fetch_window/<int:trans_id>/<int:from_rownum>/<int:to_rownum>',
     methods=["GET"], endpoint='fetch_window'
@@ -1201,6 +1308,12 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
     rows_fetched_from = 0
     rows_fetched_to = 0
 
+    row_format = _get_row_format()
+    if row_format is None:
+        return bad_request(
+            errormsg=gettext('Invalid row format: {0}').format(
+                request.args.get('row_format')))
+
     # Check the transaction and connection status
     status, error_msg, conn, trans_obj, session_obj = \
         check_transaction_status(trans_id)
@@ -1212,19 +1325,27 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
 
     if status and conn is not None and session_obj is not None:
         # rownums start from 0 but UI will ask from 1
-        status, result = conn.async_fetchmany_2darray(
-            records=None, from_rownum=from_rownum - 1, to_rownum=to_rownum - 1)
+        result = _get_cached_rows(trans_id, conn, from_rownum - 1,
+                                  to_rownum - 1, row_format)
+        if result is not None:
+            status = True
+        else:
+            status, result = conn.async_fetchmany_2darray(
+                records=None, from_rownum=from_rownum - 1,
+                to_rownum=to_rownum - 1, row_format=row_format)
+            if status:
+                _add_fetched_rows(trans_id, conn, from_rownum - 1, result,
+                                  row_format)
         if not status:
             status = 'Error'
         else:
             status = 'Success'
-            res_len = len(result) if result else 0
+            res_len = _result_row_count(result, row_format)
 
             if res_len:
                 rows_fetched_from = from_rownum
                 rows_fetched_to = rows_fetched_from + res_len - 1
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-                update_session_grid_transaction(trans_id, session_obj)
+                update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = 'NotConnected'
         result = error_msg
@@ -1242,6 +1363,7 @@ def fetch_window(trans_id, from_rownum=0, to_rownum=0):
         data={
             'status': status,
             'result': result,
+            'row_format': row_format,
             'pagination': pagination,
             'row_count': conn.row_count,
         }
@@ -1258,6 +1380,12 @@ def fetch_all_from_start(trans_id, limit=-1):
     This function is used to fetch all the records from start and reset
     the cursor back to it's previous position.
     """
+    row_format = _get_row_format()
+    if row_format is None:
+        return bad_request(
+            errormsg=gettext('Invalid row format: {0}').format(
+                request.args.get('row_format')))
+
     # Check the transaction and connection status
     status, error_msg, conn, trans_obj, session_obj = \
         check_transaction_status(trans_id)
@@ -1268,17 +1396,24 @@ def fetch_all_from_start(trans_id, limit=-1):
                                   status=404)
 
     if status and conn is not None and session_obj is not None:
-        # Reset the cursor to start to fetch all the records.
-        conn.reset_cursor_at(0)
-
-        status, result = conn.async_fetchmany_2darray(limit)
-        if not status:
-            status = 'Error'
-        else:
+        result = _get_cached_rows(
+            trans_id, conn, 0, None if limit == -1 else limit - 1,
+            row_format)
+        if result is not None:
             status = 'Success'
+        else:
+            # Reset the cursor to start to fetch all the records.
+            conn.reset_cursor_at(0)
 
-        # Reset the cursor back to it's actual position
-        conn.reset_cursor_at(trans_obj.get_fetched_row_cnt())
+            status, result = conn.async_fetchmany_2darray(
+                limit, row_format=row_format)
+            if not status:
+                status = 'Error'
+            else:
+                status = 'Success'
+
+            # Reset the cursor back to it's actual position
+            conn.reset_cursor_at(trans_obj.get_fetched_row_cnt())
     else:
         status = 'NotConnected'
         result = error_msg
@@ -1286,7 +1421,8 @@ def fetch_all_from_start(trans_id, limit=-1):
     return make_json_response(
         data={
             'status': status,
-            'result': result
+            'result': result,
+            'row_format': row_format
         }
     )
 
@@ -1294,10 +1430,13 @@ def fetch_all_from_start(trans_id, limit=-1):
 def fetch_pg_types(columns_info, trans_obj):
     """
     This method is used to fetch the pg types, which is required
-    to map the data type comes as a result of the query.
+    to map the data type comes as a result of the query. The type names
+    are cached per connection, see pg_type_cache.
 
     Args:
         columns_info:
+
+    Returns: status, dict of the type names by OID or error message
     """
 
     # get the default connection as current connection attached to trans id
@@ -1309,7 +1448,6 @@ def fetch_pg_types(columns_info, trans_obj):
                                       did=trans_obj.did)
 
     # Connect to the Server if not connected.
-    res = []
     if not default_conn.connected():
         status, msg = default_conn.connect()
         if not status:
@@ -1318,17 +1456,9 @@ def fetch_pg_types(columns_info, trans_obj):
     oids = [columns_info[col]['type_code'] for col in columns_info]
 
     if oids:
-        status, res = default_conn.execute_dict(
-            "SELECT oid, pg_catalog.format_type(oid, NULL) AS typname FROM "
-            "pg_catalog.pg_type WHERE oid = ANY(%s) ORDER BY oid;", [oids]
-        )
-
-        if not status:
-            return False, res
-
-        return status, res['rows']
+        return get_pg_types(default_conn, oids)
     else:
-        return True, []
+        return True, dict()
 
 
 def generate_client_primary_key_name(columns_info):
@@ -1495,9 +1625,8 @@ def append_filter_inclusive(trans_id):
         trans_obj.append_filter(filter_sql)
 
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-        update_session_grid_transaction(trans_id, session_obj)
+        # update the transaction registry.
+        update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = False
         res = error_msg
@@ -1551,9 +1680,8 @@ def append_filter_exclusive(trans_id):
         trans_obj.append_filter(filter_sql)
 
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-        update_session_grid_transaction(trans_id, session_obj)
+        # update the transaction registry.
+        update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = False
         res = error_msg
@@ -1592,9 +1720,8 @@ def remove_filter(trans_id):
         trans_obj.remove_filter()
 
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-        update_session_grid_transaction(trans_id, session_obj)
+        # update the transaction registry.
+        update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = False
         res = error_msg
@@ -1636,9 +1763,8 @@ def set_limit(trans_id):
         trans_obj.set_limit(limit)
 
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-        update_session_grid_transaction(trans_id, session_obj)
+        # update the transaction registry.
+        update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = False
         res = error_msg
@@ -1709,9 +1835,8 @@ def cancel_transaction(trans_id):
             info='DATAGRID_TRANSACTION_REQUIRED', status=404)
 
     # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
-    session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    session_obj, trans_obj = load_transaction(
+        trans_id, grid_data[str(trans_id)])
 
     if trans_obj is not None and session_obj is not None:
 
@@ -1789,7 +1914,8 @@ def check_and_upgrade_to_qt(trans_id, connect):
     errmsg = None
 
     if 'gridData' in session and str(trans_id) in session['gridData']:
-        data = pickle.loads(session['gridData'][str(trans_id)]['command_obj'])
+        _, data = load_transaction(
+            trans_id, session['gridData'][str(trans_id)])
         if data.object_type in ['table', 'foreign_table', 'view', 'mview']:
             manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
                 data.sid)
@@ -1850,9 +1976,8 @@ def set_auto_commit(trans_id):
         trans_obj.set_auto_commit(auto_commit)
 
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-        update_session_grid_transaction(trans_id, session_obj)
+        # update the transaction registry.
+        update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = False
         res = error_msg
@@ -1903,9 +2028,8 @@ def set_auto_rollback(trans_id):
         trans_obj.set_auto_rollback(auto_rollback)
 
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-        update_session_grid_transaction(trans_id, session_obj)
+        # update the transaction registry.
+        update_transaction(trans_id, session_obj, trans_obj)
     else:
         status = False
         res = error_msg
@@ -1957,15 +2081,23 @@ def auto_complete(trans_id):
     if status and conn is not None and \
             trans_obj is not None and session_obj is not None:
 
+        # The global lock is only held to get the lock of the transaction,
+        # the completions of the other query tools are computed meanwhile.
         with sqleditor_close_session_lock:
-            if trans_id not in auto_complete_objects:
+            auto_complete_lock = auto_complete_locks.setdefault(
+                trans_id, Lock())
+
+        with auto_complete_lock:
+            auto_complete_obj = auto_complete_objects.get(trans_id)
+            if auto_complete_obj is None:
                 # Create object of SQLAutoComplete class and pass
                 # connection object
-                auto_complete_objects[trans_id] = \
+                auto_complete_obj = \
                     SQLAutoComplete(sid=trans_obj.sid, did=trans_obj.did,
                                     conn=conn)
+                with sqleditor_close_session_lock:
+                    auto_complete_objects[trans_id] = auto_complete_obj
 
-            auto_complete_obj = auto_complete_objects[trans_id]
             # # Get the auto completion suggestions.
             res = auto_complete_obj.get_completions(full_sql,
                                                     text_before_cursor)
@@ -2164,8 +2296,8 @@ def start_query_download_tool(trans_id):
             # Re-execute the query to ensure the latest data is included
             sync_conn.execute_async(sql)
         # This returns generator of records.
-        status, gen, conn_obj = \
-            sync_conn.execute_on_server_as_csv(records=10)
+        status, gen, conn_obj = sync_conn.execute_on_server_as_csv(
+            records=blueprint.csv_download_chunk_size.get())
 
         if not status:
             return make_json_response(
@@ -2174,17 +2306,27 @@ def start_query_download_tool(trans_id):
                 }
             )
 
+        chunks = gen(conn_obj,
+                     trans_obj,
+                     quote=blueprint.csv_quoting.get(),
+                     quote_char=blueprint.csv_quote_char.get(),
+                     field_separator=blueprint.csv_field_separator.get(),
+                     replace_nulls_with=blueprint.replace_nulls_with.get(),
+                     use_copy=blueprint.csv_download_use_copy.get())
+
+        use_gzip = blueprint.csv_download_gzip.get() and \
+            'gzip' in request.accept_encodings
+        if use_gzip:
+            chunks = gzip_chunks(chunks)
+
         r = Response(
-            gen(conn_obj,
-                trans_obj,
-                quote=blueprint.csv_quoting.get(),
-                quote_char=blueprint.csv_quote_char.get(),
-                field_separator=blueprint.csv_field_separator.get(),
-                replace_nulls_with=blueprint.replace_nulls_with.get()),
+            chunks,
             mimetype='text/csv' if
             blueprint.csv_field_separator.get() == ','
             else 'text/plain'
         )
+        if use_gzip:
+            r.headers['Content-Encoding'] = 'gzip'
 
         import time
         extn = 'csv' if blueprint.csv_field_separator.get() == ',' else 'txt'
@@ -2778,3 +2920,39 @@ def user_macros(json_resp=True):
     This method is used to fetch all user macros.
     """
     return get_user_macros()
+
+
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def socket_connect():
+    """
+    Connect to the server through socket, to get the query results pushed.
+    """
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+
+@socketio.on('subscribe_query_result', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def socket_subscribe_query_result(data):
+    """
+    Subscribes the socket to the results of the queries of a transaction.
+    The return value is the acknowledgement of the client.
+    """
+    subscribe(data['trans_id'], request.sid)
+    return {'trans_id': data['trans_id']}
+
+
+@socketio.on('query_result_received', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def socket_query_result_received(data):
+    """
+    The client got the pushed result, the poll endpoint does not need to
+    return it.
+    """
+    pop_result(data['trans_id'])
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def socket_disconnect():
+    unsubscribe(request.sid)
@@ -32,6 +32,7 @@ import { usePgAdmin } from '../../../../../../static/js/PgAdminProvider';
 import pgAdmin from 'sources/pgadmin';
 import ConnectServerContent from '../../../../../../static/js/Dialogs/ConnectServerContent';
 import { MODAL_DIALOGS } from '../QueryToolConstants';
+import { openSocket } from '../../../../../../static/js/socket_instance';
 
 const StyledBox = styled(Box)(({theme}) => ({
   display: 'flex',
@@ -40,6 +41,11 @@ const StyledBox = styled(Box)(({theme}) => ({
   backgroundColor: theme.otherVars.qtDatagridBg,
 }));
 
+/* Results are pushed on this namespace, the poll endpoint is the fallback */
+const QUERY_RESULT_NAMESPACE = '/sqleditor';
+const SUBSCRIBE_TIMEOUT = 5000;
+const PUSH_FALLBACK_POLL_DELAY = 30000;
+
 export class ResultSetUtils {
   constructor(api, queryToolCtx, transId, isQueryTool=true) {
     this.api = api;
@@ -51,6 +57,15 @@ export class ResultSetUtils {
     this.historyQuerySource = null;
     this.hasQueryCommitted = false;
     this.queryToolCtx = queryToolCtx;
+    this.resultSocket = null;
+    this.pushedResult = null;
+    this.onPushedResult = null;
+    this.onQueryResult = (payload)=>{
+      if(payload.trans_id == this.transId) {
+        this.pushedResult = payload;
+        this.onPushedResult?.();
+      }
+    };
   }
 
   static generateURLReconnectionFlag(baseUrl, transId, shouldReconnect) {
@@ -258,6 +273,8 @@ export class ResultSetUtils {
       this.historyQuerySource = QuerySources.ROLLBACK;
     }
     try {
+      this.pushedResult = null;
+      await this.subscribeQueryResult();
       let {data: httpMessageData} = await this.postExecutionApi(query, explainObject, flags.isQueryTool, flags.reconnect);
 
       if (ResultSetUtils.isSqlCorrect(httpMessageData)) {
@@ -354,6 +371,64 @@ export class ResultSetUtils {
     });
   }
 
+  async subscribeQueryResult() {
+    try {
+      if(!this.resultSocket?.connected) {
+        this.resultSocket = await openSocket(QUERY_RESULT_NAMESPACE);
+        /* The socket of the namespace is shared by the query tools */
+        this.resultSocket.off('query_result', this.onQueryResult);
+        this.resultSocket.on('query_result', this.onQueryResult);
+      }
+      await new Promise((resolve, reject)=>{
+        this.resultSocket.timeout(SUBSCRIBE_TIMEOUT).emit('subscribe_query_result', {
+          trans_id: this.transId,
+        }, (err)=>err ? reject(err) : resolve());
+      });
+    } catch {
+      /* Poll for the results */
+      this.resultSocket = null;
+    }
+  }
+
+  waitForResult() {
+    if(!this.resultSocket?.connected) {
+      return this.poll();
+    }
+    return new Promise((resolve, reject)=>{
+      const socket = this.resultSocket;
+      let fallbackTimer = null;
+      const cleanup = ()=>{
+        clearTimeout(fallbackTimer);
+        this.onPushedResult = null;
+        socket.off('disconnect', fallback);
+      };
+      const onPushedResult = ()=>{
+        cleanup();
+        const payload = this.pushedResult;
+        this.pushedResult = null;
+        socket.emit('query_result_received', {trans_id: this.transId});
+        if(payload.status >= 400) {
+          reject({response: {data: payload.data, status: payload.status}});
+        } else {
+          resolve({data: payload.data, status: payload.status});
+        }
+      };
+      /* Poll if the result is not pushed, the query may still be running */
+      const fallback = ()=>{
+        cleanup();
+        this.poll().then(resolve, reject);
+      };
+
+      if(this.pushedResult) {
+        onPushedResult();
+        return;
+      }
+      this.onPushedResult = onPushedResult;
+      socket.on('disconnect', fallback);
+      fallbackTimer = setTimeout(fallback, PUSH_FALLBACK_POLL_DELAY);
+    });
+  }
+
   handlePollError(error, explainObject, flags) {
     this.eventBus.fireEvent(QUERY_TOOL_EVENTS.EXECUTION_END);
     this.eventBus.fireEvent(QUERY_TOOL_EVENTS.FOCUS_PANEL, PANELS.MESSAGES);
@@ -381,7 +456,7 @@ export class ResultSetUtils {
 
   async pollForResult(onResultsAvailable, onExplain, onPollError, explainObject, flags) {
     try {
-      let httpMessage = await this.poll();
+      let httpMessage = await this.waitForResult();
       let msg = '';
       if(httpMessage.data.data.notifies) {
         this.eventBus.fireEvent(QUERY_TOOL_EVENTS.PUSH_NOTICE, httpMessage.data.data.notifies);
@@ -7,6 +7,7 @@
 # This software is released under the PostgreSQL Licence
 #
 ##########################################################################
+import gzip
 from unittest.mock import patch
 
 from pgadmin.utils.route import BaseTestGenerator
@@ -101,6 +102,22 @@ class TestDownloadCSV(BaseTestGenerator):
                 query_commited=False
             )
         ),
+        (
+            'Download csv with COPY, compressed',
+            dict(
+                sql='SELECT 1 as "A",\'x\' as "B",NULL as "C"',
+                init_url='/sqleditor/initialize/sqleditor/{0}/{1}/{2}/{3}',
+                donwload_url="/sqleditor/query_tool/download/{0}",
+                output_columns='"A","B","C"',
+                output_values='1,"x",NULL',
+                is_valid_tx=True,
+                is_valid=True,
+                download_as_txt=False,
+                filename='test.csv',
+                query_commited=False,
+                use_copy_gzip=True
+            )
+        ),
     ]
 
     def setUp(self):
@@ -194,17 +211,31 @@ class TestDownloadCSV(BaseTestGenerator):
                 "filename": self.filename,
                 "query_commited": self.query_commited
             }
-            response = self.tester.post(
-                url,
-                data=data
-            )
+            if getattr(self, 'use_copy_gzip', False):
+                with patch('pgadmin.tools.sqleditor.blueprint.'
+                           'csv_download_use_copy.get', return_value=True), \
+                        patch('pgadmin.tools.sqleditor.blueprint.'
+                              'csv_download_gzip.get', return_value=True):
+                    response = self.tester.post(
+                        url,
+                        data=data,
+                        headers={'Accept-Encoding': 'gzip'}
+                    )
+            else:
+                response = self.tester.post(
+                    url,
+                    data=data
+                )
             headers = dict(response.headers)
             # Enable the console logging from Flask logger
             self.app.logger.disabled = False
             if self.is_valid:
                 # when valid query
                 self.assertEqual(response.status_code, 200)
-                csv_data = response.data.decode()
+                csv_data = response.data
+                if headers.get('Content-Encoding') == 'gzip':
+                    csv_data = gzip.decompress(csv_data)
+                csv_data = csv_data.decode()
                 self.assertTrue(self.output_columns in csv_data)
                 self.assertTrue(self.output_values in csv_data)
                 self.assertIn('text/csv', headers['Content-Type'])
@@ -8,13 +8,12 @@
 ##########################################################################
 
 """Code to handle data sorting in view data mode."""
-import pickle
 import json
 from flask_babel import gettext
 from flask import current_app
 from pgadmin.utils.ajax import make_json_response, internal_server_error
-from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
-    update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    update_transaction
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost
 from pgadmin.utils.constants import ERROR_MSG_TRANS_ID_NOT_FOUND
 
@@ -93,9 +92,8 @@ class FilterDialog():
             status, res = trans_obj.set_filter(data.get('sql'))
             if status:
                 # As we changed the transaction object we need to
-                # restore it and update the session variable.
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-                update_session_grid_transaction(trans_id, session_obj)
+                # update the transaction registry.
+                update_transaction(trans_id, session_obj, trans_obj)
                 res = gettext('Data sorting object updated successfully')
         else:
             return internal_server_error(
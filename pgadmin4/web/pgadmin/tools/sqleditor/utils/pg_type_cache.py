@@ -0,0 +1,87 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Cache of the type names of the query tool results.
+
+The names of the types (formatted by pg_catalog.format_type) are cached per
+connection, for the server version the connection was made to. Only the
+OIDs missing from the cache are looked up in pg_type. The cache of the
+connection is cleared before running a query which may change the type
+names: DDL, or a change of the search_path (format_type qualifies the types
+which are not visible).
+"""
+
+import re
+import threading
+from weakref import WeakKeyDictionary
+
+# Statements which may change the name of a type
+CATALOG_CHANGE = re.compile(
+    r'\b(CREATE|ALTER|DROP|IMPORT|SET|RESET|DISCARD|ROLLBACK)\b', re.I)
+
+PG_TYPES_QUERY = "SELECT oid, pg_catalog.format_type(oid, NULL) AS typname " \
+    "FROM pg_catalog.pg_type WHERE oid = ANY(%s) ORDER BY oid;"
+
+_caches = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+class _PgTypeCache:
+    def __init__(self, version):
+        self.version = version
+        # Type name by OID, None for the OIDs not found
+        self.types = dict()
+
+
+def is_catalog_change(sql):
+    """
+    Returns True if the query may change the names of the types.
+    """
+    return bool(sql) and CATALOG_CHANGE.search(sql) is not None
+
+
+def invalidate_pg_types(conn):
+    """
+    Clears the cache of the type names of the connection.
+    """
+    with _lock:
+        _caches.pop(conn, None)
+
+
+def get_pg_types(conn, oids):
+    """
+    Returns the names of the types by OID, looking up the ones missing from
+    the cache of the connection in pg_type.
+
+    Args:
+        conn: Connection object
+        oids: OIDs of the types
+
+    Returns: (status, dict of the type names by OID or error message)
+    """
+    version = conn.manager.version
+    with _lock:
+        cache = _caches.get(conn)
+        if cache is None or cache.version != version:
+            cache = _caches[conn] = _PgTypeCache(version)
+        types = cache.types
+        missing = list(set(oid for oid in oids if oid not in types))
+
+    if missing:
+        status, res = conn.execute_dict(PG_TYPES_QUERY, [missing])
+        if not status:
+            return False, res
+
+        found = dict((row['oid'], row['typname']) for row in res['rows'])
+        with _lock:
+            for oid in missing:
+                types[oid] = found.get(oid)
+
+    return True, dict((oid, types[oid]) for oid in oids)
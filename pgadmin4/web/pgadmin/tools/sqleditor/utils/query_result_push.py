@@ -0,0 +1,110 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Push of the query tool results to the Socket.IO clients.
+
+A query tool subscribes to the results of its transaction before running a
+query. When the query completes, the query thread computes the response the
+poll endpoint would have returned (status, messages, notifies and first page
+of rows), keeps it and emits it to the room of the transaction. The kept
+response is returned by the poll endpoint, which remains the fallback of
+the clients without a socket, until the client acknowledges the pushed one.
+"""
+
+import threading
+
+from flask_security import current_user
+from flask_socketio import join_room, leave_room
+
+from pgadmin import socketio
+
+SOCKETIO_NAMESPACE = '/sqleditor'
+QUERY_RESULT_EVENT = 'query_result'
+
+# Socket ids subscribed, by room
+_subscriptions = dict()
+# Response of the last query, by room
+_results = dict()
+_lock = threading.Lock()
+
+
+def result_room(trans_id):
+    """
+    Returns the name of the room of the results of the transaction.
+    """
+    return 'query_result_{0}_{1}'.format(current_user.id, trans_id)
+
+
+def subscribe(trans_id, socket_id):
+    """
+    Subscribes the socket to the results of the transaction.
+    """
+    room = result_room(trans_id)
+    join_room(room, sid=socket_id, namespace=SOCKETIO_NAMESPACE)
+    with _lock:
+        _subscriptions.setdefault(room, set()).add(socket_id)
+    return room
+
+
+def unsubscribe(socket_id):
+    """
+    Removes the subscriptions of the (disconnected) socket.
+    """
+    with _lock:
+        for room, socket_ids in list(_subscriptions.items()):
+            socket_ids.discard(socket_id)
+            if not socket_ids:
+                del _subscriptions[room]
+
+
+def is_subscribed(trans_id):
+    """
+    Returns True if a socket is subscribed to the results of the
+    transaction.
+    """
+    with _lock:
+        return result_room(trans_id) in _subscriptions
+
+
+def push_result(trans_id, response):
+    """
+    Keeps the poll response of the completed query, and emits it to the room
+    of the transaction.
+    """
+    room = result_room(trans_id)
+    with _lock:
+        _results[room] = response
+
+    socketio.emit(QUERY_RESULT_EVENT, {
+        'trans_id': trans_id,
+        'status': response.status_code,
+        'data': response.get_json()
+    }, namespace=SOCKETIO_NAMESPACE, to=room)
+
+
+def pop_result(trans_id):
+    """
+    Returns and forgets the kept response of the transaction, if any.
+    """
+    with _lock:
+        return _results.pop(result_room(trans_id), None)
+
+
+def clear_results(trans_id):
+    """
+    Forgets the kept response and the subscriptions of the transaction.
+    """
+    room = result_room(trans_id)
+    with _lock:
+        _results.pop(room, None)
+        socket_ids = _subscriptions.pop(room, set())
+
+    for socket_id in socket_ids:
+        leave_room(room, sid=socket_id, namespace=SOCKETIO_NAMESPACE)
@@ -8,13 +8,14 @@
 ##########################################################################
 
 """Check for query tool connection"""
-import pickle
 from flask_babel import gettext
 
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import internal_server_error
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.sqleditor.utils.start_running_query import StartRunningQuery
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    load_transaction
 from flask import Response, current_app, session
 
 from pgadmin.utils.driver import get_driver
@@ -30,7 +31,7 @@ def query_tool_connection_check(trans_id):
     if isinstance(session_obj, Response):
         return session_obj
 
-    transaction_object = pickle.loads(session_obj['command_obj'])
+    session_obj, transaction_object = load_transaction(trans_id, session_obj)
 
     # To verify if the transaction details for the specific query tool
     # or View/Edit Data tool is available or not and if the server is
@@ -292,6 +292,38 @@ def register_query_tool_preferences(self):
         allow_blanks=True
     )
 
+    self.csv_download_chunk_size = self.preference.register(
+        'CSV_output', 'csv_download_chunk_size',
+        gettext("Download chunk size"), 'integer', 5000,
+        min_val=100, max_val=100000,
+        category_label=PREF_LABEL_CSV_TXT,
+        help_str=gettext('Specifies the number of rows written at a time '
+                         'while downloading query results as CSV.')
+    )
+
+    self.csv_download_gzip = self.preference.register(
+        'CSV_output', 'csv_download_gzip',
+        gettext("Compress downloads?"), 'boolean', False,
+        category_label=PREF_LABEL_CSV_TXT,
+        help_str=gettext('Specifies whether or not to compress the query '
+                         'results with gzip while they are downloaded, when '
+                         'the browser supports it. The downloaded file is '
+                         'not compressed.')
+    )
+
+    self.csv_download_use_copy = self.preference.register(
+        'CSV_output', 'csv_download_use_copy',
+        gettext("Use COPY for downloads?"), 'boolean', False,
+        category_label=PREF_LABEL_CSV_TXT,
+        help_str=gettext('Specifies whether or not to run the query again on '
+                         'the server with COPY ... TO STDOUT to download its '
+                         'results as CSV, when it is a single SELECT query '
+                         'outside of a transaction and the quoting is not '
+                         'None. The values are then formatted by the server, '
+                         'e.g. booleans as t/f, and lines end with a newline '
+                         'only.')
+    )
+
     self.results_grid_quoting = self.preference.register(
         'Results_grid', 'results_grid_quoting',
         gettext("Result copy quoting"), 'options', 'strings',
@@ -0,0 +1,262 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Local file cache of the query tool results.
+
+The rows of a large result are written to two files as the pages of the
+result grid are fetched from the cursor: the pickled rows one after the
+other, and the offset of each row. The files hold the rows from the first
+one up to the last row fetched in sequence, and are memory mapped, so the
+pages fetched again are read with a seek instead of scrolling the cursor of
+the connection. The cache of a transaction is keyed by the user and
+transaction id, and is started again when another query is executed in the
+transaction.
+"""
+
+import glob
+import mmap
+import os
+import pickle
+import threading
+from array import array
+
+from flask_security import current_user
+
+import config
+
+# Type code of the row offsets (unsigned 64 bits integers)
+OFFSET_TYPE = 'Q'
+
+_caches = dict()
+_locks = dict()
+_caches_lock = threading.Lock()
+
+
+class ResultCache:
+    """
+    Rows of a query result, read from memory mapped files.
+
+    Args:
+        path: Path of the files, without extension
+        query_id: Id of the query of the result
+        total_rows: Number of rows of the result
+    """
+
+    def __init__(self, path, query_id, total_rows):
+        self.path = path
+        self.query_id = query_id
+        self.total_rows = total_rows
+        self.row_count = 0
+        self._position = 0
+        self._files = []
+        self._data = None
+        self._offsets = None
+
+        with open(self.data_file, 'wb'), \
+                open(self.offsets_file, 'wb') as offsets_file:
+            offsets_file.write(array(OFFSET_TYPE, [0]).tobytes())
+
+    @property
+    def data_file(self):
+        return self.path + '.rows'
+
+    @property
+    def offsets_file(self):
+        return self.path + '.offsets'
+
+    def append(self, rows):
+        """
+        Appends the rows, which follow the cached rows, to the files, and
+        maps them in memory again.
+        """
+        if not rows:
+            return
+
+        offsets = array(OFFSET_TYPE)
+        with open(self.data_file, 'ab') as data_file:
+            for row in rows:
+                data = pickle.dumps(tuple(row), pickle.HIGHEST_PROTOCOL)
+                data_file.write(data)
+                self._position += len(data)
+                offsets.append(self._position)
+        with open(self.offsets_file, 'ab') as offsets_file:
+            offsets_file.write(offsets.tobytes())
+        self.row_count += len(offsets)
+
+        self._unmap()
+        self._map()
+
+    def _map(self):
+        for name in (self.data_file, self.offsets_file):
+            with open(name, 'rb') as f:
+                self._files.append(
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        self._data = self._files[0]
+        self._offsets = memoryview(self._files[1]).cast(OFFSET_TYPE)
+
+    def _unmap(self):
+        if self._offsets is not None:
+            self._offsets.release()
+            self._offsets = None
+        for f in self._files:
+            f.close()
+        self._files = []
+        self._data = None
+
+    def exists(self):
+        return os.path.exists(self.data_file)
+
+    def covers(self, from_rownum, to_rownum=None):
+        """
+        Returns True if the rows from from_rownum to to_rownum (both
+        included, starting from 0), or up to the last row, are cached.
+        """
+        if to_rownum is None or to_rownum >= self.total_rows:
+            to_rownum = self.total_rows - 1
+        return max(from_rownum, 0) > to_rownum or to_rownum < self.row_count
+
+    def rows(self, from_rownum=0, to_rownum=None):
+        """
+        Returns the cached rows from from_rownum to to_rownum (both
+        included, starting from 0), or up to the last cached row.
+        """
+        if to_rownum is None or to_rownum >= self.row_count:
+            to_rownum = self.row_count - 1
+        if from_rownum < 0:
+            from_rownum = 0
+        if from_rownum > to_rownum:
+            return []
+
+        data = self._data
+        offsets = self._offsets
+        start = offsets[from_rownum]
+        rows = []
+        for rownum in range(from_rownum + 1, to_rownum + 2):
+            end = offsets[rownum]
+            rows.append(pickle.loads(data[start:end]))
+            start = end
+        return rows
+
+    def close(self):
+        self._unmap()
+
+
+def _cache_dir():
+    return os.path.join(config.SESSION_DB_PATH, 'result_cache')
+
+
+def _cache_key(trans_id):
+    return '{0}_{1}'.format(current_user.id, trans_id)
+
+
+def _remove_files(key, pid='*'):
+    for name in glob.glob(os.path.join(_cache_dir(), '{0}_{1}_*'.format(
+            key, pid))):
+        try:
+            os.remove(name)
+        except OSError:
+            pass
+
+
+def _is_cached(conn):
+    return config.QUERY_RESULT_CACHE and \
+        conn.total_rows >= config.QUERY_RESULT_CACHE_MIN_ROWS
+
+
+def _get_cache(key, conn):
+    """
+    Returns the cache of the current result of the connection, a new one if
+    another query was executed since. Called with the lock of the key held.
+    """
+    cache = _caches.get(key)
+    if cache is not None and cache.query_id == conn.async_query_id \
+            and cache.exists():
+        return cache
+
+    if cache is not None:
+        cache.close()
+    _caches.pop(key, None)
+    _remove_files(key, os.getpid())
+
+    os.makedirs(_cache_dir(), mode=0o700, exist_ok=True)
+    # The process id keeps the files of the processes of a WSGI server
+    # apart
+    cache = ResultCache(
+        os.path.join(_cache_dir(), '{0}_{1}_{2}'.format(
+            key, os.getpid(), conn.async_query_id)),
+        conn.async_query_id, conn.total_rows
+    )
+    _caches[key] = cache
+    return cache
+
+
+def _get_lock(key):
+    with _caches_lock:
+        return _locks.setdefault(key, threading.Lock())
+
+
+def get_cached_rows(trans_id, conn, from_rownum, to_rownum=None):
+    """
+    Returns the rows from from_rownum to to_rownum (both included, starting
+    from 0), or up to the last row, of the current result of the connection
+    if they are cached. Returns None when they are to be fetched from the
+    cursor.
+    """
+    if not _is_cached(conn):
+        return None
+
+    key = _cache_key(trans_id)
+    with _get_lock(key):
+        cache = _get_cache(key, conn)
+        if not cache.covers(from_rownum, to_rownum):
+            return None
+        return cache.rows(from_rownum, to_rownum)
+
+
+def add_fetched_rows(trans_id, conn, from_rownum, rows):
+    """
+    Adds the rows fetched from the cursor, starting at from_rownum, to the
+    cache of the current result of the connection. Only the rows which
+    follow the cached rows are added, the rows of a page fetched further
+    are not.
+    """
+    if not _is_cached(conn) or not rows:
+        return
+
+    key = _cache_key(trans_id)
+    with _get_lock(key):
+        cache = _get_cache(key, conn)
+        if from_rownum <= cache.row_count < from_rownum + len(rows):
+            try:
+                cache.append(rows[cache.row_count - from_rownum:])
+            except Exception:
+                cache.close()
+                _caches.pop(key, None)
+                _remove_files(key, os.getpid())
+                raise
+
+
+def evict_result_cache(trans_id):
+    """
+    Removes the cache of the transaction.
+    """
+    key = _cache_key(trans_id)
+    with _caches_lock:
+        lock = _locks.pop(key, None)
+        cache = _caches.pop(key, None)
+
+    if lock is not None:
+        with lock:
+            if cache is not None:
+                cache.close()
+            _remove_files(key)
+    else:
+        _remove_files(key)
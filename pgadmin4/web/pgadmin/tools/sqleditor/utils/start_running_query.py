@@ -9,7 +9,6 @@
 
 """Start executing the query in async mode."""
 
-import pickle
 import secrets
 from threading import Thread
 from flask import Response, current_app, copy_current_request_context
@@ -21,8 +20,12 @@ from pgadmin.tools.sqleditor.utils.apply_explain_plan_wrapper import \
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE, \
     TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.is_begin_required import is_begin_required
-from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
-    update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.pg_type_cache import is_catalog_change, \
+    invalidate_pg_types
+from pgadmin.tools.sqleditor.utils.query_result_push import is_subscribed, \
+    push_result, pop_result
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    load_transaction, update_transaction
 from pgadmin.utils.ajax import make_json_response, internal_server_error
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
@@ -46,11 +49,15 @@ class StartRunningQuery:
         if isinstance(session_obj, Response):
             return session_obj
 
+        session_obj, transaction_object = load_transaction(
+            trans_id, session_obj)
+        # Forget the result of the previous query
+        pop_result(trans_id)
+
         # Remove any existing primary keys or has_oids in session_obj
         session_obj.pop('primary_keys', None)
         session_obj.pop('oids', None)
 
-        transaction_object = pickle.loads(session_obj['command_obj'])
         can_edit = False
         can_filter = False
         notifies = None
@@ -146,6 +153,11 @@ class StartRunningQuery:
             trans_obj,
             conn)
 
+        # The query (or the rollback) may change the names of the cached
+        # types
+        if is_rollback_req or is_catalog_change(sql):
+            invalidate_pg_types(conn)
+
         @copy_current_request_context
         def asyn_exec_query(conn, sql, trans_obj, is_rollback_req,
                             app):
@@ -162,6 +174,10 @@ class StartRunningQuery:
                     self.logger.error(e)
                     return internal_server_error(errormsg=str(e))
 
+                # Push the result to the query tool instead of waiting for
+                # it to poll
+                StartRunningQuery.push_query_result(trans_id, self.logger)
+
         _thread = QueryThread(target=asyn_exec_query,
                               args=(conn, sql, trans_obj, is_rollback_req,
                                     current_app._get_current_object())
@@ -173,6 +189,18 @@ class StartRunningQuery:
         StartRunningQuery.save_transaction_in_session(session_obj,
                                                       trans_id, trans_obj)
 
+    @staticmethod
+    def push_query_result(trans_id, logger):
+        from pgadmin.tools.sqleditor import poll_result
+
+        try:
+            if is_subscribed(trans_id):
+                push_result(trans_id,
+                            poll_result(trans_id, query_thread=True))
+        except Exception as e:
+            # The client gets the result by polling
+            logger.error(e)
+
     @staticmethod
     def is_begin_required_for_sql_query(trans_obj, conn, sql):
         return (not trans_obj.auto_commit and
@@ -190,9 +218,8 @@ class StartRunningQuery:
     @staticmethod
     def save_transaction_in_session(session, transaction_id, transaction):
         # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session['command_obj'] = pickle.dumps(transaction, -1)
-        update_session_grid_transaction(transaction_id, session)
+        # update the transaction registry.
+        update_transaction(transaction_id, session, transaction)
 
     @staticmethod
     def retrieve_session_information(http_session, transaction_id):
@@ -212,7 +239,7 @@ class StartRunningQuery:
                 status=404
             )
         # Fetch the object for the specified transaction id.
-        # Use pickle.loads function to get the command object
+        # The command object is loaded by load_transaction
         return grid_data[str(transaction_id)]
 
 
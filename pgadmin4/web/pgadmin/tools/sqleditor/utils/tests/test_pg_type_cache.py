@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.utils.pg_type_cache import get_pg_types, \
+    invalidate_pg_types, is_catalog_change
+
+PG_TYPES = {16: 'boolean', 23: 'integer', 25: 'text', 1700: 'numeric',
+            16385: 'public.mood'}
+
+
+class _Manager:
+    version = 170000
+
+
+class _Connection:
+    """Connection looking up the types in PG_TYPES."""
+
+    def __init__(self, status=True):
+        self.manager = _Manager()
+        self.status = status
+        self.queried_oids = []
+
+    def execute_dict(self, query, params):
+        if not self.status:
+            return False, 'connection lost'
+        self.queried_oids.append(sorted(params[0]))
+        return True, {'rows': [
+            {'oid': oid, 'typname': PG_TYPES[oid]}
+            for oid in sorted(params[0]) if oid in PG_TYPES
+        ]}
+
+
+class PgTypeCacheTestCase(BaseTestGenerator):
+    """This class tests the cache of the type names of the results."""
+    scenarios = [
+        ('Types looked up once', dict(check='reuse')),
+        ('Missing types looked up', dict(check='missing')),
+        ('Cache invalidated', dict(check='invalidate')),
+        ('Cache of another server version', dict(check='version')),
+        ('Cache per connection', dict(check='connection')),
+        ('Look up error', dict(check='error')),
+    ]
+
+    def setUp(self):
+        self.conn = _Connection()
+
+    def runTest(self):
+        getattr(self, '_check_' + self.check)()
+
+    def _check_reuse(self):
+        oids = [23, 25, 23, 16385]
+        expected = {23: 'integer', 25: 'text', 16385: 'public.mood'}
+        self.assertEqual(get_pg_types(self.conn, oids), (True, expected))
+        self.assertEqual(get_pg_types(self.conn, oids), (True, expected))
+        self.assertEqual(self.conn.queried_oids, [[23, 25, 16385]])
+
+    def _check_missing(self):
+        get_pg_types(self.conn, [23, 25])
+        # OIDs not found are not looked up again
+        self.assertEqual(get_pg_types(self.conn, [25, 1700, 99999]),
+                         (True, {25: 'text', 1700: 'numeric', 99999: None}))
+        get_pg_types(self.conn, [99999])
+        self.assertEqual(self.conn.queried_oids,
+                         [[23, 25], [1700, 99999]])
+
+    def _check_invalidate(self):
+        get_pg_types(self.conn, [23])
+        invalidate_pg_types(self.conn)
+        get_pg_types(self.conn, [23])
+        self.assertEqual(self.conn.queried_oids, [[23], [23]])
+
+    def _check_version(self):
+        get_pg_types(self.conn, [23])
+        self.conn.manager.version = 180000
+        get_pg_types(self.conn, [23])
+        self.assertEqual(self.conn.queried_oids, [[23], [23]])
+
+    def _check_connection(self):
+        other_conn = _Connection()
+        get_pg_types(self.conn, [23])
+        get_pg_types(other_conn, [23])
+        self.assertEqual(other_conn.queried_oids, [[23]])
+
+    def _check_error(self):
+        self.conn.status = False
+        self.assertEqual(get_pg_types(self.conn, [23]),
+                         (False, 'connection lost'))
+        self.conn.status = True
+        self.assertEqual(get_pg_types(self.conn, [23]),
+                         (True, {23: 'integer'}))
+
+
+class IsCatalogChangeTestCase(BaseTestGenerator):
+    """This class tests the queries clearing the cache of the types."""
+    scenarios = [
+        ('Select', dict(sql='SELECT * FROM pg_class', expected=False)),
+        ('Insert', dict(sql="INSERT INTO t VALUES ('created')",
+                        expected=False)),
+        ('Create type', dict(sql="CREATE TYPE mood AS ENUM ('ok')",
+                             expected=True)),
+        ('Alter type', dict(sql='select 1; alter type mood rename to m',
+                            expected=True)),
+        ('Drop extension', dict(sql='DROP EXTENSION hstore', expected=True)),
+        ('Set search path', dict(sql='SET search_path TO app',
+                                 expected=True)),
+        ('Rollback', dict(sql='ROLLBACK', expected=True)),
+        ('Empty', dict(sql='', expected=False)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertEqual(is_catalog_change(self.sql), self.expected)
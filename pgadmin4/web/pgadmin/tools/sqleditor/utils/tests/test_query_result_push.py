@@ -0,0 +1,89 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.utils import query_result_push
+from pgadmin.tools.sqleditor.utils.query_result_push import subscribe, \
+    unsubscribe, is_subscribed, push_result, pop_result, clear_results, \
+    SOCKETIO_NAMESPACE, QUERY_RESULT_EVENT
+
+TRANS_ID = 8787
+ROOM = 'query_result_1_8787'
+
+
+class _User:
+    id = 1
+
+
+class QueryResultPushTestCase(BaseTestGenerator):
+    """This class tests the push of the query results to the sockets."""
+    scenarios = [
+        ('Result pushed to the room of the transaction',
+         dict(check='push')),
+        ('Subscription removed on disconnect', dict(check='disconnect')),
+        ('Results cleared with the transaction', dict(check='clear')),
+    ]
+
+    def setUp(self):
+        self.patches = [
+            patch.object(query_result_push, 'current_user', _User()),
+            patch.object(query_result_push, 'join_room'),
+            patch.object(query_result_push, 'leave_room'),
+            patch.object(query_result_push.socketio, 'emit'),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def runTest(self):
+        with self.app.app_context():
+            getattr(self, '_check_' + self.check)()
+
+    def _check_push(self):
+        self.assertFalse(is_subscribed(TRANS_ID))
+        self.assertEqual(subscribe(TRANS_ID, 'socket-1'), ROOM)
+        query_result_push.join_room.assert_called_once_with(
+            ROOM, sid='socket-1', namespace=SOCKETIO_NAMESPACE)
+        self.assertTrue(is_subscribed(TRANS_ID))
+
+        response = make_json_response(data={'status': 'Success'})
+        push_result(TRANS_ID, response)
+        query_result_push.socketio.emit.assert_called_once_with(
+            QUERY_RESULT_EVENT, {
+                'trans_id': TRANS_ID, 'status': 200,
+                'data': response.get_json()
+            }, namespace=SOCKETIO_NAMESPACE, to=ROOM)
+
+        # Kept once for the poll endpoint
+        self.assertIs(pop_result(TRANS_ID), response)
+        self.assertIsNone(pop_result(TRANS_ID))
+
+    def _check_disconnect(self):
+        subscribe(TRANS_ID, 'socket-1')
+        subscribe(TRANS_ID, 'socket-2')
+        unsubscribe('socket-1')
+        self.assertTrue(is_subscribed(TRANS_ID))
+        unsubscribe('socket-2')
+        self.assertFalse(is_subscribed(TRANS_ID))
+
+    def _check_clear(self):
+        subscribe(TRANS_ID, 'socket-1')
+        push_result(TRANS_ID, make_json_response(data={}))
+        clear_results(TRANS_ID)
+        self.assertFalse(is_subscribed(TRANS_ID))
+        self.assertIsNone(pop_result(TRANS_ID))
+        query_result_push.leave_room.assert_called_once_with(
+            ROOM, sid='socket-1', namespace=SOCKETIO_NAMESPACE)
+
+    def tearDown(self):
+        clear_results(TRANS_ID)
+        for p in self.patches:
+            p.stop()
@@ -0,0 +1,159 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.utils import result_cache
+from pgadmin.tools.sqleditor.utils.result_cache import ResultCache, \
+    get_cached_rows, add_fetched_rows, evict_result_cache
+
+ROWS = [(i, 'row {0}'.format(i), None if i % 3 else Decimal(i) / 2)
+        for i in range(2500)]
+
+
+class _Connection:
+    """Result of a query tool connection."""
+
+    def __init__(self, rows, query_id):
+        self.rows = rows
+        self.async_query_id = query_id
+        self.total_rows = len(rows)
+
+
+class _User:
+    id = 1
+
+
+class ResultCacheTestCase(BaseTestGenerator):
+    """This class tests the reading of the rows from the cached result."""
+    scenarios = [
+        ('First page', dict(from_rownum=0, to_rownum=99,
+                            expected=ROWS[0:100], covered=True)),
+        ('Page in the middle', dict(from_rownum=1000, to_rownum=1999,
+                                    expected=ROWS[1000:2000], covered=True)),
+        ('Page partly cached', dict(from_rownum=2000, to_rownum=2099,
+                                    expected=ROWS[2000:2050],
+                                    covered=False)),
+        ('All the rows', dict(from_rownum=0, to_rownum=None,
+                              expected=ROWS[:2050], covered=False)),
+        ('Past the end', dict(from_rownum=3000, to_rownum=3999,
+                              expected=[], covered=True)),
+    ]
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def runTest(self):
+        cache = ResultCache(os.path.join(self.cache_dir, 'result'), '1',
+                            len(ROWS))
+        # Appended in chunks of various sizes
+        for rows in [ROWS[:1], ROWS[1:1000], [], ROWS[1000:2050]]:
+            cache.append(rows)
+        try:
+            self.assertEqual(cache.row_count, 2050)
+            self.assertEqual(cache.covers(self.from_rownum, self.to_rownum),
+                             self.covered)
+            self.assertEqual(
+                cache.rows(self.from_rownum, self.to_rownum), self.expected)
+        finally:
+            cache.close()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+
+class FetchedRowsCacheTestCase(BaseTestGenerator):
+    """
+    This class tests the cache of the results of the query tool
+    transactions, filled with the pages fetched from the cursor.
+    """
+    scenarios = [
+        ('Pages fetched in sequence are cached', dict(check='sequence')),
+        ('Pages fetched further are not cached', dict(check='jump')),
+        ('Cache started again for another query', dict(check='new_query')),
+        ('Small results are not cached', dict(check='small')),
+        ('Cache evicted', dict(check='evict')),
+    ]
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.patches = [
+            patch('config.QUERY_RESULT_CACHE', True),
+            patch('config.QUERY_RESULT_CACHE_MIN_ROWS', 1000),
+            patch('config.SESSION_DB_PATH', self.cache_dir),
+            patch.object(result_cache, 'current_user', _User()),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def runTest(self):
+        getattr(self, '_check_' + self.check)()
+        evict_result_cache(10)
+
+    def _check_sequence(self):
+        conn = _Connection(ROWS, '1')
+        self.assertIsNone(get_cached_rows(10, conn, 0, 999))
+        add_fetched_rows(10, conn, 0, ROWS[0:1000])
+        # Overlapping page, only the new rows are added
+        add_fetched_rows(10, conn, 500, ROWS[500:1500])
+        self.assertEqual(get_cached_rows(10, conn, 1000, 1499),
+                         ROWS[1000:1500])
+        self.assertIsNone(get_cached_rows(10, conn, 1400, 1599))
+        self.assertIsNone(get_cached_rows(10, conn, 0))
+
+        add_fetched_rows(10, conn, 1500, ROWS[1500:])
+        self.assertEqual(get_cached_rows(10, conn, 0), ROWS)
+        self.assertEqual(get_cached_rows(10, conn, 2400, 2999), ROWS[2400:])
+
+    def _check_jump(self):
+        conn = _Connection(ROWS, '1')
+        add_fetched_rows(10, conn, 0, ROWS[0:1000])
+        add_fetched_rows(10, conn, 2000, ROWS[2000:])
+        self.assertIsNone(get_cached_rows(10, conn, 2000, 2099))
+        add_fetched_rows(10, conn, 1000, ROWS[1000:2000])
+        self.assertEqual(get_cached_rows(10, conn, 1000, 1999),
+                         ROWS[1000:2000])
+        self.assertIsNone(get_cached_rows(10, conn, 1999, 2000))
+
+    def _check_new_query(self):
+        conn = _Connection(ROWS, '1')
+        add_fetched_rows(10, conn, 0, ROWS[0:1000])
+        conn = _Connection(ROWS[::-1], '2')
+        self.assertIsNone(get_cached_rows(10, conn, 0, 0))
+        add_fetched_rows(10, conn, 0, ROWS[::-1][0:1000])
+        self.assertEqual(get_cached_rows(10, conn, 0, 0), [ROWS[-1]])
+        # Only the files of the last result are kept
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.cache_dir, 'result_cache'))), 2)
+
+    def _check_small(self):
+        conn = _Connection(ROWS[:999], '1')
+        add_fetched_rows(10, conn, 0, ROWS[:999])
+        self.assertIsNone(get_cached_rows(10, conn, 0, 0))
+        self.assertFalse(
+            os.path.exists(os.path.join(self.cache_dir, 'result_cache')))
+
+    def _check_evict(self):
+        conn = _Connection(ROWS, '1')
+        add_fetched_rows(10, conn, 0, ROWS[0:1000])
+        evict_result_cache(10)
+        self.assertEqual(
+            os.listdir(os.path.join(self.cache_dir, 'result_cache')), [])
+        # Evicting a transaction without cache does nothing
+        evict_result_cache(11)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.cache_dir)
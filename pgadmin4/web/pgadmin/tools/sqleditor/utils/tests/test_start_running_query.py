@@ -238,20 +238,27 @@ class StartRunningQueryTest(BaseTestGenerator):
          )),
     ]
 
+    @patch('pgadmin.tools.sqleditor.utils.start_running_query'
+           '.is_subscribed', return_value=False)
+    @patch('pgadmin.tools.sqleditor.utils.start_running_query'
+           '.pop_result')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.apply_explain_plan_wrapper_if_needed')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.make_json_response')
-    @patch('pgadmin.tools.sqleditor.utils.start_running_query.pickle')
+    @patch('pgadmin.tools.sqleditor.utils.start_running_query'
+           '.load_transaction')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query.get_driver')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
            '.internal_server_error')
     @patch('pgadmin.tools.sqleditor.utils.start_running_query'
-           '.update_session_grid_transaction')
-    def runTest(self, update_session_grid_transaction_mock,
-                internal_server_error_mock, get_driver_mock, pickle_mock,
+           '.update_transaction')
+    def runTest(self, update_transaction_mock,
+                internal_server_error_mock, get_driver_mock,
+                load_transaction_mock,
                 make_json_response_mock,
-                apply_explain_plan_wrapper_if_needed_mock):
+                apply_explain_plan_wrapper_if_needed_mock,
+                pop_result_mock, is_subscribed_mock):
         """Check correct function is called to handle to run query."""
         self.connection = None
 
@@ -261,7 +268,9 @@ class StartRunningQueryTest(BaseTestGenerator):
         make_json_response_mock.return_value = expected_response
         if self.expect_internal_server_error_called_with is not None:
             internal_server_error_mock.return_value = expected_response
-        pickle_mock.loads.return_value = self.pickle_load_return
+        load_transaction_mock.side_effect = \
+            lambda trans_id, session_obj: (session_obj,
+                                           self.pickle_load_return)
         blueprint_mock = MagicMock()
 
         # Save value for the later use
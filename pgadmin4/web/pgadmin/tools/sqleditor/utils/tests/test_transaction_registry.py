@@ -0,0 +1,167 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import pickle
+from unittest.mock import patch
+
+from flask import Response
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor import add_serialization_timing
+from pgadmin.tools.sqleditor.utils import transaction_registry
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    register_transaction, load_transaction, update_transaction, \
+    persist_transaction, remove_transaction
+
+TRANS_ID = 4242
+
+
+class _Command:
+    """Command object of a transaction."""
+
+    def __init__(self, limit):
+        self.limit = limit
+
+    def __eq__(self, other):
+        return self.limit == other.limit
+
+
+class _Session:
+    sid = 'session-id'
+
+
+class TransactionRegistryTestCase(BaseTestGenerator):
+    """This class tests the registry of the query tool transactions."""
+    scenarios = [
+        ('Transaction loaded once', dict(check='reuse')),
+        ('Transaction loaded again from another session copy',
+         dict(check='reload')),
+        ('Changes are not stored in the session', dict(check='update')),
+        ('Changes are stored in the session when persisted',
+         dict(check='persist')),
+        ('Transaction removed', dict(check='remove')),
+        ('Transaction not registered', dict(check='unregistered')),
+        ('Serialization time reported', dict(check='timing')),
+    ]
+
+    def setUp(self):
+        self.session_obj = {
+            'command_obj': pickle.dumps(_Command(100), -1),
+            'primary_keys': None
+        }
+        self.patches = [
+            patch.object(transaction_registry, 'session', _Session()),
+            patch.object(transaction_registry,
+                         'update_session_grid_transaction'),
+            patch.object(transaction_registry, 'pickle', wraps=pickle),
+        ]
+        for p in self.patches:
+            p.start()
+        self.update_session_mock = \
+            transaction_registry.update_session_grid_transaction
+        self.pickle_mock = transaction_registry.pickle
+
+    def runTest(self):
+        # A new application context, for a new flask.g
+        with self.app.app_context(), self.app.test_request_context():
+            getattr(self, '_check_' + self.check)()
+
+    def _check_reuse(self):
+        session_obj, command_obj = load_transaction(
+            TRANS_ID, self.session_obj)
+        self.assertEqual(command_obj, _Command(100))
+        self.assertIsNot(session_obj, self.session_obj)
+
+        self.assertEqual(
+            load_transaction(TRANS_ID, self.session_obj),
+            (session_obj, command_obj))
+        self.assertIs(load_transaction(TRANS_ID, self.session_obj)[1],
+                      command_obj)
+        self.assertEqual(self.pickle_mock.loads.call_count, 1)
+
+    def _check_reload(self):
+        _, command_obj = load_transaction(TRANS_ID, self.session_obj)
+        # The session holds another copy of the transaction, e.g. created
+        # by another process
+        self.session_obj['command_obj'] = pickle.dumps(_Command(200), -1)
+
+        _, command_obj = load_transaction(TRANS_ID, self.session_obj)
+        self.assertEqual(command_obj, _Command(200))
+        self.assertEqual(self.pickle_mock.loads.call_count, 2)
+
+    def _check_update(self):
+        session_obj, command_obj = load_transaction(
+            TRANS_ID, self.session_obj)
+        command_obj.limit = 500
+        session_obj['primary_keys'] = {'id': 'int4'}
+        update_transaction(TRANS_ID, session_obj, command_obj)
+
+        self.assertEqual(
+            load_transaction(TRANS_ID, self.session_obj),
+            ({'command_obj': self.session_obj['command_obj'],
+              'primary_keys': {'id': 'int4'}}, _Command(500)))
+        self.pickle_mock.dumps.assert_not_called()
+        self.update_session_mock.assert_not_called()
+
+    def _check_persist(self):
+        session_obj, command_obj = load_transaction(
+            TRANS_ID, self.session_obj)
+        # Nothing to store when nothing changed
+        persist_transaction(TRANS_ID)
+        self.update_session_mock.assert_not_called()
+
+        command_obj.limit = 500
+        update_transaction(TRANS_ID, session_obj, command_obj)
+        persist_transaction(TRANS_ID)
+        self.update_session_mock.assert_called_once()
+        trans_id, stored = self.update_session_mock.call_args[0]
+        self.assertEqual(trans_id, TRANS_ID)
+        self.assertEqual(pickle.loads(stored['command_obj']), _Command(500))
+
+        # The stored copy is the one of the registry
+        self.assertIs(load_transaction(TRANS_ID, stored)[1], command_obj)
+        self.assertEqual(self.pickle_mock.loads.call_count, 1)
+
+        # Stored once
+        persist_transaction(TRANS_ID)
+        self.update_session_mock.assert_called_once()
+
+    def _check_remove(self):
+        load_transaction(TRANS_ID, self.session_obj)
+        remove_transaction(TRANS_ID)
+        load_transaction(TRANS_ID, self.session_obj)
+        self.assertEqual(self.pickle_mock.loads.call_count, 2)
+        # Removing a transaction not registered does nothing
+        remove_transaction(TRANS_ID + 1)
+
+    def _check_unregistered(self):
+        update_transaction(TRANS_ID, self.session_obj, _Command(300))
+        self.update_session_mock.assert_called_once_with(
+            TRANS_ID, self.session_obj)
+        self.assertEqual(pickle.loads(self.session_obj['command_obj']),
+                         _Command(300))
+
+        # Registered with the copy stored in the session
+        register_transaction(TRANS_ID, self.session_obj, _Command(300))
+        load_transaction(TRANS_ID, self.session_obj)
+        self.pickle_mock.loads.assert_not_called()
+
+    def _check_timing(self):
+        response = add_serialization_timing(Response())
+        self.assertNotIn('Server-Timing', response.headers)
+
+        load_transaction(TRANS_ID, self.session_obj)
+        response = add_serialization_timing(Response())
+        self.assertRegex(response.headers['Server-Timing'],
+                         r'^session-serialization;dur=\d+\.\d{3}$')
+
+    def tearDown(self):
+        remove_transaction(TRANS_ID)
+        for p in self.patches:
+            p.stop()
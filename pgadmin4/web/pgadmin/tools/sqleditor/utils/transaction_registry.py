@@ -0,0 +1,163 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+In-process registry of the query tool transactions.
+
+The grid data of a transaction (the dict stored in session['gridData']) and
+its command object (QueryToolCommand, TableCommand...) are kept in memory
+between requests, instead of being unpickled from the session and pickled
+back into it on every request. The session keeps the copy stored when the
+transaction was created, or when it was last persisted. It is loaded again
+when the registry does not hold the transaction, or holds another copy of
+it, e.g. after a restart.
+
+Changes are only tracked (the transaction is marked dirty), and stored in
+the session by persist_transaction(), when a tab is restored from it.
+
+The time spent pickling and unpickling in a request is reported in the
+Server-Timing header of the response.
+"""
+
+import pickle
+import threading
+import time
+
+from flask import g, session
+
+from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
+    update_session_grid_transaction
+
+# Name of the Server-Timing metric of the serialization time
+SERIALIZATION_METRIC = 'session-serialization'
+
+_transactions = dict()
+_lock = threading.Lock()
+
+
+class _Transaction:
+    def __init__(self, session_obj, command_obj):
+        self.session_obj = session_obj
+        self.command_obj = command_obj
+        # Pickled command object stored in the session
+        self.persisted = session_obj.get('command_obj')
+        self.dirty = False
+
+
+def _key(trans_id):
+    return getattr(session, 'sid', None), str(trans_id)
+
+
+def _add_serialization_time(start):
+    g.sqleditor_serialization_time = \
+        g.get('sqleditor_serialization_time', 0) + \
+        time.perf_counter() - start
+
+
+def get_serialization_time():
+    """
+    Returns the time (in seconds) spent pickling and unpickling the command
+    objects in the current request, or None if there was none.
+    """
+    return g.get('sqleditor_serialization_time')
+
+
+def dumps(command_obj):
+    start = time.perf_counter()
+    try:
+        # -1 specify the highest protocol version available
+        return pickle.dumps(command_obj, -1)
+    finally:
+        _add_serialization_time(start)
+
+
+def loads(data):
+    start = time.perf_counter()
+    try:
+        return pickle.loads(data)
+    finally:
+        _add_serialization_time(start)
+
+
+def register_transaction(trans_id, session_obj, command_obj):
+    """
+    Registers a transaction, which grid data has just been stored in the
+    session.
+    """
+    with _lock:
+        _transactions[_key(trans_id)] = _Transaction(session_obj, command_obj)
+
+
+def load_transaction(trans_id, session_obj):
+    """
+    Returns the grid data and the command object of the transaction, from
+    the registry, or from session_obj (the grid data stored in the session)
+    when the registry does not hold the stored copy of the transaction.
+    """
+    key = _key(trans_id)
+    with _lock:
+        transaction = _transactions.get(key)
+
+    if transaction is not None and \
+            transaction.persisted == session_obj.get('command_obj'):
+        return transaction.session_obj, transaction.command_obj
+
+    transaction = _Transaction(dict(session_obj),
+                               loads(session_obj['command_obj']))
+    with _lock:
+        _transactions[key] = transaction
+    return transaction.session_obj, transaction.command_obj
+
+
+def update_transaction(trans_id, session_obj, command_obj=None):
+    """
+    Keeps the changed grid data and command object of the transaction, and
+    marks it dirty. The session is not updated.
+    """
+    key = _key(trans_id)
+    with _lock:
+        transaction = _transactions.get(key)
+        if transaction is not None:
+            transaction.session_obj = session_obj
+            if command_obj is not None:
+                transaction.command_obj = command_obj
+            transaction.dirty = True
+            return
+
+    # Not loaded through the registry, store it in the session
+    if command_obj is not None:
+        session_obj['command_obj'] = dumps(command_obj)
+    update_session_grid_transaction(trans_id, session_obj)
+
+
+def persist_transaction(trans_id):
+    """
+    Stores the grid data and command object of the transaction in the
+    session, if they changed since they were last stored.
+    """
+    key = _key(trans_id)
+    with _lock:
+        transaction = _transactions.get(key)
+    if transaction is None or not transaction.dirty:
+        return
+
+    data = dumps(transaction.command_obj)
+    transaction.session_obj['command_obj'] = data
+    transaction.persisted = data
+    transaction.dirty = False
+    # The session gets a copy, later changes are only kept in the registry
+    update_session_grid_transaction(trans_id, dict(transaction.session_obj))
+
+
+def remove_transaction(trans_id):
+    """
+    Removes the transaction from the registry.
+    """
+    with _lock:
+        _transactions.pop(_key(trans_id), None)
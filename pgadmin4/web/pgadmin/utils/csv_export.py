@@ -0,0 +1,197 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Writing query results as CSV for downloads.
+
+The rows are written a chunk at a time with the writer of the standard csv
+module (implemented in C), producing the same output as pgadmin.utils.csv_lib
+which pgAdmin used for it: null values (and values equal to the null
+replacement string) are written without quotes, whatever the quoting.
+
+When allowed, the query can also be run again with COPY ... TO STDOUT, for
+the server to produce the CSV output.
+"""
+
+import csv
+import re
+import zlib
+from io import StringIO
+
+from psycopg import sql
+
+# PostgreSQL text values can not contain NUL characters, which makes it a
+# safe placeholder for the null values until the chunk has been written.
+NULL_MARKER = '\x00'
+CSV_LINE_TERMINATOR = '\r\n'
+# COPY ... TO STDOUT ends the lines with a newline only
+COPY_LINE_TERMINATOR = '\n'
+GZIP_COMPRESS_LEVEL = 6
+
+# OIDs of the types (boolean, integers, floats, numeric) which are not quoted
+# when quoting the strings only.
+NUMERIC_TYPE_OIDS = (16, 20, 21, 23, 26, 700, 701, 1700)
+
+# Queries run again with COPY must be a single statement, which only reads
+# data: no data modifying CTEs, SELECT INTO nor row locks.
+READ_ONLY_QUERY = re.compile(r'^\s*(SELECT|WITH|VALUES|TABLE)\b', re.I)
+WRITE_KEYWORDS = re.compile(r'\b(INSERT|UPDATE|DELETE|MERGE|INTO|FOR)\b',
+                            re.I)
+
+
+def get_csv_quoting(quote):
+    """
+    Returns the csv module quoting of the 'CSV quoting' preference value.
+    """
+    if quote == 'strings':
+        return csv.QUOTE_NONNUMERIC
+    if quote == 'all':
+        return csv.QUOTE_ALL
+    return csv.QUOTE_NONE
+
+
+class CSVChunkWriter:
+    """
+    Writes rows (sequences of values) as CSV text, one chunk at a time.
+
+    Args:
+        quote: 'strings', 'all' or 'none'
+        quote_char: Character used to quote the values
+        field_separator: Character used to separate the values
+        replace_nulls_with: String written for the null values
+        line_terminator: String written at the end of each row
+    """
+
+    def __init__(self, quote='strings', quote_char="'", field_separator=',',
+                 replace_nulls_with=None,
+                 line_terminator=CSV_LINE_TERMINATOR):
+        self.quoting = get_csv_quoting(quote)
+        self.line_terminator = line_terminator
+        self.quote_char = quote_char
+        self.field_separator = field_separator
+        self.replace_nulls_with = replace_nulls_with
+        self.null_text = replace_nulls_with \
+            if replace_nulls_with is not None else ''
+
+        self._buffer = StringIO()
+        self._writer = None
+        if self.quoting != csv.QUOTE_NONE:
+            self._writer = csv.writer(
+                self._buffer, delimiter=field_separator,
+                quotechar=quote_char, quoting=self.quoting,
+                doublequote=True, lineterminator=line_terminator
+            )
+            self._quoted_null = quote_char + NULL_MARKER + quote_char
+
+    def _write_unquoted(self, rows):
+        # Values are written as they are, without any escaping.
+        null_text = self.null_text
+        separator = self.field_separator
+        line_terminator = self.line_terminator
+        return ''.join(
+            separator.join(
+                null_text if value is None else str(value) for value in row
+            ) + line_terminator
+            for row in rows
+        )
+
+    def write(self, rows):
+        """
+        Returns the CSV text of the rows.
+        """
+        if self._writer is None:
+            return self._write_unquoted(rows)
+
+        replace = self.replace_nulls_with
+        has_null = False
+        prepared = []
+        for row in rows:
+            if None in row or (replace is not None and replace in row):
+                has_null = True
+                row = [
+                    NULL_MARKER if value is None or (
+                        replace is not None and value == replace
+                    ) else value
+                    for value in row
+                ]
+            prepared.append(row)
+
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerows(prepared)
+        text = self._buffer.getvalue()
+
+        if has_null:
+            text = text.replace(self._quoted_null, self.null_text)
+        return text
+
+    def write_header(self, columns):
+        """
+        Returns the CSV text of the header (column names).
+        """
+        return self.write([columns])
+
+
+def copy_csv_statement(query, columns, quote='strings', quote_char="'",
+                       field_separator=',', replace_nulls_with=None):
+    """
+    Returns the COPY ... TO STDOUT statement writing the result of the query
+    as CSV with the given options, or None when the query can not be run
+    again safely or the options have no COPY equivalent.
+
+    Args:
+        query: Query of the result
+        columns: (name, type OID) of the columns of the result
+    """
+    if quote not in ('strings', 'all') or not query:
+        return None
+
+    query = query.strip().rstrip(';').rstrip()
+    if ';' in query or not READ_ONLY_QUERY.match(query) or \
+            WRITE_KEYWORDS.search(query):
+        return None
+
+    options = [
+        sql.SQL('FORMAT csv'),
+        sql.SQL('DELIMITER {0}').format(sql.Literal(field_separator)),
+        sql.SQL('QUOTE {0}').format(sql.Literal(quote_char)),
+        sql.SQL('NULL {0}').format(sql.Literal(
+            replace_nulls_with if replace_nulls_with is not None else ''))
+    ]
+
+    if quote == 'all':
+        options.append(sql.SQL('FORCE_QUOTE *'))
+    else:
+        names = [name for name, _ in columns]
+        # Columns to quote are given by name
+        if len(set(names)) != len(names):
+            return None
+        quoted = [sql.Identifier(name) for name, type_oid in columns
+                  if type_oid not in NUMERIC_TYPE_OIDS]
+        if quoted:
+            options.append(sql.SQL('FORCE_QUOTE ({0})').format(
+                sql.SQL(', ').join(quoted)))
+
+    return sql.SQL('COPY ({0}) TO STDOUT WITH ({1})').format(
+        sql.SQL(query), sql.SQL(', ').join(options))
+
+
+def gzip_chunks(chunks, encoding='utf-8', level=GZIP_COMPRESS_LEVEL):
+    """
+    Compresses a stream of text (or bytes) chunks in the gzip format, and
+    yields the compressed data as it is produced.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode(encoding)
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
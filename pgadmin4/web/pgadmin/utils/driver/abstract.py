@@ -12,6 +12,23 @@
 from abc import ABCMeta, abstractmethod, abstractproperty
 from .registry import DriverRegistry
 
+# Formats of the rows returned by execute_2darray and async_fetchmany_2darray:
+# a dict per row, a tuple per row or a list of values per column. The tuple
+# and columnar formats share a single column description for all the rows.
+ROW_FORMAT_DICT = 'dict'
+ROW_FORMAT_TUPLE = 'tuple'
+ROW_FORMAT_COLUMNAR = 'columnar'
+ROW_FORMATS = (ROW_FORMAT_DICT, ROW_FORMAT_TUPLE, ROW_FORMAT_COLUMNAR)
+
+
+def to_columnar(rows, column_count):
+    """
+    Transpose the rows (tuples) into a list of values per column.
+    """
+    if not rows:
+        return [[] for _ in range(column_count)]
+    return [list(values) for values in zip(*rows)]
+
 
 class BaseDriver(metaclass=DriverRegistry):
     """
@@ -98,19 +115,23 @@ class BaseConnection(metaclass=ABCMeta):
     * execute_void(query, params, formatted_exception_msg)
       - Implement this method to execute the given query with no result.
 
-    * execute_2darray(query, params, formatted_exception_msg)
+    * execute_2darray(query, params, formatted_exception_msg, row_format)
       - Implement this method to execute the given query and returns the result
-        as a 2 dimensional array.
+        as a 2 dimensional array. row_format is 'dict' (a dict per row),
+        'tuple' (a tuple per row) or 'columnar' (a list of values per column).
 
     * execute_dict(query, params, formatted_exception_msg)
       - Implement this method to execute the given query and returns the result
         as an array of dict (column name -> value) format.
 
-    * def async_fetchmany_2darray(records=-1, formatted_exception_msg=False):
+    * def async_fetchmany_2darray(records=-1, formatted_exception_msg=False,
+                                  row_format='tuple'):
       - Implement this method to retrieve result of asynchronous connection and
         polling with no_result flag set to True.
         This returns the result as a 2 dimensional array.
         If records is -1 then fetchmany will behave as fetchall.
+        row_format is 'tuple' (a tuple per row), 'columnar' (a list of values
+        per column) or 'dict' (a dict per row).
 
     * connected()
       - Implement this method to get the status of the connection. It should
@@ -190,7 +211,8 @@ class BaseConnection(metaclass=ABCMeta):
 
     @abstractmethod
     def execute_2darray(self, query, params=None,
-                        formatted_exception_msg=False):
+                        formatted_exception_msg=False,
+                        row_format=ROW_FORMAT_DICT):
         pass
 
     @abstractmethod
@@ -200,7 +222,8 @@ class BaseConnection(metaclass=ABCMeta):
 
     @abstractmethod
     def async_fetchmany_2darray(self, records=-1,
-                                formatted_exception_msg=False):
+                                formatted_exception_msg=False,
+                                row_format=ROW_FORMAT_TUPLE):
         pass
 
     @abstractmethod
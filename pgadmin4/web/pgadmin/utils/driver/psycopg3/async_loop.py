@@ -0,0 +1,98 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Event loop of an asynchronous connection.
+
+psycopg's AsyncConnection has to be driven from an event loop, while
+pgAdmin calls it from synchronous code (request handlers, query threads).
+Running every operation with asyncio.run() creates and closes an event loop
+for each call. Instead, every asynchronous connection owns an event loop
+running in a dedicated thread for as long as the connection is open, and
+its operations are submitted to it.
+"""
+
+import asyncio
+import threading
+
+
+class AsyncLoopThread:
+    """
+    Event loop running in a dedicated daemon thread. The thread is started
+    on the first submitted coroutine and runs until stop() is called.
+    """
+
+    def __init__(self, name=None):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        loop = asyncio.new_event_loop()
+
+        def run_loop():
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_forever()
+            finally:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+                loop.close()
+
+        thread = threading.Thread(
+            target=run_loop, name=self.name or 'pgadmin-async-loop',
+            daemon=True
+        )
+        thread.start()
+        self._loop, self._thread = loop, thread
+
+    @property
+    def running(self):
+        return self._loop is not None
+
+    def run(self, coro):
+        """
+        Runs the coroutine in the event loop and waits for its result.
+        Exceptions raised by the coroutine are raised again here.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._start()
+            loop, thread = self._loop, self._thread
+
+        if threading.current_thread() is thread:
+            coro.close()
+            raise RuntimeError(
+                'Cannot wait for a coroutine from its own event loop.')
+
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def stop(self):
+        """Stops the event loop, and waits for its thread to end."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join()
+
+
+def run_coroutine(conn, coro):
+    """
+    Runs a coroutine of the asynchronous connection in the event loop of
+    the connection, or in a new event loop if the connection has none.
+    """
+    loop_thread = getattr(conn, 'pgadmin_loop', None)
+    if loop_thread is None:
+        return asyncio.run(coro)
+    return loop_thread.run(coro)
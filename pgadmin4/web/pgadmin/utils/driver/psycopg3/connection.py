@@ -29,15 +29,17 @@ import config
 from pgadmin.model import User
 from pgadmin.utils.exception import ConnectionLost, CryptKeyMissing
 from pgadmin.utils import get_complete_file_path
-from ..abstract import BaseConnection
+from ..abstract import BaseConnection, ROW_FORMAT_DICT, ROW_FORMAT_TUPLE, \
+    ROW_FORMAT_COLUMNAR, to_columnar
 from .cursor import DictCursor, AsyncDictCursor
+from .async_loop import AsyncLoopThread, run_coroutine
 from .typecast import register_global_typecasters,\
     register_string_typecasters, register_binary_typecasters, \
-    register_array_to_string_typecasters, ALL_JSON_TYPES
+    register_array_to_string_typecasters
 from .encoding import get_encoding, configure_driver_encodings
-from pgadmin.utils import csv_lib as csv
+from pgadmin.utils.csv_export import CSVChunkWriter, copy_csv_statement, \
+    COPY_LINE_TERMINATOR
 from pgadmin.utils.master_password import get_crypt_key
-from io import StringIO
 from pgadmin.utils.locker import ConnectionLocker
 from pgadmin.utils.driver import get_driver
 
@@ -173,6 +175,8 @@ class Connection(BaseConnection):
         self.__async_cursor = None
         self.__async_query_id = None
         self.__async_query_error = None
+        # Event loop of the asynchronous connection
+        self.__async_loop = None
         self.__backend_pid = None
         self.execution_aborted = False
         self.row_count = 0
@@ -357,7 +361,13 @@ class Connection(BaseConnection):
                             autocommit=autocommit,
                             prepare_threshold=manager.prepare_threshold
                         )
-                    pg_conn = asyncio.run(connectdbserver())
+                    if self.__async_loop is None:
+                        self.__async_loop = AsyncLoopThread(
+                            'pgadmin-async-{0}-{1}'.format(
+                                manager.sid, conn_id))
+                    pg_conn = self.__async_loop.run(connectdbserver())
+                    # The cursors submit their operations to the same loop
+                    pg_conn.pgadmin_loop = self.__async_loop
                 else:
                     pg_conn = psycopg.Connection.connect(
                         connection_string,
@@ -366,6 +376,7 @@ class Connection(BaseConnection):
 
         except psycopg.Error as e:
             manager.stop_ssh_tunnel()
+            self._stop_async_loop()
             if hasattr(e, 'pgerror'):
                 msg = e.pgerror
             elif e.diag.message_detail:
@@ -822,8 +833,7 @@ WHERE db.datname = current_database()""")
         To fetch query result and generate CSV output
 
         Args:
-            params: Additional parameters
-            records: Number of initial records
+            records: Number of records fetched and written at a time
         Returns:
             Generator response
         """
@@ -867,91 +877,50 @@ WHERE db.datname = current_database()""")
             return False, \
                 gettext('The query executed did not return any data.')
 
-        def handle_null_values(results, replace_nulls_with):
-            """
-            This function is used to replace null values with the given string
-
-            :param results:
-            :param replace_nulls_with: null values will be replaced by this
-            string.
-            :return: modified result
-            """
-
-            temp_results = []
-            for row in results:
-                res = dict()
-                for k, v in row.items():
-                    if v is None:
-                        res[k] = replace_nulls_with
-                    else:
-                        res[k] = v
-                temp_results.append(res)
-            results = temp_results
-
-            return results
-
         def gen(conn_obj, trans_obj, quote='strings', quote_char="'",
-                field_separator=',', replace_nulls_with=None):
+                field_separator=',', replace_nulls_with=None,
+                use_copy=False):
 
-            cur.scroll(0, mode='absolute')
-            results = cur.fetchmany(records)
-            if not results:
+            csv_writer = CSVChunkWriter(
+                quote=quote, quote_char=quote_char,
+                field_separator=field_separator,
+                replace_nulls_with=replace_nulls_with
+            )
+
+            if cur.get_rowcount() <= 0:
                 yield gettext('The query executed did not return any data.')
                 return
 
-            header = []
-            json_columns = []
-
-            for c in cur.ordered_description():
-                # This is to handle the case in which column name is non-ascii
-                column_name = c.to_dict()['name']
-                header.append(column_name)
-                if c.to_dict()['type_code'] in ALL_JSON_TYPES:
-                    json_columns.append(column_name)
-
-            res_io = StringIO()
-
-            if quote == 'strings':
-                quote = csv.QUOTE_NONNUMERIC
-            elif quote == 'all':
-                quote = csv.QUOTE_ALL
-            else:
-                quote = csv.QUOTE_NONE
+            # This is to handle the case in which column name is non-ascii
+            columns = cur.ordered_description()
+            header = [c.to_dict()['name'] for c in columns]
 
-            csv_writer = csv.DictWriter(
-                res_io, fieldnames=header, delimiter=field_separator,
-                quoting=quote,
-                quotechar=quote_char,
-                replace_nulls_with=replace_nulls_with
-            )
+            copy_chunks = None
+            if use_copy:
+                copy_chunks = self._copy_query_as_csv(
+                    query, columns, records, quote, quote_char,
+                    field_separator, replace_nulls_with
+                )
 
-            csv_writer.writeheader()
-            # Replace the null values with given string if configured.
-            if replace_nulls_with is not None:
-                results = handle_null_values(results, replace_nulls_with)
-            csv_writer.writerows(results)
+            if copy_chunks is not None:
+                # Same line ends in the header as in the rows from COPY
+                yield CSVChunkWriter(
+                    quote=quote, quote_char=quote_char,
+                    field_separator=field_separator,
+                    replace_nulls_with=replace_nulls_with,
+                    line_terminator=COPY_LINE_TERMINATOR
+                ).write_header(header)
+                yield from copy_chunks
+                return
 
-            yield res_io.getvalue()
+            yield csv_writer.write_header(header)
 
+            cur.scroll(0, mode='absolute')
             while True:
-                results = cur.fetchmany(records)
-
+                results = cur.fetchmany(records, _tupples=True)
                 if not results:
                     break
-                res_io = StringIO()
-
-                csv_writer = csv.DictWriter(
-                    res_io, fieldnames=header, delimiter=field_separator,
-                    quoting=quote,
-                    quotechar=quote_char,
-                    replace_nulls_with=replace_nulls_with
-                )
-
-                # Replace the null values with given string if configured.
-                if replace_nulls_with is not None:
-                    results = handle_null_values(results, replace_nulls_with)
-                csv_writer.writerows(results)
-                yield res_io.getvalue()
+                yield csv_writer.write(results)
 
             try:
                 # try to reset the cursor scroll back to where it was,
@@ -970,6 +939,65 @@ WHERE db.datname = current_database()""")
         register_string_typecasters(self.conn)
         return True, gen, self
 
+    def _copy_query_as_csv(self, query, columns, records, quote, quote_char,
+                           field_separator, replace_nulls_with):
+        """
+        Run the query again on the server with COPY ... TO STDOUT, and return
+        a generator of its CSV output (without header), 'records' rows at a
+        time.
+
+        Returns None when the query can not be run again that way: it is not
+        a single read only query, the options have no COPY equivalent, the
+        connection is in a transaction (which an error would abort) or the
+        COPY statement fails to start.
+        """
+        statement = copy_csv_statement(
+            query,
+            [(c.to_dict()['display_name'], c.to_dict()['type_code'])
+             for c in columns],
+            quote=quote, quote_char=quote_char,
+            field_separator=field_separator,
+            replace_nulls_with=replace_nulls_with
+        )
+        if statement is None or \
+                not isinstance(self.conn, psycopg.AsyncConnection) or \
+                self.conn.info.encoding != 'utf-8' or \
+                self.conn.info.transaction_status != \
+                psycopg.pq.TransactionStatus.IDLE:
+            return None
+
+        copy_ctx = self.conn.cursor().copy(statement)
+        try:
+            copy = run_coroutine(self.conn, copy_ctx.__aenter__())
+        except psycopg.Error as e:
+            current_app.logger.warning(
+                'Could not download the result with COPY: {0}'.format(e))
+            return None
+
+        async def read_chunk():
+            data = bytearray()
+            for _ in range(records):
+                row = await copy.read()
+                if not row:
+                    break
+                data += row
+            return bytes(data)
+
+        def gen():
+            try:
+                while True:
+                    data = run_coroutine(self.conn, read_chunk())
+                    if not data:
+                        break
+                    yield data
+            except BaseException as e:
+                run_coroutine(self.conn, copy_ctx.__aexit__(
+                    type(e), e, e.__traceback__))
+                raise
+            run_coroutine(self.conn, copy_ctx.__aexit__(None, None, None))
+
+        return gen()
+
     def execute_scalar(self, query, params=None,
                        formatted_exception_msg=False):
         status, cur = self.__cursor()
@@ -1203,7 +1231,16 @@ WHERE db.datname = current_database()""")
         )
 
     def execute_2darray(self, query, params=None,
-                        formatted_exception_msg=False):
+                        formatted_exception_msg=False,
+                        row_format=ROW_FORMAT_DICT):
+        """
+        Execute the query and return the column descriptions and the rows.
+
+        row_format is one of:
+          'dict': {'columns': [...], 'rows': [dict per row]}
+          'tuple': {'columns': [...], 'rows': [tuple per row]}
+          'columnar': {'columns': [...], 'values': [list per column]}
+        """
         status, cur = self.__cursor()
         self.row_count = 0
 
@@ -1234,7 +1271,7 @@ WHERE db.datname = current_database()""")
                     not self.reconnecting:
                 return self.__attempt_execution_reconnect(
                     self.execute_2darray, query, params,
-                    formatted_exception_msg
+                    formatted_exception_msg, row_format
                 )
             errmsg = self._formatted_exception_msg(pe, formatted_exception_msg)
             current_app.logger.error(
@@ -1257,7 +1294,13 @@ WHERE db.datname = current_database()""")
         rows = []
         self.row_count = cur.get_rowcount()
         if cur.get_rowcount() > 0:
-            rows = cur.fetchall()
+            rows = cur.fetchall(_tupples=row_format != ROW_FORMAT_DICT)
+
+        if row_format == ROW_FORMAT_COLUMNAR:
+            return True, {
+                'columns': columns,
+                'values': to_columnar(rows, len(columns))
+            }
 
         return True, {'columns': columns, 'rows': rows}
 
@@ -1331,7 +1374,8 @@ WHERE db.datname = current_database()""")
 
     def async_fetchmany_2darray(self, records=2000,
                                 from_rownum=0, to_rownum=0,
-                                formatted_exception_msg=False):
+                                formatted_exception_msg=False,
+                                row_format=ROW_FORMAT_TUPLE):
         """
         User should poll and check if status is ASYNC_OK before calling this
         function
@@ -1339,6 +1383,8 @@ WHERE db.datname = current_database()""")
           records: no of records to fetch. use -1 to fetchall.
           formatted_exception_msg:
           for_download: if True, will fetch all records and reset the cursor
+          row_format: 'tuple' (a tuple per row), 'columnar' (a list of
+            values per column) or 'dict' (a dict per row)
 
         Returns:
 
@@ -1358,6 +1404,7 @@ WHERE db.datname = current_database()""")
                 "Asynchronous query execution/operation underway."
             )
 
+        tupples = row_format != ROW_FORMAT_DICT
         more_results = True
         while more_results:
             if cur.get_rowcount() > 0:
@@ -1366,13 +1413,13 @@ WHERE db.datname = current_database()""")
                     if records == -1:
                         result = cur.fetchwindow(
                             from_rownum=0, to_rownum=cur.get_rowcount() - 1,
-                            _tupples=True)
+                            _tupples=tupples)
                     elif records is None:
                         result = cur.fetchwindow(from_rownum=from_rownum,
                                                  to_rownum=to_rownum,
-                                                 _tupples=True)
+                                                 _tupples=tupples)
                     else:
-                        result = cur.fetchmany(records, _tupples=True)
+                        result = cur.fetchmany(records, _tupples=tupples)
                 except psycopg.ProgrammingError:
                     result = None
             else:
@@ -1382,6 +1429,9 @@ WHERE db.datname = current_database()""")
                 return True, None
             more_results = cur.nextset()
 
+        if result is not None and row_format == ROW_FORMAT_COLUMNAR:
+            result = to_columnar(result, len(cur.description or []))
+
         return True, result
 
     def connected(self):
@@ -1476,12 +1526,21 @@ Failed to reset the connection to the server due to following error:
                 self.conn = None
             self.password = None
             self.wasConnected = False
+        self._stop_async_loop()
 
     def _close_async(self):
         async def _close_conn(conn):
             if conn:
                 await conn.close()
-        asyncio.run(_close_conn(self.conn))
+        if self.__async_loop is not None:
+            self.__async_loop.run(_close_conn(self.conn))
+        else:
+            asyncio.run(_close_conn(self.conn))
+
+    def _stop_async_loop(self):
+        if self.__async_loop is not None:
+            self.__async_loop.stop()
+            self.__async_loop = None
 
     def _wait(self, conn):
         pass  # This function is empty
@@ -1568,6 +1627,10 @@ Failed to reset the connection to the server due to following error:
 
         return self.row_count
 
+    @property
+    def async_query_id(self):
+        return self.__async_query_id
+
     @property
     def total_rows(self):
         if self.__async_cursor is None:
@@ -13,7 +13,6 @@ fetching results from it, and also takes care of the duplicate column name in
 result.
 """
 
-import asyncio
 from collections import OrderedDict
 import psycopg
 from flask import g, current_app
@@ -22,6 +21,7 @@ from typing import Any, Sequence
 from psycopg.rows import dict_row, tuple_row
 from psycopg._encodings import py_codecs as encodings
 from .encoding import configure_driver_encodings
+from .async_loop import run_coroutine
 
 configure_driver_encodings(encodings)
 
@@ -205,6 +205,18 @@ class DictCursor(_cursor):
         self.row_factory = dict_row
         return res
 
+    def fetchall(self, _tupples=False):
+        """
+        Fetch all tuples as dictionary list, or as tuples.
+        """
+        if not _tupples:
+            return _cursor.fetchall(self)
+
+        self.row_factory = tuple_row
+        res = _cursor.fetchall(self)
+        self.row_factory = dict_row
+        return res
+
     def get_rowcount(self):
         return self.pgresult.ntuples
 
@@ -273,12 +285,18 @@ class AsyncDictCursor(_async_cursor):
         self._ordered_description()
         return self._odt_desc
 
+    def _run(self, coro):
+        """
+        Run the coroutine in the event loop of the connection.
+        """
+        return run_coroutine(self.connection, coro)
+
     def execute(self, query, params=None):
         """
         Execute function
         """
         try:
-            return asyncio.run(self._execute(query, params))
+            return self._run(self._execute(query, params))
         except RuntimeError as e:
             current_app.logger.exception(e)
 
@@ -309,7 +327,7 @@ class AsyncDictCursor(_async_cursor):
         """
         Close the cursor.
         """
-        asyncio.run(self._close_cursor())
+        self._run(self._close_cursor())
 
     def fetchmany(self, size=None, _tupples=False):
         """
@@ -317,7 +335,7 @@ class AsyncDictCursor(_async_cursor):
         """
         self._odt_desc = None
         self.row_factory = tuple_row
-        res = asyncio.run(self._fetchmany(size))
+        res = self._run(self._fetchmany(size))
         if not _tupples and res is not None:
             res = [self._dict_tuple(t) for t in res]
 
@@ -342,7 +360,7 @@ class AsyncDictCursor(_async_cursor):
         """
         self._odt_desc = None
         self.row_factory = tuple_row
-        res = asyncio.run(self._fetchall())
+        res = self._run(self._fetchall())
         if not _tupples and res is not None:
             res = [self._dict_tuple(t) for t in res]
 
@@ -360,7 +378,7 @@ class AsyncDictCursor(_async_cursor):
         Execute function
         """
         self.row_factory = tuple_row
-        res = asyncio.run(self._fetchone())
+        res = self._run(self._fetchone())
         self.row_factory = dict_row
         return res
 
@@ -370,14 +388,22 @@ class AsyncDictCursor(_async_cursor):
         """
         self._odt_desc = None
         self.row_factory = tuple_row
-        asyncio.run(self._scrollcur(from_rownum, "absolute"))
-        res = asyncio.run(self._fetchmany(to_rownum - from_rownum + 1))
+        res = self._run(self._fetchwindow(from_rownum, to_rownum))
         if not _tupples and res is not None:
             res = [self._dict_tuple(t) for t in res]
 
         self.row_factory = dict_row
         return res
 
+    async def _fetchwindow(self, from_rownum, to_rownum):
+        """
+        Scroll to the first row of the window and fetch it, in a single
+        round through the event loop.
+        """
+        await _async_cursor.scroll(self, from_rownum, mode="absolute")
+        return await _async_cursor.fetchmany(
+            self, to_rownum - from_rownum + 1)
+
     async def _scrollcur(self, position, mode):
         """
         Fetch all tuples as ordered dictionary list.
@@ -388,7 +414,7 @@ class AsyncDictCursor(_async_cursor):
         """
         Fetch all tuples as ordered dictionary list.
         """
-        return asyncio.run(self._scrollcur(position, mode))
+        return self._run(self._scrollcur(position, mode))
 
     def get_rowcount(self):
         if self.pgresult:
@@ -12,8 +12,10 @@ Implementation of ServerManager
 """
 import os
 import datetime
+import threading
 import config
 import logging
+from contextlib import contextmanager
 from flask import current_app, session
 from flask_security import current_user
 from flask_babel import gettext
@@ -46,9 +48,15 @@ class ServerManager(object):
     And, acts as connection manager for that particular session.
     """
     _INFORMATION_MSG = gettext("Information is not available.")
+    # Connections used in place of the database connections by the current
+    # thread, see use_connection()
+    _thread_connections = threading.local()
 
     def __init__(self, server):
         self.connections = dict()
+        # Guards the connections, which the worker threads (see
+        # use_connection()) add and release while the session is updated
+        self._connections_lock = threading.Lock()
         self.local_bind_host = '127.0.0.1'
         self.local_bind_port = None
         self.tunnel_object = None
@@ -118,12 +126,15 @@ class ServerManager(object):
         self.prepare_threshold = server.prepare_threshold
         self.post_connection_sql = server.post_connection_sql
 
-        for con in self.connections:
-            self.connections[con]._release()
+        with self._connections_lock:
+            connections = list(self.connections.values())
+        for con in connections:
+            con._release()
 
         self.update_session()
 
-        self.connections = dict()
+        with self._connections_lock:
+            self.connections = dict()
 
     def _set_password(self, res):
         """
@@ -143,7 +154,9 @@ class ServerManager(object):
         """
         Returns a dictionary object representing the server manager.
         """
-        if self.ver is None or len(self.connections) == 0:
+        with self._connections_lock:
+            server_connections = list(self.connections.items())
+        if self.ver is None or len(server_connections) == 0:
             return None
 
         res = dict()
@@ -165,8 +178,8 @@ class ServerManager(object):
 
         connections = res['connections'] = dict()
 
-        for conn_id in self.connections:
-            conn = self.connections[conn_id].as_dict()
+        for conn_id, conn in server_connections:
+            conn = conn.as_dict()
 
             if conn is not None:
                 connections[conn_id] = conn
@@ -195,9 +208,37 @@ class ServerManager(object):
             return int(int(self.sversion / 100) / 100)
         raise InternalServerError(self._INFORMATION_MSG)
 
+    @contextmanager
+    def use_connection(self, did, conn_id):
+        """
+        Use the connection 'conn_id' for the calls of connection() made for
+        the database 'did' by the current thread, so that a worker thread
+        can run the existing code on a connection of its own.
+
+        :param did: Database Id.
+        :param conn_id: Connection Id.
+        :return: The connection (not connected yet).
+        """
+        conn = self.connection(did=did, conn_id=conn_id, async_=False)
+        conn_ids = self._thread_connections.__dict__.setdefault(
+            'conn_ids', dict())
+        key = (self.sid, did)
+        prev_conn_id = conn_ids.get(key)
+        conn_ids[key] = conn_id
+        try:
+            yield conn
+        finally:
+            if prev_conn_id is None:
+                del conn_ids[key]
+            else:
+                conn_ids[key] = prev_conn_id
+
     def connection(self, **kwargs):
         database = kwargs.get('database', None)
         conn_id = kwargs.get('conn_id', None)
+        if conn_id is None and database is None:
+            conn_id = getattr(self._thread_connections, 'conn_ids',
+                              dict()).get((self.sid, kwargs.get('did')))
         auto_reconnect = kwargs.get('auto_reconnect', True)
         did = kwargs.get('did', None)
         async_ = kwargs.get('async_', None)
@@ -261,21 +302,22 @@ WHERE db.oid = {0}""".format(did))
 
         self.pinged = datetime.datetime.now()
 
-        if my_id in self.connections:
-            return self.connections[my_id]
-        else:
-            if async_ is None:
-                async_ = 1 if conn_id is not None else 0
+        with self._connections_lock:
+            if my_id in self.connections:
+                return self.connections[my_id]
             else:
-                async_ = 1 if async_ is True else 0
-            self.connections[my_id] = Connection(
-                self, my_id, database, auto_reconnect=auto_reconnect,
-                async_=async_,
-                use_binary_placeholder=use_binary_placeholder,
-                array_to_string=array_to_string
-            )
+                if async_ is None:
+                    async_ = 1 if conn_id is not None else 0
+                else:
+                    async_ = 1 if async_ is True else 0
+                self.connections[my_id] = Connection(
+                    self, my_id, database, auto_reconnect=auto_reconnect,
+                    async_=async_,
+                    use_binary_placeholder=use_binary_placeholder,
+                    array_to_string=array_to_string
+                )
 
-            return self.connections[my_id]
+                return self.connections[my_id]
 
     @staticmethod
     def _get_password_to_conn(data, masterpass_processed):
@@ -467,13 +509,15 @@ WHERE db.oid = {0}""".format(did))
             return return_value
 
         if my_id is not None:
-            if my_id in self.connections:
-                self.connections[my_id]._release()
-                del self.connections[my_id]
+            with self._connections_lock:
+                conn = self.connections.pop(my_id, None)
+                last_connection = len(self.connections) == 0
+            if conn is not None:
+                conn._release()
                 if did is not None:
                     del self.db_info[did]
 
-                if len(self.connections) == 0:
+                if last_connection:
                     self.ver = None
                     self.sversion = None
                     self.server_type = None
@@ -486,8 +530,9 @@ WHERE db.oid = {0}""".format(did))
             else:
                 return False
 
-        for con_key in list(self.connections.keys()):
-            conn = self.connections[con_key]
+        with self._connections_lock:
+            connections = list(self.connections.values())
+        for conn in connections:
             # Cancel the ongoing transaction before closing the connection
             # as it may hang forever
             if conn.connected() and conn.conn_id is not None and \
@@ -495,7 +540,8 @@ WHERE db.oid = {0}""".format(did))
                 conn.cancel_transaction(conn.conn_id[5:])
             conn._release()
 
-        self.connections = dict()
+        with self._connections_lock:
+            self.connections = dict()
         self.ver = None
         self.sversion = None
         self.server_type = None
@@ -508,8 +554,9 @@ WHERE db.oid = {0}""".format(did))
 
     def _update_password(self, passwd):
         self.password = passwd
-        for conn_id in self.connections:
-            conn = self.connections[conn_id]
+        with self._connections_lock:
+            connections = list(self.connections.values())
+        for conn in connections:
             if conn.conn is not None or conn.wasConnected is True:
                 conn.password = passwd
 
@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg3.async_loop import AsyncLoopThread
+from pgadmin.utils.driver.psycopg3.cursor import AsyncDictCursor
+
+
+async def _current_thread():
+    return threading.current_thread()
+
+
+async def _fail():
+    raise ValueError('failed')
+
+
+class AsyncLoopThreadTestCase(BaseTestGenerator):
+    """This class tests the event loop of the asynchronous connections."""
+    scenarios = [
+        ('Coroutines run in the same thread', dict(check='same_thread')),
+        ('Exceptions are raised in the caller', dict(check='exception')),
+        ('Restart after stop', dict(check='restart')),
+        ('Waiting from the loop thread fails', dict(check='reentrant')),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        loop_thread = AsyncLoopThread('test-async-loop')
+        try:
+            getattr(self, '_check_' + self.check)(loop_thread)
+        finally:
+            loop_thread.stop()
+        self.assertFalse(loop_thread.running)
+
+    def _check_same_thread(self, loop_thread):
+        first = loop_thread.run(_current_thread())
+        self.assertIsNot(first, threading.current_thread())
+        self.assertIs(loop_thread.run(_current_thread()), first)
+
+    def _check_exception(self, loop_thread):
+        with self.assertRaises(ValueError):
+            loop_thread.run(_fail())
+        # The loop is still usable
+        self.assertTrue(loop_thread.run(_current_thread()).is_alive())
+
+    def _check_restart(self, loop_thread):
+        first = loop_thread.run(_current_thread())
+        loop_thread.stop()
+        self.assertFalse(first.is_alive())
+        self.assertTrue(loop_thread.run(_current_thread()).is_alive())
+
+    def _check_reentrant(self, loop_thread):
+        async def nested():
+            loop_thread.run(_current_thread())
+
+        with self.assertRaises(RuntimeError):
+            loop_thread.run(nested())
+
+
+class AsyncCursorFetchTestCase(BaseTestGenerator):
+    """
+    This class tests that the asynchronous cursor fetches a result in
+    chunks with the event loop of the connection.
+    """
+    scenarios = [
+        ('Fetch a result in chunks', dict(rows=2500, fetch_size=1000)),
+    ]
+
+    def runTest(self):
+        async def connect():
+            return await psycopg.AsyncConnection.connect(
+                make_conninfo(
+                    dbname=self.server['db'],
+                    user=self.server['username'],
+                    password=self.server['db_password'],
+                    host=self.server['host'],
+                    port=self.server['port'],
+                    sslmode=self.server['sslmode']
+                ),
+                cursor_factory=AsyncDictCursor,
+                autocommit=True
+            )
+
+        loop_thread = AsyncLoopThread('test-async-fetch')
+        try:
+            conn = loop_thread.run(connect())
+            conn.pgadmin_loop = loop_thread
+            try:
+                cur = conn.cursor(scrollable=True)
+                cur.execute(
+                    "SELECT g FROM generate_series(1, {0}) g"
+                    .format(self.rows))
+
+                chunks = []
+                while True:
+                    rows = cur.fetchmany(self.fetch_size, _tupples=True)
+                    if not rows:
+                        break
+                    chunks.append(rows)
+                cur.close_cursor()
+            finally:
+                loop_thread.run(conn.close())
+        finally:
+            loop_thread.stop()
+
+        self.assertEqual([len(rows) for rows in chunks], [1000, 1000, 500])
+        self.assertEqual([row[0] for rows in chunks for row in rows],
+                         list(range(1, self.rows + 1)))
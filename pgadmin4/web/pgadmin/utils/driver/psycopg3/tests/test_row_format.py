@@ -0,0 +1,110 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import sys
+import time
+
+import psycopg
+from psycopg.conninfo import make_conninfo
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.abstract import to_columnar, ROW_FORMAT_DICT, \
+    ROW_FORMAT_TUPLE, ROW_FORMAT_COLUMNAR
+from pgadmin.utils.driver.psycopg3.cursor import DictCursor
+
+# Size of the result fetched and encoded by the benchmark
+BENCHMARK_ROWS = 200000
+
+
+class ToColumnarTestCase(BaseTestGenerator):
+    """This class tests the transposition of rows into columns."""
+    scenarios = [
+        ('Rows', dict(
+            rows=[(1, 'a', None), (2, 'b', True)], column_count=3,
+            expected=[[1, 2], ['a', 'b'], [None, True]])),
+        ('Single row', dict(
+            rows=[(1, 'a')], column_count=2, expected=[[1], ['a']])),
+        ('No rows', dict(
+            rows=[], column_count=2, expected=[[], []])),
+        ('No result', dict(
+            rows=None, column_count=0, expected=[])),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertEqual(to_columnar(self.rows, self.column_count),
+                         self.expected)
+
+
+class RowFormatBenchmarkTestCase(BaseTestGenerator):
+    """
+    This class compares the time taken to fetch and JSON encode a large
+    result as a dict per row, a tuple per row and a list per column.
+    """
+    scenarios = [
+        ('Fetch and encode a large result', dict(rows=BENCHMARK_ROWS)),
+    ]
+
+    def setUp(self):
+        self.conn = psycopg.connect(
+            make_conninfo(
+                dbname=self.server['db'],
+                user=self.server['username'],
+                password=self.server['db_password'],
+                host=self.server['host'],
+                port=self.server['port'],
+                sslmode=self.server['sslmode'],
+                client_encoding='utf8'
+            ),
+            cursor_factory=DictCursor,
+            autocommit=True
+        )
+
+    def _fetch(self, row_format):
+        cur = self.conn.cursor()
+        cur.execute(
+            "SELECT g AS id, md5(g::text) AS name, g % 2 = 0 AS even "
+            "FROM generate_series(1, {0}) g".format(self.rows))
+
+        start = time.perf_counter()
+        rows = cur.fetchall(_tupples=row_format != ROW_FORMAT_DICT)
+        if row_format == ROW_FORMAT_COLUMNAR:
+            rows = to_columnar(rows, len(cur.description))
+        encoded = json.dumps(rows)
+        elapsed = time.perf_counter() - start
+        cur.close()
+
+        return rows, elapsed, len(encoded)
+
+    def runTest(self):
+        results = {}
+        for row_format in (ROW_FORMAT_DICT, ROW_FORMAT_TUPLE,
+                           ROW_FORMAT_COLUMNAR):
+            results[row_format] = self._fetch(row_format)
+
+        dict_rows = results[ROW_FORMAT_DICT][0]
+        tuple_rows = results[ROW_FORMAT_TUPLE][0]
+        columns = results[ROW_FORMAT_COLUMNAR][0]
+        self.assertEqual(len(tuple_rows), self.rows)
+        self.assertEqual([tuple(row.values()) for row in dict_rows],
+                         tuple_rows)
+        self.assertEqual([list(values) for values in zip(*tuple_rows)],
+                         columns)
+
+        print("\nFetched and encoded {0} rows:".format(self.rows),
+              file=sys.stderr)
+        for row_format, (_, elapsed, size) in results.items():
+            print("  {0:8s} {1:.3f}s, {2} bytes of JSON".format(
+                row_format, elapsed, size), file=sys.stderr)
+
+    def tearDown(self):
+        self.conn.close()
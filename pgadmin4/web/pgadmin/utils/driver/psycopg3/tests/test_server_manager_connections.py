@@ -0,0 +1,149 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import threading
+import time
+from unittest.mock import patch
+
+from flask import copy_current_request_context
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.driver.psycopg3 import server_manager
+from pgadmin.utils.driver.psycopg3.server_manager import ServerManager
+
+WORKERS = 8
+CONNECTIONS_PER_WORKER = 50
+
+
+class _Connection:
+    """
+    Connection which is slow to create and to describe, so that the
+    threads switch while the manager handles it.
+    """
+
+    def __init__(self, manager, conn_id, db, **kwargs):
+        time.sleep(0.001)
+        self.conn_id = conn_id
+        self.db = db
+
+    def as_dict(self):
+        time.sleep(0.0001)
+        return {'conn_id': self.conn_id, 'database': self.db}
+
+    def _release(self):
+        pass
+
+
+def _server_manager():
+    """Server manager of a connected server, without its connections."""
+    manager = ServerManager.__new__(ServerManager)
+    manager.connections = dict()
+    manager._connections_lock = threading.Lock()
+    manager.sid = 1
+    manager.db = 'postgres'
+    manager.db_info = {10: {'datname': 'postgres'}}
+    manager.ver = '17.0'
+    manager.sversion = 170000
+    manager.server_type = 'pg'
+    manager.server_cls = None
+    manager.password = None
+    manager.use_ssh_tunnel = 0
+    return manager
+
+
+class ServerManagerConnectionsTestCase(BaseTestGenerator):
+    """
+    This class tests the connections of a server manager used by several
+    threads at once.
+    """
+    scenarios = [
+        ('Connection created once for the threads', dict(check='shared')),
+        ('Connections added and released while the session is updated',
+         dict(check='release')),
+    ]
+
+    def setUp(self):
+        self.patches = [
+            patch.object(server_manager, 'get_crypt_key',
+                         lambda: (True, 'key')),
+            patch.object(server_manager, 'Connection', _Connection),
+        ]
+        for p in self.patches:
+            p.start()
+        self.request_context = self.app.test_request_context()
+        self.request_context.push()
+        self.manager = _server_manager()
+        self.errors = []
+
+    def _run_workers(self, target):
+        barrier = threading.Barrier(WORKERS)
+
+        def worker(worker_id):
+            barrier.wait()
+            try:
+                target(worker_id)
+            except Exception as e:
+                self.errors.append(e)
+
+        # The session is updated by the workers
+        workers = [threading.Thread(
+            target=copy_current_request_context(worker), args=(worker_id,))
+            for worker_id in range(WORKERS)]
+        for w in workers:
+            w.start()
+        return workers
+
+    def runTest(self):
+        getattr(self, '_check_' + self.check)()
+
+    def _check_shared(self):
+        connections = []
+
+        def connect(worker_id):
+            connections.append(self.manager.connection(
+                did=10, conn_id='shared', async_=False))
+
+        for w in self._run_workers(connect):
+            w.join()
+
+        self.assertEqual(self.errors, [])
+        self.assertEqual(len(connections), WORKERS)
+        self.assertEqual(len(set(id(conn) for conn in connections)), 1)
+        self.assertEqual(list(self.manager.connections), ['CONN:shared'])
+
+    def _check_release(self):
+        # Keeps the server connected while the workers come and go
+        self.manager.connection(did=10)
+
+        def connect_and_release(worker_id):
+            for i in range(CONNECTIONS_PER_WORKER):
+                conn_id = '{0}-{1}'.format(worker_id, i)
+                self.manager.connection(did=10, conn_id=conn_id,
+                                        async_=False)
+                time.sleep(0.001)
+                self.manager.release(conn_id=conn_id)
+
+        workers = self._run_workers(connect_and_release)
+        while any(w.is_alive() for w in workers):
+            try:
+                self.manager.as_dict()
+            except Exception as e:
+                self.errors.append(e)
+        for w in workers:
+            w.join()
+
+        self.assertEqual(self.errors, [])
+        self.assertEqual(list(self.manager.connections), ['DB:postgres'])
+        self.assertEqual(list(self.manager.as_dict()['connections']),
+                         ['DB:postgres'])
+
+    def tearDown(self):
+        self.request_context.pop()
+        for p in self.patches:
+            p.stop()
@@ -34,6 +34,8 @@ from .parseutils.meta import FunctionMetadata, ColumnMetadata, ForeignKey
 from .parseutils.utils import last_word
 from .parseutils.tables import TableReference
 from .prioritization import PrevalenceCounter
+from .metadata_cache import get_catalog_metadata
+from .completion_index import CompletionIndex
 from flask import render_template
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
@@ -60,7 +62,7 @@ def Candidate(
     completion, prio=None, meta=None, synonyms=None, prio2=None, display=None
 ):
     return _Candidate(
-        completion, prio, meta, synonyms or [completion], prio2,
+        completion, prio, meta, tuple(synonyms or [completion]), prio2,
         display or completion
     )
 
@@ -104,6 +106,7 @@ class SQLAutoComplete():
         """
 
         self.sid = kwargs['sid'] if 'sid' in kwargs else None
+        self.did = kwargs['did'] if 'did' in kwargs else None
         self.conn = kwargs['conn'] if 'conn' in kwargs else None
         self.keywords = []
         self.name_pattern = re.compile(r"^[_a-z][_a-z0-9\$]*$")
@@ -120,9 +123,19 @@ class SQLAutoComplete():
         # we will set template path for sql scripts
         self.sql_path = 'sqlautocomplete/sql/#{0}#'.format(manager.version)
 
+        # Catalog metadata shared with the other query tools of the database
+        self.metadata = get_catalog_metadata(
+            self.sid, self.did, manager.user, self.sql_path)
+        self.generation = None
+        # Keys of the cached metadata already added to dbmetadata
+        self._extended = set()
+
         self.search_path = []
+        self.keywords_in_uppercase = None
         schema_names = []
         if self.conn.connected():
+            self.generation = self.metadata.check_version(self.conn)
+
             # Fetch the search path
             self._set_search_path()
 
@@ -130,25 +143,14 @@ class SQLAutoComplete():
             self._fetch_schema_name(schema_names)
 
             pref = Preferences.module('sqleditor')
-            keywords_in_uppercase = \
+            keywords_in_uppercase = self.keywords_in_uppercase = \
                 pref.preference('keywords_in_uppercase').get()
 
             # Fetch the keywords
-            query = render_template("/".join([self.sql_path, 'keywords.sql']))
-            # If setting 'Keywords in uppercase' is set to True in
-            # Preferences then fetch the keywords in upper case.
-            if keywords_in_uppercase:
-                query = render_template(
-                    "/".join([self.sql_path, 'keywords.sql']), upper_case=True)
-            status, res = self.conn.execute_dict(query)
-            if status:
-                for record in res['rows']:
-                    # 'public' is a keyword in EPAS database server. Don't add
-                    # this into the list of keywords.
-                    # This is a hack to fix the issue in autocomplete.
-                    if record['word'].lower() == 'public':
-                        continue
-                    self.keywords.append(record['word'])
+            self.keywords.extend(self.metadata.get(
+                ('keywords', keywords_in_uppercase),
+                lambda: self._fetch_keywords(keywords_in_uppercase)
+            ) or [])
 
         self.prioritizer = PrevalenceCounter(self.keywords)
 
@@ -182,12 +184,52 @@ class SQLAutoComplete():
             for record in res['rows']:
                 self.search_path.append(record['schema'])
 
-    def _fetch_schema_name(self, schema_names):
-        query = render_template("/".join([self.sql_path, 'schema.sql']))
+    def _fetch_keywords(self, keywords_in_uppercase):
+        query = render_template("/".join([self.sql_path, 'keywords.sql']))
+        # If setting 'Keywords in uppercase' is set to True in
+        # Preferences then fetch the keywords in upper case.
+        if keywords_in_uppercase:
+            query = render_template(
+                "/".join([self.sql_path, 'keywords.sql']), upper_case=True)
         status, res = self.conn.execute_dict(query)
-        if status:
-            for record in res['rows']:
-                schema_names.append(record['schema'])
+        if not status:
+            return None
+
+        # 'public' is a keyword in EPAS database server. Don't add
+        # this into the list of keywords.
+        # This is a hack to fix the issue in autocomplete.
+        return [record['word'] for record in res['rows']
+                if record['word'].lower() != 'public']
+
+    def _fetch_schema_name(self, schema_names):
+        def fetch():
+            query = render_template("/".join([self.sql_path, 'schema.sql']))
+            status, res = self.conn.execute_dict(query)
+            if status:
+                return [record['schema'] for record in res['rows']]
+
+        schema_names.extend(self.metadata.get('schemas', fetch) or [])
+
+    def _check_metadata(self):
+        """
+        Rebuilds dbmetadata from the cached metadata, when the catalog
+        changed.
+        """
+        if not self.conn.connected():
+            return
+
+        generation = self.metadata.check_version(self.conn)
+        if generation == self.generation:
+            return
+
+        self.generation = generation
+        self._extended = set()
+        self.dbmetadata = \
+            {"tables": {}, "views": {}, "functions": {}, "datatypes": {}}
+        self.all_completions = set(self.keywords)
+        schema_names = []
+        self._fetch_schema_name(schema_names)
+        self.extend_schemata(schema_names)
 
     def escape_name(self, name):
         if name and (
@@ -381,7 +423,46 @@ class SQLAutoComplete():
             {"tables": {}, "views": {}, "functions": {}, "datatypes": {}}
         self.all_completions = set(self.keywords + self.functions)
 
-    def find_matches(self, text, collection, mode="strict", meta=None):
+    @staticmethod
+    def _index_entries(collection):
+        """
+        Returns the text and the names matched of the completions of the
+        collection, to build its CompletionIndex.
+        """
+        return [
+            (cand.completion, cand.synonyms)
+            if isinstance(cand, _Candidate) else (cand, (cand,))
+            for cand in collection
+        ]
+
+    def _get_candidates(self, key, fetch, build, shared=True):
+        """
+        Returns the candidates built by build(), with their CompletionIndex
+        (None when it is to be built by find_matches).
+
+        The candidates made from the catalog metadata only depend on it, on
+        the search path and on the key, so they are built and indexed once
+        per catalog version, and shared with the other query tools of the
+        database. fetch() adds the metadata to dbmetadata, and returns False
+        when it could not be fetched: the candidates are then not shared.
+        """
+        if not shared or not fetch():
+            return build(), None
+
+        def build_indexed():
+            candidates = build()
+            return candidates, CompletionIndex(
+                self._index_entries(candidates))
+
+        # The names are escaped according to the keywords, which depend on
+        # the preferences of the user
+        return self.metadata.get_candidates(
+            (self.generation, tuple(self.search_path),
+             self.keywords_in_uppercase) + key,
+            build_indexed)
+
+    def find_matches(self, text, collection, mode="strict", meta=None,
+                     index=None):
         """Find completion matches for the given text.
 
         Given the user's input text and a collection of available
@@ -393,6 +474,8 @@ class SQLAutoComplete():
         `mode` can be either 'fuzzy', or 'strict'
             'fuzzy': fuzzy matching, ties broken by name prevalance
             `keyword`: start only matching, ties broken by keyword prevalance
+        `index` is the CompletionIndex of the collection, built here when
+        not given.
 
         yields prompt_toolkit Completion instances for any matches found
         in the collection of available completions.
@@ -400,6 +483,10 @@ class SQLAutoComplete():
         """
         if not collection:
             return []
+        # Only the candidates found in the index of the collection may match
+        if index is None:
+            collection = list(collection)
+            index = CompletionIndex(self._index_entries(collection))
         prio_order = [
             "keyword",
             "function",
@@ -439,94 +526,84 @@ class SQLAutoComplete():
         # Note: higher priority values mean more important, so use negative
         # signs to flip the direction of the tuple
         if fuzzy:
+            positions = index.fuzzy_candidates(text)
+            names = index.lower_names()
             regex = ".*?".join(map(re.escape, text))
-            pat = re.compile("(%s)" % regex)
-
-            def _match(item):
-                if item.lower()[: len(text) + 1] in (text, text + " "):
-                    # Exact match of first word in suggestion
-                    # This is to get exact alias matches to the top
-                    # E.g. for input `e`, 'Entries E' should be on top
-                    # (before e.g. `EndUsers EU`)
-                    return float("Infinity"), -1
-                r = pat.search(self.unescape_name(item.lower()))
-                if r:
-                    return -len(r.group()), -r.start()
+            search = re.compile("(%s)" % regex).search
+            first_words = (text, text + " ")
+            first_word_len = len(text) + 1
+
+            def _match(pos):
+                sort_key = None
+                for name, unescaped_name in names[pos]:
+                    if name[:first_word_len] in first_words:
+                        # Exact match of first word in suggestion
+                        # This is to get exact alias matches to the top
+                        # E.g. for input `e`, 'Entries E' should be on top
+                        # (before e.g. `EndUsers EU`)
+                        return float("Infinity"), -1
+                    r = search(unescaped_name)
+                    if r:
+                        key = -len(r.group()), -r.start()
+                        if sort_key is None or key > sort_key:
+                            sort_key = key
+                return sort_key
 
         else:
-            match_end_limit = len(text)
-
-            def _match(item):
-                # Text starts with double quote; Remove quoting and
-                # match on everything that follows the double-quote.
-                item = self.unescape_name(item.lower())
-                match_point = item.find(text, 0, match_end_limit)
-                if match_point >= 0:
-                    # Use negative infinity to force keywords to sort after all
-                    # fuzzy matches
-                    return -float("Infinity"), -match_point
+            # Names starting with the text, once unquoted (text starts with
+            # double quote; Remove quoting and match on everything that
+            # follows the double-quote).
+            positions = index.prefix_matches(text)
+
+            def _match(pos):
+                # Use negative infinity to force keywords to sort after all
+                # fuzzy matches
+                return -float("Infinity"), 0
 
         matches = []
-        for cand in collection:
+        for pos in positions:
+            # The best match of the names (synonyms) of the completion
+            sort_key = _match(pos)
+            if not sort_key:
+                continue
+
+            cand = collection[pos]
             if isinstance(cand, _Candidate):
-                item, prio, display_meta, synonyms, prio2, display = cand
+                item, prio, display_meta, _, prio2, display = cand
                 if display_meta is None:
                     display_meta = meta
-                syn_matches = (_match(x) for x in synonyms)
-                # Nones need to be removed to avoid max() crashing in Python 3
-                syn_matches = [m for m in syn_matches if m]
-                sort_key = max(syn_matches) if syn_matches else None
             else:
                 item, display_meta, prio, prio2, display = \
                     cand, meta, 0, 0, cand
-                sort_key = _match(cand)
-
-            if sort_key:
-                if display_meta and len(display_meta) > 50:
-                    # Truncate meta-text to 50 characters, if necessary
-                    display_meta = display_meta[:47] + "..."
-
-                # Lexical order of items in the collection, used for
-                # tiebreaking items with the same match group length and start
-                # position. Since we use *higher* priority to mean "more
-                # important," we use -ord(c) to prioritize "aa" > "ab" and end
-                # with 1 to prioritize shorter strings (ie "user" > "users").
-                # We first do a case-insensitive sort and then a
-                # case-sensitive one as a tie breaker.
-                # We also use the unescape_name to make sure quoted names have
-                # the same priority as unquoted names.
-                lexical_priority = (
-                    tuple(
-                        0 if c in " _" else -ord(c)
-                        for c in self.unescape_name(item.lower())
-                    ) +
-                    (1,) +
-                    tuple(c for c in item)
-                )
 
-                priority = (
-                    sort_key,
-                    type_priority,
-                    prio,
-                    priority_func(item),
-                    prio2,
-                    lexical_priority,
-                )
-                matches.append(
-                    Match(
-                        completion=Completion(
-                            text=item,
-                            start_position=-text_len,
-                            display_meta=display_meta,
-                            display=display,
-                        ),
-                        priority=priority,
-                    )
+            if display_meta and len(display_meta) > 50:
+                # Truncate meta-text to 50 characters, if necessary
+                display_meta = display_meta[:47] + "..."
+
+            priority = (
+                sort_key,
+                type_priority,
+                prio,
+                priority_func(item),
+                prio2,
+                index.lexical_priority(pos),
+            )
+            matches.append(
+                Match(
+                    completion=Completion(
+                        text=item,
+                        start_position=-text_len,
+                        display_meta=display_meta,
+                        display=display,
+                    ),
+                    priority=priority,
                 )
+            )
         return matches
 
     def get_completions(self, text, text_before_cursor):
         self.text_before_cursor = text_before_cursor
+        self._check_metadata()
 
         word_before_cursor = self.get_word_before_cursor(word=True)
         matches = []
@@ -803,13 +880,21 @@ class SQLAutoComplete():
             suggestion.usage, "call"
         )
 
-        # Function overloading means we way have multiple functions of the same
-        # name at this point, so keep unique names only
-        all_functions = self.populate_functions(suggestion.schema, filt)
-        funcs = {self._make_cand(f, alias, suggestion, arg_mode)
-                 for f in all_functions}
+        def build():
+            # Function overloading means we way have multiple functions of the
+            # same name at this point, so keep unique names only
+            all_functions = self.populate_functions(suggestion.schema, filt)
+            return list({self._make_cand(f, alias, suggestion, arg_mode)
+                         for f in all_functions})
+
+        funcs, index = self._get_candidates(
+            ('functions', suggestion.schema, suggestion.usage == "from",
+             arg_mode),
+            lambda: self.fetch_functions(suggestion.schema), build,
+            shared=not alias)
 
-        matches = self.find_matches(word_before_cursor, funcs, meta="function")
+        matches = self.find_matches(word_before_cursor, funcs,
+                                    meta="function", index=index)
 
         if not suggestion.schema and not suggestion.usage:
             # also suggest hardcoded functions using startswith matching
@@ -919,26 +1004,45 @@ class SQLAutoComplete():
         return Candidate(item, synonyms=synonyms, prio2=prio2, display=display)
 
     def get_table_matches(self, suggestion, word_before_cursor, alias=False):
-        tables = self.populate_schema_objects(suggestion.schema, "tables")
-        tables.extend(
-            SchemaObject(tbl.name) for tbl in suggestion.local_tables)
-
         # Unless we're sure the user really wants them, don't suggest the
         # pg_catalog tables that are implicitly on the search path
-        if not suggestion.schema and \
-                (not word_before_cursor.startswith("pg_")):
-            tables = [t for t in tables if not t.name.startswith("pg_")]
-        tables = [self._make_cand(t, alias, suggestion) for t in tables]
-        return self.find_matches(word_before_cursor, tables, meta="table")
+        hide_pg = not suggestion.schema and \
+            (not word_before_cursor.startswith("pg_"))
+
+        def build():
+            tables = self.populate_schema_objects(suggestion.schema, "tables")
+            tables.extend(
+                SchemaObject(tbl.name) for tbl in suggestion.local_tables)
+
+            if hide_pg:
+                tables = [t for t in tables if not t.name.startswith("pg_")]
+            return [self._make_cand(t, alias, suggestion) for t in tables]
+
+        # The aliases and the tables of the WITH clause depend on the query
+        tables, index = self._get_candidates(
+            ('tables', suggestion.schema, hide_pg),
+            lambda: self.fetch_schema_objects(suggestion.schema, "tables"),
+            build, shared=not alias and not suggestion.local_tables)
+        return self.find_matches(word_before_cursor, tables, meta="table",
+                                 index=index)
 
     def get_view_matches(self, suggestion, word_before_cursor, alias=False):
-        views = self.populate_schema_objects(suggestion.schema, "views")
+        hide_pg = not suggestion.schema and (
+            not word_before_cursor.startswith("pg_"))
+
+        def build():
+            views = self.populate_schema_objects(suggestion.schema, "views")
 
-        if not suggestion.schema and (
-                not word_before_cursor.startswith("pg_")):
-            views = [v for v in views if not v.name.startswith("pg_")]
-        views = [self._make_cand(v, alias, suggestion) for v in views]
-        return self.find_matches(word_before_cursor, views, meta="view")
+            if hide_pg:
+                views = [v for v in views if not v.name.startswith("pg_")]
+            return [self._make_cand(v, alias, suggestion) for v in views]
+
+        views, index = self._get_candidates(
+            ('views', suggestion.schema, hide_pg),
+            lambda: self.fetch_schema_objects(suggestion.schema, "views"),
+            build, shared=not alias)
+        return self.find_matches(word_before_cursor, views, meta="view",
+                                 index=index)
 
     def get_alias_matches(self, suggestion, word_before_cursor):
         aliases = suggestion.aliases
@@ -950,14 +1054,25 @@ class SQLAutoComplete():
                                  meta="database")
 
     def get_keyword_matches(self, suggestion, word_before_cursor):
-        return self.find_matches(word_before_cursor, self.keywords,
-                                 meta="keyword")
+        keywords, index = self._get_candidates(
+            ('keywords',), lambda: bool(self.keywords),
+            lambda: list(self.keywords))
+        return self.find_matches(word_before_cursor, keywords,
+                                 meta="keyword", index=index)
 
     def get_datatype_matches(self, suggestion, word_before_cursor):
         # suggest custom datatypes
-        types = self.populate_schema_objects(suggestion.schema, "datatypes")
-        types = [self._make_cand(t, False, suggestion) for t in types]
-        matches = self.find_matches(word_before_cursor, types, meta="datatype")
+        def build():
+            types = self.populate_schema_objects(
+                suggestion.schema, "datatypes")
+            return [self._make_cand(t, False, suggestion) for t in types]
+
+        types, index = self._get_candidates(
+            ('datatypes', suggestion.schema),
+            lambda: self.fetch_schema_objects(suggestion.schema, "datatypes"),
+            build)
+        matches = self.find_matches(word_before_cursor, types,
+                                    meta="datatype", index=index)
 
         if not suggestion.schema:
             # Also suggest hardcoded types
@@ -1168,30 +1283,53 @@ class SQLAutoComplete():
     def fetch_schema_objects(self, schema, obj_type):
         """
         This function is used to fetch schema objects like tables, views, etc..
-        :return:
+        :return: False if they could not be fetched
         """
-        data = []
         query, in_clause = self._get_schema_obj_query(schema, obj_type)
-
-        if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
-            if status:
-                for record in res['rows']:
-                    data.append(
-                        (record['schema_name'], record['object_name'])
-                    )
+        key = (obj_type, in_clause)
+        if key in self._extended:
+            return True
+
+        rows = self.metadata.get(
+            key, lambda: self._fetch_schema_object_rows(
+                query, in_clause, obj_type))
+        if rows is None:
+            return False
+        self._extended.add(key)
+        data, columns, foreign_keys = rows
 
         if (obj_type == 'tables' or obj_type == 'views') and len(data) > 0:
             self.extend_relations(data, obj_type)
-            self.extend_columns(
-                self.fetch_columns(in_clause, obj_type), obj_type
-            )
+            self.extend_columns(columns, obj_type)
             if obj_type == 'tables':
-                self.extend_foreignkeys(
-                    self.fetch_foreign_keys(in_clause)
-                )
+                self.extend_foreignkeys(foreign_keys)
         elif obj_type == 'datatypes' and len(data) > 0:
             self.extend_datatypes(data)
+        return True
+
+    def _fetch_schema_object_rows(self, query, in_clause, obj_type):
+        """
+        This function is used to fetch the rows of the schema objects, with
+        the columns and foreign keys of the tables and views.
+        :return: (objects, columns, foreign keys), or None
+        """
+        if not self.conn.connected():
+            return None
+
+        status, res = self.conn.execute_dict(query)
+        if not status:
+            return None
+
+        data = [(record['schema_name'], record['object_name'])
+                for record in res['rows']]
+        columns = []
+        foreign_keys = []
+        if (obj_type == 'tables' or obj_type == 'views') and len(data) > 0:
+            columns = self.fetch_columns(in_clause, obj_type)
+            if obj_type == 'tables':
+                foreign_keys = self.fetch_foreign_keys(in_clause)
+
+        return data, columns, foreign_keys
 
     def _get_function_sql(self, schema):
         """
@@ -1242,18 +1380,29 @@ class SQLAutoComplete():
         """
         This function is used to fecth the list of functions.
         :param schema:
-        :return:
+        :return: False if they could not be fetched
         """
-        data = []
-        query, _ = self._get_function_sql(schema)
-
-        if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
-            if status:
-                self._get_function_meta_data(res, data)
+        query, in_clause = self._get_function_sql(schema)
+        key = ('functions', in_clause)
+        if key in self._extended:
+            return True
+
+        def fetch():
+            if self.conn.connected():
+                status, res = self.conn.execute_dict(query)
+                if status:
+                    data = []
+                    self._get_function_meta_data(res, data)
+                    return data
+
+        data = self.metadata.get(key, fetch)
+        if data is None:
+            return False
+        self._extended.add(key)
 
         if len(data) > 0:
             self.extend_functions(data)
+        return True
 
     def fetch_columns(self, schemas, obj_type):
         """
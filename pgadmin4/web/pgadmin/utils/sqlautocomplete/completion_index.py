@@ -0,0 +1,151 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Index of the names of a collection of completions.
+
+SQLAutoComplete.find_matches used to unquote, lowercase and match every name
+of the collection on each keystroke. The index narrows the collection down
+to the candidates which may match the text, the candidates are then matched
+and prioritized as before:
+
+* strict mode: the names starting with the text, found by bisecting the
+  sorted lowercase unquoted names.
+* fuzzy mode: the names containing all the characters of the text, found by
+  intersecting the sets of positions by character. Fuzzy matching looks for
+  the characters of the text in order, not for contiguous substrings, so a
+  trigram index would miss matches (e.g. 'ord' in 'o_r_d').
+
+The candidates made from the catalog metadata are indexed once per catalog
+version and shared by the query tools of the database (see
+SQLAutoComplete._get_candidates), so an index may be used by several threads
+at once: the parts built on first use are only published once complete.
+"""
+
+from bisect import bisect_left
+
+
+def unescape_name(name):
+    """ Unquote a string."""
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+
+    return name
+
+
+class CompletionIndex:
+    """
+    Index of the names of a collection of completions.
+
+    Args:
+        entries: (text, names matched) of each completion of the collection
+    """
+
+    def __init__(self, entries):
+        self.size = len(entries)
+        self._entries = entries
+        self._lexical_priorities = [None] * self.size
+        # Built on first use, by mode: (sorted names, positions by name),
+        # positions by character and lowercase names of each completion
+        self._names = None
+        self._char_positions = None
+        self._lower_names = None
+
+    def _build_names(self):
+        positions = dict()
+        for pos, (_, names) in enumerate(self._entries):
+            for name in names:
+                positions.setdefault(
+                    unescape_name(name.lower()), []).append(pos)
+
+        names = sorted(positions)
+        self._names = (names, [positions[name] for name in names])
+
+    def _build_chars(self):
+        char_positions = dict()
+        for pos, (_, names) in enumerate(self._entries):
+            for char in set(''.join(names).lower()):
+                char_positions.setdefault(char, set()).add(pos)
+
+        self._char_positions = char_positions
+
+    def lower_names(self):
+        """
+        Returns the (lowercase, lowercase unquoted) names matched of each
+        completion, by position.
+        """
+        if self._lower_names is None:
+            lower_names = []
+            for _, names in self._entries:
+                lower_names.append(tuple(
+                    (name, unescape_name(name))
+                    for name in (n.lower() for n in names)))
+            self._lower_names = lower_names
+        return self._lower_names
+
+    def lexical_priority(self, pos):
+        """
+        Returns the lexical order of the completion, used for tiebreaking
+        the completions with the same match group length and start position.
+        Since we use *higher* priority to mean "more important," we use
+        -ord(c) to prioritize "aa" > "ab" and end with 1 to prioritize shorter
+        strings (ie "user" > "users"). We first do a case-insensitive sort and
+        then a case-sensitive one as a tie breaker. We also unescape the name
+        to make sure quoted names have the same priority as unquoted names.
+        """
+        priority = self._lexical_priorities[pos]
+        if priority is None:
+            item = self._entries[pos][0]
+            priority = self._lexical_priorities[pos] = (
+                tuple(
+                    0 if c in " _" else -ord(c)
+                    for c in unescape_name(item.lower())
+                ) +
+                (1,) +
+                tuple(c for c in item)
+            )
+        return priority
+
+    def prefix_matches(self, text):
+        """
+        Returns the sorted positions of the completions with a name starting
+        with the text.
+        """
+        if self._names is None:
+            self._build_names()
+        names, positions = self._names
+
+        found = set()
+        for i in range(bisect_left(names, text), len(names)):
+            if not names[i].startswith(text):
+                break
+            found.update(positions[i])
+        return sorted(found)
+
+    def fuzzy_candidates(self, text):
+        """
+        Returns the sorted positions of the completions with a name
+        containing all the characters of the text.
+        """
+        if not text:
+            return range(self.size)
+
+        if self._char_positions is None:
+            self._build_chars()
+        positions_by_char = self._char_positions
+
+        char_positions = []
+        for char in set(text):
+            if char not in positions_by_char:
+                return []
+            char_positions.append(positions_by_char[char])
+
+        char_positions.sort(key=len)
+        found = char_positions[0].intersection(*char_positions[1:])
+        return sorted(found)
@@ -0,0 +1,132 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Catalog metadata shared by the SQLAutoComplete objects of a database.
+
+The rows fetched for the completions (keywords, schemas, relations with
+their columns and foreign keys, functions, datatypes) are cached per server,
+database and role, and shared by all the query tools connected to it. So are
+the completion candidates made from them, with their CompletionIndex.
+
+The cache is cleared when the version of the catalog changes. The version
+is made of the statistics counters of the inserted, updated and deleted
+rows of the catalog tables read for the completions, which makes the check
+a cheap query. It is checked at most once every CATALOG_CHECK_INTERVAL
+seconds. The counters are reported by the backends when their transaction
+ends, so a committed DDL is seen shortly after.
+"""
+
+import threading
+import time
+
+from flask import render_template
+
+# Minimum interval (in seconds) between two checks of the catalog version
+CATALOG_CHECK_INTERVAL = 1
+
+_metadata = dict()
+_metadata_lock = threading.Lock()
+
+
+class CatalogMetadata:
+    """
+    Cached rows of the catalog of a database.
+
+    Args:
+        sql_path: Path of the SQL templates of the server version
+    """
+
+    def __init__(self, sql_path):
+        self.sql_path = sql_path
+        self.version = None
+        # Incremented each time the cache is cleared
+        self.generation = 0
+        self.checked_at = None
+        self._rows = dict()
+        self._fetch_locks = dict()
+        self._lock = threading.Lock()
+
+    def check_version(self, conn):
+        """
+        Clears the cache if the catalog changed since the last check.
+        Returns the generation of the cache.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.checked_at is not None and \
+                    now - self.checked_at < CATALOG_CHECK_INTERVAL:
+                return self.generation
+            self.checked_at = now
+
+        status, version = conn.execute_scalar(render_template(
+            "/".join([self.sql_path, 'catalog_version.sql'])))
+        if not status:
+            return self.generation
+
+        with self._lock:
+            if version != self.version:
+                if self.version is not None:
+                    self._rows = dict()
+                    self.generation += 1
+                self.version = version
+            return self.generation
+
+    def get(self, key, fetch):
+        """
+        Returns the cached rows of the key, calling fetch() to get them when
+        they are not cached. Rows are not cached when fetch() returns None.
+        """
+        with self._lock:
+            if key in self._rows:
+                return self._rows[key]
+            fetch_lock = self._fetch_locks.setdefault(key, threading.Lock())
+
+        # The other query tools wait for the rows instead of fetching them
+        # again
+        with fetch_lock:
+            with self._lock:
+                if key in self._rows:
+                    return self._rows[key]
+                generation = self.generation
+
+            rows = fetch()
+
+            with self._lock:
+                self._fetch_locks.pop(key, None)
+                if rows is not None and generation == self.generation:
+                    self._rows[key] = rows
+            return rows
+
+    def get_candidates(self, key, build):
+        """
+        Returns the completion candidates of the key with their index,
+        calling build() to make them when they are not cached. Like the
+        rows, they are kept until the catalog version changes.
+        """
+        return self.get(('candidates',) + key, build)
+
+
+def get_catalog_metadata(sid, did, user, sql_path):
+    """
+    Returns the shared catalog metadata of the database.
+
+    Args:
+        sid: Server id
+        did: Database id
+        user: Role of the connection
+        sql_path: Path of the SQL templates of the server version
+    """
+    key = (sid, did, user)
+    with _metadata_lock:
+        metadata = _metadata.get(key)
+        # The server may have been upgraded
+        if metadata is None or metadata.sql_path != sql_path:
+            metadata = _metadata[key] = CatalogMetadata(sql_path)
+        return metadata
@@ -0,0 +1,182 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete, \
+    Candidate
+from pgadmin.utils.sqlautocomplete import metadata_cache
+from pgadmin.utils.sqlautocomplete.metadata_cache import CatalogMetadata
+from pgadmin.utils.sqlautocomplete.prioritization import PrevalenceCounter
+
+NAMES = ['orders', 'order_lines', 'Orders', '"Order Items"', 'customers',
+         'customer_orders', 'o_r_d', 'products', 'stock', '"select"']
+
+
+def _unescape(name):
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+    return name
+
+
+class CompletionIndexTestCase(BaseTestGenerator):
+    """This class tests the matching of the completions with the index."""
+    scenarios = [
+        ('Strict matches', dict(mode='strict', texts=[
+            '', 'o', 'ord', 'order', 'orders', '"ord', 'cust', 'x', 'sel'])),
+        ('Fuzzy matches', dict(mode='fuzzy', texts=[
+            '', 'o', 'ord', 'ors', 'c_o', 'st', 'x', 'od'])),
+    ]
+
+    def setUp(self):
+        self.completer = SQLAutoComplete.__new__(SQLAutoComplete)
+        self.completer.prioritizer = PrevalenceCounter([])
+
+    def _expected(self, text):
+        """Matches found by scanning all the names."""
+        text = text.lower().lstrip('"')
+        if self.mode == 'strict':
+            return set(name for name in NAMES
+                       if _unescape(name.lower()).startswith(text))
+        pat = re.compile('.*?'.join(map(re.escape, text)))
+        return set(name for name in NAMES
+                   if pat.search(_unescape(name.lower())))
+
+    def runTest(self):
+        for text in self.texts:
+            matches = self.completer.find_matches(
+                text, NAMES, mode=self.mode, meta='table')
+            self.assertEqual(
+                set(m.completion.text for m in matches),
+                self._expected(text), text)
+
+        # The synonyms of the candidates are matched
+        matches = self.completer.find_matches(
+            'ol', [Candidate('order_lines', synonyms=('order_lines', 'ol'))],
+            mode=self.mode)
+        self.assertEqual([m.completion.text for m in matches],
+                         ['order_lines'])
+
+
+class CompletionPriorityTestCase(BaseTestGenerator):
+    """This class tests the priority of the matched completions."""
+    scenarios = [
+        ('Names used first', dict(mode='fuzzy')),
+        ('Keywords used first', dict(mode='strict')),
+    ]
+
+    def setUp(self):
+        self.completer = SQLAutoComplete.__new__(SQLAutoComplete)
+        self.completer.prioritizer = PrevalenceCounter(['ORDER', 'OR'])
+
+    def _ordered(self, collection):
+        matches = self.completer.find_matches(
+            'or', collection, mode=self.mode)
+        return [m.completion.text for m in
+                sorted(matches, key=lambda m: m.priority, reverse=True)]
+
+    def runTest(self):
+        if self.mode == 'fuzzy':
+            collection = ['orders', 'order_lines']
+            self.assertEqual(self._ordered(collection),
+                             ['order_lines', 'orders'])
+            self.completer.prioritizer.update('SELECT * FROM orders')
+        else:
+            collection = ['ORDER', 'OR']
+            self.assertEqual(self._ordered(collection), ['OR', 'ORDER'])
+            self.completer.prioritizer.update('SELECT 1 ORDER BY 1')
+
+        self.assertEqual(self._ordered(collection),
+                         collection)
+
+
+class _Connection:
+    """Connection returning the catalog version."""
+
+    def __init__(self):
+        self.version = '1,1,1'
+
+    def execute_scalar(self, query):
+        return True, self.version
+
+
+class CompletionCandidatesTestCase(BaseTestGenerator):
+    """
+    This class tests the candidates shared by the query tools of a
+    database.
+    """
+    scenarios = [
+        ('Candidates shared per catalog version', dict(fetched=True)),
+        ('Candidates not shared when the fetch failed', dict(fetched=False)),
+    ]
+
+    def setUp(self):
+        self.conn = _Connection()
+        self.metadata = CatalogMetadata('sqlautocomplete/sql/#170000#')
+        self.builds = []
+        self.patch = patch.object(metadata_cache, 'CATALOG_CHECK_INTERVAL', 0)
+        self.patch.start()
+
+    def _completer(self):
+        completer = SQLAutoComplete.__new__(SQLAutoComplete)
+        completer.prioritizer = PrevalenceCounter([])
+        completer.metadata = self.metadata
+        completer.generation = self.metadata.generation
+        completer.search_path = ['public']
+        completer.keywords_in_uppercase = True
+        return completer
+
+    def _build(self):
+        self.builds.append(1)
+        return [Candidate(name) for name in NAMES]
+
+    def _get_candidates(self, completer, key=('tables', None, True)):
+        return completer._get_candidates(
+            key, lambda: self.fetched, self._build)
+
+    def runTest(self):
+        with self.app.app_context():
+            self.metadata.check_version(self.conn)
+            self._check_candidates()
+
+    def _check_candidates(self):
+        first, second = self._completer(), self._completer()
+        candidates, index = self._get_candidates(first)
+        other_candidates, other_index = self._get_candidates(second)
+
+        if not self.fetched:
+            self.assertIsNone(index)
+            self.assertEqual(len(self.builds), 2)
+            return
+
+        # Built and indexed once for both query tools
+        self.assertEqual(len(self.builds), 1)
+        self.assertIs(other_candidates, candidates)
+        self.assertIs(other_index, index)
+        self.assertEqual(
+            set(m.completion.text for m in second.find_matches(
+                'ord', candidates, index=index)),
+            {'orders', 'order_lines', 'Orders', '"Order Items"'})
+
+        # Another search path or key has its own candidates
+        second.search_path = ['sales', 'public']
+        self._get_candidates(second)
+        self._get_candidates(first, ('views', None, True))
+        self.assertEqual(len(self.builds), 3)
+
+        # Built again once the catalog version changed
+        self.conn.version = '1,2,1'
+        first.generation = self.metadata.check_version(self.conn)
+        self.assertIsNot(self._get_candidates(first)[1], index)
+        self.assertEqual(len(self.builds), 4)
+
+    def tearDown(self):
+        self.patch.stop()
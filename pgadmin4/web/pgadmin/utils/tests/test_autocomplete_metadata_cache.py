@@ -0,0 +1,117 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete import metadata_cache
+from pgadmin.utils.sqlautocomplete.metadata_cache import get_catalog_metadata
+
+SQL_PATH = 'sqlautocomplete/sql/#170000#'
+
+
+class _Connection:
+    """Connection returning the catalog version."""
+
+    def __init__(self):
+        self.version = '1,1,1'
+        self.status = True
+        self.queries = 0
+
+    def execute_scalar(self, query):
+        self.queries += 1
+        if not self.status:
+            return False, 'connection lost'
+        return True, self.version
+
+
+class CatalogMetadataTestCase(BaseTestGenerator):
+    """This class tests the catalog metadata shared by the query tools."""
+    scenarios = [
+        ('Rows shared by the query tools', dict(check='shared')),
+        ('Rows cleared when the catalog changes', dict(check='version')),
+        ('Catalog version checked once per interval',
+         dict(check='interval')),
+        ('Failed fetch not cached', dict(check='failure')),
+        ('Metadata per database', dict(check='database')),
+    ]
+
+    def setUp(self):
+        self.conn = _Connection()
+        self.fetches = []
+        self.patches = [
+            patch.object(metadata_cache, '_metadata', dict()),
+            patch.object(metadata_cache, 'CATALOG_CHECK_INTERVAL', 0),
+        ]
+        for p in self.patches:
+            p.start()
+        self.metadata = get_catalog_metadata(1, 2, 'postgres', SQL_PATH)
+
+    def fetch(self, rows=('public',)):
+        def _fetch():
+            self.fetches.append(rows)
+            return rows
+        return _fetch
+
+    def runTest(self):
+        with self.app.app_context():
+            getattr(self, '_check_' + self.check)()
+
+    def _check_shared(self):
+        other = get_catalog_metadata(1, 2, 'postgres', SQL_PATH)
+        self.assertIs(other, self.metadata)
+        self.assertEqual(self.metadata.get('schemas', self.fetch()),
+                         ('public',))
+        self.assertEqual(other.get('schemas', self.fetch()), ('public',))
+        self.assertEqual(self.fetches, [('public',)])
+
+    def _check_version(self):
+        generation = self.metadata.check_version(self.conn)
+        self.metadata.get('schemas', self.fetch())
+        self.assertEqual(self.metadata.check_version(self.conn), generation)
+        self.metadata.get('schemas', self.fetch())
+        self.assertEqual(len(self.fetches), 1)
+
+        self.conn.version = '1,2,1'
+        self.assertEqual(self.metadata.check_version(self.conn),
+                         generation + 1)
+        self.metadata.get('schemas', self.fetch())
+        self.assertEqual(len(self.fetches), 2)
+
+    def _check_interval(self):
+        metadata_cache.CATALOG_CHECK_INTERVAL = 60
+        self.metadata.check_version(self.conn)
+        self.conn.version = '1,2,1'
+        self.metadata.check_version(self.conn)
+        self.assertEqual(self.conn.queries, 1)
+
+    def _check_failure(self):
+        self.assertIsNone(self.metadata.get('schemas', self.fetch(None)))
+        self.assertEqual(self.metadata.get('schemas', self.fetch()),
+                         ('public',))
+
+        # The cache is kept when the version can't be checked
+        self.conn.status = False
+        generation = self.metadata.generation
+        self.assertEqual(self.metadata.check_version(self.conn), generation)
+        self.metadata.get('schemas', self.fetch())
+        self.assertEqual(self.fetches, [None, ('public',)])
+
+    def _check_database(self):
+        self.assertIsNot(get_catalog_metadata(1, 3, 'postgres', SQL_PATH),
+                         self.metadata)
+        self.assertIsNot(get_catalog_metadata(1, 2, 'app', SQL_PATH),
+                         self.metadata)
+        # The server was upgraded
+        self.assertIsNot(get_catalog_metadata(
+            1, 2, 'postgres', 'sqlautocomplete/sql/#180000#'), self.metadata)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
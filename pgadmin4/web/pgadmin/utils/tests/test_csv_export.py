@@ -0,0 +1,151 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import gzip
+from decimal import Decimal
+from io import StringIO
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils import csv_lib
+from pgadmin.utils.csv_export import CSVChunkWriter, copy_csv_statement, \
+    get_csv_quoting, gzip_chunks
+
+HEADER = ['id', 'name', 'NULL']
+ROWS = [
+    (1, 'plain', None),
+    (2, "it's", 'NULL'),
+    (3, 'say "hi"', ''),
+    (4, 'a,b;c|d\te', True),
+    (5, 'line\r\nbreak', Decimal('1.50')),
+    (None, None, 2.5),
+]
+
+
+def _csv_lib_output(rows, quote, quote_char, field_separator,
+                    replace_nulls_with):
+    """CSV output of csv_lib, as written before for the downloads."""
+    res_io = StringIO()
+    csv_writer = csv_lib.DictWriter(
+        res_io, fieldnames=HEADER, delimiter=field_separator,
+        quoting=get_csv_quoting(quote), quotechar=quote_char,
+        replace_nulls_with=replace_nulls_with
+    )
+    csv_writer.writeheader()
+    for row in rows:
+        row = dict(zip(HEADER, row))
+        if replace_nulls_with is not None:
+            row = dict((k, replace_nulls_with if v is None else v)
+                       for k, v in row.items())
+        csv_writer.writerow(row)
+    return res_io.getvalue()
+
+
+class CSVChunkWriterTestCase(BaseTestGenerator):
+    """This class checks the CSV writer against csv_lib."""
+    scenarios = [
+        ('Quote strings', dict(
+            quote='strings', quote_char='"', field_separator=',',
+            replace_nulls_with=None)),
+        ('Quote strings, replace nulls', dict(
+            quote='strings', quote_char="'", field_separator=';',
+            replace_nulls_with='NULL')),
+        ('Quote all, replace nulls', dict(
+            quote='all', quote_char='"', field_separator='|',
+            replace_nulls_with='NULL')),
+        ('Quote all, replace nulls with a quoted string', dict(
+            quote='all', quote_char='"', field_separator=',',
+            replace_nulls_with='"N"')),
+        ('Quote none', dict(
+            quote='none', quote_char='"', field_separator='\t',
+            replace_nulls_with='')),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        writer = CSVChunkWriter(
+            quote=self.quote, quote_char=self.quote_char,
+            field_separator=self.field_separator,
+            replace_nulls_with=self.replace_nulls_with
+        )
+        # Written in chunks
+        output = writer.write_header(HEADER) + writer.write(ROWS[:2]) + \
+            writer.write(ROWS[2:]) + writer.write([])
+
+        self.assertEqual(
+            output,
+            _csv_lib_output(ROWS, self.quote, self.quote_char,
+                            self.field_separator, self.replace_nulls_with))
+
+
+class CopyCSVStatementTestCase(BaseTestGenerator):
+    """This class tests the queries which can be downloaded with COPY."""
+    scenarios = [
+        ('Select, quote strings', dict(
+            query='SELECT 1 AS a, \'x\' AS b;', quote='strings',
+            columns=[('a', 23), ('b', 25)],
+            expected='COPY (SELECT 1 AS a, \'x\' AS b) TO STDOUT WITH ('
+                     'FORMAT csv, DELIMITER \',\', QUOTE \'"\', '
+                     'NULL \'NULL\', FORCE_QUOTE ("b"))')),
+        ('With query, quote all', dict(
+            query='WITH t AS (SELECT 1 AS a) SELECT * FROM t',
+            quote='all', columns=[('a', 23)],
+            expected='COPY (WITH t AS (SELECT 1 AS a) SELECT * FROM t) TO '
+                     'STDOUT WITH (FORMAT csv, DELIMITER \',\', '
+                     'QUOTE \'"\', NULL \'NULL\', FORCE_QUOTE *)')),
+        ('Quote none', dict(
+            query='SELECT 1', quote='none', columns=[('a', 23)],
+            expected=None)),
+        ('Several statements', dict(
+            query='SELECT 1; SELECT 2', quote='all', columns=[('a', 23)],
+            expected=None)),
+        ('Data modifying query', dict(
+            query='WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d',
+            quote='all', columns=[('a', 23)], expected=None)),
+        ('Row locks', dict(
+            query='SELECT * FROM t FOR UPDATE', quote='all',
+            columns=[('a', 23)], expected=None)),
+        ('Duplicate column names', dict(
+            query='SELECT 1 AS a, 2 AS a', quote='strings',
+            columns=[('a', 23), ('a', 23)], expected=None)),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        statement = copy_csv_statement(
+            self.query, self.columns, quote=self.quote, quote_char='"',
+            field_separator=',', replace_nulls_with='NULL')
+
+        if self.expected is None:
+            self.assertIsNone(statement)
+        else:
+            self.assertEqual(statement.as_string(None), self.expected)
+
+
+class GzipChunksTestCase(BaseTestGenerator):
+    """This class tests the compression of the downloaded chunks."""
+    scenarios = [
+        ('Text chunks', dict(chunks=['a,b\r\n', 'é,"x"\r\n' * 1000, ''])),
+        ('Bytes chunks', dict(chunks=[b'1,2\n', b'3,4\n'])),
+        ('No chunks', dict(chunks=[])),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        expected = b''.join(
+            c.encode('utf-8') if isinstance(c, str) else c
+            for c in self.chunks)
+        self.assertEqual(
+            gzip.decompress(b''.join(gzip_chunks(iter(self.chunks)))),
+            expected)
@@ -0,0 +1,104 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2025, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+//////////////////////////////////////////////////////////////
+
+import { isJobMonitorDeltaComplete, mergeJobMonitorData }
+  from '../../../pgadmin/dashboard/static/js/JobMonitor';
+
+describe('JobMonitor', ()=>{
+  const prev = {
+    summary: {total_jobs: 2},
+    jobs: [
+      {jobid: 1, jobname: 'job_1', status: 'Success'},
+      {jobid: 2, jobname: 'job_2', status: 'Enabled'},
+    ],
+    history: [{jlgjobid: 1}],
+    job_versions: {1: 'a1', 2: 'b1'},
+    token: '100',
+  };
+
+  it('merges the changed jobs', ()=>{
+    const delta = {
+      summary: {total_jobs: 2},
+      jobs: [{jobid: 1, jobname: 'job_1', status: 'Running'}],
+      job_ids: [1, 2],
+      job_versions: {1: 'a1', 2: 'b1'},
+      token: '105',
+      incremental: true,
+    };
+    expect(isJobMonitorDeltaComplete(prev, delta)).toBe(true);
+    expect(mergeJobMonitorData(prev, delta)).toEqual({
+      ...prev,
+      jobs: [
+        {jobid: 1, jobname: 'job_1', status: 'Running'},
+        {jobid: 2, jobname: 'job_2', status: 'Enabled'},
+      ],
+      token: '105',
+    });
+  });
+
+  it('adds a new job and an edited job without runs', ()=>{
+    const delta = {
+      summary: {total_jobs: 3},
+      jobs: [
+        {jobid: 3, jobname: 'job_3', status: 'Enabled'},
+        {jobid: 2, jobname: 'job_2_renamed', status: 'Disabled'},
+      ],
+      job_ids: [1, 2, 3],
+      job_versions: {1: 'a1', 2: 'b2', 3: 'c1'},
+      token: '105',
+      incremental: true,
+    };
+    expect(isJobMonitorDeltaComplete(prev, delta)).toBe(true);
+    expect(mergeJobMonitorData(prev, delta).jobs).toEqual([
+      {jobid: 3, jobname: 'job_3', status: 'Enabled'},
+      {jobid: 1, jobname: 'job_1', status: 'Success'},
+      {jobid: 2, jobname: 'job_2_renamed', status: 'Disabled'},
+    ]);
+  });
+
+  it('drops the deleted jobs', ()=>{
+    const delta = {
+      summary: {total_jobs: 1},
+      jobs: [],
+      job_ids: [1],
+      job_versions: {1: 'a1'},
+      token: '105',
+      incremental: true,
+    };
+    expect(isJobMonitorDeltaComplete(prev, delta)).toBe(true);
+    expect(mergeJobMonitorData(prev, delta).jobs).toEqual([
+      {jobid: 1, jobname: 'job_1', status: 'Success'},
+    ]);
+  });
+
+  it('needs a full snapshot for a job missing from the delta', ()=>{
+    const delta = {
+      summary: {total_jobs: 3},
+      jobs: [],
+      job_ids: [1, 2, 3],
+      job_versions: {1: 'a1', 2: 'b1', 3: 'c1'},
+      token: '105',
+      incremental: true,
+    };
+    expect(isJobMonitorDeltaComplete(prev, delta)).toBe(false);
+  });
+
+  it('needs a full snapshot for a definition change missing from the delta', ()=>{
+    const delta = {
+      summary: {total_jobs: 2},
+      jobs: [],
+      job_ids: [1, 2],
+      job_versions: {1: 'a1', 2: 'b2'},
+      token: '105',
+      incremental: true,
+    };
+    expect(isJobMonitorDeltaComplete(prev, delta)).toBe(false);
+    expect(isJobMonitorDeltaComplete(null, delta)).toBe(false);
+  });
+});
@@ -0,0 +1,51 @@
+/////////////////////////////////////////////////////////////
+//
+// pgAdmin 4 - PostgreSQL Tools
+//
+// Copyright (C) 2013 - 2025, The pgAdmin Development Team
+// This software is released under the PostgreSQL Licence
+//
+/////////////////////////////////////////////////////////////
+
+import JobSubscriptions from
+  '../../../pgadmin/browser/server_groups/servers/pgagent/static/js/pga_job_subscriptions';
+
+describe('JobSubscriptions', ()=>{
+  let subscriptions;
+
+  beforeEach(()=>{
+    subscriptions = new JobSubscriptions();
+  });
+
+  it('every job is watched without any open view', ()=>{
+    expect(subscriptions.jobIds(1)).toBeNull();
+  });
+
+  it('job monitor and properties panel', ()=>{
+    expect(subscriptions.watch('job_monitor_1', 1, [3, 1, 2])).toBe(true);
+    expect(subscriptions.jobIds(1)).toEqual(['1', '2', '3']);
+
+    // The job of the properties panel is already watched
+    expect(subscriptions.watch('properties', '1', [2])).toBe(false);
+    expect(subscriptions.watch('job_monitor_1', 1, [1, 3])).toBe(false);
+    expect(subscriptions.jobIds(1)).toEqual(['1', '2', '3']);
+
+    // Closing the job monitor leaves the job of the properties panel
+    expect(subscriptions.unwatch('job_monitor_1')).toBe(true);
+    expect(subscriptions.jobIds(1)).toEqual(['2']);
+    expect(subscriptions.unwatch('properties')).toBe(true);
+    expect(subscriptions.jobIds(1)).toBeNull();
+    expect(subscriptions.unwatch('properties')).toBe(false);
+  });
+
+  it('views of another server', ()=>{
+    subscriptions.watch('job_monitor_2', 2, [5]);
+    expect(subscriptions.jobIds(1)).toBeNull();
+    expect(subscriptions.jobIds(2)).toEqual(['5']);
+  });
+
+  it('a view without any job', ()=>{
+    expect(subscriptions.watch('job_monitor_1', 1, [])).toBe(true);
+    expect(subscriptions.jobIds(1)).toEqual([]);
+  });
+});
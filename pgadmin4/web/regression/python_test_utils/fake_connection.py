@@ -0,0 +1,45 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2025, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+
+
+def render_template_name(path, **kwargs):
+    """
+    Stand-in for render_template, patched into the module under test, which
+    returns the name of the template and its arguments instead of the SQL.
+    """
+    return path.split('/')[-1], kwargs
+
+
+class FakeConnection:
+    """
+    Connection running the queries returned by render_template_name. The
+    subclasses return the rows of a template and its arguments from rows(),
+    or None for a failed query. The queries are recorded in 'queries'.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def rows(self, template, args):
+        raise NotImplementedError
+
+    def _execute(self, query):
+        self.queries.append(query)
+        rows = self.rows(*query)
+        if rows is None:
+            return False, 'query failed'
+        return True, {'rows': copy.deepcopy(rows)}
+
+    def execute_dict(self, query, params=None):
+        return self._execute(query)
+
+    def execute_2darray(self, query, params=None):
+        return self._execute(query)
@@ -12,6 +12,7 @@
 #include "pgAgent.h"
 #include "notification.h" 
 #include <iostream>
+#include <chrono>
 
 
 #if !BOOST_OS_WINDOWS
@@ -28,6 +29,10 @@ using namespace std;
 
 #define MAXATTEMPTS 10
 
+// Interval, in seconds, at which the retention policy of the audit log is
+// applied
+#define AUDIT_PRUNE_INTERVAL 3600
+
 #if !BOOST_OS_WINDOWS
 bool        runInForeground = false;
 std::string logFile;
@@ -37,6 +42,28 @@ std::string logFile;
 void        Initialized();
 #endif
 
+// Applies the retention policy of the audit log and the job run logs, if
+// the schema has it
+void PruneAuditLog(DBconn *serviceConn)
+{
+	std::string hasPrune = serviceConn->ExecuteScalar(
+		"SELECT to_regproc('pgagent.pga_job_audit_log_prune') IS NOT NULL"
+	);
+
+	if (hasPrune != "t")
+		return;
+
+	LogMessage("Pruning the job audit log", LOG_DEBUG);
+	std::string pruned = serviceConn->ExecuteScalar(
+		"SELECT pgagent.pga_job_audit_log_prune()"
+	);
+
+	if (pruned.empty())
+		LogMessage("Failed to prune the job audit log!", LOG_WARNING);
+	else if (pruned != "0")
+		LogMessage("Pruned " + pruned + " rows from the job audit log", LOG_DEBUG);
+}
+
 int MainRestartLoop(DBconn *serviceConn)
 {
 	int rc;
@@ -111,10 +138,21 @@ int MainRestartLoop(DBconn *serviceConn)
 	if (rc < 0)
 		return rc;
 
+	// Prune on the first iteration, then every AUDIT_PRUNE_INTERVAL seconds
+	auto lastPrune = std::chrono::steady_clock::now() -
+		std::chrono::seconds(AUDIT_PRUNE_INTERVAL);
+
 	while (1)
 	{
 		bool foundJobToExecute = false;
 
+		if (std::chrono::steady_clock::now() - lastPrune >=
+			std::chrono::seconds(AUDIT_PRUNE_INTERVAL))
+		{
+			PruneAuditLog(serviceConn);
+			lastPrune = std::chrono::steady_clock::now();
+		}
+
 		LogMessage("Checking for jobs to run", LOG_DEBUG);
 		CheckPendingEmailNotifications();
 		DBresultPtr res = serviceConn->Execute(
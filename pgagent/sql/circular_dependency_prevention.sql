@@ -2,50 +2,87 @@
 
 BEGIN TRANSACTION;
 
--- Function to check for circular dependencies
+-- Function to check for circular dependencies. It runs once per statement
+-- and checks all the dependencies added by the statement in a single pass,
+-- so that a bulk insert does not walk the dependency chain once per row.
 CREATE OR REPLACE FUNCTION pgagent.check_circular_dependency()
 RETURNS trigger AS $$
 DECLARE
-    cycle_exists BOOLEAN;
+    v_jobid integer;
 BEGIN
     -- First check direct self-dependency
-    IF NEW.jobid = NEW.dependent_jobid THEN
+    IF EXISTS (
+        SELECT 1 FROM new_dependencies WHERE jobid = dependent_jobid
+    ) THEN
         RAISE EXCEPTION 'A job cannot depend on itself.';
     END IF;
 
-    WITH RECURSIVE dependency_chain AS (
-        -- Base case: direct dependencies
-        SELECT d.jobid, d.dependent_jobid, 1 as level
-        FROM pgagent.pga_job_dependency d
-        WHERE d.jobid = NEW.dependent_jobid
-        
+    -- A new dependency closes a cycle if its job can be reached from the
+    -- job it depends on. UNION stops at the (job, reached job) pairs
+    -- already seen, so no depth limit is needed.
+    WITH RECURSIVE dependency_chain(start_jobid, jobid) AS (
+        SELECT n.jobid, n.dependent_jobid
+        FROM new_dependencies n
+
         UNION
-        
-        -- Recursive case: dependencies of dependencies
-        SELECT d.jobid, d.dependent_jobid, dc.level + 1
-        FROM pgagent.pga_job_dependency d
-        JOIN dependency_chain dc ON d.jobid = dc.dependent_jobid
-        WHERE dc.level < 100  -- Prevent infinite recursion
+
+        SELECT dc.start_jobid, d.dependent_jobid
+        FROM dependency_chain dc
+        JOIN pgagent.pga_job_dependency d ON d.jobid = dc.jobid
     )
-    SELECT EXISTS (
-        SELECT 1 FROM dependency_chain WHERE dependent_jobid = NEW.jobid
-    ) INTO cycle_exists;
+    SELECT start_jobid INTO v_jobid
+    FROM dependency_chain
+    WHERE jobid = start_jobid
+    LIMIT 1;
 
-    IF cycle_exists THEN
-        RAISE EXCEPTION 'Circular dependency detected: This would create a cycle between jobs.';
+    IF FOUND THEN
+        RAISE EXCEPTION 'Circular dependency detected: This would create a cycle between jobs.'
+            USING DETAIL = format('Job %s would depend on itself.', v_jobid);
     END IF;
 
-    RETURN NEW;
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
--- Drop existing trigger if it exists
+-- Drop existing triggers if they exist
 DROP TRIGGER IF EXISTS prevent_circular_dependency ON pgagent.pga_job_dependency;
+DROP TRIGGER IF EXISTS prevent_circular_dependency_update ON pgagent.pga_job_dependency;
 
--- Create trigger to prevent circular dependencies
+-- Create triggers to prevent circular dependencies. Transition tables
+-- cannot be shared by several events, hence one trigger per event.
 CREATE TRIGGER prevent_circular_dependency
-    BEFORE INSERT OR UPDATE ON pgagent.pga_job_dependency
-    FOR EACH ROW
+    AFTER INSERT ON pgagent.pga_job_dependency
+    REFERENCING NEW TABLE AS new_dependencies
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION pgagent.check_circular_dependency();
+
+CREATE TRIGGER prevent_circular_dependency_update
+    AFTER UPDATE ON pgagent.pga_job_dependency
+    REFERENCING NEW TABLE AS new_dependencies
+    FOR EACH STATEMENT
     EXECUTE FUNCTION pgagent.check_circular_dependency();
 
+-- Tell pgAdmin that its cached job dependency graph is out of date. Only
+-- the changes to the jobs which show in the graph are notified, not the
+-- updates of their next run time.
+CREATE OR REPLACE FUNCTION pgagent.pga_job_dependency_notify()
+RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('job_dependency_update', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS pga_job_dependency_notify ON pgagent.pga_job_dependency;
+CREATE TRIGGER pga_job_dependency_notify
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON pgagent.pga_job_dependency
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION pgagent.pga_job_dependency_notify();
+
+DROP TRIGGER IF EXISTS pga_job_dependency_notify ON pgagent.pga_job;
+CREATE TRIGGER pga_job_dependency_notify
+    AFTER INSERT OR DELETE OR UPDATE OF jobname OR TRUNCATE ON pgagent.pga_job
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION pgagent.pga_job_dependency_notify();
+
 COMMIT TRANSACTION;
\ No newline at end of file
@@ -12,6 +12,8 @@ CREATE TABLE pgagent.pga_job_audit_log (
 
 CREATE INDEX pga_job_audit_log_jobid ON pgagent.pga_job_audit_log(job_id);
 CREATE INDEX pga_job_audit_log_operation_time ON pgagent.pga_job_audit_log(operation_time);
+-- Keyset pagination of the audit log of a job on (operation_time, audit_id)
+CREATE INDEX pga_job_audit_log_jobid_time ON pgagent.pga_job_audit_log(job_id, operation_time, audit_id);
 
 COMMENT ON TABLE pgagent.pga_job_audit_log IS 'Audit log for pgAgent job operations';
 COMMENT ON COLUMN pgagent.pga_job_audit_log.operation_type IS 'Type of operation performed (CREATE, MODIFY, DELETE, EXECUTE)';
@@ -137,5 +139,264 @@ CREATE TRIGGER pga_job_audit_trigger
     FOR EACH ROW
     EXECUTE FUNCTION pgagent.pga_job_audit_trigger();
 
+-- Indexes used by the pgAdmin job monitor to find the latest run of every
+-- job and the latest step of a run without scanning the logs
+CREATE INDEX IF NOT EXISTS pga_joblog_jobid_jlgid ON pgagent.pga_joblog(jlgjobid, jlgid DESC);
+CREATE INDEX IF NOT EXISTS pga_joblog_jlgstart ON pgagent.pga_joblog(jlgstart);
+CREATE INDEX IF NOT EXISTS pga_jobsteplog_jlgid_jslstart ON pgagent.pga_jobsteplog(jsljlgid, jslstart DESC);
+
+-- Retention policy of the audit log and the job run logs. The table holds a
+-- single row, maintained from pgAdmin and applied by
+-- pgagent.pga_job_audit_log_prune(), which pgAgent calls periodically.
+CREATE TABLE pgagent.pga_job_audit_retention (
+    retention_id             bool                 NOT NULL PRIMARY KEY DEFAULT true CHECK (retention_id),
+    max_age                  interval             NULL CHECK (max_age > interval '0'),
+    max_rows                 int8                 NULL CHECK (max_rows > 0),
+    joblog_max_age           interval             NULL CHECK (joblog_max_age > interval '0'),
+    last_pruned_at           timestamptz          NULL,
+    last_pruned_rows         int8                 NULL,
+    last_dropped_partitions  int4                 NULL
+) WITHOUT OIDS;
+INSERT INTO pgagent.pga_job_audit_retention (retention_id) VALUES (true);
+
+COMMENT ON TABLE pgagent.pga_job_audit_retention IS 'Retention policy of the job audit log and the job run logs';
+COMMENT ON COLUMN pgagent.pga_job_audit_retention.max_age IS 'Audit log entries older than this are removed (NULL = kept forever)';
+COMMENT ON COLUMN pgagent.pga_job_audit_retention.max_rows IS 'Only the most recent max_rows audit log entries are kept (NULL = no limit)';
+COMMENT ON COLUMN pgagent.pga_job_audit_retention.joblog_max_age IS 'Job runs older than this are removed, except the latest run of every job (NULL = kept forever)';
+
+-- Upper bound of the range of an audit log partition, NULL for the default
+-- partition
+CREATE OR REPLACE FUNCTION pgagent.pga_job_audit_log_partition_end(p_partition regclass)
+RETURNS timestamptz AS $$
+    SELECT substring(
+        pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([^'']+)''\)'
+    )::timestamptz
+    FROM pg_class c
+    WHERE c.oid = p_partition;
+$$ LANGUAGE sql STABLE;
+
+-- Creates the monthly partitions of the audit log from the month of p_from
+-- up to p_months_ahead months after the current one. Rows of these months
+-- already stored in the default partition are moved to the new partition.
+-- Does nothing if the audit log is not partitioned.
+CREATE OR REPLACE FUNCTION pgagent.pga_job_audit_log_create_partitions(
+    p_from timestamptz DEFAULT current_timestamp,
+    p_months_ahead int4 DEFAULT 2
+) RETURNS int4 AS $$
+DECLARE
+    v_month timestamptz := date_trunc('month', p_from);
+    v_last timestamptz := date_trunc('month', current_timestamp) + make_interval(months => p_months_ahead);
+    v_name text;
+    v_created int4 := 0;
+BEGIN
+    IF (SELECT relkind FROM pg_class
+        WHERE oid = 'pgagent.pga_job_audit_log'::regclass) <> 'p' THEN
+        RETURN 0;
+    END IF;
+
+    WHILE v_month <= v_last LOOP
+        v_name := 'pga_job_audit_log_p' || to_char(v_month, 'YYYYMM');
+
+        IF to_regclass('pgagent.' || quote_ident(v_name)) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE pgagent.%I (LIKE pgagent.pga_job_audit_log INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                v_name
+            );
+            EXECUTE format(
+                'WITH moved AS ('
+                '    DELETE FROM pgagent.pga_job_audit_log_default'
+                '    WHERE operation_time >= %L AND operation_time < %L'
+                '    RETURNING *'
+                ') INSERT INTO pgagent.%I SELECT * FROM moved',
+                v_month, v_month + interval '1 month', v_name
+            );
+            EXECUTE format(
+                'ALTER TABLE pgagent.pga_job_audit_log ATTACH PARTITION pgagent.%I FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_month, v_month + interval '1 month'
+            );
+            v_created := v_created + 1;
+        END IF;
+
+        v_month := v_month + interval '1 month';
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Switches the audit log between a plain table and a table partitioned by
+-- month on operation_time. The table is rebuilt, existing rows are kept.
+CREATE OR REPLACE FUNCTION pgagent.pga_job_audit_log_set_partitioned(p_partitioned bool)
+RETURNS void AS $$
+DECLARE
+    v_is_partitioned bool;
+    v_ext_member bool;
+    v_from timestamptz;
+BEGIN
+    LOCK TABLE pgagent.pga_job_audit_log IN ACCESS EXCLUSIVE MODE;
+
+    SELECT c.relkind = 'p',
+           EXISTS (
+               SELECT 1 FROM pg_depend d
+               WHERE d.classid = 'pg_class'::regclass AND d.objid = c.oid
+                 AND d.deptype = 'e'
+           )
+    INTO v_is_partitioned, v_ext_member
+    FROM pg_class c
+    WHERE c.oid = 'pgagent.pga_job_audit_log'::regclass;
+
+    IF v_is_partitioned = p_partitioned THEN
+        RETURN;
+    END IF;
+
+    IF v_ext_member THEN
+        ALTER EXTENSION pgagent DROP TABLE pgagent.pga_job_audit_log;
+    END IF;
+
+    ALTER TABLE pgagent.pga_job_audit_log RENAME TO pga_job_audit_log_old;
+    ALTER TABLE pgagent.pga_job_audit_log_old DROP CONSTRAINT pga_job_audit_log_pkey;
+    DROP INDEX pgagent.pga_job_audit_log_jobid;
+    DROP INDEX pgagent.pga_job_audit_log_operation_time;
+    DROP INDEX pgagent.pga_job_audit_log_jobid_time;
+    ALTER SEQUENCE pgagent.pga_job_audit_log_audit_id_seq OWNED BY NONE;
+    ALTER TABLE pgagent.pga_job_audit_log_old ALTER COLUMN audit_id DROP DEFAULT;
+
+    IF p_partitioned THEN
+        -- The partition key has to be part of the primary key
+        CREATE TABLE pgagent.pga_job_audit_log (
+            audit_id          int4                 NOT NULL DEFAULT nextval('pgagent.pga_job_audit_log_audit_id_seq'),
+            job_id            int4                 NOT NULL ,
+            operation_type    text                 NOT NULL CHECK (operation_type IN ('CREATE', 'MODIFY', 'DELETE', 'EXECUTE')),
+            operation_time    timestamptz          NOT NULL DEFAULT current_timestamp,
+            operation_user    text                 NOT NULL,
+            old_values        jsonb                NULL,
+            new_values        jsonb                NULL,
+            additional_info   text                 NULL,
+            PRIMARY KEY (audit_id, operation_time)
+        ) PARTITION BY RANGE (operation_time);
+        CREATE TABLE pgagent.pga_job_audit_log_default
+            PARTITION OF pgagent.pga_job_audit_log DEFAULT;
+
+        SELECT min(operation_time) INTO v_from FROM pgagent.pga_job_audit_log_old;
+        PERFORM pgagent.pga_job_audit_log_create_partitions(
+            COALESCE(v_from, current_timestamp)
+        );
+    ELSE
+        CREATE TABLE pgagent.pga_job_audit_log (
+            audit_id          int4                 NOT NULL PRIMARY KEY DEFAULT nextval('pgagent.pga_job_audit_log_audit_id_seq'),
+            job_id            int4                 NOT NULL ,
+            operation_type    text                 NOT NULL CHECK (operation_type IN ('CREATE', 'MODIFY', 'DELETE', 'EXECUTE')),
+            operation_time    timestamptz          NOT NULL DEFAULT current_timestamp,
+            operation_user    text                 NOT NULL,
+            old_values        jsonb                NULL,
+            new_values        jsonb                NULL,
+            additional_info   text                 NULL
+        ) WITHOUT OIDS;
+    END IF;
+
+    INSERT INTO pgagent.pga_job_audit_log SELECT * FROM pgagent.pga_job_audit_log_old;
+    DROP TABLE pgagent.pga_job_audit_log_old;
+
+    CREATE INDEX pga_job_audit_log_jobid ON pgagent.pga_job_audit_log(job_id);
+    CREATE INDEX pga_job_audit_log_operation_time ON pgagent.pga_job_audit_log(operation_time);
+    CREATE INDEX pga_job_audit_log_jobid_time ON pgagent.pga_job_audit_log(job_id, operation_time, audit_id);
+    ALTER SEQUENCE pgagent.pga_job_audit_log_audit_id_seq OWNED BY pgagent.pga_job_audit_log.audit_id;
+
+    COMMENT ON TABLE pgagent.pga_job_audit_log IS 'Audit log for pgAgent job operations';
+    COMMENT ON COLUMN pgagent.pga_job_audit_log.operation_type IS 'Type of operation performed (CREATE, MODIFY, DELETE, EXECUTE)';
+    COMMENT ON COLUMN pgagent.pga_job_audit_log.old_values IS 'Previous values of modified fields (for MODIFY operations)';
+    COMMENT ON COLUMN pgagent.pga_job_audit_log.new_values IS 'New values of modified fields (for MODIFY operations)';
+    COMMENT ON COLUMN pgagent.pga_job_audit_log.additional_info IS 'Additional information about the operation';
+
+    IF v_ext_member THEN
+        ALTER EXTENSION pgagent ADD TABLE pgagent.pga_job_audit_log;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Applies the retention policy. Whole partitions older than the cutoff are
+-- dropped, the remaining expired rows are deleted. Returns the number of
+-- audit log rows deleted, rows of the dropped partitions are not counted.
+CREATE OR REPLACE FUNCTION pgagent.pga_job_audit_log_prune()
+RETURNS int8 AS $$
+DECLARE
+    v_policy pgagent.pga_job_audit_retention%ROWTYPE;
+    v_cutoff_time timestamptz;
+    v_cutoff_id int4;
+    v_row_time timestamptz;
+    v_row_id int4;
+    v_partition regclass;
+    v_pruned int8 := 0;
+    v_dropped int4 := 0;
+BEGIN
+    -- Only one agent prunes at a time
+    IF NOT pg_try_advisory_xact_lock('pgagent.pga_job_audit_log'::regclass::oid::int8) THEN
+        RETURN 0;
+    END IF;
+
+    SELECT * INTO v_policy FROM pgagent.pga_job_audit_retention;
+
+    PERFORM pgagent.pga_job_audit_log_create_partitions();
+
+    IF v_policy.max_age IS NOT NULL THEN
+        v_cutoff_time := current_timestamp - v_policy.max_age;
+    END IF;
+
+    IF v_policy.max_rows IS NOT NULL THEN
+        -- Newest row beyond the max_rows most recent ones
+        SELECT operation_time, audit_id INTO v_row_time, v_row_id
+        FROM pgagent.pga_job_audit_log
+        ORDER BY operation_time DESC, audit_id DESC
+        OFFSET v_policy.max_rows
+        LIMIT 1;
+
+        IF FOUND AND (v_cutoff_time IS NULL OR v_row_time >= v_cutoff_time) THEN
+            v_cutoff_time := v_row_time;
+            v_cutoff_id := v_row_id;
+        END IF;
+    END IF;
+
+    IF v_cutoff_time IS NOT NULL THEN
+        -- Partitions entirely before the cutoff are dropped
+        FOR v_partition IN
+            SELECT i.inhrelid::regclass
+            FROM pg_inherits i
+            WHERE i.inhparent = 'pgagent.pga_job_audit_log'::regclass
+              AND pgagent.pga_job_audit_log_partition_end(i.inhrelid) <= v_cutoff_time
+        LOOP
+            EXECUTE format('DROP TABLE %s', v_partition);
+            v_dropped := v_dropped + 1;
+        END LOOP;
+
+        IF v_cutoff_id IS NULL THEN
+            DELETE FROM pgagent.pga_job_audit_log
+            WHERE operation_time < v_cutoff_time;
+        ELSE
+            DELETE FROM pgagent.pga_job_audit_log
+            WHERE (operation_time, audit_id) <= (v_cutoff_time, v_cutoff_id);
+        END IF;
+        GET DIAGNOSTICS v_pruned = ROW_COUNT;
+    END IF;
+
+    IF v_policy.joblog_max_age IS NOT NULL THEN
+        -- The latest run of every job is kept for the job monitor
+        DELETE FROM pgagent.pga_joblog l
+        WHERE l.jlgstart < current_timestamp - v_policy.joblog_max_age
+          AND l.jlgstatus <> 'r'
+          AND EXISTS (
+              SELECT 1 FROM pgagent.pga_joblog n
+              WHERE n.jlgjobid = l.jlgjobid AND n.jlgid > l.jlgid
+          );
+    END IF;
+
+    UPDATE pgagent.pga_job_audit_retention
+    SET last_pruned_at = current_timestamp,
+        last_pruned_rows = v_pruned,
+        last_dropped_partitions = v_dropped;
+
+    RETURN v_pruned;
+END;
+$$ LANGUAGE plpgsql;
+
 -- Update schema version
 UPDATE pg_extension SET extversion = '4.3' WHERE extname = 'pgagent'; 
\ No newline at end of file